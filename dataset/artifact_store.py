@@ -0,0 +1,90 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parent
+OUTPUT_DIR = ROOT / "output"
+
+ARTIFACT_STORE_DIR = OUTPUT_DIR / "artifact_store"
+CHUNK_SIZE = 1 << 20
+
+CONTENT_TYPES = {
+    ".json": "application/json",
+    ".csv": "text/csv",
+    ".geojson": "application/geo+json",
+    ".html": "text/html",
+}
+
+
+def file_sha256(path: Path, chunk_size=CHUNK_SIZE):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def blob_path(sha256: str, store_dir: Path = ARTIFACT_STORE_DIR):
+    return store_dir / "sha256" / sha256[:2] / sha256
+
+
+def load_manifest(store_dir: Path = ARTIFACT_STORE_DIR):
+    path = store_dir / "manifest.json"
+    if path.exists():
+        return json.loads(path.read_text(encoding="utf-8"))
+    return {"artifacts": {}}
+
+
+def save_manifest(manifest: dict, store_dir: Path = ARTIFACT_STORE_DIR):
+    store_dir.mkdir(parents=True, exist_ok=True)
+    path = store_dir / "manifest.json"
+    path.write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8")
+    return path
+
+
+def _copy_in_chunks(src: Path, dst: Path, chunk_size=CHUNK_SIZE):
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    tmp = dst.with_name(dst.name + ".tmp")
+    with open(src, "rb") as f_in, open(tmp, "wb") as f_out:
+        for chunk in iter(lambda: f_in.read(chunk_size), b""):
+            f_out.write(chunk)
+    os.replace(tmp, dst)
+
+
+def store_artifact(path: Path, manifest: dict, store_dir: Path = ARTIFACT_STORE_DIR, chunk_size=CHUNK_SIZE):
+    # Files are only re-read when size or mtime moved since the last export, and a
+    # blob is only written when no identical content is already in the store.
+    stat = path.stat()
+    previous = manifest["artifacts"].get(path.name)
+    unchanged = (
+        previous is not None
+        and previous["size_bytes"] == stat.st_size
+        and previous["mtime_ns"] == stat.st_mtime_ns
+        and blob_path(previous["sha256"], store_dir).exists()
+    )
+
+    sha256 = previous["sha256"] if unchanged else file_sha256(path, chunk_size)
+    target = blob_path(sha256, store_dir)
+    written = False
+    if not target.exists():
+        _copy_in_chunks(path, target, chunk_size)
+        written = True
+
+    record = {
+        "filename": path.name,
+        "content_type": CONTENT_TYPES.get(path.suffix, "text/plain"),
+        "sha256": sha256,
+        "size_bytes": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "storage_path": target.relative_to(store_dir).as_posix(),
+    }
+    manifest["artifacts"][path.name] = record
+    return record, written
+
+
+def iter_blob_chunks(sha256: str, store_dir: Path = ARTIFACT_STORE_DIR, chunk_size=CHUNK_SIZE):
+    with open(blob_path(sha256, store_dir), "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            yield chunk
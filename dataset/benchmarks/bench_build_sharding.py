@@ -0,0 +1,78 @@
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import build_prd_dataset
+from build_prd_dataset import KML_DIR_ENV, assemble_routes, attach_stable_ids
+from stable_ids import load_id_map
+
+
+WORKER_COUNTS = [1, 2, 4, 8]
+CITY_COPIES = 4
+MARKERS_PER_MAP = 400
+
+
+def synthetic_kml(rng, markers):
+    placemarks = []
+    for i in range(markers):
+        lat, lng = rng.uniform(10.66, 10.76), rng.uniform(122.50, 122.60)
+        placemarks.append(
+            f"<Placemark><name>Stop {i + 1} &amp; Landmark</name>"
+            f"<Point><coordinates>{lng:.7f},{lat:.7f},0</coordinates></Point></Placemark>"
+        )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<kml xmlns="http://www.opengis.net/kml/2.2"><Document>' + "".join(placemarks) + "</Document></kml>"
+    )
+
+
+def synthetic_inputs(kml_dir: Path):
+    # The Iloilo index repeated CITY_COPIES times, every route pointing at a local
+    # KML with MARKERS_PER_MAP markers: stands in for several cities' worth of maps.
+    output = build_prd_dataset.OUTPUT_DIR
+    index_routes = json.loads((output / "iloilo_routes_index.json").read_text(encoding="utf-8"))["routes"]
+    guides = json.loads((output / "iloilo_full_guides.json").read_text(encoding="utf-8"))["guides"]
+    guides_by_route = {g.get("route_number"): g for g in guides}
+
+    rng = random.Random(25)
+    routes = []
+    for copy in range(CITY_COPIES):
+        for route in index_routes:
+            number = copy * 100 + route["route_number"]
+            mid = f"synthetic-{number}"
+            (kml_dir / f"{mid}.kml").write_text(synthetic_kml(rng, MARKERS_PER_MAP), encoding="utf-8")
+            routes.append({**route, "route_number": number, "map_mid": mid})
+            guides_by_route.setdefault(number, guides_by_route.get(route["route_number"], {}))
+    return routes, guides_by_route
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ[KML_DIR_ENV] = tmp
+        routes, guides_by_route = synthetic_inputs(Path(tmp))
+        print(f"{len(routes)} routes, {MARKERS_PER_MAP} markers each, {os.cpu_count()} CPUs")
+
+        baseline = None
+        serial_s = None
+        for workers in WORKER_COUNTS:
+            metrics = {"fetches": []}
+            started = time.perf_counter()
+            records = assemble_routes(routes, guides_by_route, metrics, workers=workers)
+            payload = attach_stable_ids(records, load_id_map(Path(tmp) / "stable_id_map.json"))
+            elapsed = time.perf_counter() - started
+
+            raw = json.dumps(payload, indent=2, ensure_ascii=False)
+            if baseline is None:
+                baseline, serial_s = raw, elapsed
+            assert raw == baseline, f"{workers} workers: output differs from the serial build"
+            print(f"  {workers} worker(s): {elapsed:6.2f}s  speedup {serial_s / elapsed:4.2f}x  identical output")
+
+
+if __name__ == "__main__":
+    main()
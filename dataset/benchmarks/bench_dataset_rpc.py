@@ -0,0 +1,87 @@
+import base64
+import gzip
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from supabase_loader import DATABASE_URL_ENV, PRD_JSON, load_payload, open_pool
+from stable_ids import load_id_map
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+RUNS = 20
+
+
+def per_table(conn):
+    meta = conn.execute("SELECT * FROM prd_meta").fetchall()
+    routes = conn.execute("SELECT * FROM prd_routes ORDER BY route_id").fetchall()
+    stops = conn.execute("SELECT * FROM prd_route_stops ORDER BY route_id, stop_order").fetchall()
+    points = conn.execute("SELECT * FROM prd_route_points ORDER BY polyline_id, point_order").fetchall()
+    by_route = {}
+    for stop in stops:
+        by_route.setdefault(stop[1], []).append(stop)
+    body = json.dumps([meta, routes, by_route, points], default=str)
+    return len(body)
+
+
+def view(conn):
+    return len(json.dumps(conn.execute("SELECT payload FROM prd_dataset_json LIMIT 1").fetchone()[0]))
+
+
+def rpc(conn):
+    return len(json.dumps(conn.execute("SELECT get_route25_dataset()").fetchone()[0]))
+
+
+def rpc_compressed(encoding):
+    decompress = gzip.decompress if encoding == "gzip" else brotli.decompress
+
+    def run(conn):
+        result = conn.execute("SELECT get_route25_dataset_compressed(%s)", (encoding,)).fetchone()[0]
+        data = base64.b64decode(result["data"])
+        json.loads(decompress(data))
+        return len(result["data"])
+
+    return run
+
+
+def measure(label, conn, fn, runs=RUNS):
+    best = float("inf")
+    size = 0
+    for _ in range(runs):
+        started = time.perf_counter()
+        size = fn(conn)
+        best = min(best, time.perf_counter() - started)
+    print(f"  {label:<38} {best * 1000:>8.2f} ms  {size:>10,} bytes on the wire")
+
+
+def main():
+    dsn = os.environ.get(DATABASE_URL_ENV)
+    if not dsn:
+        raise SystemExit(f"Set {DATABASE_URL_ENV} to a scratch Postgres database")
+
+    payload = json.loads(PRD_JSON.read_text(encoding="utf-8"))
+    pool = open_pool(dsn, max_size=1)
+    try:
+        load_payload(pool, payload, load_id_map())
+        with pool.connection() as conn:
+            print(f"{len(payload['routes'])} routes, best of {RUNS}")
+            measure("per-table selects (4 queries)", conn, per_table)
+            measure("prd_dataset_json view", conn, view)
+            measure("get_route25_dataset()", conn, rpc)
+            measure("get_route25_dataset_compressed gzip", conn, rpc_compressed("gzip"))
+            if brotli is not None:
+                measure("get_route25_dataset_compressed br", conn, rpc_compressed("br"))
+    finally:
+        pool.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fare_engine import PRD_JSON, build_route_profiles, estimate_trips, load_fare_matrix
+
+
+TRIP_COUNT = 200_000
+
+
+def main():
+    payload = json.loads(PRD_JSON.read_text(encoding="utf-8"))
+    matrix = load_fare_matrix()
+
+    started = time.perf_counter()
+    profiles = build_route_profiles(payload)
+    print(f"profile build: {time.perf_counter() - started:.3f}s for {len(profiles)} routes")
+
+    rng = random.Random(27)
+    routes = [r for r in payload["routes"] if r.get("stops")]
+    trips = []
+    for _ in range(TRIP_COUNT):
+        route = rng.choice(routes)
+        count = len(route["stops"])
+        trips.append((route["route_number"], rng.randrange(count), rng.randrange(count)))
+
+    started = time.perf_counter()
+    results = estimate_trips(profiles, trips, matrix)
+    elapsed = time.perf_counter() - started
+    priced = sum(1 for r in results if r["fare_php"] is not None)
+    print(f"batch estimate: {TRIP_COUNT / elapsed:,.0f} trips/s ({priced} of {TRIP_COUNT} priced)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+import json
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fare_extraction import FULL_GUIDES_JSON, best_fare, extract_fare_candidates, extract_guide_fares, normalize_text
+
+
+CORPUS_JSON = Path(__file__).resolve().parent / "fare_corpus.json"
+ROUNDS = 50
+
+
+def legacy_parse_fare_from_text(text: str):
+    if not text:
+        return None, None, None
+
+    flat = normalize_text(text)
+
+    range_pattern = re.compile(
+        r"(?:₱|PHP|Php|php|P)?\s*(\d{1,3}(?:\.\d{1,2})?)\s*(?:-|to|–)\s*(?:₱|PHP|Php|php|P)?\s*(\d{1,3}(?:\.\d{1,2})?)"
+    )
+    single_pattern = re.compile(
+        r"(?:minimum fare|fare|pamasahe)[^0-9]{0,20}(?:₱|PHP|Php|php|P)?\s*(\d{1,3}(?:\.\d{1,2})?)",
+        flags=re.IGNORECASE,
+    )
+
+    m = range_pattern.search(flat)
+    if m:
+        low = float(m.group(1))
+        high = float(m.group(2))
+        return min(low, high), max(low, high), m.group(0)
+
+    m = single_pattern.search(flat)
+    if m:
+        value = float(m.group(1))
+        return value, value, m.group(0)
+
+    return None, None, None
+
+
+def score(predict, items):
+    correct = 0
+    for item in items:
+        fare_min, fare_max, _ = predict(item["text"])
+        got = None if fare_min is None else [fare_min, fare_max]
+        expected = item["expected"]
+        if got == (None if expected is None else [float(v) for v in expected]):
+            correct += 1
+        else:
+            print(f"  miss: expected={expected} got={got} text={item['text'][:80]!r}")
+    return correct
+
+
+def main():
+    items = json.loads(CORPUS_JSON.read_text(encoding="utf-8"))["items"]
+
+    print("legacy parse_fare_from_text:")
+    legacy_correct = score(legacy_parse_fare_from_text, items)
+    print("fare_extraction:")
+    correct = score(lambda text: best_fare(extract_fare_candidates([text])), items)
+    print(f"accuracy: legacy {legacy_correct}/{len(items)}, fare_extraction {correct}/{len(items)}")
+
+    guides = json.loads(FULL_GUIDES_JSON.read_text(encoding="utf-8")).get("guides", [])
+    blobs = ["\n".join((g.get("paragraphs") or []) + (g.get("headings") or [])) for g in guides]
+
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        for blob in blobs:
+            legacy_parse_fare_from_text(blob)
+    legacy_elapsed = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        for guide in guides:
+            extract_guide_fares(guide)
+    elapsed = time.perf_counter() - started
+
+    total = ROUNDS * len(guides)
+    print(f"legacy: {total / legacy_elapsed:,.0f} guides/s")
+    print(f"fare_extraction: {total / elapsed:,.0f} guides/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+import json
+import re
+import sys
+import time
+from pathlib import Path
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from guide_extraction import extract_guide_page, normalize_text, unique_in_order
+
+
+DATASET_DIR = Path(__file__).resolve().parent.parent
+SOURCES = [
+    DATASET_DIR / "route17_source.html",
+    DATASET_DIR / "output" / "route_index_source.html",
+]
+ROUNDS = 20
+
+
+def legacy_extract_article_dates(soup: BeautifulSoup):
+    date_published = None
+    date_modified = None
+
+    for script in soup.find_all("script", attrs={"type": "application/ld+json"}):
+        raw = script.string or script.get_text(strip=True)
+        if not raw:
+            continue
+
+        try:
+            payload = json.loads(raw)
+        except Exception:
+            continue
+
+        candidates = []
+        if isinstance(payload, dict):
+            if isinstance(payload.get("@graph"), list):
+                candidates.extend(payload["@graph"])
+            candidates.append(payload)
+        elif isinstance(payload, list):
+            candidates.extend(payload)
+
+        for candidate in candidates:
+            if not isinstance(candidate, dict):
+                continue
+
+            candidate_type = candidate.get("@type")
+            if isinstance(candidate_type, list):
+                type_match = any(t in {"Article", "BlogPosting", "NewsArticle"} for t in candidate_type)
+            else:
+                type_match = candidate_type in {"Article", "BlogPosting", "NewsArticle"}
+
+            if type_match:
+                date_published = date_published or candidate.get("datePublished")
+                date_modified = date_modified or candidate.get("dateModified")
+
+        if date_published and date_modified:
+            break
+
+    return date_published, date_modified
+
+
+def legacy_extract_guide_page(html: str, url: str):
+    soup = BeautifulSoup(html, "lxml")
+    article = soup.select_one("article .entry-content") or soup.select_one(".entry-content") or soup
+
+    title_tag = soup.find("h1", class_=re.compile("entry-title")) or soup.find("h1")
+    article_title = normalize_text(title_tag.get_text(" ", strip=True)) if title_tag else ""
+
+    canonical_tag = soup.find("link", rel="canonical")
+    canonical_url = canonical_tag.get("href") if canonical_tag and canonical_tag.get("href") else url
+
+    paragraphs = []
+    for p in article.select("p"):
+        text = normalize_text(p.get_text(" ", strip=True))
+        if not text:
+            continue
+        if text.lower().startswith("read also"):
+            continue
+        paragraphs.append(text)
+
+    headings = [
+        normalize_text(h.get_text(" ", strip=True))
+        for h in article.select("h2, h3, h4")
+        if normalize_text(h.get_text(" ", strip=True))
+    ]
+
+    map_embed_urls = unique_in_order([urljoin(url, iframe.get("src")) for iframe in article.select("iframe[src]")])
+    date_published, date_modified = legacy_extract_article_dates(soup)
+
+    return {
+        "article_title": article_title,
+        "canonical_url": canonical_url,
+        "date_published": date_published,
+        "date_modified": date_modified,
+        "paragraphs": paragraphs,
+        "headings": headings,
+        "map_embed_urls": map_embed_urls,
+    }
+
+
+def time_it(fn, html, url):
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        fn(html, url)
+    return (time.perf_counter() - started) / ROUNDS
+
+
+def main():
+    for path in SOURCES:
+        html = path.read_text(encoding="utf-8")
+        url = "https://shemaegomez.com/"
+
+        legacy = legacy_extract_guide_page(html, url)
+        fast = extract_guide_page(html, url)
+        mismatched = [key for key in legacy if legacy[key] != fast[key]]
+
+        legacy_s = time_it(legacy_extract_guide_page, html, url)
+        fast_s = time_it(extract_guide_page, html, url)
+        print(f"{path.name} ({len(html):,} chars)")
+        print(f"  bs4 multi-pass: {legacy_s * 1000:.1f} ms/page")
+        print(f"  lxml single-pass: {fast_s * 1000:.1f} ms/page ({legacy_s / fast_s:.1f}x)")
+        print(f"  identical output: {not mismatched}" + (f" (differs: {', '.join(mismatched)})" if mismatched else ""))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+import json
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from journey_table import JOURNEY_TABLE, PRD_JSON, build_journey_table, load_journey_table, lookup_journeys, write_journey_table
+
+
+QUERY_COUNT = 100_000
+
+
+def main():
+    payload = json.loads(PRD_JSON.read_text(encoding="utf-8"))
+
+    worker_counts = sorted({1, 2, 4, os.cpu_count() or 1})
+    for workers in worker_counts:
+        started = time.perf_counter()
+        table = build_journey_table(payload, workers=workers)
+        elapsed = time.perf_counter() - started
+        print(f"rebuild workers={workers}: {elapsed:.2f}s")
+
+    write_journey_table(table)
+    started = time.perf_counter()
+    table = load_journey_table(JOURNEY_TABLE)
+    print(f"load: {time.perf_counter() - started:.3f}s")
+
+    rng = random.Random(17)
+    stops = table["stops"]
+    queries = [(rng.choice(stops), rng.choice(stops)) for _ in range(QUERY_COUNT)]
+    started = time.perf_counter()
+    for origin, destination in queries:
+        lookup_journeys(table, origin, destination)
+    elapsed = time.perf_counter() - started
+    print(f"lookup: {QUERY_COUNT / elapsed:,.0f} queries/s ({elapsed / QUERY_COUNT * 1e6:.1f} us/query)")
+
+
+if __name__ == "__main__":
+    main()
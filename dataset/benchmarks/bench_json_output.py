@@ -0,0 +1,60 @@
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from json_output import available_backends, dumps, write_json
+
+
+OUTPUT_DIR = Path(__file__).resolve().parent.parent / "output"
+FILES = [
+    "prd_routes_dataset.json",
+    "iloilo_routes_index.json",
+    "iloilo_full_guides.json",
+    "iloilo_route_polylines.geojson",
+    "iloilo_full_guides_polylines.geojson",
+]
+REPEATS = 5
+
+
+def timed(fn):
+    started = time.perf_counter()
+    for _ in range(REPEATS):
+        fn()
+    elapsed = (time.perf_counter() - started) / REPEATS
+    # Peak memory from a separate run: tracemalloc slows the pure-Python encoder.
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    print(f"backends: {', '.join(available_backends())}")
+    with tempfile.TemporaryDirectory() as tmp:
+        target = Path(tmp) / "out.json"
+        for name in FILES:
+            data = json.loads((OUTPUT_DIR / name).read_text(encoding="utf-8"))
+            baseline = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+            print(name)
+
+            elapsed, peak = timed(lambda: target.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8"))
+            print(f"  {'json.dumps + write_text':<24} {elapsed * 1000:8.2f} ms  {len(baseline):>9,} bytes  peak {peak / 1024:8.0f} KiB")
+
+            for backend in available_backends():
+                for pretty in (True, False):
+                    raw = dumps(data, pretty=pretty, backend=backend)
+                    if pretty:
+                        assert raw == baseline, f"{backend} pretty output differs from json.dumps"
+                    elapsed, peak = timed(lambda: write_json(target, data, pretty=pretty, backend=backend))
+                    label = f"{backend} {'pretty' if pretty else 'compact'}"
+                    print(f"  {label:<24} {elapsed * 1000:8.2f} ms  {len(raw):>9,} bytes  peak {peak / 1024:8.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+import copy
+import json
+import sys
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from polyline_model import CANONICAL_KEY, SWAPPED_KEY, CompactPolyline, compact_polyline_dict
+
+
+INDEX_JSON = Path(__file__).resolve().parent.parent / "output" / "iloilo_routes_index.json"
+REPEAT = 20
+
+
+def traced_bytes(build):
+    tracemalloc.start()
+    kept = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current, kept
+
+
+def main():
+    payload = json.loads(INDEX_JSON.read_text(encoding="utf-8"))
+    polylines = [p for route in payload["routes"] for p in route.get("map_polylines", [])] * REPEAT
+    points = sum(len(p.get(CANONICAL_KEY) or p.get(SWAPPED_KEY) or []) for p in polylines)
+    print(f"{len(polylines)} polylines, {points:,} points ({REPEAT}x the route index)")
+
+    legacy = [
+        {
+            "name": p.get("name"),
+            "point_count": p.get("point_count"),
+            SWAPPED_KEY: [[lng, lat] for lat, lng in p[CANONICAL_KEY]],
+            CANONICAL_KEY: [[lat, lng] for lat, lng in p[CANONICAL_KEY]],
+        }
+        for p in polylines
+    ]
+
+    both_bytes, _ = traced_bytes(lambda: copy.deepcopy(legacy))
+    one_bytes, _ = traced_bytes(lambda: [compact_polyline_dict(p) for p in legacy])
+    compact_bytes, compact = traced_bytes(lambda: [CompactPolyline.from_dict(p) for p in legacy])
+
+    print(f"dicts, both orders:  {both_bytes / 1e6:8.2f} MB")
+    print(f"dicts, one order:    {one_bytes / 1e6:8.2f} MB ({both_bytes / one_bytes:.1f}x smaller)")
+    print(f"CompactPolyline:     {compact_bytes / 1e6:8.2f} MB ({both_bytes / compact_bytes:.1f}x smaller)")
+    print(f"  coordinate buffers {sum(p.nbytes() for p in compact) / 1e6:8.2f} MB")
+
+    both_json = len(json.dumps(legacy, separators=(",", ":")))
+    one_json = len(json.dumps([p.to_dict() for p in compact], separators=(",", ":")))
+    print(f"JSON size: {both_json / 1e6:.2f} MB -> {one_json / 1e6:.2f} MB")
+
+    assert all(list(c.lng_lat) == [tuple(pair) for pair in p[SWAPPED_KEY]] for c, p in zip(compact, legacy))
+
+
+if __name__ == "__main__":
+    main()
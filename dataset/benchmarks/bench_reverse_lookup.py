@@ -0,0 +1,61 @@
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from polyline_model import CompactPolyline
+from reverse_lookup import DEFAULT_RADIUS_M, PRD_JSON, build_lookup_index, reverse_lookup
+from route_geometry import haversine_m
+
+
+POINTS = 20000
+SCAN_POINTS = 200
+
+
+def scan_point(routes, lat, lng, radius_m=DEFAULT_RADIUS_M):
+    # RouteMatcher-style: haversine to every stop and polyline vertex of every route.
+    near = []
+    for route in routes:
+        best = None
+        coords = [(s["lat"], s["lng"]) for s in route.get("stops", []) if s.get("lat") is not None]
+        for polyline in route.get("map_polylines", []):
+            coords.extend(CompactPolyline.from_dict(polyline).lat_lng)
+        for c_lat, c_lng in coords:
+            d = haversine_m(lat, lng, c_lat, c_lng)
+            if best is None or d < best:
+                best = d
+        if best is not None and best <= radius_m:
+            near.append(route.get("route_number"))
+    return near
+
+
+def main():
+    payload = json.loads(PRD_JSON.read_text(encoding="utf-8"))
+    rng = np.random.default_rng(25)
+    lats = rng.uniform(10.68, 10.75, POINTS)
+    lngs = rng.uniform(122.50, 122.59, POINTS)
+
+    started = time.perf_counter()
+    for lat, lng in zip(lats[:SCAN_POINTS], lngs[:SCAN_POINTS]):
+        scan_point(payload["routes"], lat, lng)
+    per_point = (time.perf_counter() - started) / SCAN_POINTS
+    print(f"per-point scan:      {per_point * 1000:8.3f} ms/point  (~{per_point * POINTS:.1f}s for {POINTS:,} points)")
+
+    started = time.perf_counter()
+    index = build_lookup_index(payload)
+    print(f"index build:         {(time.perf_counter() - started) * 1000:8.1f} ms  ({len(index['ax']):,} segments)")
+
+    for workers in sorted({1, 2, 4, os.cpu_count() or 1}):
+        started = time.perf_counter()
+        results = reverse_lookup(index, lats, lngs, workers=workers)
+        elapsed = time.perf_counter() - started
+        print(f"batch, {workers} worker(s): {elapsed * 1000 / POINTS:8.3f} ms/point  ({elapsed:.2f}s, {len(results):,} points)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from route_graph import PRD_JSON, astar, build_route_graph, ch_query, contract_graph, dijkstra
+
+
+QUERIES = 2000
+SYNTHETIC_ROUTES = 100
+POINTS_PER_ROUTE = 120
+STOPS_PER_ROUTE = 30
+
+
+def synthetic_payload(seed=25):
+    # Random-walk routes over a ~12 km box around Iloilo City, stops every few vertices.
+    rng = random.Random(seed)
+    routes = []
+    for number in range(1, SYNTHETIC_ROUTES + 1):
+        lat, lng = rng.uniform(10.66, 10.76), rng.uniform(122.50, 122.60)
+        heading_lat, heading_lng = rng.uniform(-1, 1), rng.uniform(-1, 1)
+        coords = []
+        for _ in range(POINTS_PER_ROUTE):
+            heading_lat += rng.uniform(-0.4, 0.4)
+            heading_lng += rng.uniform(-0.4, 0.4)
+            scale = 0.0008 / max(1e-9, (heading_lat**2 + heading_lng**2) ** 0.5)
+            lat += heading_lat * scale
+            lng += heading_lng * scale
+            coords.append([lat, lng])
+        step = POINTS_PER_ROUTE // STOPS_PER_ROUTE
+        stops = [
+            {"stop_order": i + 1, "stop_name": f"R{number} S{i + 1}", "lat": c[0], "lng": c[1], "has_coordinates": True}
+            for i, c in enumerate(coords[::step])
+        ]
+        routes.append(
+            {
+                "route_number": number,
+                "stops": stops,
+                "map_polylines": [{"name": f"R{number}", "coordinates_lat_lng": coords}],
+            }
+        )
+    return {"routes": routes}
+
+
+def run_queries(label, fn, pairs, expected=None):
+    started = time.perf_counter()
+    costs = [fn(s, t)[0] for s, t in pairs]
+    elapsed = time.perf_counter() - started
+    print(f"  {label:<24} {elapsed * 1000 / len(pairs):>8.3f} ms/query  {len(pairs) / elapsed:>10,.0f} queries/s")
+    if expected is not None:
+        mismatched = sum(1 for a, b in zip(costs, expected) if (a is None) != (b is None) or (a is not None and abs(a - b) > 1e-6))
+        assert mismatched == 0, f"{label}: {mismatched} costs differ from Dijkstra"
+    return costs
+
+
+def bench(name, payload):
+    started = time.perf_counter()
+    graph = build_route_graph(payload)
+    built = time.perf_counter()
+    ch = contract_graph(graph)
+    contracted = time.perf_counter()
+
+    nodes = len(graph["node_route"])
+    print(f"{name}: {nodes:,} nodes, {len(graph['targets']):,} edges, {ch['shortcut_count']:,} shortcuts")
+    print(f"  build {built - started:.2f}s, contraction {contracted - built:.2f}s")
+
+    rng = random.Random(41)
+    pairs = [(rng.randrange(nodes), rng.randrange(nodes)) for _ in range(QUERIES)]
+    expected = run_queries("Dijkstra", lambda s, t: dijkstra(graph, s, t), pairs)
+    run_queries("A* (haversine)", lambda s, t: astar(graph, s, t), pairs, expected)
+    run_queries("contraction hierarchies", lambda s, t: ch_query(ch, s, t), pairs, expected)
+    print(f"  reachable pairs: {sum(1 for c in expected if c is not None)} / {len(pairs)}")
+
+
+def main():
+    if PRD_JSON.exists():
+        bench("prd_routes_dataset.json", json.loads(PRD_JSON.read_text(encoding="utf-8")))
+    bench(f"synthetic ({SYNTHETIC_ROUTES} routes)", synthetic_payload())
+
+
+if __name__ == "__main__":
+    main()
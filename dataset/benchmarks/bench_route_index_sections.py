@@ -0,0 +1,108 @@
+import sys
+import time
+from pathlib import Path
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup, Tag
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from guide_extraction import normalize_text
+from route_index_sections import ROUTE_HEADER_PATTERN, parse_route_number, split_route_sections
+
+
+SOURCE_HTML = Path(__file__).resolve().parent.parent / "output" / "route_index_source.html"
+BASE_URL = "https://shemaegomez.com/iloilo-city-jeepney-routes/"
+ROUNDS = 20
+
+
+def legacy_split_route_sections(html: str, base_url: str):
+    soup = BeautifulSoup(html, "lxml")
+    article = soup.select_one("article .entry-content") or soup.select_one(".entry-content") or soup
+
+    routes = []
+    for h2 in article.find_all("h2", class_="wp-block-heading"):
+        route_title = normalize_text(h2.get_text(" ", strip=True))
+        if not ROUTE_HEADER_PATTERN.match(route_title):
+            continue
+
+        route_data = {
+            "route_number": parse_route_number(route_title),
+            "route_title": route_title,
+            "section_id": h2.get("id"),
+            "source_url": base_url,
+            "stop_description": None,
+            "stops": [],
+            "full_guide_url": None,
+            "map_embed_url": None,
+            "map_mid": None,
+            "map_kml_url": None,
+            "map_polylines": [],
+            "map_polyline_count": 0,
+            "map_point_count": 0,
+            "map_scrape_error": None,
+            "faq_url": None,
+        }
+
+        node = h2.next_sibling
+        while node:
+            if isinstance(node, Tag):
+                if node.name == "h2":
+                    next_title = normalize_text(node.get_text(" ", strip=True))
+                    if ROUTE_HEADER_PATTERN.match(next_title):
+                        break
+
+                if not route_data["full_guide_url"] and node.name in {"p", "h3", "h4"}:
+                    node_text = normalize_text(node.get_text(" ", strip=True)).lower()
+                    if "full guide" in node_text:
+                        anchor = node.find("a", href=True)
+                        if anchor:
+                            route_data["full_guide_url"] = urljoin(base_url, anchor["href"])
+
+                if node.name == "p":
+                    paragraph_text = normalize_text(node.get_text(" ", strip=True))
+                    lowered = paragraph_text.lower()
+
+                    if paragraph_text and not lowered.startswith("full guide") and not lowered.startswith("read also") and not route_data["stop_description"]:
+                        route_data["stop_description"] = paragraph_text
+
+                iframe = node.find("iframe", src=True)
+                if iframe and not route_data["map_embed_url"]:
+                    route_data["map_embed_url"] = urljoin(base_url, iframe["src"])
+
+                if node.name in {"h4", "p"}:
+                    node_text = normalize_text(node.get_text(" ", strip=True)).lower()
+                    if "faq" in node_text and not route_data["faq_url"]:
+                        faq_anchor = node.find("a", href=True)
+                        if faq_anchor:
+                            route_data["faq_url"] = urljoin(base_url, faq_anchor["href"])
+
+            node = node.next_sibling
+
+        routes.append(route_data)
+
+    return routes
+
+
+def time_it(fn, html):
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        fn(html, BASE_URL)
+    return (time.perf_counter() - started) / ROUNDS
+
+
+def main():
+    html = SOURCE_HTML.read_text(encoding="utf-8")
+
+    legacy = legacy_split_route_sections(html, BASE_URL)
+    fast = split_route_sections(html, BASE_URL)
+    print(f"sections: legacy {len(legacy)}, single-pass {len(fast)}, identical: {legacy == fast}")
+
+    legacy_s = time_it(legacy_split_route_sections, html)
+    fast_s = time_it(split_route_sections, html)
+    print(f"bs4 sibling walk: {legacy_s * 1000:.1f} ms/page ({len(html) / legacy_s / 1e6:.2f} MB/s)")
+    print(f"single-pass splitter: {fast_s * 1000:.1f} ms/page ({len(html) / fast_s / 1e6:.2f} MB/s, {legacy_s / fast_s:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
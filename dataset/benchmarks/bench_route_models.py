@@ -0,0 +1,72 @@
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from route_models import (
+    FULL_GUIDES_JSON,
+    INDEX_JSON,
+    PRD_JSON,
+    FullGuide,
+    PrdRoute,
+    RouteIndexEntry,
+    decode_items,
+    msgspec,
+    orjson,
+)
+
+
+INPUTS = [
+    (PRD_JSON, PrdRoute, "routes"),
+    (INDEX_JSON, RouteIndexEntry, "routes"),
+    (FULL_GUIDES_JSON, FullGuide, "guides"),
+]
+REPEATS = 10
+
+
+# Dict baselines for every parser available; decode_items uses the last one, so
+# the gap between that row and the models is what the models cost or save.
+PARSERS = [("json.loads", json.loads)]
+if orjson is not None:
+    PARSERS.append(("orjson", orjson.loads))
+if msgspec is not None:
+    PARSERS.append(("msgspec", msgspec.json.decode))
+
+
+def decode_dicts(raw, key, loads=json.loads):
+    payload = loads(raw)
+    return payload, payload.pop(key, [])
+
+
+def measure(fn):
+    started = time.perf_counter()
+    for _ in range(REPEATS):
+        fn()
+    elapsed = (time.perf_counter() - started) / REPEATS
+    # Retained memory of one decoded result, measured apart from the timing runs.
+    gc.collect()
+    tracemalloc.start()
+    result = fn()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return elapsed, retained, peak
+
+
+def main():
+    for path, cls, key in INPUTS:
+        raw = path.read_bytes()
+        print(f"{path.name} ({len(raw):,} bytes) -> {cls.__name__}")
+        cases = [(f"dicts ({name})", lambda loads=loads: decode_dicts(raw, key, loads)) for name, loads in PARSERS]
+        cases.append((f"slots models ({PARSERS[-1][0]})", lambda: decode_items(raw, cls, key)))
+        for label, fn in cases:
+            elapsed, retained, peak = measure(fn)
+            print(f"  {label:<24} {elapsed * 1000:8.2f} ms  retained {retained / 1024:8.0f} KiB  peak {peak / 1024:8.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
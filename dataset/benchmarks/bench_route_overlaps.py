@@ -0,0 +1,78 @@
+import math
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from route_geometry import EARTH_RADIUS_M
+from route_overlaps import candidate_pairs, find_route_overlaps, route_segments
+
+
+ROUTE_COUNTS = [100, 200, 400]
+NAIVE_ROUTES = 20
+BLOCKS = 40
+BLOCK_M = 120.0
+STEPS = 40
+POINTS_PER_BLOCK = 4
+JITTER_M = 3.0
+
+
+def synthetic_routes(count, seed=25):
+    # Random walks on a street lattice: routes share streets (corridors) and cross
+    # at intersections, like jeepneys funnelling through a city centre.
+    rng = random.Random(seed)
+    k_lat = math.pi / 180.0 * EARTH_RADIUS_M
+    k_lng = math.cos(math.radians(10.7)) * k_lat
+    routes = []
+    for number in range(1, count + 1):
+        x, y = rng.randrange(BLOCKS), rng.randrange(BLOCKS)
+        dx, dy = rng.choice([(1, 0), (-1, 0), (0, 1), (0, -1)])
+        coords = []
+        for _ in range(STEPS):
+            if rng.random() < 0.3:
+                dx, dy = rng.choice([(dy, dx), (-dy, -dx)])
+            if not (0 <= x + dx < BLOCKS and 0 <= y + dy < BLOCKS):
+                dx, dy = -dx, -dy
+            for k in range(POINTS_PER_BLOCK):
+                px = (x + dx * k / POINTS_PER_BLOCK) * BLOCK_M + rng.uniform(-JITTER_M, JITTER_M)
+                py = (y + dy * k / POINTS_PER_BLOCK) * BLOCK_M + rng.uniform(-JITTER_M, JITTER_M)
+                coords.append([round(10.7 + py / k_lat, 6), round(122.55 + px / k_lng, 6)])
+            x, y = x + dx, y + dy
+        routes.append({"route_number": number, "map_polylines": [{"name": f"R{number}", "coordinates_lat_lng": coords}]})
+    return routes
+
+
+def main():
+    routes = synthetic_routes(NAIVE_ROUTES)
+    started = time.perf_counter()
+    naive = find_route_overlaps(routes, cell_m=1e9)
+    naive_s = time.perf_counter() - started
+    started = time.perf_counter()
+    grid = find_route_overlaps(routes)
+    grid_s = time.perf_counter() - started
+    assert naive == grid, "grid broad phase found different overlaps than all-pairs"
+    segments = route_segments(routes)
+    n = len(segments["route"])
+    print(f"{NAIVE_ROUTES} routes, {n:,} segments: all-pairs {naive_s:.2f}s, grid {grid_s:.3f}s, identical results")
+
+    for count in ROUTE_COUNTS:
+        routes = synthetic_routes(count)
+        segments = route_segments(routes)
+        started = time.perf_counter()
+        i, _ = candidate_pairs(segments)
+        broad_s = time.perf_counter() - started
+        started = time.perf_counter()
+        overlaps = find_route_overlaps(routes)
+        total_s = time.perf_counter() - started
+        n = len(segments["route"])
+        all_pairs = n * (n - 1) // 2
+        print(
+            f"{count} routes, {n:,} segments: {len(i):,} candidate pairs of {all_pairs:,} "
+            f"(broad phase {broad_s:.2f}s), {len(overlaps):,} route pairs meet, total {total_s:.2f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+import gc
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from dataset_shards import MANIFEST_NAME, PRD_JSON, ShardedDataset, write_shards
+from json_output import write_json
+from route_overlaps import find_route_overlaps
+from stable_ids import load_id_map
+from stop_registry import build_stop_registry
+
+
+VIEWED_ROUTES = 3
+REPEATS = 20
+
+
+def measure(label, fn):
+    started = time.perf_counter()
+    for _ in range(REPEATS):
+        fn()
+    elapsed = (time.perf_counter() - started) / REPEATS
+
+    # Peak of a single cold call, so earlier repeats waiting for the collector do not count.
+    gc.collect()
+    tracemalloc.start()
+    result = fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<34} {elapsed * 1000:8.2f} ms  peak {peak / 1024:9.1f} KiB")
+    return result
+
+
+def main():
+    payload = json.loads(PRD_JSON.read_text(encoding="utf-8"))
+    # Older payloads predate the dataset-wide lists; build them so the full JSON is
+    # the size a current build writes.
+    if "stop_registry" not in payload:
+        payload["stop_registry"] = build_stop_registry(payload["routes"], load_id_map())
+        payload["place_count"] = len(payload["stop_registry"])
+    if "route_overlaps" not in payload:
+        payload["route_overlaps"] = find_route_overlaps(payload["routes"])
+    numbers = [r["route_number"] for r in payload["routes"]][:VIEWED_ROUTES]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        full_json = Path(tmp) / "full.json"
+        write_json(full_json, payload)
+        shard_dir = Path(tmp) / "shards"
+        write_shards(payload, shard_dir)
+        manifest_bytes = (shard_dir / MANIFEST_NAME).stat().st_size
+        print(
+            f"{len(payload['routes'])} routes, {len(payload['stop_registry'])} places: "
+            f"full JSON {full_json.stat().st_size:,} bytes, manifest {manifest_bytes:,} bytes"
+        )
+
+        measure("full JSON load (route list)", lambda: json.loads(full_json.read_text(encoding="utf-8"))["routes"])
+        measure("manifest load (route list)", lambda: ShardedDataset(shard_dir).routes)
+
+        def view_routes():
+            dataset = ShardedDataset(shard_dir)
+            return [dataset.route(n) for n in numbers]
+
+        routes = measure(f"manifest + {VIEWED_ROUTES} route shards", view_routes)
+        assert routes == [r for r in payload["routes"] if r["route_number"] in numbers]
+
+        places = measure("manifest + stop registry", lambda: ShardedDataset(shard_dir).stop_registry())
+        assert places == payload["stop_registry"]
+
+        dataset = ShardedDataset(shard_dir)
+        for n in numbers * REPEATS:
+            dataset.route(n)
+        print(f"repeat views: {dataset.cache_info()}")
+
+
+if __name__ == "__main__":
+    main()
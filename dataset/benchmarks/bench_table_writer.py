@@ -0,0 +1,89 @@
+import json
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sql_common import insert_line
+from table_writer import table_writers_from_ddl
+
+
+OUTPUT_DIR = Path(__file__).resolve().parent.parent / "output"
+REPEAT = 50
+
+DDL = """
+CREATE TABLE route_map_points (
+    id INTEGER PRIMARY KEY,
+    polyline_id INTEGER NOT NULL,
+    point_order INTEGER NOT NULL,
+    lat REAL,
+    lng REAL
+);
+CREATE TABLE full_guide_paragraphs (
+    id INTEGER PRIMARY KEY,
+    guide_id INTEGER NOT NULL,
+    paragraph_order INTEGER NOT NULL,
+    paragraph_text TEXT
+);
+"""
+
+
+def load_rows():
+    index_payload = json.loads((OUTPUT_DIR / "iloilo_routes_index.json").read_text(encoding="utf-8"))
+    full_payload = json.loads((OUTPUT_DIR / "iloilo_full_guides.json").read_text(encoding="utf-8"))
+
+    points = []
+    for route in index_payload["routes"]:
+        for polyline_id, polyline in enumerate(route.get("map_polylines", []), start=1):
+            for order, (lat, lng) in enumerate(polyline["coordinates_lat_lng"], start=1):
+                points.append([len(points) + 1, polyline_id, order, lat, lng])
+
+    paragraphs = []
+    for guide_id, guide in enumerate(full_payload["guides"], start=1):
+        for order, text in enumerate(guide.get("paragraphs", []), start=1):
+            paragraphs.append([len(paragraphs) + 1, guide_id, order, text])
+
+    return {"route_map_points": repeat_rows(points), "full_guide_paragraphs": repeat_rows(paragraphs)}
+
+
+def repeat_rows(rows):
+    return [[n * len(rows) + row[0]] + row[1:] for n in range(REPEAT) for row in rows]
+
+
+def rate(label, row_count, fn, runs=3):
+    elapsed = float("inf")
+    for _ in range(runs):
+        started = time.perf_counter()
+        fn()
+        elapsed = min(elapsed, time.perf_counter() - started)
+    print(f"  {label:<24} {row_count / elapsed:>12,.0f} rows/s")
+
+
+def main():
+    writers = table_writers_from_ddl(DDL)
+    tables = load_rows()
+
+    for table, rows in tables.items():
+        writer = writers[table]
+        print(f"{table}: {len(rows):,} rows")
+
+        assert [insert_line(table, writer.columns, r) for r in rows[:1000]] == writer.insert_many(rows[:1000])
+
+        rate("insert_line (before)", len(rows), lambda: [insert_line(table, writer.columns, r) for r in rows])
+        rate("TableWriter.insert", len(rows), lambda: [writer.insert(r) for r in rows])
+        rate("TableWriter.insert_many", len(rows), lambda: writer.insert_many(rows))
+        rate("COPY text rows", len(rows), lambda: writer.copy_rows(rows))
+
+        def load():
+            db = sqlite3.connect(":memory:")
+            db.executescript(DDL)
+            writer.executemany(db.cursor(), rows)
+            db.close()
+
+        rate("executemany (sqlite3)", len(rows), load)
+
+
+if __name__ == "__main__":
+    main()
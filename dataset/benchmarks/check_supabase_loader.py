@@ -0,0 +1,98 @@
+import json
+import math
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from polyline_model import CompactPolyline
+from stable_ids import load_id_map
+from supabase_loader import DATABASE_URL_ENV, PRD_JSON, fetch_dataset, load_payload, open_pool
+
+
+# Stop coordinates are REAL columns (float4), so they come back rounded to ~7 digits.
+STOP_COORD_TOLERANCE = 1e-4
+
+
+def _close(a, b):
+    if a is None or b is None:
+        return a is None and b is None
+    return math.isclose(a, b, abs_tol=STOP_COORD_TOLERANCE)
+
+
+def compare_route(expected: dict, served: dict):
+    problems = []
+    for field in ("route_number", "route_code", "route_name", "fare_min_php", "fare_max_php", "fare_text", "stop_count"):
+        want = expected.get(field)
+        got = served.get(field)
+        if isinstance(want, float) or isinstance(got, float):
+            same = _close(want, got)
+        else:
+            same = want == got
+        if not same:
+            problems.append(f"{field}: expected {want!r}, got {got!r}")
+
+    want_stops = expected.get("stops", [])
+    got_stops = served.get("stops", [])
+    if len(want_stops) != len(got_stops):
+        problems.append(f"stops: expected {len(want_stops)}, got {len(got_stops)}")
+    for want, got in zip(want_stops, got_stops):
+        if (
+            want.get("stop_order") != got.get("stop_order")
+            or want.get("stop_name") != got.get("stop_name")
+            or not _close(want.get("lat"), got.get("lat"))
+            or not _close(want.get("lng"), got.get("lng"))
+        ):
+            problems.append(f"stop {want.get('stop_order')}: expected {want!r}, got {got!r}")
+
+    want_lines = [CompactPolyline.from_dict(p) for p in expected.get("map_polylines", [])]
+    got_lines = served.get("map_polylines", [])
+    if len(want_lines) != len(got_lines):
+        problems.append(f"map_polylines: expected {len(want_lines)}, got {len(got_lines)}")
+    for i, (want, got) in enumerate(zip(want_lines, got_lines)):
+        if want.name != got.get("name") or want.lat_lng.to_list() != got.get("coordinates_lat_lng"):
+            problems.append(f"map_polylines[{i}] differs")
+    return problems
+
+
+def main():
+    # Loads the PRD payload into a scratch database and reads it back through the
+    # prd_dataset_json view. Loads twice to check a reload over existing data.
+    dsn = os.environ.get(DATABASE_URL_ENV)
+    if not dsn:
+        raise SystemExit(f"Set {DATABASE_URL_ENV} to a scratch Postgres database")
+
+    payload = json.loads(PRD_JSON.read_text(encoding="utf-8"))
+    pool = open_pool(dsn, max_size=1)
+    try:
+        for attempt in (1, 2):
+            metrics = load_payload(pool, payload, load_id_map())
+            served = fetch_dataset(pool) or {}
+            print(f"load {attempt}: {metrics['counters']}")
+    finally:
+        pool.close()
+
+    served_routes = {r.get("route_number"): r for r in served.get("routes", [])}
+    problems = []
+    for field in ("generated_at_utc", "route_count", "routes_with_stop_coordinates", "routes_with_fare"):
+        if served.get(field) != payload.get(field):
+            problems.append(f"{field}: expected {payload.get(field)!r}, got {served.get(field)!r}")
+    if len(served_routes) != len(payload.get("routes", [])):
+        problems.append(f"routes: expected {len(payload.get('routes', []))}, got {len(served_routes)}")
+    for route in payload.get("routes", []):
+        served_route = served_routes.get(route.get("route_number"))
+        if served_route is None:
+            problems.append(f"ROUTE {route.get('route_number')}: missing from the view")
+            continue
+        problems.extend(f"ROUTE {route.get('route_number')}: {p}" for p in compare_route(route, served_route))
+
+    for problem in problems[:20]:
+        print(f"  {problem}")
+    if problems:
+        raise SystemExit(f"{len(problems)} differences between {PRD_JSON.name} and the view")
+    print(f"View matches {PRD_JSON.name}: {len(served_routes)} routes")
+
+
+if __name__ == "__main__":
+    main()
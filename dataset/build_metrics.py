@@ -0,0 +1,157 @@
+import os
+import platform
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+from json_output import write_json
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+PROFILE_ENV = "ROUTE25_PROFILE"
+
+
+def peak_rss_bytes():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in kilobytes on Linux and bytes on macOS.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def new_build_metrics(job: str):
+    return {
+        "job": job,
+        "started_at_utc": datetime.now(timezone.utc).isoformat(),
+        "python_version": platform.python_version(),
+        "platform": platform.platform(),
+        "_started": time.perf_counter(),
+        "_lap": time.perf_counter(),
+        "stages": [],
+        "fetches": [],
+        "counters": {},
+    }
+
+
+@contextmanager
+def timed_stage(metrics: dict, name: str):
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        ended = time.perf_counter()
+        metrics["stages"].append(
+            {
+                "name": name,
+                "offset_s": round(started - metrics["_started"], 6),
+                "duration_s": round(ended - started, 6),
+                "peak_rss_bytes": peak_rss_bytes(),
+            }
+        )
+
+
+def lap(metrics: dict, name: str):
+    # For long linear scripts: closes a stage covering everything since the previous lap.
+    now = time.perf_counter()
+    metrics["stages"].append(
+        {
+            "name": name,
+            "offset_s": round(metrics["_lap"] - metrics["_started"], 6),
+            "duration_s": round(now - metrics["_lap"], 6),
+            "peak_rss_bytes": peak_rss_bytes(),
+        }
+    )
+    metrics["_lap"] = now
+
+
+def record_fetch(
+    metrics: dict, key, url, latency_s=None, parse_s=None, bytes_downloaded=0, cache_hit=False, error=None, local=False
+):
+    # local: read from disk ($ROUTE25_KML_DIR) rather than requested, so it has no
+    # network latency and stays out of the request statistics.
+    if metrics is None:
+        return
+    metrics["fetches"].append(
+        {
+            "key": key,
+            "url": url,
+            "latency_ms": None if latency_s is None else round(latency_s * 1000, 3),
+            "parse_ms": None if parse_s is None else round(parse_s * 1000, 3),
+            "bytes": bytes_downloaded,
+            "cache_hit": cache_hit,
+            "local": local,
+            "error": error,
+        }
+    )
+
+
+def count(metrics: dict, name: str, value=1):
+    metrics["counters"][name] = metrics["counters"].get(name, 0) + value
+
+
+def build_report(metrics: dict):
+    fetches = metrics["fetches"]
+    network = [f for f in fetches if not f["cache_hit"] and not f.get("local") and f["latency_ms"] is not None]
+    local = [f for f in fetches if f.get("local")]
+    latencies = sorted(f["latency_ms"] for f in network)
+
+    report = {k: v for k, v in metrics.items() if not k.startswith("_")}
+    report["finished_at_utc"] = datetime.now(timezone.utc).isoformat()
+    report["total_s"] = round(time.perf_counter() - metrics["_started"], 6)
+    report["peak_rss_bytes"] = peak_rss_bytes()
+    report["fetch_summary"] = {
+        "requests": len(network),
+        "cache_hits": sum(1 for f in fetches if f["cache_hit"]),
+        "local_files": len(local),
+        "local_bytes": sum(f["bytes"] or 0 for f in local),
+        "errors": sum(1 for f in fetches if f["error"]),
+        "bytes_downloaded": sum(f["bytes"] or 0 for f in network),
+        "latency_ms_total": round(sum(latencies), 3),
+        "latency_ms_p50": latencies[len(latencies) // 2] if latencies else None,
+        "latency_ms_max": latencies[-1] if latencies else None,
+        "parse_ms_total": round(sum(f["parse_ms"] or 0 for f in fetches), 3),
+    }
+    return report
+
+
+def write_build_report(metrics: dict, path: Path):
+    report = build_report(metrics)
+    write_json(path, report)
+    return report
+
+
+@contextmanager
+def profiling(output_stem: Path):
+    # Opt-in: ROUTE25_PROFILE=cprofile writes <stem>.prof, ROUTE25_PROFILE=pyinstrument writes <stem>.html.
+    mode = (os.environ.get(PROFILE_ENV) or "").strip().lower()
+
+    if mode == "cprofile":
+        import cProfile
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            profiler.dump_stats(str(output_stem) + ".prof")
+            print(f"Saved: {output_stem}.prof")
+    elif mode == "pyinstrument":
+        from pyinstrument import Profiler
+
+        profiler = Profiler()
+        profiler.start()
+        try:
+            yield
+        finally:
+            profiler.stop()
+            Path(str(output_stem) + ".html").write_text(profiler.output_html(), encoding="utf-8")
+            print(f"Saved: {output_stem}.html")
+    else:
+        yield
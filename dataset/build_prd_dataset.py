@@ -1,6 +1,8 @@
 import json
-import math
+import os
 import re
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from urllib.parse import urlparse, parse_qs
 
@@ -8,16 +10,52 @@ import pandas as pd
 import requests
 from bs4 import BeautifulSoup
 
+from build_metrics import count, new_build_metrics, profiling, record_fetch, timed_stage, write_build_report
+from dataset_delta import publish_delta
+from dataset_shards import write_shards
+from dataset_sources import global_route_number, id_namespaces, load_sources, partition_summary, route_key, source_inputs
+from dataset_snapshot import snapshot_statements, write_snapshot
+from fare_engine import annotate_route_estimates, load_fare_matrix
+from fare_extraction import best_fare, extract_guide_fares
+from guide_extraction import normalize_text
+from json_output import write_json
+from polyline_model import compact_polyline_dict
+from prd_schema import (
+    PRD_DATASET_VIEW,
+    PRD_DATASET_VIEW_REFRESH_SQL,
+    PRD_GEOMETRY_SCHEMA,
+    PRD_META_COLUMNS,
+    PRD_ROUTE_COLUMNS,
+    PRD_SCHEMA,
+    PRD_STOP_COLUMNS,
+    create_table_sql,
+    prd_meta_values,
+    prd_route_values,
+    prd_stop_values,
+)
+from route_overlaps import find_route_overlaps
+from route_topology import annotate_route_topology
+from sql_common import sql_value, upsert_line, upsert_select_line
+from stable_ids import assign_id, load_id_map, save_id_map
+from stop_registry import build_stop_registry
+from supabase_loader import index_statements, payload_rows, view_statements
+from table_writer import table_writers_from_ddl
+from validate_dataset import VALIDATION_REPORT, failure_message, validate_dataset
+
 
 ROOT = Path(__file__).resolve().parent
 OUTPUT_DIR = ROOT / "output"
 
-INDEX_JSON = OUTPUT_DIR / "iloilo_routes_index.json"
-FULL_GUIDES_JSON = OUTPUT_DIR / "iloilo_full_guides.json"
-
 PRD_JSON = OUTPUT_DIR / "prd_routes_dataset.json"
 PRD_SUMMARY_CSV = OUTPUT_DIR / "prd_routes_summary.csv"
 PRD_SQL = OUTPUT_DIR / "prd_route25_dump.sql"
+PRD_SQL_UPSERT = OUTPUT_DIR / "prd_route25_upsert.sql"
+PRD_BUILD_REPORT = OUTPUT_DIR / "prd_build_report.json"
+
+# ROUTE25_KML_DIR: read <mid>.kml from a local directory instead of Google (offline rebuilds).
+# ROUTE25_BUILD_WORKERS: processes for route assembly; defaults to the CPU count.
+KML_DIR_ENV = "ROUTE25_KML_DIR"
+BUILD_WORKERS_ENV = "ROUTE25_BUILD_WORKERS"
 
 HEADERS = {
     "User-Agent": (
@@ -28,46 +66,12 @@ HEADERS = {
 }
 
 
-def normalize_text(text: str) -> str:
-    if not text:
-        return ""
-    return " ".join(text.replace("\xa0", " ").split())
-
-
 def extract_route_name(route_title: str) -> str:
     if not route_title:
         return ""
     return normalize_text(re.sub(r"^ROUTE\s*#?\s*\d+\s*", "", route_title, flags=re.IGNORECASE))
 
 
-def parse_fare_from_text(text: str):
-    if not text:
-        return None, None, None
-
-    flat = normalize_text(text)
-
-    range_pattern = re.compile(
-        r"(?:₱|PHP|Php|php|P)?\s*(\d{1,3}(?:\.\d{1,2})?)\s*(?:-|to|–)\s*(?:₱|PHP|Php|php|P)?\s*(\d{1,3}(?:\.\d{1,2})?)"
-    )
-    single_pattern = re.compile(
-        r"(?:minimum fare|fare|pamasahe)[^0-9]{0,20}(?:₱|PHP|Php|php|P)?\s*(\d{1,3}(?:\.\d{1,2})?)",
-        flags=re.IGNORECASE,
-    )
-
-    m = range_pattern.search(flat)
-    if m:
-        low = float(m.group(1))
-        high = float(m.group(2))
-        return min(low, high), max(low, high), m.group(0)
-
-    m = single_pattern.search(flat)
-    if m:
-        value = float(m.group(1))
-        return value, value, m.group(0)
-
-    return None, None, None
-
-
 def parse_map_markers_from_kml(kml_text: str):
     soup = BeautifulSoup(kml_text, "xml")
     markers = []
@@ -109,23 +113,48 @@ def parse_map_markers_from_kml(kml_text: str):
     return markers
 
 
-def fetch_markers_for_mid(map_mid: str, session: requests.Session, cache: dict):
+def _markers_from_file(path: Path, kml_url: str, cache: dict, metrics: dict, label, map_mid: str):
+    started = time.perf_counter()
+    raw = path.read_bytes()
+    markers = parse_map_markers_from_kml(raw.decode("utf-8"))
+    record_fetch(metrics, label, str(path), parse_s=time.perf_counter() - started, bytes_downloaded=len(raw), local=True)
+    cache[map_mid] = (kml_url, markers, None)
+    return cache[map_mid]
+
+
+def fetch_markers_for_mid(map_mid: str, session: requests.Session, cache: dict, metrics: dict = None, label=None):
     if not map_mid:
         return None, [], None
     if map_mid in cache:
+        record_fetch(metrics, label or map_mid, cache[map_mid][0], cache_hit=True)
         return cache[map_mid]
 
     kml_url = f"https://www.google.com/maps/d/kml?mid={map_mid}&forcekml=1"
+    kml_dir = os.environ.get(KML_DIR_ENV)
+    if kml_dir and (Path(kml_dir) / f"{map_mid}.kml").exists():
+        return _markers_from_file(Path(kml_dir) / f"{map_mid}.kml", kml_url, cache, metrics, label or map_mid, map_mid)
+
+    started = time.perf_counter()
+    latency = None
+    parse_time = None
+    size = 0
     try:
         resp = session.get(kml_url, headers=HEADERS, timeout=45)
+        latency = time.perf_counter() - started
+        size = len(resp.content)
         resp.raise_for_status()
         if not resp.encoding:
             resp.encoding = "utf-8"
+        parse_started = time.perf_counter()
         markers = parse_map_markers_from_kml(resp.text)
+        parse_time = time.perf_counter() - parse_started
         result = (kml_url, markers, None)
     except Exception as exc:
+        if latency is None:
+            latency = time.perf_counter() - started
         result = (kml_url, [], str(exc))
 
+    record_fetch(metrics, label or map_mid, kml_url, latency_s=latency, parse_s=parse_time, bytes_downloaded=size, error=result[2])
     cache[map_mid] = result
     return result
 
@@ -139,279 +168,396 @@ def map_mid_from_embed(url: str):
     return mids[0] if mids else None
 
 
-def sql_value(value):
-    if value is None:
-        return "NULL"
-    if isinstance(value, bool):
-        return "1" if value else "0"
-    if isinstance(value, int):
-        return str(value)
-    if isinstance(value, float):
-        if math.isnan(value) or math.isinf(value):
-            return "NULL"
-        return repr(value)
-    text = str(value).replace("'", "''")
-    return f"'{text}'"
+def route_sort_key(route: dict):
+    return (route.get("route_number") is None, route.get("route_number") or 9999)
 
 
-def insert_line(table, columns, values):
-    cols = ", ".join(columns)
-    vals = ", ".join(sql_value(v) for v in values)
-    return f"INSERT INTO {table} ({cols}) VALUES ({vals});"
+def load_source_routes(source: dict):
+    # Index routes renumbered into the source's route_number block, and guides keyed
+    # by the same global numbers.
+    index_json, full_guides_json = source_inputs(source)
+    for path in (index_json, full_guides_json):
+        if not path.exists():
+            raise FileNotFoundError(f"Missing {path}")
+    index_payload = json.loads(index_json.read_text(encoding="utf-8"))
+    full_payload = json.loads(full_guides_json.read_text(encoding="utf-8"))
 
+    routes = []
+    for route in index_payload.get("routes", []):
+        routes.append(
+            {
+                **route,
+                "route_number": global_route_number(source, route.get("route_number")),
+                "source_route_number": route.get("route_number"),
+                "source_id": source["source_id"],
+            }
+        )
+    guides = {global_route_number(source, g.get("route_number")): g for g in full_payload.get("guides", [])}
+    return routes, guides
+
+
+def assemble_route(route: dict, guide: dict, session: requests.Session, kml_cache: dict, metrics: dict):
+    # Everything except the stable ids, which depend on assignment order and are
+    # attached afterwards in one pass (attach_stable_ids).
+    route_number = route.get("route_number")
+    local_number = route.get("source_route_number", route_number)
+    route_title = route.get("route_title")
+    route_name = extract_route_name(route_title)
+    route_code = f"ROUTE {local_number}" if local_number is not None else None
+
+    fare_candidates = extract_guide_fares(guide)
+    fare_min, fare_max, fare_text = best_fare(fare_candidates)
+
+    map_mid = route.get("map_mid") or map_mid_from_embed(route.get("map_embed_url"))
+    map_kml_url, markers, marker_error = fetch_markers_for_mid(map_mid, session=session, cache=kml_cache, metrics=metrics, label=route_code)
+
+    stops = []
+    if markers:
+        for i, marker in enumerate(markers, start=1):
+            stops.append(
+                {
+                    "stop_order": i,
+                    "stop_name": marker.get("marker_name"),
+                    "lat": marker.get("lat"),
+                    "lng": marker.get("lng"),
+                    "source_type": "map_marker",
+                    "has_coordinates": True,
+                }
+            )
+    else:
+        for i, stop_name in enumerate(route.get("stops", []), start=1):
+            stops.append(
+                {
+                    "stop_order": i,
+                    "stop_name": stop_name,
+                    "lat": None,
+                    "lng": None,
+                    "source_type": "text_stop",
+                    "has_coordinates": False,
+                }
+            )
+
+    return {
+        "route_number": route_number,
+        "route_code": route_code,
+        "route_name": route_name,
+        "route_title": route_title,
+        "fare_min_php": fare_min,
+        "fare_max_php": fare_max,
+        "fare_text": fare_text,
+        "fare_candidates": fare_candidates,
+        "fare_source_url": guide.get("full_guide_url"),
+        "map_embed_url": route.get("map_embed_url"),
+        "map_mid": map_mid,
+        "map_kml_url": map_kml_url or route.get("map_kml_url"),
+        "map_polyline_count": route.get("map_polyline_count", 0),
+        "map_point_count": route.get("map_point_count", 0),
+        "map_marker_count": len(markers),
+        "map_marker_error": marker_error,
+        "stop_count": len(stops),
+        "stops": stops,
+        "map_polylines": [compact_polyline_dict(p) for p in route.get("map_polylines", [])],
+        "source_id": route.get("source_id"),
+        "source_route_number": local_number,
+    }
+
+
+def _assemble_shard(shard):
+    # shard: [(position, index route, guide)]; one session and KML cache per shard.
+    fetches = {"fetches": []}
+    kml_cache = {}
+    session = requests.Session()
+    try:
+        records = [(position, assemble_route(route, guide, session, kml_cache, fetches)) for position, route, guide in shard]
+    finally:
+        session.close()
+    return records, fetches["fetches"]
+
+
+def shard_routes(ordered, workers: int):
+    # Routes sharing a map are kept together so each KML is fetched once; groups are
+    # dealt round-robin in route order.
+    groups = {}
+    for position, route, guide in ordered:
+        mid = route.get("map_mid") or map_mid_from_embed(route.get("map_embed_url")) or f"#{position}"
+        groups.setdefault(mid, []).append((position, route, guide))
+    shards = [[] for _ in range(max(1, min(workers, len(groups))))]
+    for i, group in enumerate(groups.values()):
+        shards[i % len(shards)].extend(group)
+    return [shard for shard in shards if shard]
+
+
+def build_workers():
+    value = os.environ.get(BUILD_WORKERS_ENV)
+    return int(value) if value else (os.cpu_count() or 1)
+
+
+def assemble_routes(index_routes, guides_by_route: dict, metrics: dict, workers=1):
+    ordered = [
+        (position, route, guides_by_route.get(route.get("route_number"), {}))
+        for position, route in enumerate(sorted(index_routes, key=route_sort_key))
+    ]
+    shards = shard_routes(ordered, workers)
+
+    if len(shards) <= 1:
+        results = [_assemble_shard(ordered)]
+    else:
+        with ProcessPoolExecutor(max_workers=len(shards)) as executor:
+            results = list(executor.map(_assemble_shard, shards))
+
+    records = [None] * len(ordered)
+    for shard_records, fetches in results:
+        for position, record in shard_records:
+            records[position] = record
+        metrics["fetches"].extend(fetches)
+    return records
+
+
+def attach_stable_ids(records, id_map: dict, sources=()):
+    # Serial, in route order, stops before their route: the same assignment order
+    # (and so the same ids on collision) whatever the number of workers.
+    namespaces = id_namespaces(sources)
+    routes = []
+    for record in records:
+        key = route_key(record, namespaces.get(record.get("source_id")))
+        stops = [
+            {"stop_id": assign_id(id_map, "prd_route_stops", *key, stop["stop_order"], stop["lat"], stop["lng"]), **stop}
+            for stop in record["stops"]
+        ]
+        routes.append({"route_id": assign_id(id_map, "prd_routes", *key), **record, "stops": stops})
+    return routes
+
+
+def build_sql_dump(payload: dict, path: Path = PRD_SQL, id_map: dict = None):
+    # Recreates everything supabase_loader sets up, geometry and the app's dataset
+    # view included, since dropping the tables takes those with them.
+    routes, stops, polylines, points = payload_rows(payload, id_map if id_map is not None else load_id_map())
 
-def build_sql_dump(payload: dict):
     lines = []
     lines.append("-- Route25 PRD-focused SQL dump (PostgreSQL / Supabase)")
     lines.append("BEGIN TRANSACTION;")
     lines.append("")
+    lines.append(f"DROP MATERIALIZED VIEW IF EXISTS {PRD_DATASET_VIEW};")
+    lines.append("DROP TABLE IF EXISTS prd_route_points;")
+    lines.append("DROP TABLE IF EXISTS prd_route_polylines;")
     lines.append("DROP TABLE IF EXISTS prd_route_stops;")
     lines.append("DROP TABLE IF EXISTS prd_routes;")
     lines.append("DROP TABLE IF EXISTS prd_meta;")
     lines.append("")
-    lines.append(
-        """
-CREATE TABLE prd_meta (
-    id INTEGER PRIMARY KEY,
-    generated_at_utc TEXT,
-    route_count INTEGER,
-    routes_with_stop_coordinates INTEGER,
-    routes_with_fare INTEGER
-);
-""".strip()
-    )
-    lines.append(
-        """
-CREATE TABLE prd_routes (
-    route_id INTEGER PRIMARY KEY,
-    route_number INTEGER NOT NULL UNIQUE,
-    route_code TEXT NOT NULL,
-    route_name TEXT NOT NULL,
-    fare_min_php REAL,
-    fare_max_php REAL,
-    fare_text TEXT,
-    stop_count INTEGER
-);
-""".strip()
-    )
-    lines.append(
-        """
-CREATE TABLE prd_route_stops (
-    stop_id INTEGER PRIMARY KEY,
-    route_id INTEGER NOT NULL,
-    stop_order INTEGER NOT NULL,
-    stop_name TEXT,
-    lat REAL,
-    lng REAL,
-    FOREIGN KEY (route_id) REFERENCES prd_routes(route_id)
-);
-""".strip()
-    )
+    for table, body in PRD_SCHEMA + PRD_GEOMETRY_SCHEMA:
+        lines.append(create_table_sql(table, body))
     lines.append("")
+    writers = table_writers_from_ddl(lines)
 
-    lines.append(
-        insert_line(
-            "prd_meta",
-            [
-                "id",
-                "generated_at_utc",
-                "route_count",
-                "routes_with_stop_coordinates",
-                "routes_with_fare",
-            ],
-            [
-                1,
-                payload.get("generated_at_utc"),
-                payload.get("route_count"),
-                payload.get("routes_with_stop_coordinates"),
-                payload.get("routes_with_fare"),
-            ],
-        )
-    )
+    lines.append(writers["prd_meta"].insert(prd_meta_values(payload)))
+    lines.extend(writers["prd_routes"].insert_many(routes))
+    lines.extend(writers["prd_route_stops"].insert_many(stops))
+    lines.extend(writers["prd_route_polylines"].insert_many(polylines))
+    lines.extend(writers["prd_route_points"].insert_many(points))
 
-    stop_id = 1
+    lines.append("")
+    lines.extend(statement.rstrip(";") + ";" for statement in index_statements() + view_statements())
+    lines.append("")
+    lines.append("COMMIT;")
+
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def build_sql_upsert(payload: dict, path: Path = PRD_SQL_UPSERT):
+    # Idempotent load for a live database: no DROP, rows are matched on natural keys
+    # (route_number, stop_order) and only rows that disappeared are deleted. A route
+    # already present keeps its route_id so stops loaded earlier stay attached.
+    lines = []
+    lines.append("-- Route25 PRD-focused idempotent upsert (PostgreSQL / Supabase)")
+    lines.append("BEGIN TRANSACTION;")
+    lines.append("")
+    for table, body in PRD_SCHEMA + PRD_GEOMETRY_SCHEMA:
+        lines.append(create_table_sql(table, body, if_not_exists=True))
+    lines.append("CREATE INDEX IF NOT EXISTS idx_prd_routes_route_number ON prd_routes(route_number);")
+    lines.append("CREATE INDEX IF NOT EXISTS idx_prd_route_stops_route_id ON prd_route_stops(route_id);")
+    lines.append("CREATE UNIQUE INDEX IF NOT EXISTS idx_prd_route_stops_route_order ON prd_route_stops(route_id, stop_order);")
+    lines.append("")
+
+    lines.append(upsert_line("prd_meta", PRD_META_COLUMNS, prd_meta_values(payload), ["id"]))
+
+    route_numbers = []
+    for route in payload["routes"]:
+        route_number = route.get("route_number")
+        route_numbers.append(route_number)
+        route_key = f"route_number = {sql_value(route_number)}"
 
-    for route_idx, route in enumerate(payload["routes"], start=1):
         lines.append(
-            insert_line(
+            upsert_select_line(
                 "prd_routes",
-                [
-                    "route_id",
-                    "route_number",
-                    "route_code",
-                    "route_name",
-                    "fare_min_php",
-                    "fare_max_php",
-                    "fare_text",
-                    "stop_count",
-                ],
-                [
-                    route_idx,
-                    route.get("route_number"),
-                    route.get("route_code"),
-                    route.get("route_name"),
-                    route.get("fare_min_php"),
-                    route.get("fare_max_php"),
-                    route.get("fare_text"),
-                    route.get("stop_count"),
-                ],
+                PRD_ROUTE_COLUMNS,
+                prd_route_values(route, route["route_id"]),
+                ["route_number"],
+                id_column="route_id",
+                match=route_key,
             )
         )
 
-        for stop in route.get("stops", []):
+        stops = route.get("stops", [])
+        for stop in stops:
             lines.append(
-                insert_line(
+                upsert_select_line(
                     "prd_route_stops",
-                    [
-                        "stop_id",
-                        "route_id",
-                        "stop_order",
-                        "stop_name",
-                        "lat",
-                        "lng",
-                    ],
-                    [
-                        stop_id,
-                        route_idx,
-                        stop.get("stop_order"),
-                        stop.get("stop_name"),
-                        stop.get("lat"),
-                        stop.get("lng"),
-                    ],
+                    PRD_STOP_COLUMNS,
+                    prd_stop_values(stop, stop["stop_id"], None),
+                    ["route_id", "stop_order"],
+                    computed={"route_id": f"(SELECT route_id FROM prd_routes WHERE {route_key})"},
                 )
             )
-            stop_id += 1
 
+        max_order = max((s.get("stop_order") or 0 for s in stops), default=0)
+        lines.append(
+            f"DELETE FROM prd_route_stops WHERE route_id = (SELECT route_id FROM prd_routes WHERE {route_key}) "
+            f"AND stop_order > {sql_value(max_order)};"
+        )
+
+    kept = ", ".join(sql_value(n) for n in route_numbers) or "NULL"
+    dropped = f"(SELECT route_id FROM prd_routes WHERE route_number NOT IN ({kept}))"
+    lines.append(
+        f"DELETE FROM prd_route_points WHERE polyline_id IN (SELECT polyline_id FROM prd_route_polylines WHERE route_id IN {dropped});"
+    )
+    lines.append(f"DELETE FROM prd_route_polylines WHERE route_id IN {dropped};")
+    lines.append(f"DELETE FROM prd_route_stops WHERE route_id IN {dropped};")
+    lines.append(f"DELETE FROM prd_routes WHERE route_number NOT IN ({kept});")
     lines.append("")
-    lines.append("CREATE INDEX idx_prd_routes_route_number ON prd_routes(route_number);")
-    lines.append("CREATE INDEX idx_prd_route_stops_route_id ON prd_route_stops(route_id);")
+    lines.append(PRD_DATASET_VIEW_REFRESH_SQL)
     lines.append("")
+    for statement in snapshot_statements(payload):
+        lines.append(statement)
+        lines.append("")
     lines.append("COMMIT;")
 
-    PRD_SQL.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
 
 
 def main():
-    if not INDEX_JSON.exists():
-        raise FileNotFoundError(f"Missing {INDEX_JSON}")
-    if not FULL_GUIDES_JSON.exists():
-        raise FileNotFoundError(f"Missing {FULL_GUIDES_JSON}")
+    metrics = new_build_metrics("build_prd_dataset")
+    sources = load_sources()
 
-    index_payload = json.loads(INDEX_JSON.read_text(encoding="utf-8"))
-    full_payload = json.loads(FULL_GUIDES_JSON.read_text(encoding="utf-8"))
+    index_routes = []
+    full_guides_by_route = {}
+    with timed_stage(metrics, "load_inputs"):
+        for source in sources:
+            routes, guides = load_source_routes(source)
+            index_routes.extend(routes)
+            full_guides_by_route.update(guides)
 
-    full_guides_by_route = {g.get("route_number"): g for g in full_payload.get("guides", [])}
+    id_map = load_id_map()
 
-    routes_out = []
-    session = requests.Session()
-    kml_cache = {}
+    with timed_stage(metrics, "assemble_routes"):
+        records = assemble_routes(index_routes, full_guides_by_route, metrics, workers=build_workers())
+        routes_out = attach_stable_ids(records, id_map, sources)
 
-    for route in sorted(index_payload.get("routes", []), key=lambda r: (r.get("route_number") is None, r.get("route_number") or 9999)):
-        route_number = route.get("route_number")
-        route_title = route.get("route_title")
-        route_name = extract_route_name(route_title)
-        route_code = f"ROUTE {route_number}" if route_number is not None else None
-
-        guide = full_guides_by_route.get(route_number, {})
-        fare_source_text = "\n".join((guide.get("paragraphs") or []) + (guide.get("headings") or []))
-        fare_min, fare_max, fare_text = parse_fare_from_text(fare_source_text)
-
-        map_mid = route.get("map_mid") or map_mid_from_embed(route.get("map_embed_url"))
-        map_kml_url, markers, marker_error = fetch_markers_for_mid(map_mid, session=session, cache=kml_cache)
-
-        stops = []
-        if markers:
-            for i, marker in enumerate(markers, start=1):
-                stops.append(
-                    {
-                        "stop_order": i,
-                        "stop_name": marker.get("marker_name"),
-                        "lat": marker.get("lat"),
-                        "lng": marker.get("lng"),
-                        "source_type": "map_marker",
-                        "has_coordinates": True,
-                    }
-                )
-        else:
-            for i, stop_name in enumerate(route.get("stops", []), start=1):
-                stops.append(
-                    {
-                        "stop_order": i,
-                        "stop_name": stop_name,
-                        "lat": None,
-                        "lng": None,
-                        "source_type": "text_stop",
-                        "has_coordinates": False,
-                    }
-                )
+    with timed_stage(metrics, "stop_registry"):
+        places = build_stop_registry(routes_out, id_map)
 
-        routes_out.append(
-            {
-                "route_number": route_number,
-                "route_code": route_code,
-                "route_name": route_name,
-                "route_title": route_title,
-                "fare_min_php": fare_min,
-                "fare_max_php": fare_max,
-                "fare_text": fare_text,
-                "fare_source_url": guide.get("full_guide_url"),
-                "map_embed_url": route.get("map_embed_url"),
-                "map_mid": map_mid,
-                "map_kml_url": map_kml_url or route.get("map_kml_url"),
-                "map_polyline_count": route.get("map_polyline_count", 0),
-                "map_point_count": route.get("map_point_count", 0),
-                "map_marker_count": len(markers),
-                "map_marker_error": marker_error,
-                "stop_count": len(stops),
-                "stops": stops,
-                "map_polylines": route.get("map_polylines", []),
-            }
-        )
+    with timed_stage(metrics, "topology"):
+        annotate_route_topology(routes_out)
+
+    with timed_stage(metrics, "route_overlaps"):
+        overlaps = find_route_overlaps(routes_out)
 
-    session.close()
+    with timed_stage(metrics, "fare_estimates"):
+        annotate_route_estimates(routes_out, load_fare_matrix())
 
     payload = {
         "generated_at_utc": pd.Timestamp.utcnow().isoformat(),
-        "source_route_index": str(INDEX_JSON.name),
-        "source_full_guides": str(FULL_GUIDES_JSON.name),
+        "source_route_index": ", ".join(s["index_json"] for s in sources),
+        "source_full_guides": ", ".join(s["full_guides_json"] for s in sources),
+        "sources": partition_summary(routes_out, sources),
         "route_count": len(routes_out),
         "routes_with_map_geometry": sum(1 for r in routes_out if (r.get("map_polyline_count") or 0) > 0),
         "routes_with_stop_coordinates": sum(1 for r in routes_out if any(s.get("has_coordinates") for s in r.get("stops", []))),
         "routes_with_fare": sum(1 for r in routes_out if r.get("fare_min_php") is not None),
+        "place_count": len(places),
+        "stop_registry": places,
+        "route_overlaps": overlaps,
         "routes": routes_out,
     }
 
-    PRD_JSON.write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
+    previous_payload = json.loads(PRD_JSON.read_text(encoding="utf-8")) if PRD_JSON.exists() else None
+
+    # Broken geometry stops the build here, before the dataset, id map, snapshots,
+    # deltas and SQL are written, so the next build still diffs against the last good one.
+    with timed_stage(metrics, "validate"):
+        validation = validate_dataset(payload)
+    print(f"Saved: {VALIDATION_REPORT}")
+    if not validation["passed"]:
+        write_build_report(metrics, PRD_BUILD_REPORT)
+        raise SystemExit(failure_message(validation))
+
+    with timed_stage(metrics, "write_json"):
+        write_json(PRD_JSON, payload)
+        id_map_path = save_id_map(id_map)
+
+    with timed_stage(metrics, "write_snapshot"):
+        snapshot_files, snapshot_sql = write_snapshot(payload)
+
+    with timed_stage(metrics, "write_shards"):
+        shard_manifest, _ = write_shards(payload)
+
+    delta_paths = None
+    if previous_payload is not None:
+        with timed_stage(metrics, "write_delta"):
+            _, patch_path, sql_path = publish_delta(previous_payload, payload)
+            delta_paths = (patch_path, sql_path)
+
+    with timed_stage(metrics, "write_summary_csv"):
+        summary_rows = []
+        for r in routes_out:
+            summary_rows.append(
+                {
+                    "route_number": r.get("route_number"),
+                    "source_id": r.get("source_id"),
+                    "route_code": r.get("route_code"),
+                    "route_name": r.get("route_name"),
+                    "fare_min_php": r.get("fare_min_php"),
+                    "fare_max_php": r.get("fare_max_php"),
+                    "route_length_km": r.get("route_length_km"),
+                    "estimated_fare_max_php": r.get("estimated_fare_max_php"),
+                    "stop_count": r.get("stop_count"),
+                    "stops_with_coordinates": sum(1 for s in r.get("stops", []) if s.get("has_coordinates")),
+                    "map_polyline_count": r.get("map_polyline_count"),
+                    "map_point_count": r.get("map_point_count"),
+                    "map_marker_count": r.get("map_marker_count"),
+                }
+            )
+        pd.DataFrame(summary_rows).to_csv(PRD_SUMMARY_CSV, index=False, encoding="utf-8")
 
-    summary_rows = []
-    for r in routes_out:
-        summary_rows.append(
-            {
-                "route_number": r.get("route_number"),
-                "route_code": r.get("route_code"),
-                "route_name": r.get("route_name"),
-                "fare_min_php": r.get("fare_min_php"),
-                "fare_max_php": r.get("fare_max_php"),
-                "stop_count": r.get("stop_count"),
-                "stops_with_coordinates": sum(1 for s in r.get("stops", []) if s.get("has_coordinates")),
-                "map_polyline_count": r.get("map_polyline_count"),
-                "map_point_count": r.get("map_point_count"),
-                "map_marker_count": r.get("map_marker_count"),
-            }
-        )
-    pd.DataFrame(summary_rows).to_csv(PRD_SUMMARY_CSV, index=False, encoding="utf-8")
+    with timed_stage(metrics, "write_sql"):
+        build_sql_dump(payload, id_map=id_map)
+        build_sql_upsert(payload)
+        # The dump assigns polyline ids the JSON does not carry.
+        save_id_map(id_map)
 
-    build_sql_dump(payload)
+    count(metrics, "routes", len(routes_out))
+    count(metrics, "stops", sum(len(r["stops"]) for r in routes_out))
+    report = write_build_report(metrics, PRD_BUILD_REPORT)
 
     print(f"Saved: {PRD_JSON}")
     print(f"Saved: {PRD_SUMMARY_CSV}")
     print(f"Saved: {PRD_SQL}")
+    print(f"Saved: {PRD_SQL_UPSERT}")
+    print(f"Saved: {id_map_path}")
+    for path, size in snapshot_files.values():
+        print(f"Saved: {path} ({size} bytes)")
+    print(f"Saved: {snapshot_sql}")
+    print(f"Saved: {shard_manifest}")
+    if delta_paths:
+        print(f"Saved: {delta_paths[0]}")
+        print(f"Saved: {delta_paths[1]}")
     print(f"Routes: {payload['route_count']}")
     print(f"Routes with map geometry: {payload['routes_with_map_geometry']}")
     print(f"Routes with stop coordinates: {payload['routes_with_stop_coordinates']}")
     print(f"Routes with fare: {payload['routes_with_fare']}")
+    print(f"Saved: {PRD_BUILD_REPORT} ({report['total_s']:.2f}s)")
 
 
 if __name__ == "__main__":
-    main()
+    with profiling(OUTPUT_DIR / "prd_build_profile"):
+        main()
 
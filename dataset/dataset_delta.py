@@ -0,0 +1,355 @@
+import argparse
+import hashlib
+import json
+import re
+from datetime import datetime, timezone
+from pathlib import Path
+
+from dataset_snapshot import snapshot_statements
+from json_output import write_json
+from polyline_model import CompactPolyline
+from prd_schema import PRD_DATASET_VIEW_REFRESH_SQL, PRD_GEOMETRY_SCHEMA, create_table_sql
+from sql_common import sql_value
+
+
+ROOT = Path(__file__).resolve().parent
+OUTPUT_DIR = ROOT / "output"
+
+PRD_JSON = OUTPUT_DIR / "prd_routes_dataset.json"
+DELTA_DIR = OUTPUT_DIR / "deltas"
+VERSION_CHAIN_JSON = DELTA_DIR / "prd_versions.json"
+
+META_FIELDS = [
+    "generated_at_utc",
+    "route_count",
+    "routes_with_map_geometry",
+    "routes_with_stop_coordinates",
+    "routes_with_fare",
+    "sources",
+    "place_count",
+    "stop_registry",
+    "route_overlaps",
+]
+SQL_META_FIELDS = [
+    "generated_at_utc",
+    "route_count",
+    "routes_with_stop_coordinates",
+    "routes_with_fare",
+]
+SQL_ROUTE_FIELDS = [
+    "route_code",
+    "route_name",
+    "fare_min_php",
+    "fare_max_php",
+    "fare_text",
+    "stop_count",
+]
+SQL_STOP_FIELDS = ["stop_id", "stop_name", "lat", "lng"]
+
+
+def version_key(generated_at_utc: str) -> str:
+    # Full precision in UTC, so two builds within the same second get distinct patch names.
+    if not generated_at_utc:
+        return "unversioned"
+    try:
+        stamp = datetime.fromisoformat(generated_at_utc)
+    except ValueError:
+        return re.sub(r"[^0-9A-Za-z]", "", generated_at_utc)
+    if stamp.tzinfo is not None:
+        stamp = stamp.astimezone(timezone.utc)
+    return stamp.strftime("%Y%m%dT%H%M%S%fZ")
+
+
+def payload_digest(payload: dict) -> str:
+    raw = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(raw).hexdigest()
+
+
+def _routes_by_number(payload: dict):
+    return {r.get("route_number"): r for r in (payload or {}).get("routes", [])}
+
+
+def _stop_changes(old_stops, new_stops):
+    old_by_order = {s.get("stop_order"): s for s in old_stops}
+    new_by_order = {s.get("stop_order"): s for s in new_stops}
+
+    upserted = [s for order, s in new_by_order.items() if old_by_order.get(order) != s]
+    deleted = sorted(order for order in old_by_order if order not in new_by_order)
+    return upserted, deleted
+
+
+def diff_payloads(previous: dict, current: dict):
+    previous = previous or {}
+    old_routes = _routes_by_number(previous)
+    new_routes = _routes_by_number(current)
+
+    patch = {
+        "format": "route25-prd-delta/1",
+        "from_version": previous.get("generated_at_utc"),
+        "to_version": current.get("generated_at_utc"),
+        "meta": {k: current.get(k) for k in META_FIELDS if previous.get(k) != current.get(k)},
+        "routes_added": [],
+        "routes_changed": [],
+        "routes_deleted": sorted(n for n in old_routes if n not in new_routes),
+    }
+
+    for route_number, route in new_routes.items():
+        old = old_routes.get(route_number)
+        if old is None:
+            patch["routes_added"].append(route)
+            continue
+        if old == route:
+            continue
+
+        fields = {k: v for k, v in route.items() if k not in ("stops", "map_polylines") and (k not in old or old[k] != v)}
+        change = {"route_number": route_number, "fields": fields}
+        removed = sorted(k for k in old if k not in route)
+        if removed:
+            change["fields_removed"] = removed
+        stops_upserted, stops_deleted = _stop_changes(old.get("stops", []), route.get("stops", []))
+        if stops_upserted or stops_deleted:
+            change["stops_upserted"] = stops_upserted
+            change["stops_deleted"] = stops_deleted
+        old_polylines = old.get("map_polylines", [])
+        new_polylines = route.get("map_polylines", [])
+        if old_polylines != new_polylines:
+            change["map_polylines"] = {
+                "count": len(new_polylines),
+                "replaced": {
+                    str(i): polyline
+                    for i, polyline in enumerate(new_polylines)
+                    if i >= len(old_polylines) or old_polylines[i] != polyline
+                },
+            }
+        patch["routes_changed"].append(change)
+
+    return patch
+
+
+def apply_patch(previous: dict, patch: dict):
+    payload = {k: v for k, v in (previous or {}).items() if k != "routes"}
+    payload.update(patch["meta"])
+    routes = {n: dict(r) for n, r in _routes_by_number(previous).items()}
+
+    for route_number in patch["routes_deleted"]:
+        routes.pop(route_number, None)
+    for route in patch["routes_added"]:
+        routes[route.get("route_number")] = route
+    for change in patch["routes_changed"]:
+        route = routes[change["route_number"]]
+        route.update(change["fields"])
+        for k in change.get("fields_removed", []):
+            route.pop(k, None)
+        if "stops_upserted" in change:
+            stops = {s.get("stop_order"): s for s in route.get("stops", [])}
+            for order in change["stops_deleted"]:
+                stops.pop(order, None)
+            for stop in change["stops_upserted"]:
+                stops[stop.get("stop_order")] = stop
+            route["stops"] = [stops[k] for k in sorted(stops)]
+        if "map_polylines" in change:
+            polylines = list(route.get("map_polylines", []))[: change["map_polylines"]["count"]]
+            for i, polyline in sorted(change["map_polylines"]["replaced"].items(), key=lambda item: int(item[0])):
+                if int(i) < len(polylines):
+                    polylines[int(i)] = polyline
+                else:
+                    polylines.append(polyline)
+            route["map_polylines"] = polylines
+
+    payload["routes"] = [routes[n] for n in sorted(routes, key=lambda n: (n is None, n or 9999))]
+    return payload
+
+
+def _set_clause(fields: dict):
+    return ", ".join(f"{k} = {sql_value(v)}" for k, v in fields.items())
+
+
+def _route_id_sql(route_number):
+    return f"(SELECT route_id FROM prd_routes WHERE route_number = {sql_value(route_number)})"
+
+
+def _next_id_sql(table, id_column, stable_id):
+    # Payloads built with stable ids carry them; older ones fall back to MAX(id)+1.
+    if stable_id is not None:
+        return f"(SELECT {sql_value(stable_id)} AS next_id) AS ids"
+    return f"(SELECT COALESCE(MAX({id_column}), 0) + 1 AS next_id FROM {table}) AS ids"
+
+
+def _insert_stop_sql(route_number, stop, unless=None):
+    sql = (
+        "INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) "
+        f"SELECT next_id, {_route_id_sql(route_number)}, "
+        f"{sql_value(stop.get('stop_order'))}, {sql_value(stop.get('stop_name'))}, "
+        f"{sql_value(stop.get('lat'))}, {sql_value(stop.get('lng'))} "
+        f"FROM {_next_id_sql('prd_route_stops', 'stop_id', stop.get('stop_id'))}"
+    )
+    if unless:
+        sql += f" WHERE NOT EXISTS (SELECT 1 FROM prd_route_stops WHERE {unless})"
+    return sql + ";"
+
+
+def _polyline_match(route_number, segment_index=None, after=None):
+    condition = f"route_id = {_route_id_sql(route_number)}"
+    if segment_index is not None:
+        condition += f" AND segment_index = {sql_value(segment_index)}"
+    if after is not None:
+        condition += f" AND segment_index > {sql_value(after)}"
+    return condition
+
+
+def _delete_points_sql(condition):
+    return f"DELETE FROM prd_route_points WHERE polyline_id IN (SELECT polyline_id FROM prd_route_polylines WHERE {condition});"
+
+
+def _delete_polylines_sql(condition):
+    return [_delete_points_sql(condition), f"DELETE FROM prd_route_polylines WHERE {condition};"]
+
+
+def _replace_polyline_sql(route_number, segment_index, polyline):
+    # segment_index is 1-based like supabase_loader; an existing row keeps its polyline_id.
+    compact = CompactPolyline.from_dict(polyline)
+    condition = _polyline_match(route_number, segment_index)
+    lines = [
+        _delete_points_sql(condition),
+        f"UPDATE prd_route_polylines SET {_set_clause({'segment_name': compact.name, 'point_count': len(compact)})} WHERE {condition};",
+        "INSERT INTO prd_route_polylines (polyline_id, route_id, segment_index, segment_name, point_count) "
+        f"SELECT next_id, {_route_id_sql(route_number)}, {sql_value(segment_index)}, {sql_value(compact.name)}, {sql_value(len(compact))} "
+        "FROM (SELECT COALESCE(MAX(polyline_id), 0) + 1 AS next_id FROM prd_route_polylines) AS ids "
+        f"WHERE NOT EXISTS (SELECT 1 FROM prd_route_polylines WHERE {condition});",
+    ]
+    if len(compact):
+        values = ", ".join(
+            f"({order}, {sql_value(lat)}, {sql_value(lng)})" for order, (lat, lng) in enumerate(compact.lat_lng, start=1)
+        )
+        lines.append(
+            "INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) "
+            f"SELECT p.polyline_id, v.point_order, v.lat, v.lng FROM prd_route_polylines p, (VALUES {values}) AS v(point_order, lat, lng) "
+            f"WHERE p.{condition};"
+        )
+    return lines
+
+
+def build_delta_sql(patch: dict, current: dict = None):
+    lines = []
+    lines.append(f"-- Route25 PRD incremental update {patch['from_version']} -> {patch['to_version']}")
+    lines.append("BEGIN TRANSACTION;")
+    lines.append("")
+    # Geometry tables only exist in databases loaded by supabase_loader; creating
+    # them here keeps the route deletes below valid against a plain dump.
+    for table, body in PRD_GEOMETRY_SCHEMA:
+        lines.append(create_table_sql(table, body, if_not_exists=True))
+    lines.append("")
+
+    meta = {k: v for k, v in patch["meta"].items() if k in SQL_META_FIELDS}
+    if meta:
+        lines.append(f"UPDATE prd_meta SET {_set_clause(meta)} WHERE id = 1;")
+
+    for route_number in patch["routes_deleted"]:
+        lines.extend(_delete_polylines_sql(_polyline_match(route_number)))
+        lines.append(f"DELETE FROM prd_route_stops WHERE route_id = {_route_id_sql(route_number)};")
+        lines.append(f"DELETE FROM prd_routes WHERE route_number = {sql_value(route_number)};")
+
+    for route in patch["routes_added"]:
+        values = [route.get(k) for k in SQL_ROUTE_FIELDS]
+        lines.append(
+            "INSERT INTO prd_routes (route_id, route_number, "
+            + ", ".join(SQL_ROUTE_FIELDS)
+            + ") SELECT next_id, "
+            + ", ".join(sql_value(v) for v in [route.get("route_number")] + values)
+            + f" FROM {_next_id_sql('prd_routes', 'route_id', route.get('route_id'))};"
+        )
+        for stop in route.get("stops", []):
+            lines.append(_insert_stop_sql(route.get("route_number"), stop))
+        for segment_index, polyline in enumerate(route.get("map_polylines", []), start=1):
+            lines.extend(_replace_polyline_sql(route.get("route_number"), segment_index, polyline))
+
+    for change in patch["routes_changed"]:
+        route_number = change["route_number"]
+        fields = {k: v for k, v in change["fields"].items() if k in SQL_ROUTE_FIELDS}
+        if fields:
+            lines.append(f"UPDATE prd_routes SET {_set_clause(fields)} WHERE route_number = {sql_value(route_number)};")
+
+        for order in change.get("stops_deleted", []):
+            lines.append(
+                f"DELETE FROM prd_route_stops WHERE route_id = {_route_id_sql(route_number)} AND stop_order = {sql_value(order)};"
+            )
+        for stop in change.get("stops_upserted", []):
+            stop_fields = {k: stop.get(k) for k in SQL_STOP_FIELDS if k in stop}
+            condition = f"route_id = {_route_id_sql(route_number)} AND stop_order = {sql_value(stop.get('stop_order'))}"
+            lines.append(f"UPDATE prd_route_stops SET {_set_clause(stop_fields)} WHERE {condition};")
+            lines.append(_insert_stop_sql(route_number, stop, unless=condition))
+
+        if "map_polylines" in change:
+            polylines = change["map_polylines"]
+            lines.extend(_delete_polylines_sql(_polyline_match(route_number, after=polylines["count"])))
+            for i, polyline in sorted(polylines["replaced"].items(), key=lambda item: int(item[0])):
+                lines.extend(_replace_polyline_sql(route_number, int(i) + 1, polyline))
+
+    lines.append("")
+    lines.append(PRD_DATASET_VIEW_REFRESH_SQL)
+    lines.append("")
+    # get_route25_dataset serves the snapshot row, not the tables; without the new
+    # payload it would keep returning the previous version.
+    if current is not None:
+        for statement in snapshot_statements(current):
+            lines.append(statement)
+            lines.append("")
+    lines.append("COMMIT;")
+    return "\n".join(lines) + "\n"
+
+
+def load_version_chain(path: Path = VERSION_CHAIN_JSON):
+    if path.exists():
+        return json.loads(path.read_text(encoding="utf-8"))
+    return {"versions": []}
+
+
+def publish_delta(previous: dict, current: dict, delta_dir: Path = DELTA_DIR):
+    delta_dir.mkdir(parents=True, exist_ok=True)
+    chain_path = delta_dir / VERSION_CHAIN_JSON.name
+    chain = load_version_chain(chain_path)
+
+    patch = diff_payloads(previous, current)
+    stem = f"prd_delta_{version_key(patch['from_version'])}_{version_key(patch['to_version'])}"
+    patch_path = delta_dir / f"{stem}.json"
+    sql_path = delta_dir / f"{stem}.sql"
+
+    write_json(patch_path, patch, pretty=False)
+    sql_path.write_text(build_delta_sql(patch, current), encoding="utf-8")
+
+    chain["versions"] = [v for v in chain["versions"] if v["version"] != current.get("generated_at_utc")]
+    chain["versions"].append(
+        {
+            "version": current.get("generated_at_utc"),
+            "parent": patch["from_version"],
+            "payload_sha256": payload_digest(current),
+            "patch": patch_path.name,
+            "sql": sql_path.name,
+            "routes_added": len(patch["routes_added"]),
+            "routes_changed": len(patch["routes_changed"]),
+            "routes_deleted": len(patch["routes_deleted"]),
+        }
+    )
+    write_json(chain_path, chain)
+    return patch, patch_path, sql_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Diff two PRD dataset versions into a JSON patch and incremental SQL.")
+    parser.add_argument("previous", type=Path)
+    parser.add_argument("current", type=Path, nargs="?", default=PRD_JSON)
+    args = parser.parse_args()
+
+    previous = json.loads(args.previous.read_text(encoding="utf-8"))
+    current = json.loads(args.current.read_text(encoding="utf-8"))
+    patch, patch_path, sql_path = publish_delta(previous, current)
+
+    print(f"Saved: {patch_path} ({patch_path.stat().st_size} bytes)")
+    print(f"Saved: {sql_path} ({sql_path.stat().st_size} bytes)")
+    print(f"Routes added: {len(patch['routes_added'])}")
+    print(f"Routes changed: {len(patch['routes_changed'])}")
+    print(f"Routes deleted: {len(patch['routes_deleted'])}")
+
+
+if __name__ == "__main__":
+    main()
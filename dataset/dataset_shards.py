@@ -0,0 +1,205 @@
+import argparse
+import hashlib
+import json
+from functools import lru_cache
+from pathlib import Path
+
+from json_output import dumps, write_json
+
+
+ROOT = Path(__file__).resolve().parent
+OUTPUT_DIR = ROOT / "output"
+
+PRD_JSON = OUTPUT_DIR / "prd_routes_dataset.json"
+SHARD_DIR = OUTPUT_DIR / "prd_shards"
+MANIFEST_NAME = "manifest.json"
+ROUTES_DIRNAME = "routes"
+MANIFEST_FORMAT = "route25-shards/2"
+
+DEFAULT_CACHE_SIZE = 16
+
+# Top-level counts and provenance copied into the manifest; anything else in the
+# payload is either a route shard or one of the dataset-wide shards below.
+MANIFEST_META_FIELDS = [
+    "generated_at_utc",
+    "source_route_index",
+    "source_full_guides",
+    "sources",
+    "route_count",
+    "routes_with_map_geometry",
+    "routes_with_stop_coordinates",
+    "routes_with_fare",
+    "place_count",
+]
+
+# Dataset-wide lists that grow with the network; kept out of the manifest so a
+# route list does not pay for them.
+DATASET_SHARDS = {
+    "stop_registry": "stop_registry.json",
+    "route_overlaps": "route_overlaps.json",
+}
+
+# What a route list needs without opening a shard; stops and geometry stay in the shard.
+MANIFEST_ROUTE_FIELDS = [
+    "route_id",
+    "route_number",
+    "source_id",
+    "route_code",
+    "route_name",
+    "route_title",
+    "fare_min_php",
+    "fare_max_php",
+    "fare_text",
+    "estimated_fare_min_php",
+    "estimated_fare_max_php",
+    "route_length_km",
+    "topology",
+    "stop_count",
+    "map_polyline_count",
+    "map_point_count",
+]
+
+
+def shard_name(route: dict):
+    key = route.get("route_id")
+    if key is None:
+        key = f"route-{route.get('route_number')}"
+    return f"{ROUTES_DIRNAME}/{key}.json"
+
+
+def route_bbox(route: dict):
+    lats = []
+    lngs = []
+    for stop in route.get("stops", []):
+        if stop.get("lat") is not None and stop.get("lng") is not None:
+            lats.append(stop["lat"])
+            lngs.append(stop["lng"])
+    for polyline in route.get("map_polylines", []):
+        for lat, lng in polyline.get("coordinates_lat_lng", []):
+            lats.append(lat)
+            lngs.append(lng)
+    return [min(lats), min(lngs), max(lats), max(lngs)] if lats else None
+
+
+def shard_info(shard: str, raw: bytes):
+    return {"shard": shard, "shard_bytes": len(raw), "shard_sha256": hashlib.sha256(raw).hexdigest()}
+
+
+def manifest_entry(route: dict, shard: str, raw: bytes):
+    entry = {field: route.get(field) for field in MANIFEST_ROUTE_FIELDS if field in route}
+    entry["stop_names"] = [stop.get("stop_name") for stop in route.get("stops", [])]
+    entry["bbox"] = route_bbox(route)
+    entry.update(shard_info(shard, raw))
+    return entry
+
+
+def _write_if_changed(path: Path, raw: bytes):
+    if path.exists() and path.read_bytes() == raw:
+        return False
+    path.write_bytes(raw)
+    return True
+
+
+def write_shards(payload: dict, shard_dir: Path = SHARD_DIR):
+    # One compact file per route, one per dataset-wide list, plus a manifest; shards
+    # are only rewritten when their bytes change, and stale shards are deleted.
+    shard_dir = Path(shard_dir)
+    (shard_dir / ROUTES_DIRNAME).mkdir(parents=True, exist_ok=True)
+
+    entries = []
+    written = 0
+    for route in payload.get("routes", []):
+        shard = shard_name(route)
+        raw = dumps(route)
+        written += _write_if_changed(shard_dir / shard, raw)
+        entries.append(manifest_entry(route, shard, raw))
+
+    keep = {shard_dir / e["shard"] for e in entries}
+    for path in (shard_dir / ROUTES_DIRNAME).glob("*.json"):
+        if path not in keep:
+            path.unlink()
+
+    shards = {}
+    for key, shard in DATASET_SHARDS.items():
+        path = shard_dir / shard
+        if key not in payload:
+            path.unlink(missing_ok=True)
+            continue
+        raw = dumps(payload[key])
+        written += _write_if_changed(path, raw)
+        shards[key] = shard_info(shard, raw)
+
+    manifest = {"format": MANIFEST_FORMAT}
+    manifest.update({k: payload[k] for k in MANIFEST_META_FIELDS if k in payload})
+    manifest["shards"] = shards
+    manifest["routes"] = entries
+    manifest_path = shard_dir / MANIFEST_NAME
+    write_json(manifest_path, manifest)
+    return manifest_path, written
+
+
+class ShardedDataset:
+    def __init__(self, shard_dir: Path = SHARD_DIR, cache_size=DEFAULT_CACHE_SIZE):
+        self.shard_dir = Path(shard_dir)
+        self.manifest = json.loads((self.shard_dir / MANIFEST_NAME).read_text(encoding="utf-8"))
+        if self.manifest.get("format") != MANIFEST_FORMAT:
+            raise ValueError(f"{self.shard_dir}: unsupported shard format {self.manifest.get('format')!r}")
+        self.routes = self.manifest["routes"]
+        self._by_number = {e.get("route_number"): e for e in self.routes}
+        self._by_id = {e.get("route_id"): e for e in self.routes if e.get("route_id") is not None}
+        self._load = lru_cache(maxsize=cache_size)(self._read_shard)
+
+    def _read_shard(self, shard: str):
+        return json.loads((self.shard_dir / shard).read_text(encoding="utf-8"))
+
+    def entry(self, route_number=None, route_id=None):
+        entry = self._by_id.get(route_id) if route_id is not None else self._by_number.get(route_number)
+        if entry is None:
+            raise KeyError(route_id if route_id is not None else route_number)
+        return entry
+
+    def route(self, route_number=None, route_id=None):
+        return self._load(self.entry(route_number, route_id)["shard"])
+
+    def _dataset_shard(self, key: str):
+        info = self.manifest.get("shards", {}).get(key)
+        return self._load(info["shard"]) if info else []
+
+    def stop_registry(self):
+        return self._dataset_shard("stop_registry")
+
+    def route_overlaps(self):
+        return self._dataset_shard("route_overlaps")
+
+    def page(self, offset=0, limit=20):
+        return self.routes[offset : offset + limit]
+
+    def routes_in_bbox(self, min_lat, min_lng, max_lat, max_lng):
+        return [
+            e
+            for e in self.routes
+            if e.get("bbox")
+            and e["bbox"][0] <= max_lat
+            and e["bbox"][2] >= min_lat
+            and e["bbox"][1] <= max_lng
+            and e["bbox"][3] >= min_lng
+        ]
+
+    def cache_info(self):
+        return self._load.cache_info()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Split the PRD dataset into a manifest and per-route shards.")
+    parser.add_argument("payload", type=Path, nargs="?", default=PRD_JSON)
+    parser.add_argument("--output", type=Path, default=SHARD_DIR)
+    args = parser.parse_args()
+
+    payload = json.loads(args.payload.read_text(encoding="utf-8"))
+    manifest_path, written = write_shards(payload, args.output)
+    print(f"Saved: {manifest_path}")
+    print(f"Shards: {len(payload.get('routes', []))} ({written} rewritten) in {args.output / ROUTES_DIRNAME}")
+
+
+if __name__ == "__main__":
+    main()
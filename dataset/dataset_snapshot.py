@@ -0,0 +1,158 @@
+import base64
+import gzip
+import hashlib
+import json
+from pathlib import Path
+
+from json_output import dumps
+from sql_common import sql_value
+
+
+ROOT = Path(__file__).resolve().parent
+OUTPUT_DIR = ROOT / "output"
+
+PRD_JSON = OUTPUT_DIR / "prd_routes_dataset.json"
+SNAPSHOT_STEM = OUTPUT_DIR / "prd_dataset_snapshot"
+SNAPSHOT_SQL = OUTPUT_DIR / "prd_dataset_snapshot.sql"
+
+try:
+    import brotli
+except ImportError:  # optional; the gzip variant is always produced
+    brotli = None
+
+
+def compact_json(payload: dict) -> bytes:
+    return dumps(payload)
+
+
+def compress_variants(raw: bytes):
+    variants = {"identity": raw, "gzip": gzip.compress(raw, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants["br"] = brotli.compress(raw, quality=11)
+    return variants
+
+
+def _bytea(data):
+    if data is None:
+        return "NULL"
+    return f"decode('{base64.b64encode(data).decode('ascii')}', 'base64')"
+
+
+def snapshot_statements(payload: dict, variants=None):
+    raw = compact_json(payload)
+    variants = variants or compress_variants(raw)
+    sha256 = hashlib.sha256(raw).hexdigest()
+
+    statements = []
+    statements.append(
+        """
+CREATE TABLE IF NOT EXISTS prd_dataset_snapshot (
+    id INTEGER PRIMARY KEY,
+    generated_at_utc TEXT,
+    payload_sha256 TEXT NOT NULL,
+    payload_bytes INTEGER,
+    payload JSONB NOT NULL,
+    payload_gzip BYTEA,
+    payload_brotli BYTEA
+);
+""".strip()
+    )
+    statements.append(
+        "INSERT INTO prd_dataset_snapshot "
+        "(id, generated_at_utc, payload_sha256, payload_bytes, payload, payload_gzip, payload_brotli) VALUES ("
+        f"1, {sql_value(payload.get('generated_at_utc'))}, {sql_value(sha256)}, {len(raw)}, "
+        f"{sql_value(raw.decode('utf-8'))}::jsonb, {_bytea(variants.get('gzip'))}, {_bytea(variants.get('br'))}"
+        ") ON CONFLICT (id) DO UPDATE SET "
+        "generated_at_utc = EXCLUDED.generated_at_utc, payload_sha256 = EXCLUDED.payload_sha256, "
+        "payload_bytes = EXCLUDED.payload_bytes, payload = EXCLUDED.payload, "
+        "payload_gzip = EXCLUDED.payload_gzip, payload_brotli = EXCLUDED.payload_brotli;"
+    )
+    statements.append(
+        """
+CREATE OR REPLACE FUNCTION get_route25_dataset()
+RETURNS JSONB
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT payload FROM prd_dataset_snapshot WHERE id = 1;
+$$;
+""".strip()
+    )
+    # PostgREST renders bytea as hex text, so compressed bodies travel base64-encoded.
+    statements.append(
+        """
+CREATE OR REPLACE FUNCTION get_route25_dataset_compressed(encoding TEXT DEFAULT 'gzip')
+RETURNS JSONB
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT jsonb_build_object(
+        'encoding', encoding,
+        'generated_at_utc', generated_at_utc,
+        'payload_sha256', payload_sha256,
+        'payload_bytes', payload_bytes,
+        'data', encode(CASE WHEN encoding = 'br' THEN payload_brotli ELSE payload_gzip END, 'base64')
+    )
+    FROM prd_dataset_snapshot
+    WHERE id = 1;
+$$;
+""".strip()
+    )
+    statements.append(
+        """
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_roles WHERE rolname = 'anon') THEN
+        GRANT SELECT ON prd_dataset_snapshot TO anon, authenticated;
+        GRANT EXECUTE ON FUNCTION get_route25_dataset() TO anon, authenticated;
+        GRANT EXECUTE ON FUNCTION get_route25_dataset_compressed(TEXT) TO anon, authenticated;
+    END IF;
+END
+$$;
+""".strip()
+    )
+    return statements
+
+
+def build_snapshot_sql(payload: dict, variants=None):
+    lines = []
+    lines.append("-- Route25 PRD dataset snapshot + get_route25_dataset RPC (PostgreSQL / Supabase)")
+    lines.append("BEGIN TRANSACTION;")
+    lines.append("")
+    for statement in snapshot_statements(payload, variants):
+        lines.append(statement)
+        lines.append("")
+    lines.append("COMMIT;")
+    return "\n".join(lines) + "\n"
+
+
+def write_snapshot(payload: dict, stem: Path = SNAPSHOT_STEM, sql_path: Path = SNAPSHOT_SQL):
+    raw = compact_json(payload)
+    variants = compress_variants(raw)
+    suffixes = {"identity": ".json", "gzip": ".json.gz", "br": ".json.br"}
+
+    written = {}
+    for name, data in variants.items():
+        path = Path(str(stem) + suffixes[name])
+        path.write_bytes(data)
+        written[name] = (path, len(data))
+
+    sql_path.write_text(build_snapshot_sql(payload, variants), encoding="utf-8")
+    return written, sql_path
+
+
+def main():
+    payload = json.loads(PRD_JSON.read_text(encoding="utf-8"))
+    written, sql_path = write_snapshot(payload)
+
+    pretty_bytes = PRD_JSON.stat().st_size
+    print(f"Source: {PRD_JSON} ({pretty_bytes} bytes)")
+    for name, (path, size) in written.items():
+        print(f"Saved: {path} ({size} bytes, {size / pretty_bytes:.1%} of source)")
+    print(f"Saved: {sql_path}")
+    if brotli is None:
+        print("brotli not installed: skipped the .json.br variant")
+
+
+if __name__ == "__main__":
+    main()
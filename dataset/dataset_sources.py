@@ -0,0 +1,126 @@
+import json
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parent
+OUTPUT_DIR = ROOT / "output"
+
+SOURCES_JSON = ROOT / "dataset_sources.json"
+
+# Generous box around Iloilo City and the neighbouring towns the jeepneys reach.
+ILOILO_BOUNDS = {"min_lat": 10.55, "max_lat": 10.90, "min_lng": 122.40, "max_lng": 122.70}
+
+# One entry per city/source. route_number_base keeps route numbers unique across
+# sources (prd_routes.route_number is UNIQUE); id_namespace prefixes the stable-id
+# keys, and None keeps the original un-prefixed keys so Iloilo ids never move.
+DEFAULT_SOURCES = [
+    {
+        "source_id": "iloilo",
+        "city": "Iloilo City",
+        "index_json": "iloilo_routes_index.json",
+        "full_guides_json": "iloilo_full_guides.json",
+        "route_number_base": 0,
+        "id_namespace": None,
+        "bounds": ILOILO_BOUNDS,
+    },
+]
+ROUTE_NUMBER_BLOCK = 1000
+
+
+def load_sources(path: Path = SOURCES_JSON):
+    sources = DEFAULT_SOURCES
+    if path and Path(path).exists():
+        sources = json.loads(Path(path).read_text(encoding="utf-8"))["sources"]
+
+    out = []
+    for position, source in enumerate(sources):
+        source = dict(source)
+        source.setdefault("route_number_base", position * ROUTE_NUMBER_BLOCK)
+        source.setdefault("id_namespace", source["source_id"])
+        source.setdefault("bounds", None)
+        out.append(source)
+
+    values = [s["source_id"] for s in out]
+    if len(set(values)) != len(values):
+        raise ValueError(f"Duplicate source_id in dataset sources: {values}")
+    # Each source owns [base, base + ROUTE_NUMBER_BLOCK); the ranges must not overlap.
+    bases = sorted((s["route_number_base"], s["source_id"]) for s in out)
+    for (base, source_id), (next_base, next_id) in zip(bases, bases[1:]):
+        if next_base - base < ROUTE_NUMBER_BLOCK:
+            raise ValueError(
+                f"Route number ranges of {source_id} (base {base}) and {next_id} (base {next_base}) overlap; "
+                f"bases must be at least {ROUTE_NUMBER_BLOCK} apart"
+            )
+    return out
+
+
+def source_inputs(source: dict, output_dir: Path = OUTPUT_DIR):
+    return output_dir / source["index_json"], output_dir / source["full_guides_json"]
+
+
+def global_route_number(source: dict, route_number):
+    if route_number is None:
+        return None
+    if not 0 <= route_number < ROUTE_NUMBER_BLOCK:
+        raise ValueError(
+            f"{source['source_id']}: route number {route_number} is outside 0..{ROUTE_NUMBER_BLOCK - 1} "
+            "and would collide with another source's numbers"
+        )
+    return source["route_number_base"] + route_number
+
+
+def id_parts(source_id_namespace, *parts):
+    return parts if source_id_namespace is None else (source_id_namespace, *parts)
+
+
+def route_key(route: dict, id_namespace=None):
+    # Stable-id key parts: the source's own route number (or title), prefixed with
+    # the source's id namespace unless it keeps the original keys.
+    local_number = route.get("source_route_number", route.get("route_number"))
+    key = local_number if local_number is not None else route.get("route_title")
+    return id_parts(id_namespace, key)
+
+
+def id_namespaces(sources):
+    return {s["source_id"]: s["id_namespace"] for s in sources}
+
+
+def sources_by_id(sources):
+    return {s["source_id"]: s for s in sources}
+
+
+def route_bounds(route: dict, sources, default=ILOILO_BOUNDS):
+    source = sources_by_id(sources).get(route.get("source_id"))
+    return (source or {}).get("bounds") or default
+
+
+def partition_summary(routes, sources):
+    # Per-source bounding boxes of what was actually built; lookups use them to
+    # skip cities a point cannot be in.
+    summary = []
+    for source in sources:
+        lats = []
+        lngs = []
+        count = 0
+        for route in routes:
+            if route.get("source_id") != source["source_id"]:
+                continue
+            count += 1
+            for stop in route.get("stops", []):
+                if stop.get("lat") is not None and stop.get("lng") is not None:
+                    lats.append(stop["lat"])
+                    lngs.append(stop["lng"])
+            for polyline in route.get("map_polylines", []):
+                for lat, lng in polyline.get("coordinates_lat_lng", []):
+                    lats.append(lat)
+                    lngs.append(lng)
+        summary.append(
+            {
+                "source_id": source["source_id"],
+                "city": source.get("city"),
+                "route_number_base": source["route_number_base"],
+                "route_count": count,
+                "bbox": [min(lats), min(lngs), max(lats), max(lngs)] if lats else None,
+            }
+        )
+    return summary
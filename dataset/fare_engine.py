@@ -0,0 +1,196 @@
+import json
+import math
+from bisect import bisect_left
+from pathlib import Path
+
+from route_geometry import cumulative_distances, haversine_m, place_stops, route_path
+from route_topology import CYCLIC_TOPOLOGIES
+
+
+ROOT = Path(__file__).resolve().parent
+OUTPUT_DIR = ROOT / "output"
+
+PRD_JSON = OUTPUT_DIR / "prd_routes_dataset.json"
+FARE_MATRIX_JSON = ROOT / "fare_matrix.json"
+
+# LTFRB traditional PUJ schedule: flat fare for the first kilometres, then a fixed
+# amount for every succeeding kilometre or fraction thereof.
+DEFAULT_FARE_MATRIX = {
+    "base_fare_php": 13.0,
+    "base_distance_km": 4.0,
+    "per_km_php": 1.8,
+    "discount_rate": 0.2,
+    "rounding_php": 0.25,
+    "fare_table": None,
+}
+
+
+def load_fare_matrix(path: Path = FARE_MATRIX_JSON):
+    matrix = dict(DEFAULT_FARE_MATRIX)
+    if path and Path(path).exists():
+        matrix.update(json.loads(Path(path).read_text(encoding="utf-8")))
+    return compile_fare_matrix(matrix)
+
+
+def compile_fare_matrix(matrix: dict):
+    compiled = dict(matrix)
+    rows = sorted(matrix.get("fare_table") or [], key=lambda row: row[0])
+    compiled["table_km"] = [float(row[0]) for row in rows]
+    compiled["table_fare"] = [float(row[1]) for row in rows]
+    return compiled
+
+
+def round_fare(value, step):
+    if not step:
+        return round(value, 2)
+    return round(round(value / step) * step, 2)
+
+
+def fare_for_distance(distance_km, matrix: dict, discounted=False):
+    if distance_km is None:
+        return None
+
+    if matrix["table_km"]:
+        # Published matrices list the fare for "up to N km"; take the first row that covers the trip.
+        i = bisect_left(matrix["table_km"], distance_km)
+        fare = matrix["table_fare"][min(i, len(matrix["table_fare"]) - 1)]
+    else:
+        extra_km = max(0.0, distance_km - matrix["base_distance_km"])
+        fare = matrix["base_fare_php"] + math.ceil(round(extra_km, 6)) * matrix["per_km_php"]
+
+    if discounted:
+        fare *= 1 - matrix["discount_rate"]
+    return round_fare(fare, matrix["rounding_php"])
+
+
+def build_route_profile(route: dict):
+    lats, lngs = route_path(route)
+    stops = route.get("stops", [])
+    cyclic = route.get("topology") in CYCLIC_TOPOLOGIES
+
+    if len(lats) >= 2:
+        cumulative = cumulative_distances(lats, lngs)
+        points = [
+            (stop["lat"], stop["lng"])
+            if stop.get("has_coordinates") and stop.get("lat") is not None and stop.get("lng") is not None
+            else None
+            for stop in stops
+        ]
+        stop_chainage = place_stops(points, lats, lngs, cumulative, cyclic=cyclic)
+        return {
+            "route_number": route.get("route_number"),
+            "topology": route.get("topology"),
+            "length_m": cumulative[-1],
+            "stop_chainage": stop_chainage,
+            "source": "polyline",
+        }
+
+    # No geometry: fall back to straight-line distances between consecutive stops.
+    stop_chainage = []
+    total = 0.0
+    previous = None
+    for stop in stops:
+        if not stop.get("has_coordinates") or stop.get("lat") is None or stop.get("lng") is None:
+            stop_chainage.append(None)
+            continue
+        if previous is not None:
+            total += haversine_m(previous[0], previous[1], stop["lat"], stop["lng"])
+        previous = (stop["lat"], stop["lng"])
+        stop_chainage.append(total)
+    if cyclic and previous is not None:
+        # A loop runs from its last stop back round to the first.
+        first = next(i for i, c in enumerate(stop_chainage) if c is not None)
+        total += haversine_m(previous[0], previous[1], stops[first]["lat"], stops[first]["lng"])
+
+    return {
+        "route_number": route.get("route_number"),
+        "topology": route.get("topology"),
+        "length_m": total if previous is not None else None,
+        "stop_chainage": stop_chainage,
+        "source": "stops" if previous is not None else None,
+    }
+
+
+def build_route_profiles(payload: dict):
+    return {route.get("route_number"): build_route_profile(route) for route in payload.get("routes", [])}
+
+
+def trip_distance_m(profile: dict, board_index: int, alight_index: int):
+    chainage = profile["stop_chainage"]
+    if not (0 <= board_index < len(chainage) and 0 <= alight_index < len(chainage)):
+        return None
+
+    start = chainage[board_index]
+    end = chainage[alight_index]
+    if start is None or end is None:
+        return None
+    if end >= start:
+        return end - start
+    if profile.get("topology") not in CYCLIC_TOPOLOGIES:
+        # Non-cyclic routes run both ways: this is the trip in the opposite direction.
+        return start - end
+    # Alighting behind the boarding point on a loop means riding around through the terminal.
+    return profile["length_m"] - start + end
+
+
+def estimate_trip(profile: dict, board_index: int, alight_index: int, matrix: dict, discounted=False):
+    distance_m = trip_distance_m(profile, board_index, alight_index)
+    distance_km = None if distance_m is None else distance_m / 1000.0
+    return {
+        "route_number": profile["route_number"],
+        "board_index": board_index,
+        "alight_index": alight_index,
+        "distance_km": None if distance_km is None else round(distance_km, 3),
+        "fare_php": fare_for_distance(distance_km, matrix, discounted=discounted),
+    }
+
+
+def estimate_trips(profiles: dict, trips, matrix: dict, discounted=False):
+    results = []
+    for route_number, board_index, alight_index in trips:
+        profile = profiles.get(route_number)
+        if profile is None:
+            results.append(
+                {
+                    "route_number": route_number,
+                    "board_index": board_index,
+                    "alight_index": alight_index,
+                    "distance_km": None,
+                    "fare_php": None,
+                }
+            )
+            continue
+        results.append(estimate_trip(profile, board_index, alight_index, matrix, discounted=discounted))
+    return results
+
+
+def annotate_route_estimates(routes: list, matrix: dict):
+    for route in routes:
+        profile = build_route_profile(route)
+        length_m = profile["length_m"]
+        route["route_length_km"] = None if length_m is None else round(length_m / 1000.0, 3)
+        route["estimated_fare_min_php"] = fare_for_distance(0.0, matrix)
+        route["estimated_fare_max_php"] = fare_for_distance(None if length_m is None else length_m / 1000.0, matrix)
+        for stop, chainage in zip(route.get("stops", []), profile["stop_chainage"]):
+            stop["distance_along_route_m"] = None if chainage is None else round(chainage, 1)
+    return routes
+
+
+def main():
+    if not PRD_JSON.exists():
+        raise FileNotFoundError(f"Missing {PRD_JSON}")
+
+    payload = json.loads(PRD_JSON.read_text(encoding="utf-8"))
+    matrix = load_fare_matrix()
+    profiles = build_route_profiles(payload)
+
+    for route_number, profile in profiles.items():
+        if profile["length_m"] is None:
+            print(f"ROUTE {route_number}: no coordinates")
+            continue
+        full_fare = fare_for_distance(profile["length_m"] / 1000.0, matrix)
+        print(f"ROUTE {route_number}: {profile['length_m'] / 1000.0:.2f} km ({profile['source']}), full ride PHP {full_fare:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+import json
+import re
+from pathlib import Path
+
+from guide_extraction import normalize_text
+
+
+ROOT = Path(__file__).resolve().parent
+OUTPUT_DIR = ROOT / "output"
+
+FULL_GUIDES_JSON = OUTPUT_DIR / "iloilo_full_guides.json"
+
+MIN_CONFIDENCE = 0.6
+KEYWORD_WINDOW = 60
+PLAUSIBLE_FARE_PHP = (8.0, 150.0)
+
+_CURRENCY = r"(?:₱|\bphp(?![a-z])|\bp(?=\s?\d))"
+_AMOUNT = r"(\d{1,3}(?:\.\d{1,2})?)(?![\d/&]|[.,]\d)"
+_PESO_WORD = r"(?:pesos?|php)\b"
+_RANGE_SEP = r"\s*(?:-|–|—|to)\s*"
+
+# Ranges must carry a currency marker or a trailing "pesos" so address spans
+# ("Plazuela 1-2") and dates are not mistaken for fares.
+RANGE_PATTERN = re.compile(
+    rf"(?<![\w.]){_CURRENCY}\s*{_AMOUNT}{_RANGE_SEP}(?:{_CURRENCY}\s*)?{_AMOUNT}"
+    rf"|(?<![\w.]){_AMOUNT}{_RANGE_SEP}{_AMOUNT}\s*{_PESO_WORD}",
+    flags=re.IGNORECASE,
+)
+SINGLE_PATTERN = re.compile(
+    rf"(?<![\w.]){_CURRENCY}\s*{_AMOUNT}|(?<![\w.#]){_AMOUNT}\s*{_PESO_WORD}",
+    flags=re.IGNORECASE,
+)
+KEYWORD_AMOUNT_PATTERN = re.compile(
+    rf"\b(?:minimum fare|fare|pamasahe|plete)\b\s*(?:is|:|of|=)?\s*{_AMOUNT}",
+    flags=re.IGNORECASE,
+)
+# Cheap prefilter: a paragraph without a currency marker or fare keyword cannot yield a candidate.
+HINT_PATTERN = re.compile(r"₱|php|peso|\bp\s?\d|fare|pamasahe|plete", flags=re.IGNORECASE)
+KEYWORD_PATTERN = re.compile(
+    r"\b(?:minimum fare|fares?|pamasahe|plete|bayad|student|discount(?:ed)?|regular)\b",
+    flags=re.IGNORECASE,
+)
+
+
+def _keyword_proximity(keyword_spans, start, end):
+    best = None
+    for k_start, k_end in keyword_spans:
+        if k_end <= start:
+            gap = start - k_end
+        elif k_start >= end:
+            gap = k_start - end
+        else:
+            gap = 0
+        if best is None or gap < best:
+            best = gap
+    if best is None or best > KEYWORD_WINDOW:
+        return 0.0
+    return 1.0 - best / KEYWORD_WINDOW
+
+
+def _plausible(value):
+    return PLAUSIBLE_FARE_PHP[0] <= value <= PLAUSIBLE_FARE_PHP[1]
+
+
+def extract_fare_candidates(paragraphs, source=None):
+    candidates = []
+
+    for paragraph_index, raw in enumerate(paragraphs):
+        text = normalize_text(raw)
+        if not text or not HINT_PATTERN.search(text):
+            continue
+
+        keyword_spans = [m.span() for m in KEYWORD_PATTERN.finditer(text)]
+        taken = []
+
+        def add(match, low, high, base):
+            start, end = match.span()
+            if any(start < t_end and end > t_start for t_start, t_end in taken):
+                return
+            taken.append((start, end))
+            confidence = base + 0.4 * _keyword_proximity(keyword_spans, start, end)
+            if not (_plausible(low) and _plausible(high)):
+                confidence -= 0.4
+            candidates.append(
+                {
+                    "fare_min_php": min(low, high),
+                    "fare_max_php": max(low, high),
+                    "fare_text": match.group(0).strip(),
+                    "confidence": round(max(0.0, min(1.0, confidence)), 3),
+                    "paragraph_index": paragraph_index,
+                    "source": source,
+                }
+            )
+
+        for m in RANGE_PATTERN.finditer(text):
+            groups = [g for g in m.groups() if g is not None]
+            add(m, float(groups[0]), float(groups[1]), 0.6)
+
+        for m in SINGLE_PATTERN.finditer(text):
+            value = float(next(g for g in m.groups() if g is not None))
+            add(m, value, value, 0.5)
+
+        for m in KEYWORD_AMOUNT_PATTERN.finditer(text):
+            value = float(m.group(1))
+            add(m, value, value, 0.4)
+
+    candidates.sort(key=lambda c: (-c["confidence"], c["paragraph_index"], c["fare_min_php"]))
+    return candidates
+
+
+def best_fare(candidates, min_confidence=MIN_CONFIDENCE):
+    for candidate in candidates:
+        if candidate["confidence"] >= min_confidence:
+            return candidate["fare_min_php"], candidate["fare_max_php"], candidate["fare_text"]
+    return None, None, None
+
+
+def extract_guide_fares(guide: dict):
+    paragraphs = (guide.get("paragraphs") or []) + (guide.get("headings") or [])
+    return extract_fare_candidates(paragraphs, source=guide.get("full_guide_url"))
+
+
+def main():
+    if not FULL_GUIDES_JSON.exists():
+        raise FileNotFoundError(f"Missing {FULL_GUIDES_JSON}")
+
+    full_payload = json.loads(FULL_GUIDES_JSON.read_text(encoding="utf-8"))
+    guides = full_payload.get("guides", [])
+
+    with_candidates = 0
+    with_fare = 0
+    for guide in guides:
+        candidates = extract_guide_fares(guide)
+        if candidates:
+            with_candidates += 1
+        fare_min, fare_max, fare_text = best_fare(candidates)
+        if fare_min is not None:
+            with_fare += 1
+            print(f"ROUTE {guide.get('route_number')}: {fare_min}-{fare_max} ({fare_text!r})")
+
+    print(f"Guides scanned: {len(guides)}")
+    print(f"Guides with fare candidates: {with_candidates}")
+    print(f"Guides with accepted fare: {with_fare}")
+
+
+if __name__ == "__main__":
+    main()
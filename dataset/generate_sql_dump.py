@@ -1,37 +1,25 @@
 import json
-import math
 from pathlib import Path
 
+from artifact_store import ARTIFACT_STORE_DIR, load_manifest, save_manifest, store_artifact
+from build_metrics import count, lap, new_build_metrics, profiling, write_build_report
+from stable_ids import assign_id, load_id_map, save_id_map
+from table_writer import table_writers_from_ddl
+
 
 ROOT = Path(__file__).resolve().parent
 OUTPUT_DIR = ROOT / "output"
 SQL_DUMP_PATH = OUTPUT_DIR / "route25_dataset_dump.sql"
-
-
-def sql_value(value):
-    if value is None:
-        return "NULL"
-    if isinstance(value, bool):
-        return "1" if value else "0"
-    if isinstance(value, int):
-        return str(value)
-    if isinstance(value, float):
-        if math.isnan(value) or math.isinf(value):
-            return "NULL"
-        return repr(value)
-    text = str(value).replace("'", "''")
-    return f"'{text}'"
-
-
-def insert_line(table, columns, values):
-    cols = ", ".join(columns)
-    vals = ", ".join(sql_value(v) for v in values)
-    return f"INSERT INTO {table} ({cols}) VALUES ({vals});"
+SQL_DUMP_REPORT = OUTPUT_DIR / "route25_dataset_dump_report.json"
 
 
 def main():
+    metrics = new_build_metrics("generate_sql_dump")
+
     index_payload = json.loads((OUTPUT_DIR / "iloilo_routes_index.json").read_text(encoding="utf-8"))
     full_payload = json.loads((OUTPUT_DIR / "iloilo_full_guides.json").read_text(encoding="utf-8"))
+    id_map = load_id_map()
+    lap(metrics, "load_inputs")
 
     lines = []
     lines.append("-- Route25 dataset SQL dump (PostgreSQL / Supabase)")
@@ -243,24 +231,18 @@ CREATE TABLE full_guide_errors (
 CREATE TABLE output_artifacts (
     filename TEXT PRIMARY KEY,
     content_type TEXT,
-    content_text TEXT
+    sha256 TEXT NOT NULL,
+    size_bytes INTEGER,
+    storage_path TEXT
 );
 """.strip()
     )
     lines.append("")
+    writers = table_writers_from_ddl(lines)
+    lap(metrics, "schema")
 
     lines.append(
-        insert_line(
-            "route_index_meta",
-            [
-                "id",
-                "source_url",
-                "scraped_at_utc",
-                "route_count",
-                "routes_with_geometry",
-                "total_polyline_segments",
-                "total_polyline_points",
-            ],
+        writers["route_index_meta"].insert(
             [
                 1,
                 index_payload.get("source_url"),
@@ -273,13 +255,11 @@ CREATE TABLE output_artifacts (
         )
     )
 
-    for i, row in enumerate(index_payload.get("compilation_table_rows", []), start=1):
+    for row in index_payload.get("compilation_table_rows", []):
         lines.append(
-            insert_line(
-                "route_compilation_rows",
-                ["id", "route_number", "route_title", "route_link", "full_guide_url", "is_outside_iloilo_city"],
+            writers["route_compilation_rows"].insert(
                 [
-                    i,
+                    assign_id(id_map, "route_compilation_rows", row.get("route_number"), row.get("route_title")),
                     row.get("route_number"),
                     row.get("route_title"),
                     row.get("route_link"),
@@ -291,33 +271,15 @@ CREATE TABLE output_artifacts (
 
     route_rows = sorted(index_payload.get("routes", []), key=lambda r: (r.get("route_number") is None, r.get("route_number") or 9999))
     route_id_map = {}
-    route_stop_id = 1
-    route_polyline_id = 1
-    route_point_id = 1
 
-    for route_id, route in enumerate(route_rows, start=1):
+    for route in route_rows:
         route_number = route.get("route_number")
+        route_key = route_number if route_number is not None else route.get("route_title")
+        route_id = assign_id(id_map, "routes", route_key)
         route_id_map[route_number] = route_id
 
         lines.append(
-            insert_line(
-                "routes",
-                [
-                    "route_id",
-                    "route_number",
-                    "route_title",
-                    "section_id",
-                    "source_url",
-                    "stop_description",
-                    "full_guide_url",
-                    "map_embed_url",
-                    "map_mid",
-                    "map_kml_url",
-                    "map_polyline_count",
-                    "map_point_count",
-                    "map_scrape_error",
-                    "faq_url",
-                ],
+            writers["routes"].insert(
                 [
                     route_id,
                     route_number,
@@ -337,22 +299,19 @@ CREATE TABLE output_artifacts (
             )
         )
 
-        for stop_order, stop_name in enumerate(route.get("stops", []), start=1):
-            lines.append(
-                insert_line(
-                    "route_stops",
-                    ["id", "route_id", "stop_order", "stop_name"],
-                    [route_stop_id, route_id, stop_order, stop_name],
-                )
+        lines.extend(
+            writers["route_stops"].insert_many(
+                [
+                    [assign_id(id_map, "route_stops", route_key, stop_order, stop_name), route_id, stop_order, stop_name]
+                    for stop_order, stop_name in enumerate(route.get("stops", []), start=1)
+                ]
             )
-            route_stop_id += 1
+        )
 
         for segment_index, polyline in enumerate(route.get("map_polylines", []), start=1):
-            current_polyline_id = route_polyline_id
+            current_polyline_id = assign_id(id_map, "route_map_polylines", route_key, segment_index)
             lines.append(
-                insert_line(
-                    "route_map_polylines",
-                    ["id", "route_id", "segment_index", "segment_name", "point_count"],
+                writers["route_map_polylines"].insert(
                     [
                         current_polyline_id,
                         route_id,
@@ -362,34 +321,27 @@ CREATE TABLE output_artifacts (
                     ],
                 )
             )
-            route_polyline_id += 1
 
-            for point_order, lat_lng in enumerate(polyline.get("coordinates_lat_lng", []), start=1):
-                if len(lat_lng) < 2:
-                    continue
-                lat, lng = lat_lng[0], lat_lng[1]
-                lines.append(
-                    insert_line(
-                        "route_map_points",
-                        ["id", "polyline_id", "point_order", "lat", "lng"],
-                        [route_point_id, current_polyline_id, point_order, lat, lng],
-                    )
+            lines.extend(
+                writers["route_map_points"].insert_many(
+                    [
+                        [
+                            assign_id(id_map, "route_map_points", route_key, segment_index, point_order, lat_lng[0], lat_lng[1]),
+                            current_polyline_id,
+                            point_order,
+                            lat_lng[0],
+                            lat_lng[1],
+                        ]
+                        for point_order, lat_lng in enumerate(polyline.get("coordinates_lat_lng", []), start=1)
+                        if len(lat_lng) >= 2
+                    ]
                 )
-                route_point_id += 1
+            )
+
+    lap(metrics, "route_index_rows")
 
     lines.append(
-        insert_line(
-            "full_guides_meta",
-            [
-                "id",
-                "source",
-                "scraped_at_utc",
-                "guide_count",
-                "guides_with_geometry",
-                "total_polyline_segments",
-                "total_polyline_points",
-                "error_count",
-            ],
+        writers["full_guides_meta"].insert(
             [
                 1,
                 full_payload.get("source"),
@@ -405,33 +357,15 @@ CREATE TABLE output_artifacts (
 
     guide_rows = sorted(full_payload.get("guides", []), key=lambda g: (g.get("route_number") is None, g.get("route_number") or 9999))
     guide_id_map = {}
-    guide_paragraph_id = 1
-    guide_heading_id = 1
-    guide_embed_id = 1
-    guide_polyline_id = 1
-    guide_point_id = 1
 
-    for guide_id, guide in enumerate(guide_rows, start=1):
+    for guide in guide_rows:
         route_number = guide.get("route_number")
+        guide_key = route_number if route_number is not None else guide.get("full_guide_url")
+        guide_id = assign_id(id_map, "full_guides", guide_key)
         guide_id_map[route_number] = guide_id
 
         lines.append(
-            insert_line(
-                "full_guides",
-                [
-                    "guide_id",
-                    "route_number",
-                    "route_title",
-                    "full_guide_url",
-                    "canonical_url",
-                    "article_title",
-                    "date_published",
-                    "date_modified",
-                    "first_paragraph",
-                    "guide_polyline_count",
-                    "guide_point_count",
-                    "scraped_at_utc",
-                ],
+            writers["full_guides"].insert(
                 [
                     guide_id,
                     guide.get("route_number"),
@@ -449,42 +383,28 @@ CREATE TABLE output_artifacts (
             )
         )
 
-        for paragraph_order, paragraph_text in enumerate(guide.get("paragraphs", []), start=1):
-            lines.append(
-                insert_line(
-                    "full_guide_paragraphs",
-                    ["id", "guide_id", "paragraph_order", "paragraph_text"],
-                    [guide_paragraph_id, guide_id, paragraph_order, paragraph_text],
-                )
+        lines.extend(
+            writers["full_guide_paragraphs"].insert_many(
+                [
+                    [assign_id(id_map, "full_guide_paragraphs", guide_key, paragraph_order), guide_id, paragraph_order, paragraph_text]
+                    for paragraph_order, paragraph_text in enumerate(guide.get("paragraphs", []), start=1)
+                ]
             )
-            guide_paragraph_id += 1
+        )
 
-        for heading_order, heading_text in enumerate(guide.get("headings", []), start=1):
-            lines.append(
-                insert_line(
-                    "full_guide_headings",
-                    ["id", "guide_id", "heading_order", "heading_text"],
-                    [guide_heading_id, guide_id, heading_order, heading_text],
-                )
+        lines.extend(
+            writers["full_guide_headings"].insert_many(
+                [
+                    [assign_id(id_map, "full_guide_headings", guide_key, heading_order), guide_id, heading_order, heading_text]
+                    for heading_order, heading_text in enumerate(guide.get("headings", []), start=1)
+                ]
             )
-            guide_heading_id += 1
+        )
 
         for embed_order, embed in enumerate(guide.get("map_geometry", []), start=1):
-            current_embed_id = guide_embed_id
+            current_embed_id = assign_id(id_map, "full_guide_map_embeds", guide_key, embed_order)
             lines.append(
-                insert_line(
-                    "full_guide_map_embeds",
-                    [
-                        "id",
-                        "guide_id",
-                        "embed_order",
-                        "map_embed_url",
-                        "map_mid",
-                        "map_kml_url",
-                        "map_polyline_count",
-                        "map_point_count",
-                        "map_scrape_error",
-                    ],
+                writers["full_guide_map_embeds"].insert(
                     [
                         current_embed_id,
                         guide_id,
@@ -498,14 +418,11 @@ CREATE TABLE output_artifacts (
                     ],
                 )
             )
-            guide_embed_id += 1
 
             for segment_index, polyline in enumerate(embed.get("map_polylines", []), start=1):
-                current_polyline_id = guide_polyline_id
+                current_polyline_id = assign_id(id_map, "full_guide_map_polylines", guide_key, embed_order, segment_index)
                 lines.append(
-                    insert_line(
-                        "full_guide_map_polylines",
-                        ["id", "embed_id", "segment_index", "segment_name", "point_count"],
+                    writers["full_guide_map_polylines"].insert(
                         [
                             current_polyline_id,
                             current_embed_id,
@@ -515,28 +432,28 @@ CREATE TABLE output_artifacts (
                         ],
                     )
                 )
-                guide_polyline_id += 1
-
-                for point_order, lat_lng in enumerate(polyline.get("coordinates_lat_lng", []), start=1):
-                    if len(lat_lng) < 2:
-                        continue
-                    lat, lng = lat_lng[0], lat_lng[1]
-                    lines.append(
-                        insert_line(
-                            "full_guide_map_points",
-                            ["id", "polyline_id", "point_order", "lat", "lng"],
-                            [guide_point_id, current_polyline_id, point_order, lat, lng],
-                        )
+
+                lines.extend(
+                    writers["full_guide_map_points"].insert_many(
+                        [
+                            [
+                                assign_id(id_map, "full_guide_map_points", guide_key, embed_order, segment_index, point_order, lat_lng[0], lat_lng[1]),
+                                current_polyline_id,
+                                point_order,
+                                lat_lng[0],
+                                lat_lng[1],
+                            ]
+                            for point_order, lat_lng in enumerate(polyline.get("coordinates_lat_lng", []), start=1)
+                            if len(lat_lng) >= 2
+                        ]
                     )
-                    guide_point_id += 1
+                )
 
-    for err_id, err in enumerate(full_payload.get("errors", []), start=1):
+    for err in full_payload.get("errors", []):
         lines.append(
-            insert_line(
-                "full_guide_errors",
-                ["id", "route_number", "route_title", "full_guide_url", "error_text"],
+            writers["full_guide_errors"].insert(
                 [
-                    err_id,
+                    assign_id(id_map, "full_guide_errors", err.get("route_number"), err.get("full_guide_url")),
                     err.get("route_number"),
                     err.get("route_title"),
                     err.get("full_guide_url"),
@@ -545,6 +462,8 @@ CREATE TABLE output_artifacts (
             )
         )
 
+    lap(metrics, "full_guide_rows")
+
     artifact_files = [
         "iloilo_routes_index.json",
         "iloilo_routes_index.csv",
@@ -554,24 +473,22 @@ CREATE TABLE output_artifacts (
         "iloilo_full_guides_polylines.geojson",
         "route_index_source.html",
     ]
-    content_types = {
-        ".json": "application/json",
-        ".csv": "text/csv",
-        ".geojson": "application/geo+json",
-        ".html": "text/html",
-    }
+    # Artifact bodies live in the content-addressed store; the dump only references them.
+    artifact_manifest = load_manifest()
     for filename in artifact_files:
         path = OUTPUT_DIR / filename
         if not path.exists():
             continue
-        content_text = path.read_text(encoding="utf-8")
+        record, written = store_artifact(path, artifact_manifest)
+        count(metrics, "artifacts_written" if written else "artifacts_unchanged")
         lines.append(
-            insert_line(
-                "output_artifacts",
-                ["filename", "content_type", "content_text"],
-                [filename, content_types.get(path.suffix, "text/plain"), content_text],
+            writers["output_artifacts"].insert(
+                [record["filename"], record["content_type"], record["sha256"], record["size_bytes"], record["storage_path"]],
             )
         )
+    artifact_manifest_path = save_manifest(artifact_manifest)
+
+    lap(metrics, "output_artifacts")
 
     lines.append("")
     lines.append("CREATE INDEX idx_routes_route_number ON routes(route_number);")
@@ -588,11 +505,22 @@ CREATE TABLE output_artifacts (
     lines.append("COMMIT;")
 
     SQL_DUMP_PATH.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    id_map_path = save_id_map(id_map)
+    lap(metrics, "write_sql")
+
+    count(metrics, "sql_lines", len(lines))
+    count(metrics, "sql_bytes", SQL_DUMP_PATH.stat().st_size)
+    report = write_build_report(metrics, SQL_DUMP_REPORT)
+
     print(f"Created SQL dump: {SQL_DUMP_PATH}")
     print(f"Routes inserted: {len(route_rows)}")
     print(f"Guides inserted: {len(guide_rows)}")
+    print(f"Saved: {id_map_path}")
+    print(f"Saved: {artifact_manifest_path} (blobs in {ARTIFACT_STORE_DIR})")
+    print(f"Saved: {SQL_DUMP_REPORT} ({report['total_s']:.2f}s)")
 
 
 if __name__ == "__main__":
-    main()
+    with profiling(OUTPUT_DIR / "route25_dataset_dump_profile"):
+        main()
 
@@ -0,0 +1,194 @@
+import json
+from urllib.parse import urljoin
+
+import lxml.html
+from lxml import etree
+
+
+ARTICLE_TYPES = {"Article", "BlogPosting", "NewsArticle"}
+HEADING_TAGS = {"h2", "h3", "h4"}
+SKIPPED_TEXT_TAGS = {"script", "style", "template"}
+
+
+def normalize_text(text: str) -> str:
+    if not text:
+        return ""
+    return " ".join(text.replace("\xa0", " ").split())
+
+
+def stop_key(stop_name: str) -> str:
+    return normalize_text(stop_name).casefold()
+
+
+def unique_in_order(items):
+    seen = set()
+    out = []
+    for item in items:
+        if item and item not in seen:
+            seen.add(item)
+            out.append(item)
+    return out
+
+
+def element_text(element) -> str:
+    # Equivalent to BeautifulSoup's get_text(" ", strip=True) + normalize_text:
+    # script/style bodies and comments are not part of the visible text.
+    parts = []
+
+    def walk(node):
+        if node.text and isinstance(node.tag, str) and node.tag not in SKIPPED_TEXT_TAGS:
+            parts.append(node.text)
+        for child in node:
+            if isinstance(child.tag, str):
+                walk(child)
+            if child.tail:
+                parts.append(child.tail)
+
+    walk(element)
+    return normalize_text(" ".join(parts))
+
+
+def _has_class(element, name: str) -> bool:
+    return name in (element.get("class") or "").split()
+
+
+def extract_article_dates(ld_json_blocks):
+    date_published = None
+    date_modified = None
+
+    for raw in ld_json_blocks:
+        if not raw:
+            continue
+        try:
+            payload = json.loads(raw)
+        except Exception:
+            continue
+
+        candidates = []
+        if isinstance(payload, dict):
+            if isinstance(payload.get("@graph"), list):
+                candidates.extend(payload["@graph"])
+            candidates.append(payload)
+        elif isinstance(payload, list):
+            candidates.extend(payload)
+
+        for candidate in candidates:
+            if not isinstance(candidate, dict):
+                continue
+
+            candidate_type = candidate.get("@type")
+            if isinstance(candidate_type, list):
+                type_match = any(t in ARTICLE_TYPES for t in candidate_type)
+            else:
+                type_match = candidate_type in ARTICLE_TYPES
+
+            if type_match:
+                date_published = date_published or candidate.get("datePublished")
+                date_modified = date_modified or candidate.get("dateModified")
+
+        if date_published and date_modified:
+            break
+
+    return date_published, date_modified
+
+
+def extract_guide_page(html: str, url: str):
+    root = lxml.html.document_fromstring(html)
+
+    # Content is bucketed while walking so the container choice of the old
+    # select_one("article .entry-content") or select_one(".entry-content") or soup
+    # can be made at the end without a second pass.
+    buckets = {
+        "article_entry": {"paragraphs": [], "headings": [], "iframes": []},
+        "entry": {"paragraphs": [], "headings": [], "iframes": []},
+        "document": {"paragraphs": [], "headings": [], "iframes": []},
+    }
+    article_entry = None
+    entry = None
+    in_article_entry = False
+    in_entry = False
+    article_depth = 0
+
+    first_h1 = None
+    title_h1 = None
+    canonical_tag = None
+    ld_json_blocks = []
+
+    for event, element in etree.iterwalk(root, events=("start", "end")):
+        tag = element.tag
+        if not isinstance(tag, str):
+            continue
+
+        if event == "end":
+            if tag == "article":
+                article_depth -= 1
+            if element is entry:
+                in_entry = False
+            if element is article_entry:
+                in_article_entry = False
+            continue
+
+        if tag == "article":
+            article_depth += 1
+
+        if _has_class(element, "entry-content"):
+            if entry is None:
+                entry = element
+                in_entry = True
+            if article_entry is None and article_depth > 0:
+                article_entry = element
+                in_article_entry = True
+
+        targets = [buckets["document"]]
+        if in_entry:
+            targets.append(buckets["entry"])
+        if in_article_entry:
+            targets.append(buckets["article_entry"])
+
+        if tag == "p":
+            text = element_text(element)
+            if text and not text.lower().startswith("read also"):
+                for bucket in targets:
+                    bucket["paragraphs"].append(text)
+        elif tag in HEADING_TAGS:
+            text = element_text(element)
+            if text:
+                for bucket in targets:
+                    bucket["headings"].append(text)
+        elif tag == "iframe":
+            src = element.get("src")
+            if src is not None:
+                embed_url = urljoin(url, src)
+                for bucket in targets:
+                    bucket["iframes"].append(embed_url)
+        elif tag == "h1":
+            if first_h1 is None:
+                first_h1 = element
+            if title_h1 is None and "entry-title" in (element.get("class") or ""):
+                title_h1 = element
+        elif tag == "link":
+            if canonical_tag is None and "canonical" in (element.get("rel") or "").lower().split():
+                canonical_tag = element
+        elif tag == "script":
+            if (element.get("type") or "").strip().lower() == "application/ld+json":
+                ld_json_blocks.append((element.text or "").strip())
+
+    if article_entry is not None:
+        content = buckets["article_entry"]
+    elif entry is not None:
+        content = buckets["entry"]
+    else:
+        content = buckets["document"]
+
+    title_tag = title_h1 if title_h1 is not None else first_h1
+    date_published, date_modified = extract_article_dates(ld_json_blocks)
+
+    return {
+        "article_title": element_text(title_tag) if title_tag is not None else "",
+        "canonical_url": (canonical_tag.get("href") if canonical_tag is not None else None) or url,
+        "date_published": date_published,
+        "date_modified": date_modified,
+        "paragraphs": content["paragraphs"],
+        "headings": content["headings"],
+        "map_embed_urls": unique_in_order(content["iframes"]),
+    }
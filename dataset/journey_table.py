@@ -0,0 +1,344 @@
+import gzip
+import json
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from guide_extraction import stop_key
+from json_output import dumps
+from route_geometry import EARTH_RADIUS_M, haversine_m
+from route_topology import travel_span
+
+
+ROOT = Path(__file__).resolve().parent
+OUTPUT_DIR = ROOT / "output"
+
+PRD_JSON = OUTPUT_DIR / "prd_routes_dataset.json"
+JOURNEY_TABLE = OUTPUT_DIR / "prd_journey_table.json.gz"
+
+MAX_OPTIONS = 3
+TRANSFER_RADIUS_M = 250.0
+ORIGIN_CHUNK_SIZE = 32
+
+_NETWORK = None
+
+
+def coordinate_score(route: dict) -> int:
+    count = sum(1 for s in route.get("stops", []) if s.get("has_coordinates"))
+    if count == 0 and (route.get("map_polyline_count") or 0) > 0 and route.get("map_polylines"):
+        return 1
+    return count
+
+
+def rank_key(distance_m, coord_score, fare, span, route_number, walk_m=0.0):
+    # Mirrors RouteMatcher.findRoutes: known origin distance first (ascending), then
+    # more coordinates, cheaper fare, shorter stop span and finally the route number.
+    # Transfers break span ties on the walk between the two routes.
+    return (
+        distance_m is None,
+        distance_m if distance_m is not None else 0.0,
+        -coord_score,
+        fare if fare is not None else math.inf,
+        span,
+        walk_m,
+        route_number,
+    )
+
+
+def _link(route_a, i, route_b, j):
+    # Walk metres between two route stops, or None when they are not a transfer.
+    if route_a["keys"][i] and route_a["keys"][i] == route_b["keys"][j]:
+        return 0.0
+    a_coord = route_a["coords"][i]
+    b_coord = route_b["coords"][j]
+    if a_coord is None or b_coord is None:
+        return None
+    walk_m = haversine_m(a_coord[0], a_coord[1], b_coord[0], b_coord[1])
+    return walk_m if walk_m <= TRANSFER_RADIUS_M else None
+
+
+def pairwise_links(routes):
+    links = {}
+    for a_pos, route_a in enumerate(routes):
+        for b_pos, route_b in enumerate(routes):
+            if a_pos == b_pos:
+                continue
+            for i in range(len(route_a["keys"])):
+                for j in range(len(route_b["keys"])):
+                    walk_m = _link(route_a, i, route_b, j)
+                    if walk_m is not None:
+                        links.setdefault((a_pos, i), []).append((b_pos, j, round(walk_m, 1)))
+    return links
+
+
+def place_links(routes):
+    # Same links as pairwise_links, but only stops of the same stop_registry place
+    # or of places within walking distance are compared. Same-name stops always
+    # share a place, so only the coordinate test needs the neighbouring places.
+    members = {}
+    for pos, route in enumerate(routes):
+        for i, place in enumerate(route["places"]):
+            members.setdefault(place, []).append((pos, i))
+
+    centres = {}
+    for place, refs in members.items():
+        coords = [routes[pos]["coords"][i] for pos, i in refs if routes[pos]["coords"][i] is not None]
+        if coords:
+            lat = sum(c[0] for c in coords) / len(coords)
+            lng = sum(c[1] for c in coords) / len(coords)
+            spread = max(haversine_m(lat, lng, c[0], c[1]) for c in coords)
+            centres[place] = (lat, lng, spread)
+
+    pairs = {place: {place} for place in members}
+    reach_m = TRANSFER_RADIUS_M + 2 * max((c[2] for c in centres.values()), default=0.0)
+    cell_lat = reach_m / (math.pi / 180.0 * EARTH_RADIUS_M)
+    buckets = {}
+    for place, (lat, lng, _) in centres.items():
+        cell_lng = cell_lat / max(math.cos(math.radians(lat)), 1e-6)
+        buckets.setdefault((int(lat // cell_lat), int(lng // cell_lng)), []).append(place)
+    for (cy, cx), places in buckets.items():
+        nearby = [p for dy in (-1, 0, 1) for dx in (-1, 0, 1) for p in buckets.get((cy + dy, cx + dx), ())]
+        for a in places:
+            lat_a, lng_a, spread_a = centres[a]
+            for b in nearby:
+                lat_b, lng_b, spread_b = centres[b]
+                if haversine_m(lat_a, lng_a, lat_b, lng_b) <= TRANSFER_RADIUS_M + spread_a + spread_b:
+                    pairs[a].add(b)
+
+    links = {}
+    for place, refs in members.items():
+        others = [ref for other in pairs[place] for ref in members[other]]
+        for a_pos, i in refs:
+            found = []
+            for b_pos, j in others:
+                if a_pos == b_pos:
+                    continue
+                walk_m = _link(routes[a_pos], i, routes[b_pos], j)
+                if walk_m is not None:
+                    found.append((b_pos, j, round(walk_m, 1)))
+            if found:
+                links[(a_pos, i)] = sorted(found)
+    return links
+
+
+def build_network(payload: dict):
+    stop_keys = set()
+    routes = []
+
+    for route in payload.get("routes", []):
+        stops = route.get("stops", [])
+        if not stops or route.get("route_number") is None:
+            continue
+
+        keys = [stop_key(s.get("stop_name")) for s in stops]
+        first_index = {}
+        for i, key in enumerate(keys):
+            if key and key not in first_index:
+                first_index[key] = i
+        stop_keys.update(first_index)
+
+        routes.append(
+            {
+                "route_number": route["route_number"],
+                "fare": route.get("fare_min_php"),
+                "coord_score": coordinate_score(route),
+                "keys": keys,
+                "coords": [
+                    (s["lat"], s["lng"]) if s.get("has_coordinates") and s.get("lat") is not None and s.get("lng") is not None else None
+                    for s in stops
+                ],
+                "places": [s.get("place_id") for s in stops],
+                "first_index": first_index,
+                "topology": route.get("topology"),
+                "cycle_length": route.get("cycle_length"),
+            }
+        )
+
+    routes.sort(key=lambda r: r["route_number"])
+    stops = sorted(stop_keys)
+
+    # Transfer links: (route, stop index) -> [(other route, other stop index, walk metres)].
+    if all(p is not None for route in routes for p in route["places"]):
+        links = place_links(routes)
+    else:
+        links = pairwise_links(routes)
+
+    return {"routes": routes, "stops": stops, "links": links}
+
+
+def _init_worker(network):
+    global _NETWORK
+    _NETWORK = network
+
+
+def _best(candidates):
+    candidates.sort(key=lambda c: c[0])
+    return [c[1] for c in candidates[:MAX_OPTIONS]]
+
+
+def journeys_from_origin(network: dict, origin: str):
+    routes = network["routes"]
+    links = network["links"]
+    direct = {}
+    transfer = {}
+
+    for a_pos, route_a in enumerate(routes):
+        o_idx = route_a["first_index"].get(origin)
+        if o_idx is None:
+            continue
+
+        for dest, d_idx in route_a["first_index"].items():
+            if dest == origin:
+                continue
+            span = travel_span(route_a["topology"], route_a["cycle_length"], o_idx, d_idx)
+            direct.setdefault(dest, []).append(
+                (
+                    rank_key(None, route_a["coord_score"], route_a["fare"], span, route_a["route_number"]),
+                    [route_a["route_number"], o_idx, d_idx, span],
+                )
+            )
+
+        for x_idx in range(len(route_a["keys"])):
+            if x_idx == o_idx:
+                continue
+            for b_pos, y_idx, walk_m in links.get((a_pos, x_idx), ()):
+                route_b = routes[b_pos]
+                if route_b["first_index"].get(origin) is not None:
+                    continue
+                fare = None
+                if route_a["fare"] is not None and route_b["fare"] is not None:
+                    fare = route_a["fare"] + route_b["fare"]
+                first_span = travel_span(route_a["topology"], route_a["cycle_length"], o_idx, x_idx)
+                for dest, d_idx in route_b["first_index"].items():
+                    if dest == origin or d_idx == y_idx:
+                        continue
+                    span = first_span + travel_span(route_b["topology"], route_b["cycle_length"], y_idx, d_idx)
+                    transfer.setdefault(dest, []).append(
+                        (
+                            rank_key(
+                                None,
+                                min(route_a["coord_score"], route_b["coord_score"]),
+                                fare,
+                                span,
+                                (route_a["route_number"], route_b["route_number"]),
+                                walk_m,
+                            ),
+                            [route_a["route_number"], o_idx, x_idx, route_b["route_number"], y_idx, d_idx, walk_m],
+                        )
+                    )
+
+    stop_index = {key: i for i, key in enumerate(network["stops"])}
+    row = {}
+    for dest in sorted(set(direct) | set(transfer), key=stop_index.get):
+        entry = {}
+        if dest in direct:
+            entry["d"] = _best(direct[dest])
+        if dest in transfer:
+            # Deduplicate identical legs reached through different transfer links.
+            seen = {}
+            for key, option in transfer[dest]:
+                ident = tuple(option)
+                if ident not in seen or key < seen[ident][0]:
+                    seen[ident] = (key, option)
+            entry["t"] = _best(list(seen.values()))
+        row[str(stop_index[dest])] = entry
+    return row
+
+
+def _journeys_for_chunk(origins):
+    return [(origin, journeys_from_origin(_NETWORK, origin)) for origin in origins]
+
+
+def build_journey_table(payload: dict, workers=None):
+    network = build_network(payload)
+    stops = network["stops"]
+    stop_index = {key: i for i, key in enumerate(stops)}
+    chunks = [stops[i : i + ORIGIN_CHUNK_SIZE] for i in range(0, len(stops), ORIGIN_CHUNK_SIZE)]
+
+    if workers == 1:
+        _init_worker(network)
+        results = list(map(_journeys_for_chunk, chunks))
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(network,)) as executor:
+            results = list(executor.map(_journeys_for_chunk, chunks))
+
+    pairs = {}
+    for chunk in results:
+        for origin, row in chunk:
+            if row:
+                pairs[str(stop_index[origin])] = row
+
+    return {
+        "generated_at_utc": payload.get("generated_at_utc"),
+        "max_options": MAX_OPTIONS,
+        "transfer_radius_m": TRANSFER_RADIUS_M,
+        "direct_fields": ["route_number", "board_index", "alight_index", "stop_span"],
+        "transfer_fields": [
+            "first_route_number",
+            "board_index",
+            "transfer_from_index",
+            "second_route_number",
+            "transfer_to_index",
+            "alight_index",
+            "walk_m",
+        ],
+        "stops": stops,
+        "pairs": pairs,
+    }
+
+
+def write_journey_table(table: dict, path: Path = JOURNEY_TABLE):
+    raw = dumps(table)
+    # mtime=0 keeps the archive byte-identical across rebuilds of the same dataset.
+    with open(path, "wb") as fh:
+        with gzip.GzipFile(fileobj=fh, mode="wb", compresslevel=9, mtime=0) as gz:
+            gz.write(raw)
+    return len(raw)
+
+
+def load_journey_table(path: Path = JOURNEY_TABLE):
+    with gzip.open(path, "rb") as fh:
+        table = json.loads(fh.read().decode("utf-8"))
+    table["stop_index"] = {key: str(i) for i, key in enumerate(table["stops"])}
+    return table
+
+
+def lookup_journeys(table: dict, origin_stop: str, destination_stop: str):
+    origin = table["stop_index"].get(stop_key(origin_stop))
+    destination = table["stop_index"].get(stop_key(destination_stop))
+    if origin is None or destination is None:
+        return {"direct": [], "transfer": []}
+
+    entry = table["pairs"].get(origin, {}).get(destination, {})
+    return {
+        "direct": [dict(zip(table["direct_fields"], row)) for row in entry.get("d", [])],
+        "transfer": [dict(zip(table["transfer_fields"], row)) for row in entry.get("t", [])],
+    }
+
+
+def main():
+    if not PRD_JSON.exists():
+        raise FileNotFoundError(f"Missing {PRD_JSON}")
+
+    payload = json.loads(PRD_JSON.read_text(encoding="utf-8"))
+
+    started = time.perf_counter()
+    table = build_journey_table(payload, workers=os.cpu_count())
+    elapsed = time.perf_counter() - started
+    raw_size = write_journey_table(table)
+
+    pair_count = sum(len(row) for row in table["pairs"].values())
+    direct_count = sum(1 for row in table["pairs"].values() for entry in row.values() if "d" in entry)
+
+    print(f"Saved: {JOURNEY_TABLE}")
+    print(f"Stops: {len(table['stops'])}")
+    print(f"Stop pairs with options: {pair_count}")
+    print(f"Stop pairs with direct options: {direct_count}")
+    print(f"Table size: {raw_size} bytes raw, {JOURNEY_TABLE.stat().st_size} bytes gzip")
+    print(f"Build time: {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
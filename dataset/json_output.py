@@ -0,0 +1,84 @@
+import json
+import os
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:  # optional; stdlib json is the fallback
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # optional
+    msgspec = None
+
+
+JSON_BACKEND_ENV = "ROUTE25_JSON_BACKEND"
+BACKENDS = ("orjson", "msgspec", "stdlib")
+STREAM_CHUNK_BYTES = 1 << 16
+
+
+def available_backends():
+    return [name for name, module in zip(BACKENDS, (orjson, msgspec, json)) if module is not None]
+
+
+def json_backend(name=None):
+    name = name or os.environ.get(JSON_BACKEND_ENV)
+    if name:
+        if name not in available_backends():
+            raise ValueError(f"JSON backend {name!r} is not available (have: {', '.join(available_backends())})")
+        return name
+    return available_backends()[0]
+
+
+# Every backend writes the same layout as json.dumps(..., ensure_ascii=False) with
+# indent=2 (pretty) or (",", ":") separators (compact), so switching between them keeps
+# diffs small. They are not byte-identical: orjson writes exponents as 1e16 where
+# stdlib writes 1e+16, and orjson/msgspec write NaN/inf as null. stdlib refuses
+# NaN/inf (allow_nan=False) rather than emit NaN, which is not JSON.
+def _stdlib_encoder(pretty, sort_keys):
+    if pretty:
+        return json.JSONEncoder(ensure_ascii=False, allow_nan=False, indent=2, sort_keys=sort_keys)
+    return json.JSONEncoder(ensure_ascii=False, allow_nan=False, separators=(",", ":"), sort_keys=sort_keys)
+
+
+def dumps(data, pretty=False, sort_keys=False, backend=None) -> bytes:
+    backend = json_backend(backend)
+    if backend == "orjson":
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(data, option=option)
+    if backend == "msgspec":
+        raw = msgspec.json.encode(data, order="sorted" if sort_keys else None)
+        return msgspec.json.format(raw, indent=2) if pretty else raw
+    return _stdlib_encoder(pretty, sort_keys).encode(data).encode("utf-8")
+
+
+def write_json(path, data, pretty=True, sort_keys=False, backend=None):
+    # The C backends build one bytes buffer (no intermediate str); stdlib streams
+    # encoder chunks straight to the file instead of joining one giant string.
+    path = Path(path)
+    backend = json_backend(backend)
+    if backend != "stdlib":
+        raw = dumps(data, pretty=pretty, sort_keys=sort_keys, backend=backend)
+        path.write_bytes(raw)
+        return len(raw)
+
+    size = 0
+    pending = []
+    pending_size = 0
+    with open(path, "wb") as f:
+        for chunk in _stdlib_encoder(pretty, sort_keys).iterencode(data):
+            chunk = chunk.encode("utf-8")
+            pending.append(chunk)
+            pending_size += len(chunk)
+            if pending_size >= STREAM_CHUNK_BYTES:
+                f.write(b"".join(pending))
+                size += pending_size
+                pending = []
+                pending_size = 0
+        f.write(b"".join(pending))
+    return size + pending_size
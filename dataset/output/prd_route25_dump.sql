@@ -1,6 +1,9 @@
 -- Route25 PRD-focused SQL dump (PostgreSQL / Supabase)
 BEGIN TRANSACTION;
 
+DROP MATERIALIZED VIEW IF EXISTS prd_dataset_json;
+DROP TABLE IF EXISTS prd_route_points;
+DROP TABLE IF EXISTS prd_route_polylines;
 DROP TABLE IF EXISTS prd_route_stops;
 DROP TABLE IF EXISTS prd_routes;
 DROP TABLE IF EXISTS prd_meta;
@@ -31,559 +34,4822 @@ CREATE TABLE prd_route_stops (
     lng REAL,
     FOREIGN KEY (route_id) REFERENCES prd_routes(route_id)
 );
+CREATE TABLE prd_route_polylines (
+    polyline_id INTEGER PRIMARY KEY,
+    route_id INTEGER NOT NULL,
+    segment_index INTEGER NOT NULL,
+    segment_name TEXT,
+    point_count INTEGER,
+    FOREIGN KEY (route_id) REFERENCES prd_routes(route_id)
+);
+CREATE TABLE prd_route_points (
+    polyline_id INTEGER NOT NULL,
+    point_order INTEGER NOT NULL,
+    lat DOUBLE PRECISION,
+    lng DOUBLE PRECISION,
+    PRIMARY KEY (polyline_id, point_order),
+    FOREIGN KEY (polyline_id) REFERENCES prd_route_polylines(polyline_id)
+);
 
 INSERT INTO prd_meta (id, generated_at_utc, route_count, routes_with_stop_coordinates, routes_with_fare) VALUES (1, '2026-02-18T13:28:41.286047+00:00', 25, 10, 0);
-INSERT INTO prd_routes (route_id, route_number, route_code, route_name, fare_min_php, fare_max_php, fare_text, stop_count) VALUES (1, 1, 'ROUTE 1', 'BO. OBRERO, LAPUZ TO CITY PROPER LOOP', NULL, NULL, NULL, 10);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1, 1, 1, 'Everlasting Street, Lapuz, Iloilo City, Iloilo', 10.6988168, 122.587106);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (2, 1, 2, 'Arroyo Fountain, 399-A Iznart St, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 10.7015273, 122.5690194);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (3, 1, 3, 'Washington Supermart, Guanco Street, Iloilo City Proper, Iloilo City, Iloilo', 10.6940383, 122.5709329);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (4, 1, 4, 'Iloilo Central Market Building, Iloilo City Proper, Iloilo City, Iloilo', 10.6926369, 122.5701416);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (5, 1, 5, 'MHW9+45V Hawaii, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 10.6951872, 122.5678818);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (6, 1, 6, 'PH29+83M, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 10.7008545, 122.5677122);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (7, 1, 7, '5000 Iznart Street, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 10.7015516, 122.5689458);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (8, 1, 8, '59 Rizal St, Lapuz, Iloilo City, 5000 Iloilo, Philippines', 10.7068118, 122.5691386);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (9, 1, 9, 'PH2C+VH9, Lapuz, Iloilo City, Iloilo, Philippines', 10.7022369, 122.5715509);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (10, 1, 10, 'PH2F+MM3, Rizal St, Lapuz, Iloilo City, Iloilo, Philippines', 10.7017971, 122.5742432);
-INSERT INTO prd_routes (route_id, route_number, route_code, route_name, fare_min_php, fare_max_php, fare_text, stop_count) VALUES (2, 2, 'ROUTE 2', 'VILLA PLAZA TO CITY PROPER VIA CALUMPANG', NULL, NULL, NULL, 17);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (11, 2, 1, 'Arevalo Elementary School, Jocson Street, Villa Arevalo District, Iloilo City, Iloilo', 10.6888711, 122.5170727);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (12, 2, 2, 'Breakthrough Restaurant, Villa Arevalo District, Iloilo City, Iloilo', 10.6802346, 122.5174426);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (13, 2, 3, 'Boulevard Health Center, Brgy. Boulevard, Molo, Iloilo City, Iloilo', 10.6894795, 122.5486624);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (14, 2, 4, 'MHW9+HJP, Arroyo St, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 10.6963895, 122.5690103);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (15, 2, 5, 'Iloilo Grand Hotel Corporation, Iznart Street, Iloilo City Proper, Iloilo City, Iloilo', 10.6926742, 122.5691105);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (16, 2, 6, 'MHVF+25F, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 10.6926023, 122.5730597);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (17, 2, 7, '2022 Rizal St, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 10.6916576, 122.5737202);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (18, 2, 8, 'University of Iloilo - Phinma Education, Rizal Street, Iloilo City Proper, Iloilo City, Iloilo', 10.6920277, 122.5695958);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (19, 2, 9, 'UNITOP, Iloilo City Proper, Iloilo City, Iloilo', 10.6963401, 122.5684774);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (20, 2, 10, 'UNITOP, Iloilo City Proper, Iloilo City, Iloilo', 10.6963401, 122.5684774);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (21, 2, 11, 'Tanza Church, Iloilo City Proper, Iloilo City, Iloilo', 10.6934022, 122.5592303);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (22, 2, 12, 'Boulevard Health Center, Brgy. Boulevard, Molo, Iloilo City, Iloilo', 10.6894795, 122.5486624);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (23, 2, 13, 'Breakthrough Restaurant, Villa Arevalo District, Iloilo City, Iloilo', 10.6802346, 122.5174426);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (24, 2, 14, 'Iloilo Supermart - Villa, Quezon Street, Villa, Iloilo City, Iloilo', 10.6870736, 122.5169089);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (25, 2, 15, 'Ventuno Bar & Cafe Villa Branch, Villa Arevalo District, Leon, Iloilo', 10.6875522, 122.5210179);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (26, 2, 16, 'Dunkin'' Donuts, Villa Arevalo District, Iloilo City, Iloilo', 10.6890609, 122.5208865);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (27, 2, 17, 'Arevalo Elementary School, Jocson Street, Villa Arevalo District, Iloilo City, Iloilo', 10.6888711, 122.5170727);
-INSERT INTO prd_routes (route_id, route_number, route_code, route_name, fare_min_php, fare_max_php, fare_text, stop_count) VALUES (3, 3, 'ROUTE 3', 'UNGKA TO CITY PROPER VIA CPU LOOP', NULL, NULL, NULL, 16);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (28, 3, 1, 'GT Town Center Pavia, Pavia, Iloilo', 10.7533792, 122.5383523);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (29, 3, 2, 'CARMELITE MONASTERY, Iloilo East Coast - Capiz Road, Jaro, Iloilo City, Iloilo', 10.7379901, 122.5438145);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (30, 3, 3, 'PHC5+CPC, Jaro, Iloilo City, Iloilo, Philippines', 10.7210293, 122.5592384);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (31, 3, 4, 'Arroyo Fountain, Iznart Street, Iloilo City Proper, Iloilo City, Iloilo', 10.7015273, 122.5690194);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (32, 3, 5, 'Socorro Drug Company, Iznart St. Cor. J.M. Basa St., City Proper, Iloilo City, Iloilo', 10.6962877, 122.5692676);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (33, 3, 6, 'CityMall - Parola, Parola Wharf, Iloilo City Proper, Iloilo City, Iloilo', 10.6922161, 122.5827724);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (34, 3, 7, 'A.Montes ll Elementary School, Duran St, Iloilo City Proper, Iloilo City, Iloilo', 10.6916394, 122.5777668);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (35, 3, 8, 'Plaza Libertad, Zamora Street, Iloilo City Proper, Iloilo City, Iloilo', 10.6922737, 122.5734065);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (36, 3, 9, '399-A Iznart St, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 10.6999876, 122.5691099);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (37, 3, 10, 'Gaisano Capital City-Iloilo, La Paz, Iloilo City, Iloilo', 10.7073963, 122.5671856);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (38, 3, 11, 'Gaisano Capital City-Iloilo, La Paz, Iloilo City, Iloilo', 10.7073963, 122.5671856);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (39, 3, 12, 'Lapaz Public Market, Huervana Street, La Paz, Iloilo City, Iloilo', 10.7086308, 122.5675671);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (40, 3, 13, 'Jaro Plaza, Plaza Rizal Street, Jaro, Iloilo City, Iloilo', 10.7247369, 122.55776);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (41, 3, 14, 'TIBIAO BAKERY, Washington Street, Jaro, Iloilo City, Iloilo', 10.7267706, 122.5579864);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (42, 3, 15, 'Iloilo Baptist church, Jaro, Iloilo City, Iloilo', 10.7279704, 122.5551388);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (43, 3, 16, 'CHRIST THE KING MEMORIAL PARK, Diversion Rd, Jaro, Iloilo City, Iloilo', 10.7457608, 122.5411428);
-INSERT INTO prd_routes (route_id, route_number, route_code, route_name, fare_min_php, fare_max_php, fare_text, stop_count) VALUES (4, 4, 'ROUTE 4', 'UNGKA TO CITY PROPER VIA B. AQUINO AVE./ FESTIVE WALK LOOP', NULL, NULL, NULL, 9);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (44, 4, 1, 'GT Town Center Pavia, Pavia, Iloilo', 10.7533792, 122.5383523);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (45, 4, 2, 'Carlos'' Bakeshop, Mandurriao, Iloilo City, Iloilo', 10.7250526, 122.5494275);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (46, 4, 3, 'Richmonde Hotel Iloilo, Mandurriao, Iloilo City, Iloilo', 10.7154168, 122.5458035);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (47, 4, 4, 'SM City Iloilo, Benigno Aquino Avenue, Mandurriao, Iloilo City, Iloilo', 10.7139462, 122.5517573);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (48, 4, 5, 'MHV4+35H, Iloilo City Proper, Brgy. North Baluarte, Molo, Iloilo City, 5000 Iloilo, Philippines', 10.6926859, 122.5553367);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (49, 4, 6, 'Robinsons Iloilo, Mabini Street, Iloilo City Proper, Iloilo City, Iloilo', 10.6946794, 122.5648804);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (50, 4, 7, 'Sta. Teresita del Niño Jesus Parish - Iloilo City, J. De Leon Street, Iloilo City Proper, Iloilo City, Iloilo', 10.6931039, 122.5667699);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (51, 4, 8, 'MHX9+353, Delgado St, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 10.6976499, 122.5678143);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (52, 4, 9, 'UPV - College of Management, Iloilo City Proper, Iloilo City, Iloilo', 10.6970485, 122.5548117);
-INSERT INTO prd_routes (route_id, route_number, route_code, route_name, fare_min_php, fare_max_php, fare_text, stop_count) VALUES (5, 5, 'ROUTE 5', 'FESTIVE WALK TO CITY PROPER VIA B. AQUINO AVE. AND SM CITY', NULL, NULL, NULL, 15);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (53, 5, 1, 'Festive Walk Mall, Megaworld Boulevard, Mandurriao, Iloilo City, Iloilo', 10.7169101, 122.5465366);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (54, 5, 2, 'PH73+P48, Jalandoni St, Mandurriao, Iloilo City, Iloilo, Philippines', 10.7143744, 122.5524441);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (55, 5, 3, 'Atrium Iloilo Commercial Center, General Luna Street, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 10.7015457, 122.5681237);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (56, 5, 4, 'Socorro Drug Company, Iznart St. Cor. J.M. Basa St., City Proper, Iloilo City, Iloilo, Philippines', 10.6962877, 122.5692676);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (57, 5, 5, 'Plaza Libertad, Zamora Street, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 10.6923154, 122.5733644);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (58, 5, 6, 'University of Iloilo - Phinma Education, Rizal Street, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 10.6920277, 122.5695958);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (59, 5, 7, 'UNITOP, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 10.6963401, 122.5684774);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (60, 5, 8, 'Maybank Ledesma, Mabini Street, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 10.6957178, 122.5648069);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (61, 5, 9, 'Feline''s Gift Shop, Delgado Street, Iloilo City Proper, Iloilo City, Iloilo', 10.697303, 122.5620788);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (62, 5, 10, 'JD Bakery Cafe – Gen. Luna, General Luna Street, La Paz, Iloilo City, Iloilo', 10.7004549, 122.5603651);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (63, 5, 11, 'JD Bakery Cafe – Gen. Luna, General Luna Street, La Paz, Iloilo City, Iloilo', 10.7004549, 122.5603651);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (64, 5, 12, 'Zuri Hotel, Benigno Aquino Avenue, Mandurriao, Iloilo City, Iloilo', 10.7159904, 122.5527924);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (65, 5, 13, 'Atria Park District, Benigno Aquino Avenue, Mandurriao, Iloilo City, Iloilo', 10.7062819, 122.5492651);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (66, 5, 14, 'Tabucan Elementary School, San Rafael-Tabucan Road, Mandurriao, Iloilo City, Iloilo', 10.7047452, 122.5449536);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (67, 5, 15, 'Festive Walk Mall, Megaworld Boulevard, Mandurriao, Iloilo City, Iloilo', 10.7169101, 122.5465366);
-INSERT INTO prd_routes (route_id, route_number, route_code, route_name, fare_min_php, fare_max_php, fare_text, stop_count) VALUES (6, 6, 'ROUTE 6', 'LANIT TO SM CITY VIA INFANTE', NULL, NULL, NULL, 42);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (68, 6, 1, 'Lanit/Leganes Boundary loop', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (69, 6, 2, 'Tiu Cho Teg-Ana Ros Foundation Integrated School', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (70, 6, 3, 'lloilo Radial Bypass Rd', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (71, 6, 4, 'Iloilo Circumferential Rd. (C. Aquino Ave.)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (72, 6, 5, 'Tacas Quintin Salas Rd. (SM Savemore)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (73, 6, 6, 'MacArthur Dr. (LTO/LTFRB)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (74, 6, 7, 'Simon Ledesma St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (75, 6, 8, 'Lopez Jaena St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (76, 6, 9, '(Biscocho House)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (77, 6, 10, 'Rizal Street (Jaro Plaza)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (78, 6, 11, 'E. Lopez St. (Robinsons Jaro)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (79, 6, 12, 'Jalandoni St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (80, 6, 13, '(Injap Tower Hotel) B. Aquino Ave', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (81, 6, 14, 'U-turn Gil Trading Car Sales/Petron', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (82, 6, 15, 'B. Aquino Ave', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (83, 6, 16, 'Pison Rotunda', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (84, 6, 17, 'B. Aquino Ave', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (85, 6, 18, 'Infante (UP/llollo Doctors’ Hospital/Iloilo Fish Port)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (86, 6, 19, 'Locsin St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (87, 6, 20, 'Rizal St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (88, 6, 21, 'Infante', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (89, 6, 22, 'B. Aquino Ave. Gaisano Hub', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (90, 6, 23, 'SM Transport Hub (Strata)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (91, 6, 24, 'Jalandoni St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (92, 6, 25, '(Injap Tower Hotel)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (93, 6, 26, 'Commission Civil St. (SM Hypermarket)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (94, 6, 27, 'M. Jayme', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (95, 6, 28, 'E. Lopez (Robinsons Jaro)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (96, 6, 29, 'Seminario St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (97, 6, 30, 'Burgos St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (98, 6, 31, 'Cuartero St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (99, 6, 32, 'Fajardo St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (100, 6, 33, 'Libertad St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (101, 6, 34, 'Sta. Isabel', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (102, 6, 35, 'Lopez Jaena St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (103, 6, 36, 'Washington St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (104, 6, 37, 'MacArthur Dr', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (105, 6, 38, 'Tacas-Quintin Salas Rd', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (106, 6, 39, 'Iloilo Circumferential Rd. (C. Aquino Ave.)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (107, 6, 40, 'llollo Radial Bypass Rd', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (108, 6, 41, 'Tiu Cho Teg-Ana Ros Foundation Integrated School', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (109, 6, 42, 'Lanit/ Leganes Boundary loop', NULL, NULL);
-INSERT INTO prd_routes (route_id, route_number, route_code, route_name, fare_min_php, fare_max_php, fare_text, stop_count) VALUES (7, 7, 'ROUTE 7', 'COMPANIA TO CITY PROPER LOOP', NULL, NULL, NULL, 7);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (110, 7, 1, 'Plaza Libertad, Zamora Street, Iloilo City Proper, Iloilo City, Iloilo', 10.6922737, 122.5734065);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (111, 7, 2, 'ISC ILOILO SOCIETY COMMERCIAL, INC, Rizal Street, Iloilo City Proper, Iloilo City, Iloilo', 10.6918834, 122.5722006);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (112, 7, 3, 'MHW9+HJP, Arroyo St, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 10.6964031, 122.5690608);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (113, 7, 4, 'MHW6+8P8, Jalandoni St, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 10.6956991, 122.5617174);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (114, 7, 5, 'MGRM+6JV, Compania Fundidor road, Molo, Iloilo City, Iloilo, Philippines', 10.6906202, 122.534218);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (115, 7, 6, 'MGWV+R8J, Lacson Street, Molo, Iloilo City, 5000 Iloilo, Philippines', 10.6972825, 122.543449);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (116, 7, 7, '216 Locsin St, Molo, Iloilo City, Iloilo, Philippines', 10.6944744, 122.5456124);
-INSERT INTO prd_routes (route_id, route_number, route_code, route_name, fare_min_php, fare_max_php, fare_text, stop_count) VALUES (8, 8, 'ROUTE 8', 'PAROLA TO SM CITY VIA INFANTE LOOP', NULL, NULL, NULL, 23);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (117, 8, 1, 'Parola Wharf (City Mall Parola)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (118, 8, 2, 'Zamora Ext', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (119, 8, 3, 'Zamora St. (GSIS)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (120, 8, 4, 'Rizal St. (lloilo Central Market)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (121, 8, 5, 'Quezon St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (122, 8, 6, 'De Leon St. (Robinsons City)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (123, 8, 7, 'Jalandoni St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (124, 8, 8, 'Rizal St. (Tanza Church)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (125, 8, 9, 'Infante St. (lloilo Doctors’ Hospital-College/UPV Iloilo Campus)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (126, 8, 10, 'B. Aquino Ave', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (127, 8, 11, 'Gaisano ICC loop', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (128, 8, 12, 'B. Aquino Ave', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (129, 8, 13, 'SM Transport Hub (Strata)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (130, 8, 14, 'B. Aquino Ave', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (131, 8, 15, 'U-turn Gil Traders/Petron Station', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (132, 8, 16, 'B. Aquino Ave. (Zuri Hotel)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (133, 8, 17, 'Plazuela 1&2', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (134, 8, 18, 'Pacencia Tijam Ave. (S&R/Atria)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (135, 8, 19, 'Pison Rotunda', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (136, 8, 20, 'B. Aquino Ave. (Smallville/Esplanade 182)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (137, 8, 21, 'Infante St.(UPV Iloilo Campus/lloilo Doctors’ Hospital/College)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (138, 8, 22, 'Rizal St. Zamora St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (139, 8, 23, 'Zamora Ext. Parola Wharf (City Mall Parola)', NULL, NULL);
-INSERT INTO prd_routes (route_id, route_number, route_code, route_name, fare_min_php, fare_max_php, fare_text, stop_count) VALUES (9, 9, 'ROUTE 9', 'MOHON TO CITY PROPER LOOP', NULL, NULL, NULL, 12);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (140, 9, 1, 'Mohon Terminal, Osmeña Street, Villa Arevalo District, Iloilo City, Iloilo', 10.6934751, 122.499771);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (141, 9, 2, 'Plaza Villa, Yulo Drive, Villa Arevalo District, Iloilo City, Iloilo', 10.6890699, 122.516098);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (142, 9, 3, 'YMCA - Iloilo, Iloilo City Proper, Iloilo City, Iloilo', 10.7008474, 122.5691106);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (143, 9, 4, 'Roberto''s, JM Basa Street, Iloilo City Proper, Iloilo City, Iloilo', 10.6937638, 122.5712931);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (144, 9, 5, 'MHRF+M3C, Rizal St, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 10.6917358, 122.5731649);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (145, 9, 6, 'MHR9+P6J, Rizal St, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 10.6919073, 122.5679494);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (146, 9, 7, 'Corner Valeria, MHX9+44M, Delgado St, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 10.697848, 122.5677724);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (147, 9, 8, '104 De Leon St, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 10.6933332, 122.5647583);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (148, 9, 9, '208b Fuentes St, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 10.6943997, 122.5632707);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (149, 9, 10, 'MHV3+PXQ, Infante St, Molo, Iloilo City, 5000 Iloilo, Philippines', 10.6944738, 122.5550266);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (150, 9, 11, 'MHV3+PXQ, Infante St, Molo, Iloilo City, 5000 Iloilo, Philippines', 10.6944738, 122.5550266);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (151, 9, 12, '102 General Luna St, Molo, Iloilo City, Iloilo, Philippines', 10.69968, 122.553494);
-INSERT INTO prd_routes (route_id, route_number, route_code, route_name, fare_min_php, fare_max_php, fare_text, stop_count) VALUES (10, 10, 'ROUTE 10', 'BUNTATALA / TAGBAK TERMINAL TO CITY PROPER LOOP', NULL, NULL, NULL, 39);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (152, 10, 1, 'Buntatala Loop (Spousal of Mary and Joseph Parish Church)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (153, 10, 2, 'Tagbak Terminal', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (154, 10, 3, 'MacArthur Dr. (NFA', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (155, 10, 4, 'Iloilo Supermart Jaro', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (156, 10, 5, 'Angelicum)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (157, 10, 6, 'Simon Ledesma St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (158, 10, 7, 'Jaro Plaza Rizal St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (159, 10, 8, 'Commission Civil St. (SM Hypermarket)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (160, 10, 9, 'Del Carmen St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (161, 10, 10, 'Luna St. (Benito Hospital', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (162, 10, 11, 'WVSU)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (163, 10, 12, 'Bonifacio Dr. (Provincial Capitol', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (164, 10, 13, 'Atrium Mall)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (165, 10, 14, 'Gen. Luna St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (166, 10, 15, 'Jalandoni St. (University of San Agustin )', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (167, 10, 16, 'Rizal St. (Super)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (168, 10, 17, 'Mabini St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (169, 10, 18, 'De Leon St. (Robinsons City)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (170, 10, 19, 'Quezon St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (171, 10, 20, 'Rizal St. (UI Phinma) Mapa St. (Bombo Radyo lloilo', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (172, 10, 21, 'Goldberry Lite Hotel)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (173, 10, 22, 'JM Basa St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (174, 10, 23, 'Ortiz St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (175, 10, 24, 'Rizal St. (lloilo Central Market)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (176, 10, 25, 'Quezon St. (Sta. Teresita Church)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (177, 10, 26, 'De Leon St. (Ledi Supermart)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (178, 10, 27, 'Valeria St. (Marymart) Gen. Luna St. (Atrium lloilo)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (179, 10, 28, 'Muelle Loney St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (180, 10, 29, 'Rizal St. (La Paz)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (181, 10, 30, 'Luna St. (WIT)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (182, 10, 31, 'E. Lopez St. (Benito Hospital)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (183, 10, 32, 'Del Carmen St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (184, 10, 33, 'Commission Civil St. (SM Hypermarket)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (185, 10, 34, 'Rizal St. (Jaro Plaza', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (186, 10, 35, 'Ledi Supermart)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (187, 10, 36, 'Washington St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (188, 10, 37, 'MacArthur Dr. (lloilo Supermart Jaro)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (189, 10, 38, 'Tagbak Terminal', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (190, 10, 39, 'Buntatala Loop (Spousal of Mary and Joseph Parish Church)', NULL, NULL);
-INSERT INTO prd_routes (route_id, route_number, route_code, route_name, fare_min_php, fare_max_php, fare_text, stop_count) VALUES (11, 11, 'ROUTE 11', 'TICUD, LA PAZ TO CITY PROPER LOOP', NULL, NULL, NULL, 14);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (191, 11, 1, 'Ticud Terminal, La Paz, Iloilo City, Iloilo', 10.7174092, 122.5801028);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (192, 11, 2, 'Jereos Street, La Paz, Iloilo City, Iloilo', 10.7159911, 122.5688388);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (193, 11, 3, '29 Commission Civil St, Jaro, Iloilo City, Iloilo, Philippines', 10.7185679, 122.5639723);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (194, 11, 4, '23 Huervana St, La Paz, Iloilo City, Iloilo, Philippines', 10.710335, 122.5702298);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (195, 11, 5, '113 Luna St, La Paz, Iloilo City, 5000 Iloilo, Philippines', 10.7091764, 122.5668534);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (196, 11, 6, 'No. 119 Luna St, La Paz, Iloilo City, Iloilo, Philippines', 10.7089777, 122.5667618);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (197, 11, 7, 'PH39+J4Q, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 10.7039756, 122.5679633);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (198, 11, 8, '42 Jalandoni St, Iloilo City Proper, Iloilo City, 5000 Iloilo, Philippines', 10.6974743, 122.5617384);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (199, 11, 9, 'MHV6+RH9, Jalandoni St, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 10.6945516, 122.5617376);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (200, 11, 10, 'Locsin-Coscuella Building, Iznart St, Iloilo City Proper, Iloilo City, 5000 Iloilo, Philippines', 10.6963196, 122.5687497);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (201, 11, 11, '2022 Rizal St, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 10.6916576, 122.5737202);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (202, 11, 12, '222 Santo Rosario St, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 10.6918424, 122.5749708);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (203, 11, 13, 'MHVC+FP2, Muelle Loney St, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 10.6936278, 122.5716409);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (204, 11, 14, 'PH29+W9F, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 10.7023036, 122.5681325);
-INSERT INTO prd_routes (route_id, route_number, route_code, route_name, fare_min_php, fare_max_php, fare_text, stop_count) VALUES (12, 12, 'ROUTE 12', 'MANDURRIAO TO CITY PROPER VIA FESTIVE WALK / B. AQUINO AVE.', NULL, NULL, NULL, 33);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (205, 12, 1, 'Mandurriao Plaza', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (206, 12, 2, 'PHHC', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (207, 12, 3, 'R. Mapa St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (208, 12, 4, 'Megaworld Blvd', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (209, 12, 5, 'Festive Walk Transport Hub', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (210, 12, 6, 'Spur Rd. (Carlo’s Bakeshop)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (211, 12, 7, 'B. Aquino Ave. (SM City)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (212, 12, 8, 'Pison loop (Seda Hotel)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (213, 12, 9, 'B. Aquino Ave', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (214, 12, 10, 'Gen. Luna St. (UPV Iloilo Campus/University of San Agustin)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (215, 12, 11, 'Jalandoni St. (University of San Agustin Gym)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (216, 12, 12, 'Ledesma St. (Robinsons City)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (217, 12, 13, 'Iznart St. (Socorro Drug/ Iloilo Central Market)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (218, 12, 14, 'Rizal St. (UI Phinma)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (219, 12, 15, 'Valeria St. (Marymart)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (220, 12, 16, 'Delgado St. (SM Delgado)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (221, 12, 17, 'Mabini St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (222, 12, 18, 'Gen. Luna St. (UPV Iloilo Campus)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (223, 12, 19, 'B. Aquino Ave. Gaisano llollo City Center Loop', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (224, 12, 20, 'SM Transport Hub', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (225, 12, 21, 'B. Aquino Ave', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (226, 12, 22, 'U-turn Fancom Inc', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (227, 12, 23, 'Spur Road (Carlos Bakeshop)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (228, 12, 24, 'Q. Abeto St. (WVMC)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (229, 12, 25, 'Guzman St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (230, 12, 26, 'Perfecto St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (231, 12, 27, 'Oñate St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (232, 12, 28, 'De Leon St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (233, 12, 29, 'Jesena St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (234, 12, 30, 'Benedicto St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (235, 12, 31, 'Libertad St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (236, 12, 32, '(PHHC) Housing Main Road', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (237, 12, 33, 'Q. Abeto St', NULL, NULL);
-INSERT INTO prd_routes (route_id, route_number, route_code, route_name, fare_min_php, fare_max_php, fare_text, stop_count) VALUES (13, 13, 'ROUTE 13', 'HIBAO-AN TO CITY PROPER VIA TABUCAN HUB LOOP', NULL, NULL, NULL, 25);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (238, 13, 1, 'Hibao-an Loop', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (239, 13, 2, 'Guzman St. (Ana Ros VIllage)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (240, 13, 3, 'R. Mapa St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (241, 13, 4, 'Carpenter’s Bridge', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (242, 13, 5, 'Locsin St. (lloilo Supermart Molo) MH del Pilar St. (John B. Lacson University)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (243, 13, 6, 'Gen. Luna St. (UPV Iloilo Campus/University of San Agustin)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (244, 13, 7, 'Jalandoni St. (University of San Agustin Gym)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (245, 13, 8, 'Ledesma St. (Robinsons City)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (246, 13, 9, 'Iznart St. (Socorro Drug/ Iloilo Central Market)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (247, 13, 10, 'Rizal St. (UI Phinma)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (248, 13, 11, 'Ortiz St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (249, 13, 12, 'JM Basa St. (Plaza Libertad)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (250, 13, 13, 'Rizal St. (Gaisano Capital/Ilollo Central Market)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (251, 13, 14, 'Iznart St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (252, 13, 15, 'Ledesma St. (Colegio de las Hijas de Jesus)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (253, 13, 16, 'Jalandoni St. (University of San Agustin Gym)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (254, 13, 17, 'Gen. Luna St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (255, 13, 18, 'MH del Piiar St. (Hotel del Rio)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (256, 13, 19, 'San Pedro St. (Molo Plaza)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (257, 13, 20, 'Locsin St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (258, 13, 21, 'Carpenter Br. (Medical City)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (259, 13, 22, 'R. Mapa St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (260, 13, 23, 'Onate St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (261, 13, 24, 'Guzman-Jesena St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (262, 13, 25, 'Hibao-an Loop', NULL, NULL);
-INSERT INTO prd_routes (route_id, route_number, route_code, route_name, fare_min_php, fare_max_php, fare_text, stop_count) VALUES (14, 14, 'ROUTE 14', 'HIBAO-AN TO JARO VIA B. AQUINO AVE. / FESTIVE LOOP', NULL, NULL, NULL, 22);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (263, 14, 1, 'Hibao-an Norte Loop', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (264, 14, 2, 'Guzman St. (Hibao-an Elementary School)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (265, 14, 3, 'Q. Abeto St. (WVMC/J7 Plaza Hotel)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (266, 14, 4, 'Megaworld Blvd', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (267, 14, 5, 'Festive Walk Transport Hub', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (268, 14, 6, 'Taft St. (lloilo Integrated School)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (269, 14, 7, 'B. Aquino Ave. (Zuri Hotel/SM City)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (270, 14, 8, 'Pison Ave', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (271, 14, 9, 'Rotunda (Seda)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (272, 14, 10, 'SM Transport Hub (Strata)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (273, 14, 11, 'B. Aquino Ave', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (274, 14, 12, 'Jalandoni St. (Injap Tower)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (275, 14, 13, 'Commission Civil St. (SM Hypermarket)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (276, 14, 14, 'Rizal St. (Plaza Jaro)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (277, 14, 15, 'El-98 St. (Jaro Market)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (278, 14, 16, 'B. Aquino Ave', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (279, 14, 17, 'Carlos', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (280, 14, 18, 'U-turn Fancom Inc', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (281, 14, 19, 'Spur Road', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (282, 14, 20, 'Turn Right Q. Abeto St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (283, 14, 21, 'Guzman St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (284, 14, 22, 'Hibao-an Loop', NULL, NULL);
-INSERT INTO prd_routes (route_id, route_number, route_code, route_name, fare_min_php, fare_max_php, fare_text, stop_count) VALUES (15, 15, 'ROUTE 15', 'MOLO TO CITY PROPER VIA BALUARTE LOOP', NULL, NULL, NULL, 15);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (285, 15, 1, 'Iloilo City National High School, Molo, Iloilo City, Iloilo', 10.6986445, 122.5489371);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (286, 15, 2, 'Molo Plaza, San Pedro Street, Molo, Iloilo City, Iloilo', 10.6968839, 122.5437346);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (287, 15, 3, 'Locsin Street, Molo, Iloilo City, Iloilo', 10.6953011, 122.5448801);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (288, 15, 4, 'MHW9+HJP, Arroyo St, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 10.6964031, 122.5690608);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (289, 15, 5, 'Iloilo Grand Hotel Corporation, Iznart Street, Iloilo City Proper, Iloilo City, Iloilo', 10.6926742, 122.5691105);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (290, 15, 6, 'Ortiz Jeepney Stop, Oritz Street, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 10.6919796, 122.571659);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (291, 15, 7, 'Plaza Libertad Jeepney Stop, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 10.6923602, 122.5733168);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (292, 15, 8, '10 Rizal St, Iloilo City Proper, Iloilo City, 5000 Iloilo, Philippines', 10.6918987, 122.5721147);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (293, 15, 9, 'Basement Level, Gaisano Iloilo, La Paz, Iloilo City, Iloilo, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 10.6920633, 122.5699927);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (294, 15, 10, 'Basement Level, Gaisano Iloilo, La Paz, Iloilo City, Iloilo, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 10.6920633, 122.5699927);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (295, 15, 11, 'Maria Clara, Iloilo City Proper, Iloilo City, Iloilo', 10.6910852, 122.5694413);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (296, 15, 12, 'UNITOP, Iloilo City Proper, Iloilo City, Iloilo', 10.6963401, 122.5684774);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (297, 15, 13, '163 Baluarte - Calumpang - Villa - Oton Blvd, Molo, Iloilo City, Iloilo, Philippines', 10.6923536, 122.5524901);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (298, 15, 14, 'Molo Plaza, San Pedro Street, Molo, Iloilo City, Iloilo', 10.6968839, 122.5437346);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (299, 15, 15, 'Iloilo City National High School, Molo, Iloilo City, Iloilo', 10.6986445, 122.5489371);
-INSERT INTO prd_routes (route_id, route_number, route_code, route_name, fare_min_php, fare_max_php, fare_text, stop_count) VALUES (16, 16, 'ROUTE 16', 'BITO-ON TO JARO VIA BALABAGO LOOP', NULL, NULL, NULL, 14);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (300, 16, 1, 'Metropolis East Entrance Gate (Philippine Science HS)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (301, 16, 2, 'Coastal Rd', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (302, 16, 3, 'Balabago Rd', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (303, 16, 4, '(Balabago Elementary School)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (304, 16, 5, 'Cubay Rd. (MG Motor Car Sales)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (305, 16, 6, 'MacArthur Dr. (Angelicum)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (306, 16, 7, 'Simon Ledesma St. (Jaro Small Market)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (307, 16, 8, 'Lopez Jaena St. (Biscocho House)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (308, 16, 9, 'Rizal St. (Jaro Plaza)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (309, 16, 10, 'Washington St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (310, 16, 11, 'MacArthur Dr', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (311, 16, 12, 'Balabago Rd. (Jollibee Tabuc Suba)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (312, 16, 13, 'Coastal Rd', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (313, 16, 14, 'Metropolis East Entrance', NULL, NULL);
-INSERT INTO prd_routes (route_id, route_number, route_code, route_name, fare_min_php, fare_max_php, fare_text, stop_count) VALUES (17, 17, 'ROUTE 17', 'VILLA BAYBAY TO CITY PROPER VIA BONIFACIO', NULL, NULL, NULL, 28);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (314, 17, 1, 'Total Gas Station (Yulo)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (315, 17, 2, 'Baluarte-Calumpang-Villa-Oton Blvd. Tatoy’s Manokan and Seafood)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (316, 17, 3, 'Sto. Domingo St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (317, 17, 4, 'Bonifacio St. (lloilo Supermart Arevalo)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (318, 17, 5, 'Quezon St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (319, 17, 6, 'Avanceña St. (Dominican Motherhouse). Locsin St. (Molo Plaza)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (320, 17, 7, 'MH del Pilar St. (GT Mall Molo/lloilo City National HS/St. Therese MTC/JBLCF-Molo)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (321, 17, 8, 'Gen. Luna St. (UPV lloilo Campus/University of San Agustin)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (322, 17, 9, 'Quezon St.(Robinsons City)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (323, 17, 10, 'Rizal St.(UI Phinma)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (324, 17, 11, 'Ortiz St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (325, 17, 12, 'JM Basa St. (Plaza Libertad)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (326, 17, 13, 'Rizal St. (Goldberry Lite Hotel/Gaisano Capltal/lloilo Central Market)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (327, 17, 14, 'Quezon St. (Sta. Teresita Church)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (328, 17, 15, 'Delgado St. (Narita)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (329, 17, 16, 'Mabini St. (EMCOR/SPED-Integrated/Jubilee Hall)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (330, 17, 17, 'Gen. Luna St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (331, 17, 18, 'MH del Pilar St. (Technical Institute ot Iloilo City)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (332, 17, 19, 'San Pedro St. (Molo Church/Plaza)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (333, 17, 20, 'Avanceña St. (lloilo Supermart-Molo)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (334, 17, 21, 'Quezon St. (lloilo Supermart Arevalo)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (335, 17, 22, 'Yulo St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (336, 17, 23, 'Baluarte-Calumpang-Villa-Oton Blvd. (Tatoy’s', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (337, 17, 24, 'John B Lacson Arevalo Campus)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (338, 17, 25, 'Sto.Domingo', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (339, 17, 26, 'Bonifacio St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (340, 17, 27, 'Quezon St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (341, 17, 28, 'to lloilo City Proper', NULL, NULL);
-INSERT INTO prd_routes (route_id, route_number, route_code, route_name, fare_min_php, fare_max_php, fare_text, stop_count) VALUES (18, 18, 'ROUTE 18', 'TAGBAK TO CITY PROPER VIA COASTAL LOOP', NULL, NULL, NULL, 26);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (342, 18, 1, 'Buntatala/Tagbak loop (Spousal of Mary and Joseph Parish Church)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (343, 18, 2, 'Tagbak Terminal', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (344, 18, 3, 'MacArthur Dr. (Ceres Terminal)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (345, 18, 4, 'lloilo Circumferential Rd. (C. Aquino Ave.)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (346, 18, 5, 'Coastal Rd', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (347, 18, 6, 'Lapuz Mansaya-Loboc Rd. (Guimaras RORO Terminal)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (348, 18, 7, 'Rizal St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (349, 18, 8, 'lloilo Ferry Terminal Road (lloilo-Bacolod Ferry Terminal)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (350, 18, 9, 'Arroyo Bridge', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (351, 18, 10, 'Muelle Loney St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (352, 18, 11, 'Aldeguer St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (353, 18, 12, 'JM Basa St. (Washington Supermart)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (354, 18, 13, 'Mapa St. (SSS/Sun Yat Sen)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (355, 18, 14, 'Rizal St. (UI Phinma)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (356, 18, 15, 'Iznart St. (lloilo Central Market)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (357, 18, 16, 'Aldeguer St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (358, 18, 17, 'Muelley Loney St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (359, 18, 18, 'Arroyo Bridge', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (360, 18, 19, 'lloilo Ferry Terminal Road', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (361, 18, 20, 'Rizal St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (362, 18, 21, 'Lapuz Mansaya-Loboc Rd', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (363, 18, 22, 'Coastal Rd', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (364, 18, 23, 'Iloilo Circumferential Rd. (C. Aquino Ave.)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (365, 18, 24, 'MacArthur Dr', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (366, 18, 25, 'Tagbak Terminal', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (367, 18, 26, 'Buntatala/Tagbak loop (Spousal of Mary and Joseph Parish Church)', NULL, NULL);
-INSERT INTO prd_routes (route_id, route_number, route_code, route_name, fare_min_php, fare_max_php, fare_text, stop_count) VALUES (19, 19, 'ROUTE 19', 'BITO-ON TO CITY PROPER VIA LA PAZ LOOP', NULL, NULL, NULL, 22);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (368, 19, 1, 'Metropolis Ave. (Philippine Science HS)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (369, 19, 2, 'Coastal Rd', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (370, 19, 3, 'Baldoza St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (371, 19, 4, 'Lopez Jaena St. La Paz Police Station)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (372, 19, 5, 'Jereos St. (La Paz Plaza)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (373, 19, 6, 'Huervana Ext', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (374, 19, 7, 'Burgos St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (375, 19, 8, 'Magdalo St. (St. Therese-MTC Colleges)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (376, 19, 9, 'Luna St. (Galsano La Paz)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (377, 19, 10, 'Bonifacio Dr. (Hall of Justice/ Provincial Capitol)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (378, 19, 11, 'Gen. Luna (St. Paul’s Hospital and University)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (379, 19, 12, 'Mabini St. (Jubilee Hall/SPED School)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (380, 19, 13, 'De Leon St. (Robinsons City)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (381, 19, 14, 'Valeria St. (Marymart/SM/Atrium)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (382, 19, 15, 'Gen. luna St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (383, 19, 16, 'Muelle Loney (Registry of Deeds/lloilo Provincial Capitol)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (384, 19, 17, 'Rizal St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (385, 19, 18, 'Huervana St. (La Paz Market)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (386, 19, 19, 'Lopez Jaena St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (387, 19, 20, 'Baldoza St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (388, 19, 21, 'Coastal Rd', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (389, 19, 22, 'Bito-on loop', NULL, NULL);
-INSERT INTO prd_routes (route_id, route_number, route_code, route_name, fare_min_php, fare_max_php, fare_text, stop_count) VALUES (20, 20, 'ROUTE 20', 'MOHON TO JARO VIA SO OC / FESTIVE WALK / ISATU', NULL, NULL, NULL, 30);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (390, 20, 1, 'Mohon Terminal', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (391, 20, 2, 'Arevalo Plaza', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (392, 20, 3, 'Quezon St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (393, 20, 4, 'Jocson St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (394, 20, 5, 'So-oc Resettlement Rd', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (395, 20, 6, 'Calajunan Rd', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (396, 20, 7, 'Oñate St. (Mandurriao Plaza)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (397, 20, 8, 'Q. Abeto St. (Western Visayas Medical Center)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (398, 20, 9, 'Megaworld BIvd', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (399, 20, 10, 'Festive Walk Transport Hub', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (400, 20, 11, 'Taft St. (lloilo Integrated School)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (401, 20, 12, 'El 98 St. (Jaro Big Market)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (402, 20, 13, 'Rizal St. (Jaro Plaza)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (403, 20, 14, 'Commission Civil', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (404, 20, 15, 'ISATU Loop', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (405, 20, 16, 'Commission Civil St. (SM Hypermarket)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (406, 20, 17, 'M. Jayme St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (407, 20, 18, 'E. Lopez St. (Robinsons Jaro)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (408, 20, 19, 'Rizal St. (Jaro Plaza)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (409, 20, 20, 'El 98 St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (410, 20, 21, 'Taft St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (411, 20, 22, 'Q. Abeto St. (lloilo Supermart Mandurriao)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (412, 20, 23, 'Perfecto St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (413, 20, 24, '(Mandurriao Church)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (414, 20, 25, 'Ofate St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (415, 20, 26, 'Calajunan Rd', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (416, 20, 27, 'So-oc Resettiement Rd', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (417, 20, 28, 'Jocson St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (418, 20, 29, 'Arevalo Plaza', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (419, 20, 30, 'Mohon Terminal', NULL, NULL);
-INSERT INTO prd_routes (route_id, route_number, route_code, route_name, fare_min_php, fare_max_php, fare_text, stop_count) VALUES (21, 21, 'ROUTE 21', 'TAGBAK / BUNTATALA TO FESTIVE WALK VIA SM CITY / ATRIA', NULL, NULL, NULL, 24);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (420, 21, 1, 'Buntatala Loop (Spousal of Mary and Joseph Parish Church)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (421, 21, 2, 'Tagbak Terminal (City Mall Tagbak)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (422, 21, 3, 'MacArthur Dr. (Ceres Terminal)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (423, 21, 4, 'Simon Ledesma St. (Jaro Small Market)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (424, 21, 5, 'Lopez Jaena St. (Biscocho Haus)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (425, 21, 6, 'Rizal St. (Jaro Plaza)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (426, 21, 7, 'El-98 St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (427, 21, 8, 'B. Aquino Ave. (SM City/Smallville Complex)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (428, 21, 9, 'Infante St. (UP/lloilo Doctors’ College)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (429, 21, 10, 'Locsin St. (lloilo Fish Port Complex)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (430, 21, 11, 'Rizal St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (431, 21, 12, 'Infante St. (UPV lloilo Campus)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (432, 21, 13, 'B. Aquino Ave', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (433, 21, 14, 'Gaisano ICC Loop', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (434, 21, 15, 'Pison Ave. (Atria)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (435, 21, 16, 'R. Mapa St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (436, 21, 17, 'Megaworld Ave. (Festive Hub)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (437, 21, 18, 'Taft St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (438, 21, 19, 'El-98 St. (Puregold)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (439, 21, 20, 'Rizal St. (Jaro Plaza)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (440, 21, 21, 'Washington St. (Palasyo)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (441, 21, 22, 'MacArthur Dr. (lloilo Supermart-Jaro)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (442, 21, 23, 'Tagbak Terminal', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (443, 21, 24, 'Buntatala Loop (Spousal of Mary and Joseph Parish Church)', NULL, NULL);
-INSERT INTO prd_routes (route_id, route_number, route_code, route_name, fare_min_php, fare_max_php, fare_text, stop_count) VALUES (22, 22, 'ROUTE 22', 'UNGKA TO LA PAZ VIA CPU – ISATU LOOP', NULL, NULL, NULL, 17);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (444, 22, 1, 'Ungka Terminal (ITGS lI)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (445, 22, 2, 'Diversion Rd. (University of San Agustin-Sambag)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (446, 22, 3, 'Lopez Jaena St. (CPU)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (447, 22, 4, 'Rizal St. (Jaro Plaza)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (448, 22, 5, 'Commission Civil St. (SM Hypermarket)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (449, 22, 6, 'Burgos St. (ISATU)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (450, 22, 7, 'Huervana St. (La Paz Plaza)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (451, 22, 8, 'Rizal St. (La Paz Public Market)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (452, 22, 9, 'Arroyo St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (453, 22, 10, 'Magdalo St. (St. Therese-MTC Colleges) Burgos St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (454, 22, 11, 'Commission Civil St. (SM Hypermarket)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (455, 22, 12, 'Washington St. (Old Jaro Municipal Hall)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (456, 22, 13, 'Democracia St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (457, 22, 14, 'Simon Ledesma', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (458, 22, 15, 'Lopez Jaena St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (459, 22, 16, 'Diversion Rd', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (460, 22, 17, 'Ungka Terminal', NULL, NULL);
-INSERT INTO prd_routes (route_id, route_number, route_code, route_name, fare_min_php, fare_max_php, fare_text, stop_count) VALUES (23, 23, 'ROUTE 23', 'MOHON TO MANDURRIAO BUSINESS DISTRICT', NULL, NULL, NULL, 23);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (461, 23, 1, 'Mohon Terminal', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (462, 23, 2, 'Osmeña St. (Plaza Arevalo)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (463, 23, 3, 'Jocson St. (JD Bakeshop)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (464, 23, 4, 'Avanceña St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (465, 23, 5, '(Dominican Motherhouse)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (466, 23, 6, 'Molo Plaza', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (467, 23, 7, 'GT Mall', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (468, 23, 8, 'Iloilo City National High School', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (469, 23, 9, 'lloilo City College', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (470, 23, 10, 'San Marcos St. (Ground Effects)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (471, 23, 11, 'Locsin St. (lloilo Supermart-Molo)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (472, 23, 12, 'Pison Ave', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (473, 23, 13, 'Gaisano Iloilo City Center', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (474, 23, 14, 'SM Strata', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (475, 23, 15, 'B. Aquino Ave', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (476, 23, 16, 'Taft St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (477, 23, 17, 'Megaworld Ave', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (478, 23, 18, 'R. Mapa St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (479, 23, 19, 'Locsin St. (Medical City)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (480, 23, 20, 'Avanceña St. (lloilo Supermart-Molo)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (481, 23, 21, 'Jocson St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (482, 23, 22, 'Osmeña St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (483, 23, 23, 'Mohon Terminal', NULL, NULL);
-INSERT INTO prd_routes (route_id, route_number, route_code, route_name, fare_min_php, fare_max_php, fare_text, stop_count) VALUES (24, 24, 'ROUTE 24', 'LA PAZ TO FESTIVE WALK VIA NABITASAN LOOP', NULL, NULL, NULL, 31);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (484, 24, 1, 'La Paz Plaza', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (485, 24, 2, 'Huervana Ext', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (486, 24, 3, 'Burgos St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (487, 24, 4, 'ISATU Loop', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (488, 24, 5, 'Magdalo', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (489, 24, 6, 'Hechanova St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (490, 24, 7, 'Senator E. Treñas Boulevard (Prime Estate/Garden of Love)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (491, 24, 8, 'B. Aquino Ave', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (492, 24, 9, 'Gaisano Iloilo City Center Hub', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (493, 24, 10, 'SM Strata Hub', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (494, 24, 11, 'U-turn Gil Traders', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (495, 24, 12, 'B. Aquino Ave. (Zuri Hotel/SM City)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (496, 24, 13, 'Pison Ave', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (497, 24, 14, 'R. Mapa St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (498, 24, 15, 'Megaworld Blvd', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (499, 24, 16, 'Festive Walk Transport Hub', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (500, 24, 17, 'Megaworld Blvd', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (501, 24, 18, 'Airport Spur Rd', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (502, 24, 19, 'Diversion Road', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (503, 24, 20, 'Gaisano lloilo City Center Loop', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (504, 24, 21, 'Diversion Service Rd', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (505, 24, 22, 'Senator E. Treñas Blvd. (Nabitasan Garden of love)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (506, 24, 23, 'Hechanova St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (507, 24, 24, 'Luna St. (Gaisano La Paz)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (508, 24, 25, 'Bonifacio St. (Provincial Capitol)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (509, 24, 26, 'Muelle Loney St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (510, 24, 27, 'Rizal St. (Registry of Deeds)', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (511, 24, 28, 'Huervana St', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (512, 24, 29, 'La Paz Plaza', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (513, 24, 30, 'Huervana Extension', NULL, NULL);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (514, 24, 31, 'La Paz Plaza', NULL, NULL);
-INSERT INTO prd_routes (route_id, route_number, route_code, route_name, fare_min_php, fare_max_php, fare_text, stop_count) VALUES (25, 25, 'ROUTE 25', 'MOLO TO CITY PROPER VIA GENERAL LUNA LOOP', NULL, NULL, NULL, 10);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (515, 25, 1, 'Escoto Natividad Building, M.H. del Pilar corner Lopez Jaena Streets (infront of Police Station), Iloilo City, 5000, Iloilo, Molo, Iloilo City, Iloilo, Philippines', 10.6960099, 122.5444256);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (516, 25, 2, 'PH26+6PJ, General Luna St, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 10.7006459, 122.5617122);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (517, 25, 3, 'Atrium Iloilo Commercial Center, General Luna St, Iloilo City Proper, Iloilo City, Iloilo', 10.7015457, 122.5681237);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (518, 25, 4, 'UNITOP, Iloilo City Proper, Iloilo City, Iloilo', 10.6963401, 122.5684774);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (519, 25, 5, 'Plaza Libertad, Zamora Street, Iloilo City Proper, Iloilo City, Iloilo', 10.6923154, 122.5733644);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (520, 25, 6, 'PHINMA UNIVERSITY OF ILOILO, Rizal Street, Iloilo City Proper, Iloilo City, Iloilo', 10.6920277, 122.5695958);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (521, 25, 7, 'UNITOP, Iloilo City Proper, Iloilo City, Iloilo', 10.6963401, 122.5684774);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (522, 25, 8, 'Tanza Church, Iloilo City Proper, Iloilo City, Iloilo', 10.6934022, 122.5592303);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (523, 25, 9, 'BALUARTE ELEMENTARY SCHOOL, Lopez Jaena Street, Molo, Iloilo City, Iloilo', 10.6923432, 122.5484599);
-INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (524, 25, 10, 'GT Plaza Mall, M.H del Pilar Street, Molo, Iloilo City, Iloilo', 10.6964042, 122.5454765);
+INSERT INTO prd_routes (route_id, route_number, route_code, route_name, fare_min_php, fare_max_php, fare_text, stop_count) VALUES (1046468184, 1, 'ROUTE 1', 'BO. OBRERO, LAPUZ TO CITY PROPER LOOP', NULL, NULL, NULL, 10);
+INSERT INTO prd_routes (route_id, route_number, route_code, route_name, fare_min_php, fare_max_php, fare_text, stop_count) VALUES (1430312025, 2, 'ROUTE 2', 'VILLA PLAZA TO CITY PROPER VIA CALUMPANG', NULL, NULL, NULL, 17);
+INSERT INTO prd_routes (route_id, route_number, route_code, route_name, fare_min_php, fare_max_php, fare_text, stop_count) VALUES (519120736, 3, 'ROUTE 3', 'UNGKA TO CITY PROPER VIA CPU LOOP', NULL, NULL, NULL, 16);
+INSERT INTO prd_routes (route_id, route_number, route_code, route_name, fare_min_php, fare_max_php, fare_text, stop_count) VALUES (1703456505, 4, 'ROUTE 4', 'UNGKA TO CITY PROPER VIA B. AQUINO AVE./ FESTIVE WALK LOOP', NULL, NULL, NULL, 9);
+INSERT INTO prd_routes (route_id, route_number, route_code, route_name, fare_min_php, fare_max_php, fare_text, stop_count) VALUES (225491600, 5, 'ROUTE 5', 'FESTIVE WALK TO CITY PROPER VIA B. AQUINO AVE. AND SM CITY', NULL, NULL, NULL, 15);
+INSERT INTO prd_routes (route_id, route_number, route_code, route_name, fare_min_php, fare_max_php, fare_text, stop_count) VALUES (1433290735, 6, 'ROUTE 6', 'LANIT TO SM CITY VIA INFANTE', NULL, NULL, NULL, 42);
+INSERT INTO prd_routes (route_id, route_number, route_code, route_name, fare_min_php, fare_max_php, fare_text, stop_count) VALUES (2103489053, 7, 'ROUTE 7', 'COMPANIA TO CITY PROPER LOOP', NULL, NULL, NULL, 7);
+INSERT INTO prd_routes (route_id, route_number, route_code, route_name, fare_min_php, fare_max_php, fare_text, stop_count) VALUES (466985459, 8, 'ROUTE 8', 'PAROLA TO SM CITY VIA INFANTE LOOP', NULL, NULL, NULL, 23);
+INSERT INTO prd_routes (route_id, route_number, route_code, route_name, fare_min_php, fare_max_php, fare_text, stop_count) VALUES (246691017, 9, 'ROUTE 9', 'MOHON TO CITY PROPER LOOP', NULL, NULL, NULL, 12);
+INSERT INTO prd_routes (route_id, route_number, route_code, route_name, fare_min_php, fare_max_php, fare_text, stop_count) VALUES (963368896, 10, 'ROUTE 10', 'BUNTATALA / TAGBAK TERMINAL TO CITY PROPER LOOP', NULL, NULL, NULL, 39);
+INSERT INTO prd_routes (route_id, route_number, route_code, route_name, fare_min_php, fare_max_php, fare_text, stop_count) VALUES (1175064832, 11, 'ROUTE 11', 'TICUD, LA PAZ TO CITY PROPER LOOP', NULL, NULL, NULL, 14);
+INSERT INTO prd_routes (route_id, route_number, route_code, route_name, fare_min_php, fare_max_php, fare_text, stop_count) VALUES (1764141810, 12, 'ROUTE 12', 'MANDURRIAO TO CITY PROPER VIA FESTIVE WALK / B. AQUINO AVE.', NULL, NULL, NULL, 33);
+INSERT INTO prd_routes (route_id, route_number, route_code, route_name, fare_min_php, fare_max_php, fare_text, stop_count) VALUES (1410325484, 13, 'ROUTE 13', 'HIBAO-AN TO CITY PROPER VIA TABUCAN HUB LOOP', NULL, NULL, NULL, 25);
+INSERT INTO prd_routes (route_id, route_number, route_code, route_name, fare_min_php, fare_max_php, fare_text, stop_count) VALUES (209664240, 14, 'ROUTE 14', 'HIBAO-AN TO JARO VIA B. AQUINO AVE. / FESTIVE LOOP', NULL, NULL, NULL, 22);
+INSERT INTO prd_routes (route_id, route_number, route_code, route_name, fare_min_php, fare_max_php, fare_text, stop_count) VALUES (479168301, 15, 'ROUTE 15', 'MOLO TO CITY PROPER VIA BALUARTE LOOP', NULL, NULL, NULL, 15);
+INSERT INTO prd_routes (route_id, route_number, route_code, route_name, fare_min_php, fare_max_php, fare_text, stop_count) VALUES (1565494172, 16, 'ROUTE 16', 'BITO-ON TO JARO VIA BALABAGO LOOP', NULL, NULL, NULL, 14);
+INSERT INTO prd_routes (route_id, route_number, route_code, route_name, fare_min_php, fare_max_php, fare_text, stop_count) VALUES (1115948942, 17, 'ROUTE 17', 'VILLA BAYBAY TO CITY PROPER VIA BONIFACIO', NULL, NULL, NULL, 28);
+INSERT INTO prd_routes (route_id, route_number, route_code, route_name, fare_min_php, fare_max_php, fare_text, stop_count) VALUES (1353721056, 18, 'ROUTE 18', 'TAGBAK TO CITY PROPER VIA COASTAL LOOP', NULL, NULL, NULL, 26);
+INSERT INTO prd_routes (route_id, route_number, route_code, route_name, fare_min_php, fare_max_php, fare_text, stop_count) VALUES (794134662, 19, 'ROUTE 19', 'BITO-ON TO CITY PROPER VIA LA PAZ LOOP', NULL, NULL, NULL, 22);
+INSERT INTO prd_routes (route_id, route_number, route_code, route_name, fare_min_php, fare_max_php, fare_text, stop_count) VALUES (2006898523, 20, 'ROUTE 20', 'MOHON TO JARO VIA SO OC / FESTIVE WALK / ISATU', NULL, NULL, NULL, 30);
+INSERT INTO prd_routes (route_id, route_number, route_code, route_name, fare_min_php, fare_max_php, fare_text, stop_count) VALUES (1980144542, 21, 'ROUTE 21', 'TAGBAK / BUNTATALA TO FESTIVE WALK VIA SM CITY / ATRIA', NULL, NULL, NULL, 24);
+INSERT INTO prd_routes (route_id, route_number, route_code, route_name, fare_min_php, fare_max_php, fare_text, stop_count) VALUES (2091730364, 22, 'ROUTE 22', 'UNGKA TO LA PAZ VIA CPU – ISATU LOOP', NULL, NULL, NULL, 17);
+INSERT INTO prd_routes (route_id, route_number, route_code, route_name, fare_min_php, fare_max_php, fare_text, stop_count) VALUES (81853868, 23, 'ROUTE 23', 'MOHON TO MANDURRIAO BUSINESS DISTRICT', NULL, NULL, NULL, 23);
+INSERT INTO prd_routes (route_id, route_number, route_code, route_name, fare_min_php, fare_max_php, fare_text, stop_count) VALUES (77732220, 24, 'ROUTE 24', 'LA PAZ TO FESTIVE WALK VIA NABITASAN LOOP', NULL, NULL, NULL, 31);
+INSERT INTO prd_routes (route_id, route_number, route_code, route_name, fare_min_php, fare_max_php, fare_text, stop_count) VALUES (236626717, 25, 'ROUTE 25', 'MOLO TO CITY PROPER VIA GENERAL LUNA LOOP', NULL, NULL, NULL, 10);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (242379454, 1046468184, 1, 'Everlasting Street, Lapuz, Iloilo City, Iloilo', 10.6988168, 122.587106);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1156412317, 1046468184, 2, 'Arroyo Fountain, 399-A Iznart St, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 10.7015273, 122.5690194);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1984722418, 1046468184, 3, 'Washington Supermart, Guanco Street, Iloilo City Proper, Iloilo City, Iloilo', 10.6940383, 122.5709329);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (901105978, 1046468184, 4, 'Iloilo Central Market Building, Iloilo City Proper, Iloilo City, Iloilo', 10.6926369, 122.5701416);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1201158534, 1046468184, 5, 'MHW9+45V Hawaii, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 10.6951872, 122.5678818);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1611509844, 1046468184, 6, 'PH29+83M, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 10.7008545, 122.5677122);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1269314124, 1046468184, 7, '5000 Iznart Street, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 10.7015516, 122.5689458);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1437195726, 1046468184, 8, '59 Rizal St, Lapuz, Iloilo City, 5000 Iloilo, Philippines', 10.7068118, 122.5691386);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (114566146, 1046468184, 9, 'PH2C+VH9, Lapuz, Iloilo City, Iloilo, Philippines', 10.7022369, 122.5715509);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (643841480, 1046468184, 10, 'PH2F+MM3, Rizal St, Lapuz, Iloilo City, Iloilo, Philippines', 10.7017971, 122.5742432);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1039511581, 1430312025, 1, 'Arevalo Elementary School, Jocson Street, Villa Arevalo District, Iloilo City, Iloilo', 10.6888711, 122.5170727);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1127380676, 1430312025, 2, 'Breakthrough Restaurant, Villa Arevalo District, Iloilo City, Iloilo', 10.6802346, 122.5174426);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (733407416, 1430312025, 3, 'Boulevard Health Center, Brgy. Boulevard, Molo, Iloilo City, Iloilo', 10.6894795, 122.5486624);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (722379686, 1430312025, 4, 'MHW9+HJP, Arroyo St, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 10.6963895, 122.5690103);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (883075599, 1430312025, 5, 'Iloilo Grand Hotel Corporation, Iznart Street, Iloilo City Proper, Iloilo City, Iloilo', 10.6926742, 122.5691105);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1799526909, 1430312025, 6, 'MHVF+25F, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 10.6926023, 122.5730597);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1906149927, 1430312025, 7, '2022 Rizal St, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 10.6916576, 122.5737202);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (564071688, 1430312025, 8, 'University of Iloilo - Phinma Education, Rizal Street, Iloilo City Proper, Iloilo City, Iloilo', 10.6920277, 122.5695958);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (2038672694, 1430312025, 9, 'UNITOP, Iloilo City Proper, Iloilo City, Iloilo', 10.6963401, 122.5684774);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (938240574, 1430312025, 10, 'UNITOP, Iloilo City Proper, Iloilo City, Iloilo', 10.6963401, 122.5684774);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (573115013, 1430312025, 11, 'Tanza Church, Iloilo City Proper, Iloilo City, Iloilo', 10.6934022, 122.5592303);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1576509256, 1430312025, 12, 'Boulevard Health Center, Brgy. Boulevard, Molo, Iloilo City, Iloilo', 10.6894795, 122.5486624);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1685384302, 1430312025, 13, 'Breakthrough Restaurant, Villa Arevalo District, Iloilo City, Iloilo', 10.6802346, 122.5174426);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1613655555, 1430312025, 14, 'Iloilo Supermart - Villa, Quezon Street, Villa, Iloilo City, Iloilo', 10.6870736, 122.5169089);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (323629143, 1430312025, 15, 'Ventuno Bar & Cafe Villa Branch, Villa Arevalo District, Leon, Iloilo', 10.6875522, 122.5210179);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (340838658, 1430312025, 16, 'Dunkin'' Donuts, Villa Arevalo District, Iloilo City, Iloilo', 10.6890609, 122.5208865);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (285837163, 1430312025, 17, 'Arevalo Elementary School, Jocson Street, Villa Arevalo District, Iloilo City, Iloilo', 10.6888711, 122.5170727);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (858524536, 519120736, 1, 'GT Town Center Pavia, Pavia, Iloilo', 10.7533792, 122.5383523);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1983668347, 519120736, 2, 'CARMELITE MONASTERY, Iloilo East Coast - Capiz Road, Jaro, Iloilo City, Iloilo', 10.7379901, 122.5438145);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1079767111, 519120736, 3, 'PHC5+CPC, Jaro, Iloilo City, Iloilo, Philippines', 10.7210293, 122.5592384);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1702509680, 519120736, 4, 'Arroyo Fountain, Iznart Street, Iloilo City Proper, Iloilo City, Iloilo', 10.7015273, 122.5690194);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1321177426, 519120736, 5, 'Socorro Drug Company, Iznart St. Cor. J.M. Basa St., City Proper, Iloilo City, Iloilo', 10.6962877, 122.5692676);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (2034358561, 519120736, 6, 'CityMall - Parola, Parola Wharf, Iloilo City Proper, Iloilo City, Iloilo', 10.6922161, 122.5827724);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (697599366, 519120736, 7, 'A.Montes ll Elementary School, Duran St, Iloilo City Proper, Iloilo City, Iloilo', 10.6916394, 122.5777668);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (185399514, 519120736, 8, 'Plaza Libertad, Zamora Street, Iloilo City Proper, Iloilo City, Iloilo', 10.6922737, 122.5734065);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (2106782576, 519120736, 9, '399-A Iznart St, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 10.6999876, 122.5691099);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (585499807, 519120736, 10, 'Gaisano Capital City-Iloilo, La Paz, Iloilo City, Iloilo', 10.7073963, 122.5671856);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (365019361, 519120736, 11, 'Gaisano Capital City-Iloilo, La Paz, Iloilo City, Iloilo', 10.7073963, 122.5671856);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (2020763576, 519120736, 12, 'Lapaz Public Market, Huervana Street, La Paz, Iloilo City, Iloilo', 10.7086308, 122.5675671);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (570888829, 519120736, 13, 'Jaro Plaza, Plaza Rizal Street, Jaro, Iloilo City, Iloilo', 10.7247369, 122.55776);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (705546349, 519120736, 14, 'TIBIAO BAKERY, Washington Street, Jaro, Iloilo City, Iloilo', 10.7267706, 122.5579864);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1658331321, 519120736, 15, 'Iloilo Baptist church, Jaro, Iloilo City, Iloilo', 10.7279704, 122.5551388);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (723657067, 519120736, 16, 'CHRIST THE KING MEMORIAL PARK, Diversion Rd, Jaro, Iloilo City, Iloilo', 10.7457608, 122.5411428);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1649055691, 1703456505, 1, 'GT Town Center Pavia, Pavia, Iloilo', 10.7533792, 122.5383523);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (886326466, 1703456505, 2, 'Carlos'' Bakeshop, Mandurriao, Iloilo City, Iloilo', 10.7250526, 122.5494275);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1920400755, 1703456505, 3, 'Richmonde Hotel Iloilo, Mandurriao, Iloilo City, Iloilo', 10.7154168, 122.5458035);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (390060911, 1703456505, 4, 'SM City Iloilo, Benigno Aquino Avenue, Mandurriao, Iloilo City, Iloilo', 10.7139462, 122.5517573);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1384250902, 1703456505, 5, 'MHV4+35H, Iloilo City Proper, Brgy. North Baluarte, Molo, Iloilo City, 5000 Iloilo, Philippines', 10.6926859, 122.5553367);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1261483952, 1703456505, 6, 'Robinsons Iloilo, Mabini Street, Iloilo City Proper, Iloilo City, Iloilo', 10.6946794, 122.5648804);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1164239184, 1703456505, 7, 'Sta. Teresita del Niño Jesus Parish - Iloilo City, J. De Leon Street, Iloilo City Proper, Iloilo City, Iloilo', 10.6931039, 122.5667699);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (87813718, 1703456505, 8, 'MHX9+353, Delgado St, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 10.6976499, 122.5678143);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1788524541, 1703456505, 9, 'UPV - College of Management, Iloilo City Proper, Iloilo City, Iloilo', 10.6970485, 122.5548117);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1707266788, 225491600, 1, 'Festive Walk Mall, Megaworld Boulevard, Mandurriao, Iloilo City, Iloilo', 10.7169101, 122.5465366);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (645992556, 225491600, 2, 'PH73+P48, Jalandoni St, Mandurriao, Iloilo City, Iloilo, Philippines', 10.7143744, 122.5524441);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1243259526, 225491600, 3, 'Atrium Iloilo Commercial Center, General Luna Street, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 10.7015457, 122.5681237);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1011670246, 225491600, 4, 'Socorro Drug Company, Iznart St. Cor. J.M. Basa St., City Proper, Iloilo City, Iloilo, Philippines', 10.6962877, 122.5692676);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1481759543, 225491600, 5, 'Plaza Libertad, Zamora Street, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 10.6923154, 122.5733644);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1041228752, 225491600, 6, 'University of Iloilo - Phinma Education, Rizal Street, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 10.6920277, 122.5695958);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1689057868, 225491600, 7, 'UNITOP, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 10.6963401, 122.5684774);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (150006932, 225491600, 8, 'Maybank Ledesma, Mabini Street, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 10.6957178, 122.5648069);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (213231038, 225491600, 9, 'Feline''s Gift Shop, Delgado Street, Iloilo City Proper, Iloilo City, Iloilo', 10.697303, 122.5620788);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1969493079, 225491600, 10, 'JD Bakery Cafe – Gen. Luna, General Luna Street, La Paz, Iloilo City, Iloilo', 10.7004549, 122.5603651);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1980187652, 225491600, 11, 'JD Bakery Cafe – Gen. Luna, General Luna Street, La Paz, Iloilo City, Iloilo', 10.7004549, 122.5603651);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (57303573, 225491600, 12, 'Zuri Hotel, Benigno Aquino Avenue, Mandurriao, Iloilo City, Iloilo', 10.7159904, 122.5527924);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1513767141, 225491600, 13, 'Atria Park District, Benigno Aquino Avenue, Mandurriao, Iloilo City, Iloilo', 10.7062819, 122.5492651);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (2137472179, 225491600, 14, 'Tabucan Elementary School, San Rafael-Tabucan Road, Mandurriao, Iloilo City, Iloilo', 10.7047452, 122.5449536);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (2017034313, 225491600, 15, 'Festive Walk Mall, Megaworld Boulevard, Mandurriao, Iloilo City, Iloilo', 10.7169101, 122.5465366);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (543506193, 1433290735, 1, 'Lanit/Leganes Boundary loop', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1394933530, 1433290735, 2, 'Tiu Cho Teg-Ana Ros Foundation Integrated School', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (2125497112, 1433290735, 3, 'lloilo Radial Bypass Rd', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (2054524755, 1433290735, 4, 'Iloilo Circumferential Rd. (C. Aquino Ave.)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1880533848, 1433290735, 5, 'Tacas Quintin Salas Rd. (SM Savemore)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (799356546, 1433290735, 6, 'MacArthur Dr. (LTO/LTFRB)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1613359530, 1433290735, 7, 'Simon Ledesma St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (178151840, 1433290735, 8, 'Lopez Jaena St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1841038135, 1433290735, 9, '(Biscocho House)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (76329529, 1433290735, 10, 'Rizal Street (Jaro Plaza)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (565578528, 1433290735, 11, 'E. Lopez St. (Robinsons Jaro)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (361993048, 1433290735, 12, 'Jalandoni St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (2054230584, 1433290735, 13, '(Injap Tower Hotel) B. Aquino Ave', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (535565433, 1433290735, 14, 'U-turn Gil Trading Car Sales/Petron', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1280763638, 1433290735, 15, 'B. Aquino Ave', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (20880968, 1433290735, 16, 'Pison Rotunda', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (2145509583, 1433290735, 17, 'B. Aquino Ave', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (742504468, 1433290735, 18, 'Infante (UP/llollo Doctors’ Hospital/Iloilo Fish Port)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1863657880, 1433290735, 19, 'Locsin St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (847024918, 1433290735, 20, 'Rizal St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (770568421, 1433290735, 21, 'Infante', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (469476629, 1433290735, 22, 'B. Aquino Ave. Gaisano Hub', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (235176552, 1433290735, 23, 'SM Transport Hub (Strata)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1082345732, 1433290735, 24, 'Jalandoni St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (81728929, 1433290735, 25, '(Injap Tower Hotel)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1267950183, 1433290735, 26, 'Commission Civil St. (SM Hypermarket)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1410806644, 1433290735, 27, 'M. Jayme', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (2063000258, 1433290735, 28, 'E. Lopez (Robinsons Jaro)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1782602252, 1433290735, 29, 'Seminario St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1050639536, 1433290735, 30, 'Burgos St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (111462528, 1433290735, 31, 'Cuartero St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (2123292466, 1433290735, 32, 'Fajardo St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (391592981, 1433290735, 33, 'Libertad St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (475540723, 1433290735, 34, 'Sta. Isabel', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1110242681, 1433290735, 35, 'Lopez Jaena St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (2012932384, 1433290735, 36, 'Washington St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (2008044637, 1433290735, 37, 'MacArthur Dr', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1689963084, 1433290735, 38, 'Tacas-Quintin Salas Rd', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (529509460, 1433290735, 39, 'Iloilo Circumferential Rd. (C. Aquino Ave.)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1529415704, 1433290735, 40, 'llollo Radial Bypass Rd', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (347895815, 1433290735, 41, 'Tiu Cho Teg-Ana Ros Foundation Integrated School', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (2053047185, 1433290735, 42, 'Lanit/ Leganes Boundary loop', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1465643033, 2103489053, 1, 'Plaza Libertad, Zamora Street, Iloilo City Proper, Iloilo City, Iloilo', 10.6922737, 122.5734065);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (424759839, 2103489053, 2, 'ISC ILOILO SOCIETY COMMERCIAL, INC, Rizal Street, Iloilo City Proper, Iloilo City, Iloilo', 10.6918834, 122.5722006);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (668743224, 2103489053, 3, 'MHW9+HJP, Arroyo St, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 10.6964031, 122.5690608);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (849021959, 2103489053, 4, 'MHW6+8P8, Jalandoni St, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 10.6956991, 122.5617174);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1177684077, 2103489053, 5, 'MGRM+6JV, Compania Fundidor road, Molo, Iloilo City, Iloilo, Philippines', 10.6906202, 122.534218);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (690446638, 2103489053, 6, 'MGWV+R8J, Lacson Street, Molo, Iloilo City, 5000 Iloilo, Philippines', 10.6972825, 122.543449);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (717539807, 2103489053, 7, '216 Locsin St, Molo, Iloilo City, Iloilo, Philippines', 10.6944744, 122.5456124);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (41458401, 466985459, 1, 'Parola Wharf (City Mall Parola)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1350460506, 466985459, 2, 'Zamora Ext', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1606072742, 466985459, 3, 'Zamora St. (GSIS)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (2031707660, 466985459, 4, 'Rizal St. (lloilo Central Market)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (410061604, 466985459, 5, 'Quezon St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1276885326, 466985459, 6, 'De Leon St. (Robinsons City)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1776988284, 466985459, 7, 'Jalandoni St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (946015388, 466985459, 8, 'Rizal St. (Tanza Church)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1317088474, 466985459, 9, 'Infante St. (lloilo Doctors’ Hospital-College/UPV Iloilo Campus)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1288260558, 466985459, 10, 'B. Aquino Ave', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1265498293, 466985459, 11, 'Gaisano ICC loop', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (2094205176, 466985459, 12, 'B. Aquino Ave', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1773682559, 466985459, 13, 'SM Transport Hub (Strata)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1459300758, 466985459, 14, 'B. Aquino Ave', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (58326467, 466985459, 15, 'U-turn Gil Traders/Petron Station', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (915822848, 466985459, 16, 'B. Aquino Ave. (Zuri Hotel)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1675380489, 466985459, 17, 'Plazuela 1&2', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (331663194, 466985459, 18, 'Pacencia Tijam Ave. (S&R/Atria)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1829132003, 466985459, 19, 'Pison Rotunda', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1318360521, 466985459, 20, 'B. Aquino Ave. (Smallville/Esplanade 182)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (942539760, 466985459, 21, 'Infante St.(UPV Iloilo Campus/lloilo Doctors’ Hospital/College)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (2058487292, 466985459, 22, 'Rizal St. Zamora St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (2040900813, 466985459, 23, 'Zamora Ext. Parola Wharf (City Mall Parola)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (172923260, 246691017, 1, 'Mohon Terminal, Osmeña Street, Villa Arevalo District, Iloilo City, Iloilo', 10.6934751, 122.499771);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (422552343, 246691017, 2, 'Plaza Villa, Yulo Drive, Villa Arevalo District, Iloilo City, Iloilo', 10.6890699, 122.516098);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1754853696, 246691017, 3, 'YMCA - Iloilo, Iloilo City Proper, Iloilo City, Iloilo', 10.7008474, 122.5691106);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1469866839, 246691017, 4, 'Roberto''s, JM Basa Street, Iloilo City Proper, Iloilo City, Iloilo', 10.6937638, 122.5712931);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (859856018, 246691017, 5, 'MHRF+M3C, Rizal St, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 10.6917358, 122.5731649);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1573923816, 246691017, 6, 'MHR9+P6J, Rizal St, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 10.6919073, 122.5679494);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1599347283, 246691017, 7, 'Corner Valeria, MHX9+44M, Delgado St, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 10.697848, 122.5677724);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (2015321166, 246691017, 8, '104 De Leon St, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 10.6933332, 122.5647583);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1667309475, 246691017, 9, '208b Fuentes St, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 10.6943997, 122.5632707);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (773859125, 246691017, 10, 'MHV3+PXQ, Infante St, Molo, Iloilo City, 5000 Iloilo, Philippines', 10.6944738, 122.5550266);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1968946696, 246691017, 11, 'MHV3+PXQ, Infante St, Molo, Iloilo City, 5000 Iloilo, Philippines', 10.6944738, 122.5550266);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1619838315, 246691017, 12, '102 General Luna St, Molo, Iloilo City, Iloilo, Philippines', 10.69968, 122.553494);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1098778805, 963368896, 1, 'Buntatala Loop (Spousal of Mary and Joseph Parish Church)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (163645970, 963368896, 2, 'Tagbak Terminal', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1375005859, 963368896, 3, 'MacArthur Dr. (NFA', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (2087475199, 963368896, 4, 'Iloilo Supermart Jaro', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (732836981, 963368896, 5, 'Angelicum)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (333006266, 963368896, 6, 'Simon Ledesma St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1764016512, 963368896, 7, 'Jaro Plaza Rizal St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1550030472, 963368896, 8, 'Commission Civil St. (SM Hypermarket)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (638999303, 963368896, 9, 'Del Carmen St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (354089187, 963368896, 10, 'Luna St. (Benito Hospital', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (461792657, 963368896, 11, 'WVSU)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1070775693, 963368896, 12, 'Bonifacio Dr. (Provincial Capitol', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1816988267, 963368896, 13, 'Atrium Mall)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (630635893, 963368896, 14, 'Gen. Luna St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1945481834, 963368896, 15, 'Jalandoni St. (University of San Agustin )', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (642775211, 963368896, 16, 'Rizal St. (Super)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (144961101, 963368896, 17, 'Mabini St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (578134674, 963368896, 18, 'De Leon St. (Robinsons City)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1293591641, 963368896, 19, 'Quezon St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (132684419, 963368896, 20, 'Rizal St. (UI Phinma) Mapa St. (Bombo Radyo lloilo', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1348398637, 963368896, 21, 'Goldberry Lite Hotel)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (974564964, 963368896, 22, 'JM Basa St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (562059988, 963368896, 23, 'Ortiz St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (864662603, 963368896, 24, 'Rizal St. (lloilo Central Market)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1410032476, 963368896, 25, 'Quezon St. (Sta. Teresita Church)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1810162285, 963368896, 26, 'De Leon St. (Ledi Supermart)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (684153315, 963368896, 27, 'Valeria St. (Marymart) Gen. Luna St. (Atrium lloilo)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1761798262, 963368896, 28, 'Muelle Loney St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1499901458, 963368896, 29, 'Rizal St. (La Paz)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1287502932, 963368896, 30, 'Luna St. (WIT)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (159014452, 963368896, 31, 'E. Lopez St. (Benito Hospital)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (259940651, 963368896, 32, 'Del Carmen St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1955945304, 963368896, 33, 'Commission Civil St. (SM Hypermarket)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (2113803923, 963368896, 34, 'Rizal St. (Jaro Plaza', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1680222074, 963368896, 35, 'Ledi Supermart)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (405039904, 963368896, 36, 'Washington St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (2051036592, 963368896, 37, 'MacArthur Dr. (lloilo Supermart Jaro)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1123303889, 963368896, 38, 'Tagbak Terminal', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1925804637, 963368896, 39, 'Buntatala Loop (Spousal of Mary and Joseph Parish Church)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (2138335896, 1175064832, 1, 'Ticud Terminal, La Paz, Iloilo City, Iloilo', 10.7174092, 122.5801028);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1853686947, 1175064832, 2, 'Jereos Street, La Paz, Iloilo City, Iloilo', 10.7159911, 122.5688388);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (704310096, 1175064832, 3, '29 Commission Civil St, Jaro, Iloilo City, Iloilo, Philippines', 10.7185679, 122.5639723);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1851225881, 1175064832, 4, '23 Huervana St, La Paz, Iloilo City, Iloilo, Philippines', 10.710335, 122.5702298);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1462681566, 1175064832, 5, '113 Luna St, La Paz, Iloilo City, 5000 Iloilo, Philippines', 10.7091764, 122.5668534);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (462697219, 1175064832, 6, 'No. 119 Luna St, La Paz, Iloilo City, Iloilo, Philippines', 10.7089777, 122.5667618);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (520982033, 1175064832, 7, 'PH39+J4Q, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 10.7039756, 122.5679633);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1323040094, 1175064832, 8, '42 Jalandoni St, Iloilo City Proper, Iloilo City, 5000 Iloilo, Philippines', 10.6974743, 122.5617384);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (2108588666, 1175064832, 9, 'MHV6+RH9, Jalandoni St, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 10.6945516, 122.5617376);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1459216562, 1175064832, 10, 'Locsin-Coscuella Building, Iznart St, Iloilo City Proper, Iloilo City, 5000 Iloilo, Philippines', 10.6963196, 122.5687497);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1005480359, 1175064832, 11, '2022 Rizal St, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 10.6916576, 122.5737202);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1772156867, 1175064832, 12, '222 Santo Rosario St, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 10.6918424, 122.5749708);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (155599348, 1175064832, 13, 'MHVC+FP2, Muelle Loney St, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 10.6936278, 122.5716409);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (597207937, 1175064832, 14, 'PH29+W9F, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 10.7023036, 122.5681325);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1229651221, 1764141810, 1, 'Mandurriao Plaza', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1460246681, 1764141810, 2, 'PHHC', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (830381189, 1764141810, 3, 'R. Mapa St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (2031155601, 1764141810, 4, 'Megaworld Blvd', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (865107455, 1764141810, 5, 'Festive Walk Transport Hub', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (133076583, 1764141810, 6, 'Spur Rd. (Carlo’s Bakeshop)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1570585690, 1764141810, 7, 'B. Aquino Ave. (SM City)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (325196931, 1764141810, 8, 'Pison loop (Seda Hotel)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (2092135059, 1764141810, 9, 'B. Aquino Ave', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (712273544, 1764141810, 10, 'Gen. Luna St. (UPV Iloilo Campus/University of San Agustin)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (136852478, 1764141810, 11, 'Jalandoni St. (University of San Agustin Gym)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1887609961, 1764141810, 12, 'Ledesma St. (Robinsons City)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1343289963, 1764141810, 13, 'Iznart St. (Socorro Drug/ Iloilo Central Market)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (680795165, 1764141810, 14, 'Rizal St. (UI Phinma)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (948438413, 1764141810, 15, 'Valeria St. (Marymart)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (27189902, 1764141810, 16, 'Delgado St. (SM Delgado)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1753210449, 1764141810, 17, 'Mabini St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1350006349, 1764141810, 18, 'Gen. Luna St. (UPV Iloilo Campus)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (695540002, 1764141810, 19, 'B. Aquino Ave. Gaisano llollo City Center Loop', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (297626639, 1764141810, 20, 'SM Transport Hub', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1292299653, 1764141810, 21, 'B. Aquino Ave', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1542784240, 1764141810, 22, 'U-turn Fancom Inc', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (973661891, 1764141810, 23, 'Spur Road (Carlos Bakeshop)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1294704354, 1764141810, 24, 'Q. Abeto St. (WVMC)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1572494207, 1764141810, 25, 'Guzman St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (763256573, 1764141810, 26, 'Perfecto St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (925682304, 1764141810, 27, 'Oñate St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (817145123, 1764141810, 28, 'De Leon St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1138606050, 1764141810, 29, 'Jesena St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1039282720, 1764141810, 30, 'Benedicto St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1897787239, 1764141810, 31, 'Libertad St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (177993985, 1764141810, 32, '(PHHC) Housing Main Road', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (82248555, 1764141810, 33, 'Q. Abeto St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (620366490, 1410325484, 1, 'Hibao-an Loop', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (608120739, 1410325484, 2, 'Guzman St. (Ana Ros VIllage)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1042729071, 1410325484, 3, 'R. Mapa St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (2102770627, 1410325484, 4, 'Carpenter’s Bridge', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (940659578, 1410325484, 5, 'Locsin St. (lloilo Supermart Molo) MH del Pilar St. (John B. Lacson University)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1335046523, 1410325484, 6, 'Gen. Luna St. (UPV Iloilo Campus/University of San Agustin)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (221492093, 1410325484, 7, 'Jalandoni St. (University of San Agustin Gym)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (284040426, 1410325484, 8, 'Ledesma St. (Robinsons City)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1006261403, 1410325484, 9, 'Iznart St. (Socorro Drug/ Iloilo Central Market)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (938429547, 1410325484, 10, 'Rizal St. (UI Phinma)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (709743926, 1410325484, 11, 'Ortiz St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (256702715, 1410325484, 12, 'JM Basa St. (Plaza Libertad)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1429388425, 1410325484, 13, 'Rizal St. (Gaisano Capital/Ilollo Central Market)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (446088219, 1410325484, 14, 'Iznart St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1278023189, 1410325484, 15, 'Ledesma St. (Colegio de las Hijas de Jesus)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (888774018, 1410325484, 16, 'Jalandoni St. (University of San Agustin Gym)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (701256126, 1410325484, 17, 'Gen. Luna St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (241547001, 1410325484, 18, 'MH del Piiar St. (Hotel del Rio)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1601025653, 1410325484, 19, 'San Pedro St. (Molo Plaza)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (2057024200, 1410325484, 20, 'Locsin St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1860546201, 1410325484, 21, 'Carpenter Br. (Medical City)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1752898874, 1410325484, 22, 'R. Mapa St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1714759028, 1410325484, 23, 'Onate St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (204057728, 1410325484, 24, 'Guzman-Jesena St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (717841870, 1410325484, 25, 'Hibao-an Loop', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1641701493, 209664240, 1, 'Hibao-an Norte Loop', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (2021302764, 209664240, 2, 'Guzman St. (Hibao-an Elementary School)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (985631076, 209664240, 3, 'Q. Abeto St. (WVMC/J7 Plaza Hotel)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (994247703, 209664240, 4, 'Megaworld Blvd', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1983503558, 209664240, 5, 'Festive Walk Transport Hub', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (134788515, 209664240, 6, 'Taft St. (lloilo Integrated School)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (167111758, 209664240, 7, 'B. Aquino Ave. (Zuri Hotel/SM City)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (786194186, 209664240, 8, 'Pison Ave', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (239006741, 209664240, 9, 'Rotunda (Seda)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1200292183, 209664240, 10, 'SM Transport Hub (Strata)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (472114468, 209664240, 11, 'B. Aquino Ave', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (578102059, 209664240, 12, 'Jalandoni St. (Injap Tower)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (594694724, 209664240, 13, 'Commission Civil St. (SM Hypermarket)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1789130866, 209664240, 14, 'Rizal St. (Plaza Jaro)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1698745606, 209664240, 15, 'El-98 St. (Jaro Market)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (246343310, 209664240, 16, 'B. Aquino Ave', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (977510786, 209664240, 17, 'Carlos', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (362699749, 209664240, 18, 'U-turn Fancom Inc', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (81113725, 209664240, 19, 'Spur Road', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1855116021, 209664240, 20, 'Turn Right Q. Abeto St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (373261727, 209664240, 21, 'Guzman St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (2000388417, 209664240, 22, 'Hibao-an Loop', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1492387818, 479168301, 1, 'Iloilo City National High School, Molo, Iloilo City, Iloilo', 10.6986445, 122.5489371);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1008079464, 479168301, 2, 'Molo Plaza, San Pedro Street, Molo, Iloilo City, Iloilo', 10.6968839, 122.5437346);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1407356873, 479168301, 3, 'Locsin Street, Molo, Iloilo City, Iloilo', 10.6953011, 122.5448801);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (663154238, 479168301, 4, 'MHW9+HJP, Arroyo St, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 10.6964031, 122.5690608);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (319734288, 479168301, 5, 'Iloilo Grand Hotel Corporation, Iznart Street, Iloilo City Proper, Iloilo City, Iloilo', 10.6926742, 122.5691105);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1418276963, 479168301, 6, 'Ortiz Jeepney Stop, Oritz Street, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 10.6919796, 122.571659);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (2128169308, 479168301, 7, 'Plaza Libertad Jeepney Stop, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 10.6923602, 122.5733168);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1796080206, 479168301, 8, '10 Rizal St, Iloilo City Proper, Iloilo City, 5000 Iloilo, Philippines', 10.6918987, 122.5721147);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1032694014, 479168301, 9, 'Basement Level, Gaisano Iloilo, La Paz, Iloilo City, Iloilo, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 10.6920633, 122.5699927);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (888629011, 479168301, 10, 'Basement Level, Gaisano Iloilo, La Paz, Iloilo City, Iloilo, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 10.6920633, 122.5699927);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (75359769, 479168301, 11, 'Maria Clara, Iloilo City Proper, Iloilo City, Iloilo', 10.6910852, 122.5694413);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1428436938, 479168301, 12, 'UNITOP, Iloilo City Proper, Iloilo City, Iloilo', 10.6963401, 122.5684774);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1976788876, 479168301, 13, '163 Baluarte - Calumpang - Villa - Oton Blvd, Molo, Iloilo City, Iloilo, Philippines', 10.6923536, 122.5524901);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (552809028, 479168301, 14, 'Molo Plaza, San Pedro Street, Molo, Iloilo City, Iloilo', 10.6968839, 122.5437346);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1216024447, 479168301, 15, 'Iloilo City National High School, Molo, Iloilo City, Iloilo', 10.6986445, 122.5489371);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1984825311, 1565494172, 1, 'Metropolis East Entrance Gate (Philippine Science HS)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1151830874, 1565494172, 2, 'Coastal Rd', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1765731301, 1565494172, 3, 'Balabago Rd', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (2031453028, 1565494172, 4, '(Balabago Elementary School)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (674403969, 1565494172, 5, 'Cubay Rd. (MG Motor Car Sales)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (884113871, 1565494172, 6, 'MacArthur Dr. (Angelicum)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1589806774, 1565494172, 7, 'Simon Ledesma St. (Jaro Small Market)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1302801333, 1565494172, 8, 'Lopez Jaena St. (Biscocho House)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1116557942, 1565494172, 9, 'Rizal St. (Jaro Plaza)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1153804222, 1565494172, 10, 'Washington St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1178327468, 1565494172, 11, 'MacArthur Dr', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (443960867, 1565494172, 12, 'Balabago Rd. (Jollibee Tabuc Suba)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1113091562, 1565494172, 13, 'Coastal Rd', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1278898363, 1565494172, 14, 'Metropolis East Entrance', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (384437585, 1115948942, 1, 'Total Gas Station (Yulo)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (2044503563, 1115948942, 2, 'Baluarte-Calumpang-Villa-Oton Blvd. Tatoy’s Manokan and Seafood)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (466777407, 1115948942, 3, 'Sto. Domingo St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1350460826, 1115948942, 4, 'Bonifacio St. (lloilo Supermart Arevalo)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1387919460, 1115948942, 5, 'Quezon St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (615042351, 1115948942, 6, 'Avanceña St. (Dominican Motherhouse). Locsin St. (Molo Plaza)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (587056150, 1115948942, 7, 'MH del Pilar St. (GT Mall Molo/lloilo City National HS/St. Therese MTC/JBLCF-Molo)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (2091129784, 1115948942, 8, 'Gen. Luna St. (UPV lloilo Campus/University of San Agustin)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (820720812, 1115948942, 9, 'Quezon St.(Robinsons City)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1456394035, 1115948942, 10, 'Rizal St.(UI Phinma)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (374616645, 1115948942, 11, 'Ortiz St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1802001342, 1115948942, 12, 'JM Basa St. (Plaza Libertad)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (134743556, 1115948942, 13, 'Rizal St. (Goldberry Lite Hotel/Gaisano Capltal/lloilo Central Market)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (584090783, 1115948942, 14, 'Quezon St. (Sta. Teresita Church)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1888187340, 1115948942, 15, 'Delgado St. (Narita)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1104794356, 1115948942, 16, 'Mabini St. (EMCOR/SPED-Integrated/Jubilee Hall)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1806197105, 1115948942, 17, 'Gen. Luna St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (416998846, 1115948942, 18, 'MH del Pilar St. (Technical Institute ot Iloilo City)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (613672615, 1115948942, 19, 'San Pedro St. (Molo Church/Plaza)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1483009863, 1115948942, 20, 'Avanceña St. (lloilo Supermart-Molo)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1688707213, 1115948942, 21, 'Quezon St. (lloilo Supermart Arevalo)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1824564285, 1115948942, 22, 'Yulo St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (629073216, 1115948942, 23, 'Baluarte-Calumpang-Villa-Oton Blvd. (Tatoy’s', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1021303734, 1115948942, 24, 'John B Lacson Arevalo Campus)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1694782065, 1115948942, 25, 'Sto.Domingo', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1738276972, 1115948942, 26, 'Bonifacio St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (399011693, 1115948942, 27, 'Quezon St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1665947157, 1115948942, 28, 'to lloilo City Proper', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1419829006, 1353721056, 1, 'Buntatala/Tagbak loop (Spousal of Mary and Joseph Parish Church)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1538445448, 1353721056, 2, 'Tagbak Terminal', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1084367435, 1353721056, 3, 'MacArthur Dr. (Ceres Terminal)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (2067086916, 1353721056, 4, 'lloilo Circumferential Rd. (C. Aquino Ave.)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (838648558, 1353721056, 5, 'Coastal Rd', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1991796981, 1353721056, 6, 'Lapuz Mansaya-Loboc Rd. (Guimaras RORO Terminal)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (110262362, 1353721056, 7, 'Rizal St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1460101318, 1353721056, 8, 'lloilo Ferry Terminal Road (lloilo-Bacolod Ferry Terminal)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1835654438, 1353721056, 9, 'Arroyo Bridge', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (457957410, 1353721056, 10, 'Muelle Loney St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (569038849, 1353721056, 11, 'Aldeguer St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (604601155, 1353721056, 12, 'JM Basa St. (Washington Supermart)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (738697660, 1353721056, 13, 'Mapa St. (SSS/Sun Yat Sen)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1403203096, 1353721056, 14, 'Rizal St. (UI Phinma)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1372545056, 1353721056, 15, 'Iznart St. (lloilo Central Market)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (111578967, 1353721056, 16, 'Aldeguer St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (768919490, 1353721056, 17, 'Muelley Loney St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (273346611, 1353721056, 18, 'Arroyo Bridge', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (2094985464, 1353721056, 19, 'lloilo Ferry Terminal Road', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1275310568, 1353721056, 20, 'Rizal St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (448381434, 1353721056, 21, 'Lapuz Mansaya-Loboc Rd', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (414687423, 1353721056, 22, 'Coastal Rd', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1692559451, 1353721056, 23, 'Iloilo Circumferential Rd. (C. Aquino Ave.)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (298822939, 1353721056, 24, 'MacArthur Dr', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (416204271, 1353721056, 25, 'Tagbak Terminal', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (2071429743, 1353721056, 26, 'Buntatala/Tagbak loop (Spousal of Mary and Joseph Parish Church)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1951559634, 794134662, 1, 'Metropolis Ave. (Philippine Science HS)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1600158857, 794134662, 2, 'Coastal Rd', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (679411649, 794134662, 3, 'Baldoza St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1050929889, 794134662, 4, 'Lopez Jaena St. La Paz Police Station)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (552727060, 794134662, 5, 'Jereos St. (La Paz Plaza)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1177777452, 794134662, 6, 'Huervana Ext', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1918913319, 794134662, 7, 'Burgos St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (951925364, 794134662, 8, 'Magdalo St. (St. Therese-MTC Colleges)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1079161387, 794134662, 9, 'Luna St. (Galsano La Paz)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (123134685, 794134662, 10, 'Bonifacio Dr. (Hall of Justice/ Provincial Capitol)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (2133931405, 794134662, 11, 'Gen. Luna (St. Paul’s Hospital and University)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (577592593, 794134662, 12, 'Mabini St. (Jubilee Hall/SPED School)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1832334939, 794134662, 13, 'De Leon St. (Robinsons City)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1139718041, 794134662, 14, 'Valeria St. (Marymart/SM/Atrium)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (428247523, 794134662, 15, 'Gen. luna St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1752032583, 794134662, 16, 'Muelle Loney (Registry of Deeds/lloilo Provincial Capitol)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1789858782, 794134662, 17, 'Rizal St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (256267307, 794134662, 18, 'Huervana St. (La Paz Market)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1657680652, 794134662, 19, 'Lopez Jaena St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1593299716, 794134662, 20, 'Baldoza St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (338524120, 794134662, 21, 'Coastal Rd', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1189793575, 794134662, 22, 'Bito-on loop', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1634254558, 2006898523, 1, 'Mohon Terminal', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1646047456, 2006898523, 2, 'Arevalo Plaza', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1431996543, 2006898523, 3, 'Quezon St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1654223686, 2006898523, 4, 'Jocson St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (474197918, 2006898523, 5, 'So-oc Resettlement Rd', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1071230132, 2006898523, 6, 'Calajunan Rd', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1896280902, 2006898523, 7, 'Oñate St. (Mandurriao Plaza)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1903884123, 2006898523, 8, 'Q. Abeto St. (Western Visayas Medical Center)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (917708808, 2006898523, 9, 'Megaworld BIvd', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1220461814, 2006898523, 10, 'Festive Walk Transport Hub', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (251290850, 2006898523, 11, 'Taft St. (lloilo Integrated School)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1072376056, 2006898523, 12, 'El 98 St. (Jaro Big Market)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1462807097, 2006898523, 13, 'Rizal St. (Jaro Plaza)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1696061812, 2006898523, 14, 'Commission Civil', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1618914443, 2006898523, 15, 'ISATU Loop', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (2079923345, 2006898523, 16, 'Commission Civil St. (SM Hypermarket)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (2062001390, 2006898523, 17, 'M. Jayme St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (519576021, 2006898523, 18, 'E. Lopez St. (Robinsons Jaro)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1770953110, 2006898523, 19, 'Rizal St. (Jaro Plaza)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1117392119, 2006898523, 20, 'El 98 St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1281627515, 2006898523, 21, 'Taft St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (3995925, 2006898523, 22, 'Q. Abeto St. (lloilo Supermart Mandurriao)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (2017964823, 2006898523, 23, 'Perfecto St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (612869527, 2006898523, 24, '(Mandurriao Church)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (745810224, 2006898523, 25, 'Ofate St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (655515686, 2006898523, 26, 'Calajunan Rd', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1497318249, 2006898523, 27, 'So-oc Resettiement Rd', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1853439901, 2006898523, 28, 'Jocson St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (886071006, 2006898523, 29, 'Arevalo Plaza', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1089396568, 2006898523, 30, 'Mohon Terminal', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1486968201, 1980144542, 1, 'Buntatala Loop (Spousal of Mary and Joseph Parish Church)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (802231135, 1980144542, 2, 'Tagbak Terminal (City Mall Tagbak)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1919300537, 1980144542, 3, 'MacArthur Dr. (Ceres Terminal)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (903607168, 1980144542, 4, 'Simon Ledesma St. (Jaro Small Market)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (2059641260, 1980144542, 5, 'Lopez Jaena St. (Biscocho Haus)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1311135011, 1980144542, 6, 'Rizal St. (Jaro Plaza)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1404775651, 1980144542, 7, 'El-98 St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1977929445, 1980144542, 8, 'B. Aquino Ave. (SM City/Smallville Complex)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1418699451, 1980144542, 9, 'Infante St. (UP/lloilo Doctors’ College)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (267081713, 1980144542, 10, 'Locsin St. (lloilo Fish Port Complex)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1722575172, 1980144542, 11, 'Rizal St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (206189909, 1980144542, 12, 'Infante St. (UPV lloilo Campus)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (320102240, 1980144542, 13, 'B. Aquino Ave', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1505916044, 1980144542, 14, 'Gaisano ICC Loop', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (892605655, 1980144542, 15, 'Pison Ave. (Atria)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1127595141, 1980144542, 16, 'R. Mapa St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (367545988, 1980144542, 17, 'Megaworld Ave. (Festive Hub)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1552721496, 1980144542, 18, 'Taft St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1661073300, 1980144542, 19, 'El-98 St. (Puregold)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (993386868, 1980144542, 20, 'Rizal St. (Jaro Plaza)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (479015425, 1980144542, 21, 'Washington St. (Palasyo)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (604085619, 1980144542, 22, 'MacArthur Dr. (lloilo Supermart-Jaro)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (420947119, 1980144542, 23, 'Tagbak Terminal', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1650565264, 1980144542, 24, 'Buntatala Loop (Spousal of Mary and Joseph Parish Church)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (765056715, 2091730364, 1, 'Ungka Terminal (ITGS lI)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (788718509, 2091730364, 2, 'Diversion Rd. (University of San Agustin-Sambag)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1087789362, 2091730364, 3, 'Lopez Jaena St. (CPU)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (45596984, 2091730364, 4, 'Rizal St. (Jaro Plaza)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (4467263, 2091730364, 5, 'Commission Civil St. (SM Hypermarket)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (686314444, 2091730364, 6, 'Burgos St. (ISATU)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (2074657792, 2091730364, 7, 'Huervana St. (La Paz Plaza)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1642291253, 2091730364, 8, 'Rizal St. (La Paz Public Market)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (290271575, 2091730364, 9, 'Arroyo St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (312573180, 2091730364, 10, 'Magdalo St. (St. Therese-MTC Colleges) Burgos St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1763195735, 2091730364, 11, 'Commission Civil St. (SM Hypermarket)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (620329385, 2091730364, 12, 'Washington St. (Old Jaro Municipal Hall)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1274764494, 2091730364, 13, 'Democracia St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (331562304, 2091730364, 14, 'Simon Ledesma', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (978999344, 2091730364, 15, 'Lopez Jaena St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (2024777236, 2091730364, 16, 'Diversion Rd', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1906864854, 2091730364, 17, 'Ungka Terminal', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (52214402, 81853868, 1, 'Mohon Terminal', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (323671314, 81853868, 2, 'Osmeña St. (Plaza Arevalo)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (2100382077, 81853868, 3, 'Jocson St. (JD Bakeshop)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1075606189, 81853868, 4, 'Avanceña St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (501007690, 81853868, 5, '(Dominican Motherhouse)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (577596688, 81853868, 6, 'Molo Plaza', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (55962134, 81853868, 7, 'GT Mall', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1142595240, 81853868, 8, 'Iloilo City National High School', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (141742853, 81853868, 9, 'lloilo City College', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (2023536829, 81853868, 10, 'San Marcos St. (Ground Effects)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1739006974, 81853868, 11, 'Locsin St. (lloilo Supermart-Molo)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (457696038, 81853868, 12, 'Pison Ave', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (319763745, 81853868, 13, 'Gaisano Iloilo City Center', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (376441693, 81853868, 14, 'SM Strata', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1163162148, 81853868, 15, 'B. Aquino Ave', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1371768370, 81853868, 16, 'Taft St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (715328885, 81853868, 17, 'Megaworld Ave', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (86363613, 81853868, 18, 'R. Mapa St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (36186164, 81853868, 19, 'Locsin St. (Medical City)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (785517728, 81853868, 20, 'Avanceña St. (lloilo Supermart-Molo)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1625399224, 81853868, 21, 'Jocson St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1932029289, 81853868, 22, 'Osmeña St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1933898963, 81853868, 23, 'Mohon Terminal', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (395154391, 77732220, 1, 'La Paz Plaza', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (984483789, 77732220, 2, 'Huervana Ext', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (583424962, 77732220, 3, 'Burgos St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1585241894, 77732220, 4, 'ISATU Loop', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (91127085, 77732220, 5, 'Magdalo', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1496267355, 77732220, 6, 'Hechanova St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1813064664, 77732220, 7, 'Senator E. Treñas Boulevard (Prime Estate/Garden of Love)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (111134340, 77732220, 8, 'B. Aquino Ave', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1596598314, 77732220, 9, 'Gaisano Iloilo City Center Hub', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (381321775, 77732220, 10, 'SM Strata Hub', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (274015922, 77732220, 11, 'U-turn Gil Traders', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (292721350, 77732220, 12, 'B. Aquino Ave. (Zuri Hotel/SM City)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (433327604, 77732220, 13, 'Pison Ave', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (165534070, 77732220, 14, 'R. Mapa St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (156525633, 77732220, 15, 'Megaworld Blvd', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (120636591, 77732220, 16, 'Festive Walk Transport Hub', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (644526298, 77732220, 17, 'Megaworld Blvd', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (818997826, 77732220, 18, 'Airport Spur Rd', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (18006077, 77732220, 19, 'Diversion Road', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1783110704, 77732220, 20, 'Gaisano lloilo City Center Loop', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (661445902, 77732220, 21, 'Diversion Service Rd', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1694306530, 77732220, 22, 'Senator E. Treñas Blvd. (Nabitasan Garden of love)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1923138242, 77732220, 23, 'Hechanova St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1781488617, 77732220, 24, 'Luna St. (Gaisano La Paz)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1935804081, 77732220, 25, 'Bonifacio St. (Provincial Capitol)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1138574633, 77732220, 26, 'Muelle Loney St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1216462104, 77732220, 27, 'Rizal St. (Registry of Deeds)', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1722818523, 77732220, 28, 'Huervana St', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1414559501, 77732220, 29, 'La Paz Plaza', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1158319610, 77732220, 30, 'Huervana Extension', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (742260894, 77732220, 31, 'La Paz Plaza', NULL, NULL);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (213657373, 236626717, 1, 'Escoto Natividad Building, M.H. del Pilar corner Lopez Jaena Streets (infront of Police Station), Iloilo City, 5000, Iloilo, Molo, Iloilo City, Iloilo, Philippines', 10.6960099, 122.5444256);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (723053067, 236626717, 2, 'PH26+6PJ, General Luna St, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 10.7006459, 122.5617122);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1891386002, 236626717, 3, 'Atrium Iloilo Commercial Center, General Luna St, Iloilo City Proper, Iloilo City, Iloilo', 10.7015457, 122.5681237);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1256985950, 236626717, 4, 'UNITOP, Iloilo City Proper, Iloilo City, Iloilo', 10.6963401, 122.5684774);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (205143657, 236626717, 5, 'Plaza Libertad, Zamora Street, Iloilo City Proper, Iloilo City, Iloilo', 10.6923154, 122.5733644);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (1898606307, 236626717, 6, 'PHINMA UNIVERSITY OF ILOILO, Rizal Street, Iloilo City Proper, Iloilo City, Iloilo', 10.6920277, 122.5695958);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (352308607, 236626717, 7, 'UNITOP, Iloilo City Proper, Iloilo City, Iloilo', 10.6963401, 122.5684774);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (322926930, 236626717, 8, 'Tanza Church, Iloilo City Proper, Iloilo City, Iloilo', 10.6934022, 122.5592303);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (670873280, 236626717, 9, 'BALUARTE ELEMENTARY SCHOOL, Lopez Jaena Street, Molo, Iloilo City, Iloilo', 10.6923432, 122.5484599);
+INSERT INTO prd_route_stops (stop_id, route_id, stop_order, stop_name, lat, lng) VALUES (751433087, 236626717, 10, 'GT Plaza Mall, M.H del Pilar Street, Molo, Iloilo City, Iloilo', 10.6964042, 122.5454765);
+INSERT INTO prd_route_polylines (polyline_id, route_id, segment_index, segment_name, point_count) VALUES (992104935, 1046468184, 1, 'Directions from Everlasting Street, Lapuz, Iloilo City, Iloilo to PH2F+MM3, Rizal St, Lapuz, Iloilo City, Iloilo, Philippines', 321);
+INSERT INTO prd_route_polylines (polyline_id, route_id, segment_index, segment_name, point_count) VALUES (672541012, 1430312025, 1, 'Directions from Arevalo Elementary School, Jocson Street, Villa Arevalo District, Iloilo City, Iloilo to UNITOP, Iloilo City Proper, Iloilo City, Iloilo', 308);
+INSERT INTO prd_route_polylines (polyline_id, route_id, segment_index, segment_name, point_count) VALUES (1415582340, 1430312025, 2, 'Directions from UNITOP, Iloilo City Proper, Iloilo City, Iloilo to Arevalo Elementary School, Jocson Street, Villa Arevalo District, Iloilo City, Iloilo', 217);
+INSERT INTO prd_route_polylines (polyline_id, route_id, segment_index, segment_name, point_count) VALUES (2004548497, 519120736, 1, 'Directions from GT Town Center Pavia, Pavia, Iloilo to Gaisano Capital City-Iloilo, La Paz, Iloilo City, Iloilo', 450);
+INSERT INTO prd_route_polylines (polyline_id, route_id, segment_index, segment_name, point_count) VALUES (1966520376, 519120736, 2, 'Directions from Gaisano Capital City-Iloilo, La Paz, Iloilo City, Iloilo to CHRIST THE KING MEMORIAL PARK, Diversion Rd, Jaro, Iloilo City, Iloilo', 193);
+INSERT INTO prd_route_polylines (polyline_id, route_id, segment_index, segment_name, point_count) VALUES (1871586405, 1703456505, 1, 'Directions from GT Town Center Pavia, Pavia, Iloilo to UPV - College of Management, Iloilo City Proper, Iloilo City, Iloilo', 374);
+INSERT INTO prd_route_polylines (polyline_id, route_id, segment_index, segment_name, point_count) VALUES (2049429081, 225491600, 1, 'Directions from Festive Walk Mall, Megaworld Boulevard, Mandurriao, Iloilo City, Iloilo to JD Bakery Cafe – Gen. Luna, General Luna Street, La Paz, Iloilo City, Iloilo', 304);
+INSERT INTO prd_route_polylines (polyline_id, route_id, segment_index, segment_name, point_count) VALUES (1566553975, 225491600, 2, 'Directions from JD Bakery Cafe – Gen. Luna, General Luna Street, La Paz, Iloilo City, Iloilo to Festive Walk Mall, Megaworld Boulevard, Mandurriao, Iloilo City, Iloilo', 253);
+INSERT INTO prd_route_polylines (polyline_id, route_id, segment_index, segment_name, point_count) VALUES (270737713, 2103489053, 1, 'Directions from Plaza Libertad, Zamora Street, Iloilo City Proper, Iloilo City, Iloilo to 216 Locsin St, Molo, Iloilo City, Iloilo, Philippines', 217);
+INSERT INTO prd_route_polylines (polyline_id, route_id, segment_index, segment_name, point_count) VALUES (508373133, 246691017, 1, 'Directions from Mohon Terminal, Osmeña Street, Villa Arevalo District, Iloilo City, Iloilo to MHV3+PXQ, Infante St, Molo, Iloilo City, 5000 Iloilo, Philippines', 357);
+INSERT INTO prd_route_polylines (polyline_id, route_id, segment_index, segment_name, point_count) VALUES (1455207158, 246691017, 2, 'Directions from MHV3+PXQ, Infante St, Molo, Iloilo City, 5000 Iloilo, Philippines to 102 General Luna St, Molo, Iloilo City, Iloilo, Philippines', 44);
+INSERT INTO prd_route_polylines (polyline_id, route_id, segment_index, segment_name, point_count) VALUES (1539890272, 1175064832, 1, 'Directions from Ticud Terminal, La Paz, Iloilo City, Iloilo to 113 Luna St, La Paz, Iloilo City, 5000 Iloilo, Philippines', 153);
+INSERT INTO prd_route_polylines (polyline_id, route_id, segment_index, segment_name, point_count) VALUES (1619997782, 1175064832, 2, 'Directions from No. 119 Luna St, La Paz, Iloilo City, Iloilo, Philippines to PH29+W9F, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 221);
+INSERT INTO prd_route_polylines (polyline_id, route_id, segment_index, segment_name, point_count) VALUES (616320184, 479168301, 1, 'Directions from Iloilo City National High School, Molo, Iloilo City, Iloilo to Basement Level, Gaisano Iloilo, La Paz, Iloilo City, Iloilo, Iloilo City Proper, Iloilo City, Iloilo, Philippines', 200);
+INSERT INTO prd_route_polylines (polyline_id, route_id, segment_index, segment_name, point_count) VALUES (2043878050, 479168301, 2, 'Directions from Basement Level, Gaisano Iloilo, La Paz, Iloilo City, Iloilo, Iloilo City Proper, Iloilo City, Iloilo, Philippines to Iloilo City National High School, Molo, Iloilo City, Iloilo', 197);
+INSERT INTO prd_route_polylines (polyline_id, route_id, segment_index, segment_name, point_count) VALUES (1941429857, 236626717, 1, 'Directions from Escoto Natividad Building, M.H. del Pilar corner Lopez Jaena Streets (infront of Police Station), Iloilo City, 5000, Iloilo, Molo, Iloilo City, Iloilo, Philippines to GT Plaza Mall, M.H del Pilar Street, Molo, Iloilo City, Iloilo', 351);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 1, 10.69882, 122.58711);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 2, 10.69859, 122.58691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 3, 10.6984, 122.58676);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 4, 10.69821, 122.58659);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 5, 10.69801, 122.58643);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 6, 10.69781, 122.58626);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 7, 10.69762, 122.5861);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 8, 10.69743, 122.58594);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 9, 10.69721, 122.58575);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 10, 10.69739, 122.58551);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 11, 10.69795, 122.58482);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 12, 10.69799, 122.58444);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 13, 10.69799, 122.58436);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 14, 10.69799, 122.58432);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 15, 10.69799, 122.58427);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 16, 10.69798, 122.5842);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 17, 10.69797, 122.58413);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 18, 10.69793, 122.58406);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 19, 10.6979, 122.58398);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 20, 10.69789, 122.58397);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 21, 10.69784, 122.58391);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 22, 10.6978, 122.58385);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 23, 10.69775, 122.5838);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 24, 10.69769, 122.58373);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 25, 10.69762, 122.58368);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 26, 10.69755, 122.58362);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 27, 10.69747, 122.58356);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 28, 10.69738, 122.58352);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 29, 10.69726, 122.58346);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 30, 10.69732, 122.58335);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 31, 10.69734, 122.58331);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 32, 10.69736, 122.58328);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 33, 10.69741, 122.58321);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 34, 10.69745, 122.58317);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 35, 10.69746, 122.58315);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 36, 10.69752, 122.58312);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 37, 10.69761, 122.58309);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 38, 10.69768, 122.58307);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 39, 10.69776, 122.58306);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 40, 10.69805, 122.58304);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 41, 10.69811, 122.58303);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 42, 10.69815, 122.58301);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 43, 10.69818, 122.58299);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 44, 10.6982, 122.58298);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 45, 10.69821, 122.58296);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 46, 10.69823, 122.58293);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 47, 10.69824, 122.5829);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 48, 10.69825, 122.58284);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 49, 10.69825, 122.58279);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 50, 10.69826, 122.5824);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 51, 10.69827, 122.58234);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 52, 10.69828, 122.58229);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 53, 10.6983, 122.58225);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 54, 10.69833, 122.58222);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 55, 10.69836, 122.58219);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 56, 10.69843, 122.58216);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 57, 10.69858, 122.58209);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 58, 10.69881, 122.58198);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 59, 10.69903, 122.5819);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 60, 10.69915, 122.58184);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 61, 10.69935, 122.58175);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 62, 10.69955, 122.58161);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 63, 10.69959, 122.58156);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 64, 10.6996, 122.58153);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 65, 10.69963, 122.58144);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 66, 10.69965, 122.58133);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 67, 10.69967, 122.58113);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 68, 10.6997, 122.58102);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 69, 10.69977, 122.58087);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 70, 10.69987, 122.58074);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 71, 10.70004, 122.58051);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 72, 10.70046, 122.57994);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 73, 10.70129, 122.5789);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 74, 10.70137, 122.57879);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 75, 10.70144, 122.57861);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 76, 10.70148, 122.57849);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 77, 10.70157, 122.57823);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 78, 10.70162, 122.57806);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 79, 10.70168, 122.57786);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 80, 10.70168, 122.57785);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 81, 10.70173, 122.57758);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 82, 10.70175, 122.5773);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 83, 10.70177, 122.57697);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 84, 10.70177, 122.57684);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 85, 10.70178, 122.57657);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 86, 10.70178, 122.57646);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 87, 10.70179, 122.5762);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 88, 10.70179, 122.57615);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 89, 10.70179, 122.57533);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 90, 10.7018, 122.57448);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 91, 10.7018, 122.57398);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 92, 10.7018, 122.57364);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 93, 10.70181, 122.57308);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 94, 10.70181, 122.57306);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 95, 10.70181, 122.57304);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 96, 10.70182, 122.57251);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 97, 10.70185, 122.57232);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 98, 10.70185, 122.57229);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 99, 10.70189, 122.5722);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 100, 10.70192, 122.57213);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 101, 10.70222, 122.57159);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 102, 10.70224, 122.57155);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 103, 10.70225, 122.57151);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 104, 10.70226, 122.57147);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 105, 10.70225, 122.57143);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 106, 10.70223, 122.57134);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 107, 10.70211, 122.571);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 108, 10.7021, 122.57091);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 109, 10.70204, 122.57071);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 110, 10.70179, 122.56988);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 111, 10.70176, 122.56977);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 112, 10.70169, 122.56948);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 113, 10.70163, 122.56918);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 114, 10.70163, 122.56917);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 115, 10.70164, 122.56917);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 116, 10.70164, 122.56916);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 117, 10.70164, 122.56915);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 118, 10.70165, 122.56915);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 119, 10.70165, 122.56914);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 120, 10.70165, 122.56913);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 121, 10.70165, 122.56912);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 122, 10.70165, 122.56911);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 123, 10.70165, 122.5691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 124, 10.70165, 122.56909);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 125, 10.70164, 122.56908);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 126, 10.70164, 122.56907);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 127, 10.70164, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 128, 10.70163, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 129, 10.70163, 122.56905);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 130, 10.70162, 122.56905);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 131, 10.70162, 122.56904);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 132, 10.70161, 122.56904);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 133, 10.70161, 122.56903);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 134, 10.7016, 122.56903);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 135, 10.70159, 122.56903);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 136, 10.70159, 122.56902);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 137, 10.70158, 122.56902);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 138, 10.70157, 122.56902);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 139, 10.70156, 122.56902);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 140, 10.70155, 122.56902);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 141, 10.70154, 122.56902);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 142, 10.70153, 122.56902);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 143, 10.70152, 122.56902);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 144, 10.70152, 122.56903);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 145, 10.70151, 122.56903);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 146, 10.7015, 122.56903);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 147, 10.7015, 122.56904);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 148, 10.70149, 122.56904);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 149, 10.70148, 122.56905);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 150, 10.70129, 122.5691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 151, 10.70096, 122.56911);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 152, 10.70054, 122.56911);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 153, 10.70009, 122.56911);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 154, 10.69931, 122.56911);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 155, 10.69914, 122.56907);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 156, 10.69818, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 157, 10.69797, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 158, 10.69795, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 159, 10.69781, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 160, 10.69676, 122.56905);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 161, 10.69667, 122.56905);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 162, 10.69663, 122.56905);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 163, 10.69659, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 164, 10.69658, 122.56907);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 165, 10.69651, 122.5691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 166, 10.69643, 122.56915);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 167, 10.69557, 122.56986);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 168, 10.69475, 122.57049);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 169, 10.69474, 122.5705);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 170, 10.69404, 122.57093);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 171, 10.69392, 122.57101);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 172, 10.69361, 122.57081);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 173, 10.69315, 122.5705);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 174, 10.69264, 122.57014);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 175, 10.69213, 122.56979);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 176, 10.69212, 122.56919);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 177, 10.69213, 122.56919);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 178, 10.69213, 122.56918);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 179, 10.69214, 122.56918);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 180, 10.69214, 122.56917);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 181, 10.69214, 122.56916);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 182, 10.69214, 122.56915);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 183, 10.69215, 122.56915);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 184, 10.69215, 122.56914);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 185, 10.69215, 122.56913);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 186, 10.69215, 122.56912);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 187, 10.69214, 122.56912);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 188, 10.69214, 122.56911);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 189, 10.69214, 122.5691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 190, 10.69213, 122.5691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 191, 10.69213, 122.56909);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 192, 10.69212, 122.56908);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 193, 10.69211, 122.56908);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 194, 10.69211, 122.56907);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 195, 10.6921, 122.56907);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 196, 10.69209, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 197, 10.69208, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 198, 10.69207, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 199, 10.69206, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 200, 10.69205, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 201, 10.69205, 122.56907);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 202, 10.69204, 122.56907);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 203, 10.69203, 122.56907);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 204, 10.69203, 122.56908);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 205, 10.69202, 122.56908);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 206, 10.69191, 122.56795);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 207, 10.69193, 122.56795);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 208, 10.69251, 122.56794);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 209, 10.69294, 122.56793);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 210, 10.69356, 122.56791);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 211, 10.69402, 122.56789);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 212, 10.69441, 122.56789);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 213, 10.69483, 122.56789);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 214, 10.69519, 122.56788);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 215, 10.69608, 122.56787);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 216, 10.69617, 122.56787);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 217, 10.69656, 122.56786);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 218, 10.69785, 122.56781);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 219, 10.69809, 122.5678);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 220, 10.6991, 122.56779);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 221, 10.69939, 122.56777);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 222, 10.70082, 122.56771);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 223, 10.70085, 122.56771);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 224, 10.70125, 122.5677);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 225, 10.7013, 122.5677);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 226, 10.70146, 122.56771);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 227, 10.7015, 122.5679);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 228, 10.70155, 122.56813);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 229, 10.70158, 122.56823);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 230, 10.70163, 122.56833);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 231, 10.70171, 122.5684);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 232, 10.70168, 122.56846);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 233, 10.70157, 122.56885);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 234, 10.70155, 122.56895);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 235, 10.70154, 122.56898);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 236, 10.70153, 122.56902);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 237, 10.70152, 122.56902);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 238, 10.70152, 122.56903);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 239, 10.70151, 122.56903);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 240, 10.7015, 122.56903);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 241, 10.7015, 122.56904);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 242, 10.70149, 122.56904);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 243, 10.70148, 122.56905);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 244, 10.70148, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 245, 10.70147, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 246, 10.70147, 122.56907);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 247, 10.70146, 122.56908);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 248, 10.70146, 122.56909);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 249, 10.70146, 122.5691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 250, 10.70146, 122.56911);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 251, 10.70146, 122.56912);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 252, 10.70146, 122.56913);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 253, 10.70146, 122.56914);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 254, 10.70146, 122.56915);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 255, 10.70146, 122.56916);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 256, 10.70147, 122.56916);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 257, 10.70147, 122.56917);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 258, 10.70148, 122.56918);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 259, 10.70148, 122.56919);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 260, 10.70149, 122.56919);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 261, 10.70149, 122.5692);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 262, 10.7015, 122.5692);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 263, 10.70151, 122.56921);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 264, 10.70152, 122.56921);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 265, 10.70169, 122.56979);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 266, 10.70176, 122.56977);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 267, 10.70222, 122.56964);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 268, 10.7025, 122.56953);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 269, 10.70277, 122.56943);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 270, 10.70304, 122.56933);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 271, 10.70384, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 272, 10.70395, 122.56904);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 273, 10.70422, 122.56896);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 274, 10.70472, 122.56874);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 275, 10.7048, 122.56871);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 276, 10.70483, 122.56871);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 277, 10.70494, 122.56869);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 278, 10.70501, 122.56869);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 279, 10.70516, 122.56871);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 280, 10.7057, 122.56889);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 281, 10.70648, 122.5691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 282, 10.70666, 122.56912);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 283, 10.70681, 122.56914);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 284, 10.70726, 122.56918);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 285, 10.70699, 122.56961);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 286, 10.70677, 122.5699);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 287, 10.70643, 122.57032);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 288, 10.70637, 122.57039);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 289, 10.70631, 122.57046);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 290, 10.70625, 122.57053);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 291, 10.70603, 122.57079);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 292, 10.70591, 122.57093);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 293, 10.70582, 122.571);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 294, 10.70575, 122.57105);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 295, 10.70567, 122.57111);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 296, 10.7055, 122.57122);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 297, 10.70526, 122.57131);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 298, 10.70498, 122.57138);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 299, 10.70474, 122.57143);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 300, 10.70447, 122.57147);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 301, 10.70442, 122.57147);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 302, 10.7041, 122.57148);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 303, 10.70403, 122.57148);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 304, 10.70339, 122.57146);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 305, 10.70315, 122.57145);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 306, 10.70288, 122.57144);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 307, 10.70226, 122.57147);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 308, 10.70225, 122.57151);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 309, 10.70224, 122.57155);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 310, 10.70222, 122.57159);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 311, 10.70192, 122.57213);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 312, 10.70189, 122.5722);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 313, 10.70185, 122.57229);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 314, 10.70185, 122.57232);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 315, 10.70182, 122.57251);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 316, 10.70181, 122.57304);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 317, 10.70181, 122.57306);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 318, 10.70181, 122.57308);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 319, 10.7018, 122.57364);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 320, 10.7018, 122.57398);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (992104935, 321, 10.7018, 122.57424);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 1, 10.68887, 122.51707);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 2, 10.68886, 122.51673);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 3, 10.68891, 122.51648);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 4, 10.68893, 122.51639);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 5, 10.68891, 122.5164);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 6, 10.68844, 122.51647);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 7, 10.68812, 122.51652);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 8, 10.68798, 122.51654);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 9, 10.68705, 122.51669);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 10, 10.6868, 122.51673);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 11, 10.68636, 122.51672);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 12, 10.68605, 122.51679);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 13, 10.68565, 122.51685);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 14, 10.6852, 122.51692);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 15, 10.68499, 122.51694);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 16, 10.68469, 122.51697);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 17, 10.6845, 122.51699);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 18, 10.68444, 122.517);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 19, 10.68409, 122.51706);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 20, 10.68359, 122.51711);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 21, 10.68355, 122.51712);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 22, 10.68259, 122.51721);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 23, 10.68236, 122.51723);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 24, 10.68216, 122.51725);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 25, 10.68118, 122.51735);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 26, 10.68023, 122.51744);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 27, 10.68024, 122.51766);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 28, 10.68024, 122.51787);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 29, 10.68031, 122.51954);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 30, 10.68038, 122.5212);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 31, 10.68039, 122.52157);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 32, 10.6804, 122.52196);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 33, 10.68045, 122.52333);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 34, 10.68045, 122.5234);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 35, 10.68046, 122.52362);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 36, 10.68048, 122.52389);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 37, 10.6805, 122.5244);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 38, 10.68052, 122.52484);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 39, 10.68052, 122.5249);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 40, 10.68053, 122.52514);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 41, 10.6806, 122.52714);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 42, 10.6806, 122.52719);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 43, 10.68061, 122.52751);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 44, 10.68063, 122.5284);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 45, 10.68066, 122.52884);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 46, 10.68068, 122.52913);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 47, 10.68069, 122.52924);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 48, 10.68073, 122.52964);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 49, 10.68077, 122.52996);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 50, 10.68078, 122.53006);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 51, 10.68083, 122.53051);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 52, 10.68084, 122.53062);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 53, 10.68095, 122.53152);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 54, 10.68101, 122.53209);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 55, 10.68102, 122.53214);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 56, 10.68106, 122.53247);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 57, 10.68113, 122.53295);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 58, 10.68125, 122.53378);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 59, 10.68129, 122.53444);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 60, 10.68144, 122.53571);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 61, 10.68155, 122.53658);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 62, 10.68167, 122.53749);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 63, 10.68169, 122.53789);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 64, 10.68169, 122.5379);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 65, 10.68172, 122.53809);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 66, 10.68176, 122.53832);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 67, 10.68176, 122.53833);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 68, 10.68182, 122.53856);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 69, 10.6819, 122.53883);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 70, 10.68195, 122.53901);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 71, 10.68214, 122.53949);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 72, 10.68234, 122.54002);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 73, 10.68244, 122.54024);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 74, 10.68249, 122.54037);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 75, 10.68263, 122.54065);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 76, 10.68272, 122.54083);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 77, 10.68283, 122.54105);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 78, 10.68307, 122.54151);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 79, 10.68319, 122.54173);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 80, 10.68337, 122.54199);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 81, 10.68369, 122.5425);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 82, 10.68401, 122.54295);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 83, 10.68431, 122.54335);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 84, 10.68433, 122.54339);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 85, 10.68475, 122.54391);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 86, 10.68507, 122.54427);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 87, 10.6853, 122.54454);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 88, 10.68561, 122.54489);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 89, 10.68564, 122.54492);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 90, 10.686, 122.54531);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 91, 10.6865, 122.54587);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 92, 10.68655, 122.54594);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 93, 10.68673, 122.54611);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 94, 10.68682, 122.54621);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 95, 10.68699, 122.54639);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 96, 10.68715, 122.54658);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 97, 10.68731, 122.54675);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 98, 10.68744, 122.5469);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 99, 10.68767, 122.54717);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 100, 10.68787, 122.54739);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 101, 10.6879, 122.54742);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 102, 10.68814, 122.54769);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 103, 10.68826, 122.5478);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 104, 10.68833, 122.54787);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 105, 10.68846, 122.54797);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 106, 10.68876, 122.54822);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 107, 10.68913, 122.54847);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 108, 10.68944, 122.54865);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 109, 10.68948, 122.54866);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 110, 10.68955, 122.54869);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 111, 10.68959, 122.54871);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 112, 10.6899, 122.54885);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 113, 10.69141, 122.54937);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 114, 10.69152, 122.54939);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 115, 10.69155, 122.54939);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 116, 10.69162, 122.54939);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 117, 10.69192, 122.54936);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 118, 10.69204, 122.54936);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 119, 10.69212, 122.54966);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 120, 10.6922, 122.54997);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 121, 10.69225, 122.55016);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 122, 10.69229, 122.5504);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 123, 10.6923, 122.55049);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 124, 10.69229, 122.55058);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 125, 10.69229, 122.55111);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 126, 10.6923, 122.55144);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 127, 10.69231, 122.55173);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 128, 10.69231, 122.55177);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 129, 10.69231, 122.55186);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 130, 10.69232, 122.55208);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 131, 10.69233, 122.55213);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 132, 10.69241, 122.55324);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 133, 10.69243, 122.55365);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 134, 10.69244, 122.55386);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 135, 10.69245, 122.55404);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 136, 10.69247, 122.55432);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 137, 10.69249, 122.55444);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 138, 10.69253, 122.55462);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 139, 10.69257, 122.55474);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 140, 10.69258, 122.55479);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 141, 10.69269, 122.55513);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 142, 10.69275, 122.55526);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 143, 10.69282, 122.55535);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 144, 10.69294, 122.55556);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 145, 10.693, 122.55564);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 146, 10.69312, 122.55576);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 147, 10.69325, 122.55591);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 148, 10.69333, 122.556);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 149, 10.6936, 122.55635);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 150, 10.69366, 122.55644);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 151, 10.69368, 122.55649);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 152, 10.69369, 122.55658);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 153, 10.69369, 122.55663);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 154, 10.69368, 122.55673);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 155, 10.69364, 122.55694);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 156, 10.6936, 122.55707);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 157, 10.69352, 122.55737);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 158, 10.69346, 122.55762);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 159, 10.69344, 122.55774);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 160, 10.69342, 122.5578);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 161, 10.69329, 122.55854);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 162, 10.69328, 122.55872);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 163, 10.69328, 122.55882);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 164, 10.69329, 122.55885);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 165, 10.69331, 122.55892);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 166, 10.69366, 122.56007);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 167, 10.6937, 122.56018);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 168, 10.69419, 122.56175);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 169, 10.69428, 122.56206);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 170, 10.69466, 122.56328);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 171, 10.69496, 122.56427);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 172, 10.69513, 122.56481);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 173, 10.69527, 122.56528);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 174, 10.69561, 122.56639);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 175, 10.6958, 122.56699);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 176, 10.69608, 122.56787);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 177, 10.69639, 122.56901);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 178, 10.6964, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 179, 10.69619, 122.5691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 180, 10.6959, 122.5691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 181, 10.69511, 122.56909);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 182, 10.69488, 122.56908);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 183, 10.69463, 122.56909);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 184, 10.69367, 122.5691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 185, 10.69309, 122.5691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 186, 10.69267, 122.56911);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 187, 10.69215, 122.56913);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 188, 10.69215, 122.56912);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 189, 10.69214, 122.56912);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 190, 10.69214, 122.56911);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 191, 10.69214, 122.5691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 192, 10.69213, 122.5691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 193, 10.69213, 122.56909);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 194, 10.69212, 122.56908);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 195, 10.69211, 122.56908);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 196, 10.69211, 122.56907);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 197, 10.6921, 122.56907);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 198, 10.69209, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 199, 10.69208, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 200, 10.69207, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 201, 10.69206, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 202, 10.69205, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 203, 10.69205, 122.56907);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 204, 10.69204, 122.56907);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 205, 10.69203, 122.56907);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 206, 10.69203, 122.56908);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 207, 10.69202, 122.56908);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 208, 10.692, 122.56911);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 209, 10.692, 122.56913);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 210, 10.692, 122.56914);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 211, 10.692, 122.56915);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 212, 10.692, 122.56916);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 213, 10.692, 122.56917);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 214, 10.69201, 122.56918);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 215, 10.69201, 122.56919);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 216, 10.69202, 122.56919);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 217, 10.69202, 122.5692);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 218, 10.69203, 122.5692);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 219, 10.69202, 122.56975);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 220, 10.69203, 122.56979);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 221, 10.69206, 122.56999);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 222, 10.69206, 122.57001);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 223, 10.69206, 122.57066);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 224, 10.69198, 122.57165);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 225, 10.69198, 122.57166);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 226, 10.69205, 122.57169);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 227, 10.6921, 122.57173);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 228, 10.69216, 122.57178);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 229, 10.69292, 122.57257);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 230, 10.69287, 122.57273);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 231, 10.69273, 122.57293);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 232, 10.6926, 122.57306);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 233, 10.69232, 122.57336);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 234, 10.6918, 122.57388);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 235, 10.69166, 122.57372);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 236, 10.69168, 122.57357);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 237, 10.69183, 122.57251);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 238, 10.69198, 122.57166);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 239, 10.69198, 122.57165);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 240, 10.69206, 122.57066);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 241, 10.69206, 122.57001);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 242, 10.69206, 122.56999);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 243, 10.69213, 122.56979);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 244, 10.69212, 122.56919);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 245, 10.69213, 122.56919);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 246, 10.69213, 122.56918);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 247, 10.69214, 122.56918);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 248, 10.69214, 122.56917);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 249, 10.69214, 122.56916);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 250, 10.69214, 122.56915);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 251, 10.69215, 122.56915);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 252, 10.69215, 122.56914);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 253, 10.69215, 122.56913);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 254, 10.69215, 122.56912);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 255, 10.69214, 122.56912);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 256, 10.69214, 122.56911);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 257, 10.69214, 122.5691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 258, 10.69213, 122.5691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 259, 10.69213, 122.56909);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 260, 10.69212, 122.56908);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 261, 10.69211, 122.56908);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 262, 10.69211, 122.56907);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 263, 10.6921, 122.56907);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 264, 10.69209, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 265, 10.69208, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 266, 10.69207, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 267, 10.69206, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 268, 10.69205, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 269, 10.69205, 122.56907);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 270, 10.69204, 122.56907);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 271, 10.69203, 122.56907);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 272, 10.69203, 122.56908);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 273, 10.69202, 122.56908);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 274, 10.692, 122.56911);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 275, 10.692, 122.56913);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 276, 10.692, 122.56914);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 277, 10.692, 122.56915);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 278, 10.692, 122.56916);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 279, 10.692, 122.56917);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 280, 10.69201, 122.56918);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 281, 10.69201, 122.56919);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 282, 10.69202, 122.56919);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 283, 10.69202, 122.5692);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 284, 10.69203, 122.5692);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 285, 10.69203, 122.5696);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 286, 10.69202, 122.56975);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 287, 10.69203, 122.56979);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 288, 10.69213, 122.56979);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 289, 10.69212, 122.56919);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 290, 10.69213, 122.56919);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 291, 10.69213, 122.56918);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 292, 10.69214, 122.56918);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 293, 10.69214, 122.56917);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 294, 10.69214, 122.56916);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 295, 10.69214, 122.56915);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 296, 10.69215, 122.56915);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 297, 10.69215, 122.56914);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 298, 10.69215, 122.56913);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 299, 10.69309, 122.5691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 300, 10.69367, 122.5691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 301, 10.69463, 122.56909);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 302, 10.69488, 122.56908);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 303, 10.69511, 122.56909);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 304, 10.6959, 122.5691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 305, 10.69619, 122.5691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 306, 10.6964, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 307, 10.6965, 122.56904);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (672541012, 308, 10.69634, 122.56848);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 1, 10.69634, 122.56848);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 2, 10.69617, 122.56787);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 3, 10.69589, 122.56698);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 4, 10.69571, 122.56638);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 5, 10.69523, 122.56481);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 6, 10.69505, 122.56425);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 7, 10.69475, 122.56327);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 8, 10.69444, 122.56226);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 9, 10.69429, 122.56175);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 10, 10.69417, 122.56139);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 11, 10.69412, 122.56123);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 12, 10.69384, 122.56034);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 13, 10.69367, 122.55981);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 14, 10.69336, 122.55889);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 15, 10.69331, 122.55892);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 16, 10.6934, 122.55923);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 17, 10.69366, 122.56007);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 18, 10.6937, 122.56018);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 19, 10.69419, 122.56175);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 20, 10.69429, 122.56175);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 21, 10.69417, 122.56139);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 22, 10.69412, 122.56123);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 23, 10.69384, 122.56034);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 24, 10.69367, 122.55981);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 25, 10.69336, 122.55889);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 26, 10.69335, 122.55881);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 27, 10.69334, 122.55872);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 28, 10.69335, 122.55863);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 29, 10.69336, 122.55855);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 30, 10.69339, 122.55835);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 31, 10.69344, 122.55809);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 32, 10.69346, 122.55799);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 33, 10.6936, 122.55739);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 34, 10.69377, 122.55665);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 35, 10.69388, 122.55607);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 36, 10.69409, 122.55567);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 37, 10.69445, 122.55519);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 38, 10.69449, 122.5551);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 39, 10.69447, 122.55503);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 40, 10.69401, 122.55514);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 41, 10.69396, 122.55515);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 42, 10.69383, 122.55517);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 43, 10.69297, 122.55526);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 44, 10.69294, 122.55527);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 45, 10.69278, 122.5553);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 46, 10.69275, 122.55526);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 47, 10.69269, 122.55513);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 48, 10.69258, 122.55479);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 49, 10.69257, 122.55474);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 50, 10.69253, 122.55462);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 51, 10.69249, 122.55444);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 52, 10.69247, 122.55432);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 53, 10.69245, 122.55404);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 54, 10.69244, 122.55386);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 55, 10.69243, 122.55365);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 56, 10.69241, 122.55324);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 57, 10.69233, 122.55213);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 58, 10.69232, 122.55208);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 59, 10.69231, 122.55186);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 60, 10.69231, 122.55177);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 61, 10.69231, 122.55173);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 62, 10.6923, 122.55144);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 63, 10.69229, 122.55111);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 64, 10.69229, 122.55058);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 65, 10.6923, 122.55049);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 66, 10.69229, 122.5504);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 67, 10.69225, 122.55016);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 68, 10.6922, 122.54997);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 69, 10.69212, 122.54966);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 70, 10.69204, 122.54936);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 71, 10.69192, 122.54936);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 72, 10.69162, 122.54939);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 73, 10.69155, 122.54939);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 74, 10.69152, 122.54939);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 75, 10.69141, 122.54937);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 76, 10.6899, 122.54885);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 77, 10.68959, 122.54871);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 78, 10.68955, 122.54869);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 79, 10.68948, 122.54866);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 80, 10.68944, 122.54865);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 81, 10.68913, 122.54847);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 82, 10.68876, 122.54822);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 83, 10.68846, 122.54797);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 84, 10.68833, 122.54787);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 85, 10.68826, 122.5478);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 86, 10.68814, 122.54769);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 87, 10.6879, 122.54742);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 88, 10.68787, 122.54739);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 89, 10.68767, 122.54717);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 90, 10.68744, 122.5469);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 91, 10.68731, 122.54675);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 92, 10.68715, 122.54658);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 93, 10.68699, 122.54639);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 94, 10.68682, 122.54621);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 95, 10.68673, 122.54611);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 96, 10.68655, 122.54594);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 97, 10.6865, 122.54587);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 98, 10.68635, 122.5457);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 99, 10.686, 122.54531);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 100, 10.68564, 122.54492);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 101, 10.68561, 122.54489);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 102, 10.6853, 122.54454);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 103, 10.68507, 122.54427);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 104, 10.68475, 122.54391);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 105, 10.68433, 122.54339);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 106, 10.68431, 122.54335);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 107, 10.68401, 122.54295);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 108, 10.68369, 122.5425);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 109, 10.68337, 122.54199);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 110, 10.68319, 122.54173);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 111, 10.68307, 122.54151);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 112, 10.68283, 122.54105);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 113, 10.68272, 122.54083);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 114, 10.68263, 122.54065);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 115, 10.68249, 122.54037);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 116, 10.68244, 122.54024);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 117, 10.68234, 122.54002);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 118, 10.68214, 122.53949);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 119, 10.68195, 122.53901);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 120, 10.6819, 122.53883);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 121, 10.68182, 122.53856);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 122, 10.68176, 122.53833);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 123, 10.68176, 122.53832);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 124, 10.68172, 122.53809);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 125, 10.68169, 122.5379);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 126, 10.68169, 122.53789);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 127, 10.68167, 122.53749);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 128, 10.68155, 122.53658);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 129, 10.68144, 122.53571);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 130, 10.68129, 122.53444);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 131, 10.68125, 122.53378);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 132, 10.68113, 122.53295);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 133, 10.68106, 122.53247);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 134, 10.68102, 122.53214);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 135, 10.68101, 122.53209);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 136, 10.68095, 122.53152);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 137, 10.68084, 122.53062);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 138, 10.68083, 122.53051);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 139, 10.68078, 122.53006);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 140, 10.68077, 122.52996);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 141, 10.68073, 122.52964);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 142, 10.68069, 122.52924);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 143, 10.68068, 122.52913);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 144, 10.68066, 122.52884);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 145, 10.68063, 122.5284);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 146, 10.68061, 122.52751);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 147, 10.6806, 122.52719);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 148, 10.6806, 122.52714);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 149, 10.68053, 122.52514);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 150, 10.68052, 122.5249);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 151, 10.68052, 122.52484);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 152, 10.6805, 122.5244);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 153, 10.68048, 122.52389);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 154, 10.68046, 122.52362);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 155, 10.68045, 122.5234);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 156, 10.68045, 122.52333);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 157, 10.6804, 122.52196);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 158, 10.68039, 122.52164);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 159, 10.68039, 122.52157);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 160, 10.68038, 122.5212);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 161, 10.68031, 122.51954);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 162, 10.68024, 122.51787);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 163, 10.68024, 122.51766);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 164, 10.68023, 122.51744);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 165, 10.68118, 122.51735);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 166, 10.68216, 122.51725);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 167, 10.68236, 122.51723);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 168, 10.68259, 122.51721);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 169, 10.68355, 122.51712);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 170, 10.68359, 122.51711);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 171, 10.68409, 122.51706);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 172, 10.68444, 122.517);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 173, 10.6845, 122.51699);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 174, 10.68469, 122.51697);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 175, 10.68499, 122.51694);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 176, 10.6852, 122.51692);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 177, 10.68565, 122.51685);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 178, 10.68605, 122.51679);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 179, 10.68636, 122.51672);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 180, 10.6868, 122.51673);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 181, 10.68705, 122.51669);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 182, 10.68707, 122.51691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 183, 10.68716, 122.51763);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 184, 10.68733, 122.51909);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 185, 10.68736, 122.51935);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 186, 10.68738, 122.5195);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 187, 10.68739, 122.5196);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 188, 10.68743, 122.51991);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 189, 10.68745, 122.52011);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 190, 10.68755, 122.52102);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 191, 10.68758, 122.52124);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 192, 10.68761, 122.52155);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 193, 10.6881, 122.5215);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 194, 10.68818, 122.52149);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 195, 10.68896, 122.5214);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 196, 10.68895, 122.5211);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 197, 10.68896, 122.52089);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 198, 10.68902, 122.52089);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 199, 10.68906, 122.52089);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 200, 10.68908, 122.52089);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 201, 10.68911, 122.52089);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 202, 10.68913, 122.52091);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 203, 10.68915, 122.52093);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 204, 10.68916, 122.52096);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 205, 10.68916, 122.52101);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 206, 10.68916, 122.52108);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 207, 10.68895, 122.5211);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 208, 10.68896, 122.52089);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 209, 10.68896, 122.52085);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 210, 10.68895, 122.52072);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 211, 10.68894, 122.51985);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 212, 10.68894, 122.51955);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 213, 10.68894, 122.51947);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 214, 10.68891, 122.51826);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 215, 10.68891, 122.51824);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 216, 10.6889, 122.51788);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1415582340, 217, 10.68887, 122.51707);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 1, 10.75338, 122.53835);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 2, 10.75337, 122.53834);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 3, 10.75336, 122.53834);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 4, 10.75335, 122.53833);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 5, 10.75333, 122.53833);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 6, 10.75326, 122.53833);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 7, 10.7531, 122.53829);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 8, 10.75309, 122.53829);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 9, 10.75286, 122.53821);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 10, 10.75285, 122.53827);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 11, 10.75283, 122.53845);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 12, 10.75282, 122.53857);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 13, 10.75246, 122.53857);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 14, 10.7516, 122.53859);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 15, 10.75123, 122.53859);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 16, 10.75082, 122.53861);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 17, 10.75051, 122.53865);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 18, 10.75027, 122.53868);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 19, 10.7495, 122.53882);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 20, 10.74913, 122.53886);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 21, 10.7491, 122.53887);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 22, 10.74908, 122.53888);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 23, 10.74907, 122.53889);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 24, 10.74904, 122.53892);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 25, 10.74896, 122.53893);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 26, 10.74878, 122.53896);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 27, 10.74848, 122.539);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 28, 10.74817, 122.53905);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 29, 10.74782, 122.5391);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 30, 10.74701, 122.5392);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 31, 10.74692, 122.53921);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 32, 10.74662, 122.53923);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 33, 10.74636, 122.53926);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 34, 10.74576, 122.53931);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 35, 10.74554, 122.53934);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 36, 10.74476, 122.53942);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 37, 10.74423, 122.53949);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 38, 10.74412, 122.5395);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 39, 10.74395, 122.5395);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 40, 10.74378, 122.5395);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 41, 10.74357, 122.53948);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 42, 10.74322, 122.53944);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 43, 10.74301, 122.5394);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 44, 10.74268, 122.53933);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 45, 10.74218, 122.5392);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 46, 10.74212, 122.53933);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 47, 10.74205, 122.5395);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 48, 10.74199, 122.53964);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 49, 10.74194, 122.53974);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 50, 10.74186, 122.53987);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 51, 10.74176, 122.54003);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 52, 10.74167, 122.54014);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 53, 10.74133, 122.54045);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 54, 10.7413, 122.54047);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 55, 10.74114, 122.54056);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 56, 10.74103, 122.54066);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 57, 10.74075, 122.54088);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 58, 10.7406, 122.54101);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 59, 10.74028, 122.54137);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 60, 10.73979, 122.54191);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 61, 10.73946, 122.54227);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 62, 10.73898, 122.54279);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 63, 10.73834, 122.54343);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 64, 10.73799, 122.54381);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 65, 10.73755, 122.5443);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 66, 10.73738, 122.54448);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 67, 10.73724, 122.54466);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 68, 10.73691, 122.54503);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 69, 10.73682, 122.54512);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 70, 10.7366, 122.54536);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 71, 10.73622, 122.54579);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 72, 10.73602, 122.54601);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 73, 10.7359, 122.54614);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 74, 10.7354, 122.5467);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 75, 10.73519, 122.54695);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 76, 10.735, 122.54717);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 77, 10.73477, 122.54745);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 78, 10.73464, 122.5476);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 79, 10.73434, 122.54794);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 80, 10.73402, 122.5483);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 81, 10.73397, 122.54836);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 82, 10.73393, 122.5484);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 83, 10.7336, 122.54878);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 84, 10.73337, 122.54906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 85, 10.73336, 122.54907);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 86, 10.73322, 122.54923);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 87, 10.7324, 122.55026);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 88, 10.73222, 122.55048);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 89, 10.73216, 122.55057);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 90, 10.73213, 122.5506);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 91, 10.73182, 122.55096);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 92, 10.73168, 122.55113);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 93, 10.73153, 122.55131);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 94, 10.73118, 122.5517);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 95, 10.73084, 122.55206);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 96, 10.73066, 122.55227);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 97, 10.73065, 122.55228);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 98, 10.73059, 122.55234);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 99, 10.73022, 122.55273);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 100, 10.72967, 122.55332);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 101, 10.72956, 122.55345);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 102, 10.72936, 122.55365);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 103, 10.72889, 122.55417);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 104, 10.72885, 122.55421);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 105, 10.72881, 122.55426);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 106, 10.72848, 122.55462);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 107, 10.72804, 122.55507);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 108, 10.72762, 122.55549);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 109, 10.72751, 122.55559);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 110, 10.72747, 122.55563);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 111, 10.72697, 122.55603);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 112, 10.72648, 122.55644);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 113, 10.72554, 122.55712);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 114, 10.72555, 122.55703);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 115, 10.72548, 122.55694);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 116, 10.72533, 122.55681);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 117, 10.72503, 122.55658);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 118, 10.7247, 122.55635);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 119, 10.7246, 122.55639);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 120, 10.72454, 122.55642);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 121, 10.72449, 122.55645);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 122, 10.72441, 122.5565);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 123, 10.72427, 122.55662);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 124, 10.72417, 122.55674);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 125, 10.72407, 122.55686);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 126, 10.724, 122.55693);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 127, 10.72368, 122.55726);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 128, 10.72327, 122.5576);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 129, 10.72314, 122.55768);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 130, 10.72278, 122.55795);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 131, 10.72235, 122.55829);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 132, 10.7217, 122.55877);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 133, 10.72153, 122.55889);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 134, 10.72117, 122.55913);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 135, 10.72111, 122.55918);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 136, 10.72103, 122.55924);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 137, 10.72088, 122.55934);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 138, 10.72069, 122.55947);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 139, 10.72064, 122.5595);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 140, 10.72049, 122.55959);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 141, 10.72033, 122.55969);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 142, 10.72018, 122.55978);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 143, 10.7195, 122.56025);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 144, 10.71891, 122.56064);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 145, 10.71866, 122.5608);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 146, 10.71827, 122.56103);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 147, 10.71786, 122.56128);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 148, 10.71756, 122.56146);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 149, 10.71731, 122.56162);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 150, 10.71695, 122.56185);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 151, 10.71681, 122.56193);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 152, 10.71644, 122.56216);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 153, 10.71609, 122.5624);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 154, 10.71593, 122.5625);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 155, 10.71567, 122.56266);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 156, 10.71555, 122.56269);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 157, 10.7147, 122.5632);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 158, 10.71421, 122.56353);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 159, 10.71369, 122.56388);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 160, 10.71345, 122.56406);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 161, 10.71342, 122.56408);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 162, 10.71331, 122.56415);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 163, 10.71315, 122.56424);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 164, 10.71293, 122.56437);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 165, 10.71286, 122.56445);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 166, 10.71273, 122.56454);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 167, 10.71266, 122.56458);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 168, 10.71261, 122.56462);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 169, 10.71244, 122.56472);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 170, 10.71223, 122.56482);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 171, 10.71143, 122.56531);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 172, 10.71082, 122.56569);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 173, 10.71077, 122.56572);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 174, 10.71042, 122.56594);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 175, 10.71033, 122.56599);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 176, 10.7102, 122.56608);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 177, 10.71, 122.5662);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 178, 10.70931, 122.56662);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 179, 10.70925, 122.56666);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 180, 10.70919, 122.56667);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 181, 10.70913, 122.56669);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 182, 10.70907, 122.56671);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 183, 10.70898, 122.56673);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 184, 10.70807, 122.56702);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 185, 10.70778, 122.5671);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 186, 10.70767, 122.56713);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 187, 10.70749, 122.56716);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 188, 10.70733, 122.5672);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 189, 10.70721, 122.56723);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 190, 10.70704, 122.56726);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 191, 10.70698, 122.56728);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 192, 10.70688, 122.56731);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 193, 10.7068, 122.56734);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 194, 10.70663, 122.5674);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 195, 10.70658, 122.56741);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 196, 10.70637, 122.56749);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 197, 10.70627, 122.56752);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 198, 10.70575, 122.56769);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 199, 10.70521, 122.56786);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 200, 10.70507, 122.5679);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 201, 10.70498, 122.56791);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 202, 10.70469, 122.56793);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 203, 10.70465, 122.56793);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 204, 10.70452, 122.56793);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 205, 10.70408, 122.56796);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 206, 10.70383, 122.56797);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 207, 10.70356, 122.56799);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 208, 10.70323, 122.56804);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 209, 10.70303, 122.56806);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 210, 10.70298, 122.56807);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 211, 10.70265, 122.5681);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 212, 10.70261, 122.5681);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 213, 10.70224, 122.56814);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 214, 10.7021, 122.56816);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 215, 10.70183, 122.56828);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 216, 10.70171, 122.5684);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 217, 10.70168, 122.56846);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 218, 10.70157, 122.56885);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 219, 10.70155, 122.56895);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 220, 10.70154, 122.56898);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 221, 10.70153, 122.56902);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 222, 10.70152, 122.56902);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 223, 10.70152, 122.56903);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 224, 10.70151, 122.56903);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 225, 10.7015, 122.56903);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 226, 10.7015, 122.56904);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 227, 10.70149, 122.56904);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 228, 10.70148, 122.56905);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 229, 10.70129, 122.5691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 230, 10.70096, 122.56911);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 231, 10.70009, 122.56911);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 232, 10.69931, 122.56911);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 233, 10.69914, 122.56907);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 234, 10.69818, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 235, 10.69797, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 236, 10.69795, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 237, 10.69781, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 238, 10.69676, 122.56905);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 239, 10.69667, 122.56905);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 240, 10.69663, 122.56905);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 241, 10.69659, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 242, 10.69658, 122.56907);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 243, 10.69651, 122.5691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 244, 10.69643, 122.56915);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 245, 10.69629, 122.56927);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 246, 10.69557, 122.56986);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 247, 10.69475, 122.57049);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 248, 10.69474, 122.5705);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 249, 10.69392, 122.57101);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 250, 10.69363, 122.57154);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 251, 10.69358, 122.57162);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 252, 10.69352, 122.57172);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 253, 10.69331, 122.57203);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 254, 10.69292, 122.57257);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 255, 10.69287, 122.57273);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 256, 10.69273, 122.57293);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 257, 10.69232, 122.57336);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 258, 10.6918, 122.57388);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 259, 10.69143, 122.5743);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 260, 10.69106, 122.5748);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 261, 10.69094, 122.57498);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 262, 10.69046, 122.57566);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 263, 10.68993, 122.57642);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 264, 10.68932, 122.57723);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 265, 10.68909, 122.57759);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 266, 10.68888, 122.57793);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 267, 10.6885, 122.57866);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 268, 10.68837, 122.57895);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 269, 10.68827, 122.5792);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 270, 10.6882, 122.57959);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 271, 10.68823, 122.57976);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 272, 10.68827, 122.57986);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 273, 10.68827, 122.57989);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 274, 10.68832, 122.58001);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 275, 10.68838, 122.58016);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 276, 10.6887, 122.58079);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 277, 10.6889, 122.58119);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 278, 10.68891, 122.5812);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 279, 10.68908, 122.58154);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 280, 10.68921, 122.58175);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 281, 10.68926, 122.58182);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 282, 10.68935, 122.58195);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 283, 10.68941, 122.58203);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 284, 10.6895, 122.58211);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 285, 10.68958, 122.58216);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 286, 10.68959, 122.58217);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 287, 10.68966, 122.58219);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 288, 10.68998, 122.58225);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 289, 10.69022, 122.58228);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 290, 10.6903, 122.58225);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 291, 10.69035, 122.58226);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 292, 10.69057, 122.58233);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 293, 10.69076, 122.58238);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 294, 10.69135, 122.58253);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 295, 10.69154, 122.58259);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 296, 10.69222, 122.58277);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 297, 10.69154, 122.58259);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 298, 10.69135, 122.58253);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 299, 10.69076, 122.58238);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 300, 10.69057, 122.58233);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 301, 10.69035, 122.58226);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 302, 10.6903, 122.58225);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 303, 10.69022, 122.5822);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 304, 10.68964, 122.58208);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 305, 10.68953, 122.582);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 306, 10.68948, 122.58196);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 307, 10.68943, 122.58192);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 308, 10.6894, 122.58187);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 309, 10.68934, 122.58178);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 310, 10.68898, 122.58115);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 311, 10.68886, 122.58092);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 312, 10.68872, 122.58065);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 313, 10.68854, 122.58027);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 314, 10.68843, 122.58004);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 315, 10.68836, 122.57989);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 316, 10.68834, 122.57983);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 317, 10.68832, 122.57979);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 318, 10.68831, 122.57973);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 319, 10.68828, 122.5795);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 320, 10.68828, 122.57941);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 321, 10.6883, 122.57933);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 322, 10.68833, 122.57922);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 323, 10.68838, 122.57908);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 324, 10.68846, 122.5789);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 325, 10.68857, 122.57869);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 326, 10.68876, 122.57829);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 327, 10.68885, 122.57811);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 328, 10.68892, 122.57797);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 329, 10.68899, 122.57789);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 330, 10.68903, 122.57786);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 331, 10.68909, 122.57781);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 332, 10.68915, 122.57777);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 333, 10.68918, 122.57775);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 334, 10.68963, 122.57748);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 335, 10.68985, 122.57734);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 336, 10.69033, 122.57705);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 337, 10.69045, 122.57698);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 338, 10.69052, 122.57691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 339, 10.69109, 122.57735);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 340, 10.69149, 122.57765);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 341, 10.69151, 122.57767);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 342, 10.69164, 122.57777);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 343, 10.69151, 122.57767);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 344, 10.69149, 122.57765);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 345, 10.69109, 122.57735);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 346, 10.69052, 122.57691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 347, 10.69054, 122.57689);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 348, 10.69079, 122.57656);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 349, 10.69115, 122.57601);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 350, 10.69148, 122.57549);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 351, 10.69153, 122.57542);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 352, 10.69158, 122.57534);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 353, 10.69177, 122.57508);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 354, 10.69228, 122.57434);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 355, 10.6918, 122.57388);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 356, 10.69227, 122.57341);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 357, 10.69232, 122.57336);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 358, 10.69273, 122.57293);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 359, 10.69287, 122.57273);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 360, 10.69299, 122.57264);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 361, 10.69337, 122.57208);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 362, 10.69338, 122.57207);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 363, 10.69357, 122.57175);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 364, 10.69363, 122.57164);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 365, 10.69368, 122.57156);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 366, 10.69397, 122.57104);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 367, 10.69486, 122.57056);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 368, 10.69561, 122.56992);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 369, 10.69643, 122.56926);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 370, 10.69646, 122.56924);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 371, 10.69654, 122.56921);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 372, 10.69655, 122.5692);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 373, 10.69659, 122.56918);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 374, 10.69662, 122.56917);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 375, 10.69667, 122.56915);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 376, 10.69673, 122.56914);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 377, 10.69684, 122.56913);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 378, 10.69695, 122.56912);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 379, 10.69781, 122.56915);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 380, 10.69795, 122.56914);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 381, 10.69797, 122.56914);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 382, 10.69819, 122.56914);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 383, 10.69914, 122.56916);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 384, 10.69931, 122.56911);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 385, 10.69999, 122.56911);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 386, 10.70009, 122.56911);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 387, 10.70096, 122.56911);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 388, 10.70129, 122.5691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 389, 10.7014, 122.56915);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 390, 10.70146, 122.56917);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 391, 10.70148, 122.56918);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 392, 10.70148, 122.56919);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 393, 10.70149, 122.56919);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 394, 10.70149, 122.5692);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 395, 10.7015, 122.5692);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 396, 10.70151, 122.56921);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 397, 10.70152, 122.56921);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 398, 10.70153, 122.56921);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 399, 10.70154, 122.56922);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 400, 10.70155, 122.56922);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 401, 10.70156, 122.56922);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 402, 10.70157, 122.56922);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 403, 10.70157, 122.56921);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 404, 10.70158, 122.56921);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 405, 10.70159, 122.56921);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 406, 10.7016, 122.56921);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 407, 10.7016, 122.5692);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 408, 10.70161, 122.5692);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 409, 10.70162, 122.56919);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 410, 10.70163, 122.56918);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 411, 10.70163, 122.56917);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 412, 10.70164, 122.56917);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 413, 10.70164, 122.56916);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 414, 10.70164, 122.56915);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 415, 10.70165, 122.56915);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 416, 10.70165, 122.56914);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 417, 10.70165, 122.56913);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 418, 10.70177, 122.56882);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 419, 10.7018, 122.56871);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 420, 10.70185, 122.56855);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 421, 10.70195, 122.5684);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 422, 10.70203, 122.56834);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 423, 10.70215, 122.56826);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 424, 10.70224, 122.56814);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 425, 10.70261, 122.5681);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 426, 10.70265, 122.5681);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 427, 10.70298, 122.56807);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 428, 10.70303, 122.56806);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 429, 10.70323, 122.56804);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 430, 10.70356, 122.56799);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 431, 10.70383, 122.56797);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 432, 10.70408, 122.56796);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 433, 10.70452, 122.56793);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 434, 10.70465, 122.56793);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 435, 10.70469, 122.56793);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 436, 10.70498, 122.56791);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 437, 10.70507, 122.5679);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 438, 10.70521, 122.56786);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 439, 10.70575, 122.56769);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 440, 10.70627, 122.56752);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 441, 10.70637, 122.56749);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 442, 10.70658, 122.56741);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 443, 10.70663, 122.5674);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 444, 10.7068, 122.56734);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 445, 10.70688, 122.56731);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 446, 10.70698, 122.56728);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 447, 10.70704, 122.56726);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 448, 10.70721, 122.56723);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 449, 10.70733, 122.5672);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2004548497, 450, 10.7074, 122.56719);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 1, 10.7074, 122.56719);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 2, 10.70749, 122.56716);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 3, 10.70767, 122.56713);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 4, 10.70778, 122.5671);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 5, 10.70808, 122.56751);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 6, 10.70838, 122.56786);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 7, 10.70851, 122.56772);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 8, 10.70863, 122.56757);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 9, 10.70885, 122.5673);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 10, 10.70901, 122.5671);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 11, 10.70915, 122.56691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 12, 10.70925, 122.56671);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 13, 10.70931, 122.56667);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 14, 10.71002, 122.56623);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 15, 10.71021, 122.56611);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 16, 10.71035, 122.56603);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 17, 10.71044, 122.56597);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 18, 10.71079, 122.56575);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 19, 10.71085, 122.56572);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 20, 10.71145, 122.56534);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 21, 10.71225, 122.56484);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 22, 10.71244, 122.56472);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 23, 10.71261, 122.56462);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 24, 10.71266, 122.56458);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 25, 10.71273, 122.56454);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 26, 10.71286, 122.56445);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 27, 10.71296, 122.56441);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 28, 10.71346, 122.56414);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 29, 10.71348, 122.56412);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 30, 10.71374, 122.56394);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 31, 10.71425, 122.5636);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 32, 10.71475, 122.56327);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 33, 10.7156, 122.56276);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 34, 10.71567, 122.56266);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 35, 10.71593, 122.5625);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 36, 10.71609, 122.5624);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 37, 10.71644, 122.56216);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 38, 10.71681, 122.56193);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 39, 10.71695, 122.56185);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 40, 10.71731, 122.56162);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 41, 10.71756, 122.56146);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 42, 10.71786, 122.56128);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 43, 10.71827, 122.56103);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 44, 10.71866, 122.5608);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 45, 10.71891, 122.56064);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 46, 10.7195, 122.56025);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 47, 10.72018, 122.55978);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 48, 10.72033, 122.55969);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 49, 10.72049, 122.55959);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 50, 10.72064, 122.5595);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 51, 10.72069, 122.55947);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 52, 10.72088, 122.55934);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 53, 10.72111, 122.55918);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 54, 10.72117, 122.55913);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 55, 10.72153, 122.55889);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 56, 10.7217, 122.55877);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 57, 10.72235, 122.55829);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 58, 10.72278, 122.55795);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 59, 10.72314, 122.55768);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 60, 10.72327, 122.5576);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 61, 10.72348, 122.55788);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 62, 10.724, 122.55835);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 63, 10.72424, 122.55817);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 64, 10.72435, 122.55806);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 65, 10.72474, 122.55776);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 66, 10.72475, 122.55775);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 67, 10.72527, 122.55732);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 68, 10.72554, 122.55712);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 69, 10.72565, 122.5574);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 70, 10.72575, 122.5576);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 71, 10.7258, 122.55766);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 72, 10.72583, 122.5577);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 73, 10.72588, 122.55773);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 74, 10.72594, 122.55776);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 75, 10.72606, 122.5578);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 76, 10.72619, 122.55784);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 77, 10.72627, 122.55786);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 78, 10.72677, 122.55799);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 79, 10.72694, 122.55803);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 80, 10.72704, 122.55796);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 81, 10.7273, 122.55777);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 82, 10.72749, 122.55764);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 83, 10.72774, 122.55746);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 84, 10.7279, 122.55733);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 85, 10.72818, 122.55709);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 86, 10.72819, 122.55708);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 87, 10.72856, 122.5567);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 88, 10.72851, 122.55665);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 89, 10.72747, 122.55563);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 90, 10.72751, 122.55559);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 91, 10.72762, 122.55549);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 92, 10.72797, 122.55514);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 93, 10.72804, 122.55507);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 94, 10.72848, 122.55462);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 95, 10.72881, 122.55426);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 96, 10.72885, 122.55421);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 97, 10.72936, 122.55365);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 98, 10.72956, 122.55345);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 99, 10.72967, 122.55332);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 100, 10.73022, 122.55273);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 101, 10.73059, 122.55234);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 102, 10.73065, 122.55228);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 103, 10.73066, 122.55227);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 104, 10.73084, 122.55206);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 105, 10.73118, 122.5517);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 106, 10.73153, 122.55131);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 107, 10.73168, 122.55113);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 108, 10.73182, 122.55096);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 109, 10.73213, 122.5506);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 110, 10.73216, 122.55057);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 111, 10.73222, 122.55048);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 112, 10.7324, 122.55026);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 113, 10.73322, 122.54923);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 114, 10.73336, 122.54907);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 115, 10.73337, 122.54906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 116, 10.7336, 122.54878);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 117, 10.73393, 122.5484);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 118, 10.73397, 122.54836);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 119, 10.73402, 122.5483);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 120, 10.73434, 122.54794);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 121, 10.73464, 122.5476);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 122, 10.73477, 122.54745);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 123, 10.735, 122.54717);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 124, 10.73519, 122.54695);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 125, 10.7354, 122.5467);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 126, 10.7359, 122.54614);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 127, 10.73602, 122.54601);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 128, 10.73622, 122.54579);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 129, 10.7366, 122.54536);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 130, 10.73682, 122.54512);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 131, 10.73691, 122.54503);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 132, 10.73724, 122.54466);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 133, 10.73738, 122.54448);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 134, 10.73755, 122.5443);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 135, 10.73834, 122.54343);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 136, 10.73898, 122.54279);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 137, 10.73946, 122.54227);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 138, 10.73979, 122.54191);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 139, 10.74028, 122.54137);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 140, 10.7406, 122.54101);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 141, 10.74075, 122.54088);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 142, 10.74103, 122.54066);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 143, 10.74114, 122.54056);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 144, 10.7413, 122.54047);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 145, 10.74133, 122.54045);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 146, 10.74167, 122.54014);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 147, 10.74176, 122.54003);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 148, 10.74186, 122.53987);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 149, 10.74194, 122.53974);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 150, 10.74199, 122.53964);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 151, 10.74205, 122.5395);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 152, 10.74212, 122.53933);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 153, 10.74262, 122.53945);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 154, 10.7428, 122.53949);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 155, 10.74299, 122.53953);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 156, 10.74313, 122.53955);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 157, 10.74316, 122.53956);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 158, 10.74337, 122.53959);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 159, 10.74353, 122.5396);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 160, 10.74369, 122.53962);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 161, 10.74383, 122.53962);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 162, 10.74394, 122.53962);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 163, 10.74414, 122.53961);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 164, 10.74427, 122.5396);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 165, 10.74457, 122.53958);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 166, 10.74464, 122.53957);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 167, 10.74477, 122.53955);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 168, 10.74479, 122.53964);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 169, 10.74481, 122.53972);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 170, 10.74483, 122.53978);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 171, 10.74486, 122.53984);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 172, 10.7449, 122.53992);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 173, 10.74497, 122.54001);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 174, 10.74503, 122.54007);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 175, 10.74508, 122.54012);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 176, 10.74513, 122.54015);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 177, 10.74532, 122.5402);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 178, 10.74538, 122.54021);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 179, 10.74544, 122.54022);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 180, 10.74559, 122.54023);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 181, 10.74564, 122.54026);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 182, 10.74566, 122.54028);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 183, 10.7457, 122.54031);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 184, 10.74571, 122.54034);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 185, 10.74572, 122.54038);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 186, 10.74573, 122.54043);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 187, 10.74573, 122.54045);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 188, 10.7458, 122.54093);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 189, 10.7458, 122.54098);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 190, 10.7458, 122.54101);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 191, 10.7458, 122.54105);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 192, 10.74578, 122.54111);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1966520376, 193, 10.74576, 122.54114);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 1, 10.75338, 122.53835);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 2, 10.75337, 122.53834);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 3, 10.75336, 122.53834);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 4, 10.75335, 122.53833);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 5, 10.75333, 122.53833);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 6, 10.75326, 122.53833);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 7, 10.7531, 122.53829);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 8, 10.75309, 122.53829);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 9, 10.75286, 122.53821);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 10, 10.75285, 122.53827);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 11, 10.75283, 122.53845);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 12, 10.75282, 122.53857);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 13, 10.75246, 122.53857);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 14, 10.7516, 122.53859);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 15, 10.75123, 122.53859);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 16, 10.75082, 122.53861);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 17, 10.75051, 122.53865);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 18, 10.75027, 122.53868);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 19, 10.7495, 122.53882);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 20, 10.74913, 122.53886);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 21, 10.7491, 122.53887);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 22, 10.74908, 122.53888);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 23, 10.74907, 122.53889);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 24, 10.74904, 122.53892);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 25, 10.74896, 122.53893);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 26, 10.74878, 122.53896);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 27, 10.74848, 122.539);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 28, 10.74817, 122.53905);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 29, 10.74782, 122.5391);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 30, 10.74701, 122.5392);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 31, 10.74692, 122.53921);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 32, 10.74662, 122.53923);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 33, 10.74636, 122.53926);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 34, 10.74576, 122.53931);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 35, 10.74554, 122.53934);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 36, 10.74476, 122.53942);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 37, 10.74423, 122.53949);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 38, 10.74412, 122.5395);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 39, 10.74395, 122.5395);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 40, 10.74378, 122.5395);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 41, 10.74357, 122.53948);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 42, 10.74322, 122.53944);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 43, 10.74301, 122.5394);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 44, 10.74268, 122.53933);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 45, 10.74218, 122.5392);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 46, 10.74181, 122.53909);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 47, 10.74125, 122.5389);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 48, 10.73955, 122.53837);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 49, 10.73923, 122.53829);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 50, 10.73893, 122.53823);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 51, 10.73867, 122.5382);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 52, 10.73841, 122.53818);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 53, 10.73825, 122.53817);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 54, 10.73768, 122.53817);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 55, 10.73728, 122.5382);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 56, 10.7371, 122.53823);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 57, 10.73681, 122.53828);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 58, 10.73661, 122.53831);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 59, 10.73637, 122.53837);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 60, 10.73617, 122.53842);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 61, 10.73599, 122.53848);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 62, 10.7358, 122.53854);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 63, 10.73552, 122.53864);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 64, 10.73513, 122.5388);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 65, 10.73492, 122.53889);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 66, 10.73469, 122.53901);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 67, 10.73444, 122.53915);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 68, 10.73416, 122.53933);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 69, 10.73392, 122.53949);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 70, 10.73373, 122.53963);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 71, 10.73357, 122.53976);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 72, 10.73338, 122.53992);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 73, 10.73326, 122.54003);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 74, 10.73296, 122.54033);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 75, 10.73243, 122.54096);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 76, 10.73232, 122.5411);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 77, 10.73205, 122.54144);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 78, 10.7318, 122.54176);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 79, 10.73175, 122.54182);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 80, 10.73117, 122.54251);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 81, 10.73115, 122.54254);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 82, 10.73104, 122.54267);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 83, 10.73084, 122.54293);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 84, 10.73042, 122.54346);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 85, 10.72974, 122.54431);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 86, 10.7295, 122.54461);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 87, 10.72895, 122.54531);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 88, 10.72768, 122.54684);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 89, 10.72686, 122.54781);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 90, 10.72678, 122.54789);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 91, 10.72651, 122.54818);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 92, 10.72628, 122.54841);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 93, 10.72588, 122.5488);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 94, 10.72574, 122.54893);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 95, 10.72545, 122.54914);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 96, 10.72505, 122.54943);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 97, 10.7249, 122.54954);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 98, 10.72469, 122.54936);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 99, 10.72466, 122.54933);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 100, 10.72463, 122.54932);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 101, 10.72458, 122.54929);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 102, 10.7245, 122.54926);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 103, 10.72416, 122.54917);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 104, 10.72406, 122.54915);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 105, 10.72402, 122.54914);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 106, 10.72371, 122.54907);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 107, 10.7235, 122.54902);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 108, 10.72319, 122.54894);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 109, 10.72303, 122.54891);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 110, 10.72283, 122.5489);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 111, 10.72267, 122.54886);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 112, 10.72247, 122.54889);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 113, 10.72243, 122.5489);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 114, 10.72238, 122.54891);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 115, 10.72231, 122.54893);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 116, 10.72216, 122.54897);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 117, 10.72186, 122.54903);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 118, 10.72174, 122.54904);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 119, 10.72165, 122.54903);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 120, 10.72159, 122.54902);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 121, 10.7215, 122.549);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 122, 10.72107, 122.54882);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 123, 10.71993, 122.54831);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 124, 10.71976, 122.54824);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 125, 10.71853, 122.54765);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 126, 10.71838, 122.54757);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 127, 10.71826, 122.5475);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 128, 10.7182, 122.54746);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 129, 10.71804, 122.54737);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 130, 10.71778, 122.54719);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 131, 10.7177, 122.54713);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 132, 10.71757, 122.54704);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 133, 10.7175, 122.54699);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 134, 10.71748, 122.54698);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 135, 10.71702, 122.54661);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 136, 10.71698, 122.54658);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 137, 10.71674, 122.54642);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 138, 10.71655, 122.54631);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 139, 10.71642, 122.54623);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 140, 10.71614, 122.54612);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 141, 10.71606, 122.54609);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 142, 10.71599, 122.54606);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 143, 10.71571, 122.54596);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 144, 10.71546, 122.54589);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 145, 10.71544, 122.54584);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 146, 10.71542, 122.54581);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 147, 10.71542, 122.5458);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 148, 10.7154, 122.54578);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 149, 10.71534, 122.54574);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 150, 10.71528, 122.54571);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 151, 10.71509, 122.54564);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 152, 10.71499, 122.5456);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 153, 10.71493, 122.54578);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 154, 10.71489, 122.5459);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 155, 10.71514, 122.54597);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 156, 10.71566, 122.54607);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 157, 10.71584, 122.54612);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 158, 10.7161, 122.54621);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 159, 10.71627, 122.54628);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 160, 10.71641, 122.54634);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 161, 10.71666, 122.54648);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 162, 10.71676, 122.54654);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 163, 10.71693, 122.54666);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 164, 10.71735, 122.54698);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 165, 10.71745, 122.54706);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 166, 10.71764, 122.54721);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 167, 10.71779, 122.54732);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 168, 10.71814, 122.54755);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 169, 10.71837, 122.54769);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 170, 10.71849, 122.54775);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 171, 10.71854, 122.54778);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 172, 10.71855, 122.54784);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 173, 10.71857, 122.54807);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 174, 10.71861, 122.5485);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 175, 10.71863, 122.54875);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 176, 10.71868, 122.54918);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 177, 10.71874, 122.54983);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 178, 10.71876, 122.54999);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 179, 10.71877, 122.55008);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 180, 10.71878, 122.55014);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 181, 10.7188, 122.55021);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 182, 10.71886, 122.5504);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 183, 10.71892, 122.55058);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 184, 10.71909, 122.55103);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 185, 10.71923, 122.55139);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 186, 10.71946, 122.55199);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 187, 10.7195, 122.55212);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 188, 10.71935, 122.55219);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 189, 10.71919, 122.55225);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 190, 10.71909, 122.5523);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 191, 10.71881, 122.55242);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 192, 10.71879, 122.55243);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 193, 10.71832, 122.55257);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 194, 10.71783, 122.55268);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 195, 10.71739, 122.55276);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 196, 10.71681, 122.55279);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 197, 10.71616, 122.55277);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 198, 10.71583, 122.55273);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 199, 10.7158, 122.55273);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 200, 10.71556, 122.55269);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 201, 10.71504, 122.55261);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 202, 10.71519, 122.55228);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 203, 10.7149, 122.55204);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 204, 10.7146, 122.55192);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 205, 10.71395, 122.55176);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 206, 10.7139, 122.55175);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 207, 10.71355, 122.55166);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 208, 10.71329, 122.55159);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 209, 10.71302, 122.5515);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 210, 10.71294, 122.55186);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 211, 10.7129, 122.55205);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 212, 10.71245, 122.55194);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 213, 10.71194, 122.55181);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 214, 10.71169, 122.55176);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 215, 10.71146, 122.55171);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 216, 10.71127, 122.55167);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 217, 10.7111, 122.55164);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 218, 10.7107, 122.55158);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 219, 10.71049, 122.55157);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 220, 10.71032, 122.55156);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 221, 10.71025, 122.55156);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 222, 10.70983, 122.55158);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 223, 10.70964, 122.55159);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 224, 10.70945, 122.55162);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 225, 10.70927, 122.55165);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 226, 10.70912, 122.55168);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 227, 10.70894, 122.55171);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 228, 10.7086, 122.5518);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 229, 10.70756, 122.55209);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 230, 10.70737, 122.55214);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 231, 10.70687, 122.55227);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 232, 10.70658, 122.55235);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 233, 10.70591, 122.55253);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 234, 10.70523, 122.55271);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 235, 10.705, 122.55276);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 236, 10.70476, 122.55282);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 237, 10.70452, 122.55288);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 238, 10.70417, 122.55296);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 239, 10.70364, 122.55311);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 240, 10.70333, 122.55319);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 241, 10.70268, 122.55337);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 242, 10.70263, 122.55339);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 243, 10.70235, 122.55345);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 244, 10.70168, 122.55364);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 245, 10.70101, 122.55382);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 246, 10.70095, 122.55384);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 247, 10.70089, 122.55385);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 248, 10.70078, 122.55388);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 249, 10.7001, 122.55406);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 250, 10.69985, 122.55415);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 251, 10.6997, 122.55419);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 252, 10.69953, 122.55424);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 253, 10.69917, 122.55439);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 254, 10.6989, 122.55448);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 255, 10.69873, 122.55453);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 256, 10.69863, 122.55455);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 257, 10.69854, 122.55456);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 258, 10.6983, 122.55459);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 259, 10.69791, 122.55463);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 260, 10.69787, 122.55464);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 261, 10.69769, 122.55467);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 262, 10.69754, 122.55469);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 263, 10.69746, 122.55471);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 264, 10.69689, 122.55478);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 265, 10.69653, 122.55483);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 266, 10.69593, 122.55487);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 267, 10.69569, 122.55489);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 268, 10.69447, 122.55503);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 269, 10.69401, 122.55514);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 270, 10.69396, 122.55515);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 271, 10.69383, 122.55517);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 272, 10.69297, 122.55526);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 273, 10.69294, 122.55527);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 274, 10.69278, 122.5553);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 275, 10.69269, 122.55534);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 276, 10.69278, 122.5553);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 277, 10.69282, 122.55536);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 278, 10.69289, 122.55547);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 279, 10.69294, 122.55556);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 280, 10.693, 122.55564);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 281, 10.69312, 122.55576);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 282, 10.69325, 122.55591);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 283, 10.69333, 122.556);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 284, 10.6936, 122.55635);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 285, 10.69366, 122.55644);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 286, 10.69368, 122.55649);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 287, 10.69369, 122.55658);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 288, 10.69369, 122.55663);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 289, 10.69368, 122.55673);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 290, 10.69364, 122.55694);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 291, 10.6936, 122.55707);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 292, 10.69352, 122.55737);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 293, 10.69346, 122.55762);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 294, 10.69344, 122.55774);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 295, 10.69342, 122.5578);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 296, 10.69329, 122.55854);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 297, 10.69328, 122.55872);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 298, 10.69328, 122.55882);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 299, 10.69329, 122.55885);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 300, 10.69331, 122.55892);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 301, 10.69366, 122.56007);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 302, 10.6937, 122.56018);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 303, 10.69419, 122.56175);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 304, 10.69428, 122.56206);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 305, 10.69466, 122.56328);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 306, 10.69496, 122.56427);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 307, 10.69513, 122.56481);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 308, 10.69462, 122.56479);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 309, 10.69465, 122.56485);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 310, 10.69467, 122.56487);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 311, 10.69468, 122.56488);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 312, 10.69467, 122.56487);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 313, 10.69465, 122.56485);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 314, 10.69462, 122.56479);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 315, 10.69442, 122.56479);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 316, 10.69378, 122.56477);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 317, 10.69331, 122.56476);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 318, 10.69335, 122.56523);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 319, 10.69335, 122.56525);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 320, 10.69336, 122.56531);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 321, 10.69336, 122.56536);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 322, 10.69337, 122.56541);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 323, 10.69337, 122.56546);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 324, 10.69338, 122.56555);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 325, 10.69338, 122.56558);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 326, 10.6934, 122.56574);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 327, 10.69341, 122.56592);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 328, 10.69342, 122.566);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 329, 10.69343, 122.5661);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 330, 10.69345, 122.56634);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 331, 10.69348, 122.56677);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 332, 10.69319, 122.56678);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 333, 10.6931, 122.56677);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 334, 10.69319, 122.56678);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 335, 10.69348, 122.56677);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 336, 10.69345, 122.56634);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 337, 10.69394, 122.56636);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 338, 10.69439, 122.56636);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 339, 10.69486, 122.56637);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 340, 10.69561, 122.56639);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 341, 10.6958, 122.56699);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 342, 10.69608, 122.56787);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 343, 10.69617, 122.56787);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 344, 10.69656, 122.56786);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 345, 10.69765, 122.56781);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 346, 10.69785, 122.56781);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 347, 10.69785, 122.56771);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 348, 10.69785, 122.56672);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 349, 10.69788, 122.56642);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 350, 10.69781, 122.56586);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 351, 10.69775, 122.56537);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 352, 10.69768, 122.56479);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 353, 10.69763, 122.5644);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 354, 10.69761, 122.56429);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 355, 10.69755, 122.56383);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 356, 10.69753, 122.56372);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 357, 10.69746, 122.56328);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 358, 10.69741, 122.56289);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 359, 10.69726, 122.56173);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 360, 10.69713, 122.56064);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 361, 10.69708, 122.5603);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 362, 10.69706, 122.56015);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 363, 10.69697, 122.55896);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 364, 10.69693, 122.55862);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 365, 10.69685, 122.5579);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 366, 10.69684, 122.55784);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 367, 10.69684, 122.55779);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 368, 10.69672, 122.5566);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 369, 10.69669, 122.55638);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 370, 10.69667, 122.55617);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 371, 10.69666, 122.55616);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 372, 10.69665, 122.55604);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 373, 10.69654, 122.55488);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1871586405, 374, 10.69705, 122.55481);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 1, 10.71691, 122.54654);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 2, 10.71674, 122.54642);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 3, 10.71655, 122.54631);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 4, 10.71642, 122.54623);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 5, 10.71614, 122.54612);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 6, 10.71606, 122.54609);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 7, 10.71599, 122.54606);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 8, 10.71571, 122.54596);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 9, 10.71546, 122.54589);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 10, 10.71518, 122.54584);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 11, 10.71493, 122.54578);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 12, 10.71489, 122.5459);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 13, 10.71514, 122.54597);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 14, 10.71566, 122.54607);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 15, 10.7161, 122.54621);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 16, 10.71666, 122.54648);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 17, 10.71676, 122.54654);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 18, 10.71693, 122.54666);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 19, 10.71735, 122.54698);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 20, 10.71745, 122.54706);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 21, 10.71764, 122.54721);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 22, 10.71779, 122.54732);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 23, 10.71814, 122.54755);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 24, 10.71837, 122.54769);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 25, 10.71849, 122.54775);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 26, 10.71854, 122.54778);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 27, 10.71855, 122.54784);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 28, 10.71857, 122.54807);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 29, 10.71861, 122.5485);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 30, 10.71863, 122.54875);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 31, 10.71868, 122.54918);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 32, 10.71874, 122.54983);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 33, 10.71876, 122.54999);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 34, 10.71877, 122.55008);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 35, 10.71878, 122.55014);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 36, 10.7188, 122.55021);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 37, 10.71886, 122.5504);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 38, 10.71892, 122.55058);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 39, 10.71909, 122.55103);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 40, 10.71923, 122.55139);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 41, 10.71946, 122.55199);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 42, 10.7195, 122.55212);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 43, 10.71935, 122.55219);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 44, 10.71919, 122.55225);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 45, 10.71909, 122.5523);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 46, 10.71883, 122.55243);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 47, 10.71881, 122.55243);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 48, 10.71833, 122.55258);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 49, 10.71783, 122.5527);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 50, 10.71738, 122.55278);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 51, 10.71679, 122.55282);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 52, 10.71614, 122.55281);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 53, 10.7158, 122.55277);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 54, 10.71577, 122.55277);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 55, 10.71555, 122.55273);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 56, 10.71504, 122.55261);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 57, 10.71489, 122.55255);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 58, 10.71437, 122.55244);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 59, 10.71431, 122.55243);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 60, 10.71337, 122.55217);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 61, 10.7129, 122.55205);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 62, 10.71245, 122.55194);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 63, 10.71194, 122.55181);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 64, 10.71169, 122.55176);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 65, 10.71146, 122.55171);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 66, 10.71127, 122.55167);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 67, 10.7111, 122.55164);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 68, 10.7107, 122.55158);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 69, 10.71049, 122.55157);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 70, 10.71032, 122.55156);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 71, 10.71025, 122.55156);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 72, 10.70983, 122.55158);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 73, 10.70964, 122.55159);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 74, 10.70945, 122.55162);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 75, 10.70927, 122.55165);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 76, 10.70912, 122.55168);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 77, 10.70894, 122.55171);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 78, 10.7086, 122.5518);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 79, 10.70756, 122.55209);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 80, 10.70737, 122.55214);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 81, 10.70687, 122.55227);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 82, 10.70658, 122.55235);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 83, 10.70591, 122.55253);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 84, 10.70523, 122.55271);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 85, 10.705, 122.55276);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 86, 10.70476, 122.55282);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 87, 10.70452, 122.55288);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 88, 10.70417, 122.55296);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 89, 10.70364, 122.55311);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 90, 10.70333, 122.55319);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 91, 10.70268, 122.55337);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 92, 10.70263, 122.55339);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 93, 10.70235, 122.55345);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 94, 10.70168, 122.55364);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 95, 10.70101, 122.55382);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 96, 10.70095, 122.55384);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 97, 10.70089, 122.55385);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 98, 10.70078, 122.55388);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 99, 10.7001, 122.55406);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 100, 10.69985, 122.55415);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 101, 10.6997, 122.55419);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 102, 10.69971, 122.55427);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 103, 10.69975, 122.55451);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 104, 10.69978, 122.55479);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 105, 10.6998, 122.55493);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 106, 10.69984, 122.55528);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 107, 10.69988, 122.55558);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 108, 10.6999, 122.55567);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 109, 10.69991, 122.55574);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 110, 10.69992, 122.55575);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 111, 10.69993, 122.55578);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 112, 10.69994, 122.55587);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 113, 10.69995, 122.55599);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 114, 10.7, 122.55648);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 115, 10.70001, 122.55658);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 116, 10.70008, 122.55728);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 117, 10.70008, 122.55733);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 118, 10.70011, 122.55758);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 119, 10.70012, 122.55774);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 120, 10.70013, 122.55793);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 121, 10.70025, 122.55921);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 122, 10.7003, 122.55989);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 123, 10.70031, 122.55992);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 124, 10.70034, 122.56024);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 125, 10.70039, 122.56075);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 126, 10.70044, 122.56101);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 127, 10.70046, 122.56111);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 128, 10.70051, 122.5613);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 129, 10.70052, 122.56135);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 130, 10.70055, 122.56149);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 131, 10.70059, 122.56177);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 132, 10.70066, 122.56222);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 133, 10.70076, 122.56285);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 134, 10.70079, 122.563);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 135, 10.70085, 122.56344);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 136, 10.70091, 122.56387);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 137, 10.70103, 122.56464);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 138, 10.70106, 122.56486);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 139, 10.70108, 122.56502);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 140, 10.70112, 122.56532);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 141, 10.70115, 122.5655);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 142, 10.70115, 122.56553);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 143, 10.70118, 122.56574);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 144, 10.70128, 122.56646);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 145, 10.70135, 122.56696);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 146, 10.70137, 122.56709);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 147, 10.70142, 122.56748);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 148, 10.70146, 122.56771);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 149, 10.7015, 122.5679);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 150, 10.70155, 122.56812);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 151, 10.70155, 122.56813);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 152, 10.70158, 122.56823);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 153, 10.70163, 122.56833);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 154, 10.70171, 122.5684);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 155, 10.70168, 122.56846);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 156, 10.70157, 122.56885);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 157, 10.70155, 122.56895);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 158, 10.70154, 122.56898);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 159, 10.70153, 122.56902);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 160, 10.70152, 122.56902);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 161, 10.70152, 122.56903);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 162, 10.70151, 122.56903);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 163, 10.7015, 122.56903);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 164, 10.7015, 122.56904);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 165, 10.70149, 122.56904);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 166, 10.70148, 122.56905);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 167, 10.70129, 122.5691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 168, 10.70096, 122.56911);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 169, 10.70009, 122.56911);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 170, 10.69931, 122.56911);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 171, 10.69914, 122.56907);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 172, 10.69818, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 173, 10.69797, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 174, 10.69795, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 175, 10.69781, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 176, 10.69676, 122.56905);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 177, 10.69667, 122.56905);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 178, 10.69663, 122.56905);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 179, 10.69659, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 180, 10.69658, 122.56907);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 181, 10.69651, 122.5691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 182, 10.69643, 122.56915);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 183, 10.69629, 122.56927);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 184, 10.69557, 122.56986);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 185, 10.69475, 122.57049);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 186, 10.69474, 122.5705);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 187, 10.69392, 122.57101);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 188, 10.69363, 122.57154);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 189, 10.69358, 122.57162);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 190, 10.69352, 122.57172);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 191, 10.69331, 122.57203);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 192, 10.69292, 122.57257);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 193, 10.69287, 122.57273);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 194, 10.69273, 122.57293);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 195, 10.69232, 122.57336);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 196, 10.6918, 122.57388);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 197, 10.69166, 122.57372);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 198, 10.69168, 122.57357);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 199, 10.69183, 122.57251);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 200, 10.69198, 122.57166);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 201, 10.69198, 122.57165);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 202, 10.69206, 122.57066);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 203, 10.69206, 122.57001);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 204, 10.69206, 122.56999);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 205, 10.69213, 122.56979);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 206, 10.69212, 122.56919);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 207, 10.69213, 122.56919);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 208, 10.69213, 122.56918);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 209, 10.69214, 122.56918);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 210, 10.69214, 122.56917);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 211, 10.69214, 122.56916);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 212, 10.69214, 122.56915);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 213, 10.69215, 122.56915);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 214, 10.69215, 122.56914);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 215, 10.69215, 122.56913);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 216, 10.69215, 122.56912);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 217, 10.69214, 122.56912);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 218, 10.69214, 122.56911);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 219, 10.69214, 122.5691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 220, 10.69213, 122.5691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 221, 10.69213, 122.56909);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 222, 10.69212, 122.56908);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 223, 10.69211, 122.56908);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 224, 10.69211, 122.56907);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 225, 10.6921, 122.56907);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 226, 10.69209, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 227, 10.69208, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 228, 10.69207, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 229, 10.69206, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 230, 10.69205, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 231, 10.69205, 122.56907);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 232, 10.69204, 122.56907);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 233, 10.69203, 122.56907);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 234, 10.69203, 122.56908);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 235, 10.69202, 122.56908);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 236, 10.692, 122.56911);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 237, 10.692, 122.56913);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 238, 10.692, 122.56914);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 239, 10.692, 122.56915);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 240, 10.692, 122.56916);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 241, 10.692, 122.56917);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 242, 10.69201, 122.56918);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 243, 10.69201, 122.56919);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 244, 10.69202, 122.56919);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 245, 10.69202, 122.5692);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 246, 10.69203, 122.5692);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 247, 10.69203, 122.5696);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 248, 10.69202, 122.56975);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 249, 10.69203, 122.56979);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 250, 10.69213, 122.56979);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 251, 10.69212, 122.56919);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 252, 10.69213, 122.56919);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 253, 10.69213, 122.56918);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 254, 10.69214, 122.56918);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 255, 10.69214, 122.56917);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 256, 10.69214, 122.56916);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 257, 10.69214, 122.56915);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 258, 10.69215, 122.56915);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 259, 10.69215, 122.56914);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 260, 10.69215, 122.56913);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 261, 10.69309, 122.5691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 262, 10.69367, 122.5691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 263, 10.69463, 122.56909);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 264, 10.69488, 122.56908);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 265, 10.69511, 122.56909);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 266, 10.6959, 122.5691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 267, 10.69619, 122.5691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 268, 10.6964, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 269, 10.6965, 122.56904);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 270, 10.69634, 122.56848);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 271, 10.69617, 122.56787);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 272, 10.69589, 122.56698);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 273, 10.69571, 122.56638);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 274, 10.69523, 122.56481);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 275, 10.69572, 122.56481);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 276, 10.69748, 122.5648);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 277, 10.69768, 122.56479);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 278, 10.69763, 122.5644);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 279, 10.69761, 122.56429);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 280, 10.69755, 122.56383);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 281, 10.69753, 122.56372);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 282, 10.69746, 122.56328);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 283, 10.69741, 122.56289);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 284, 10.6973, 122.56208);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 285, 10.69726, 122.56173);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 286, 10.69788, 122.56175);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 287, 10.69804, 122.56175);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 288, 10.69894, 122.56174);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 289, 10.69947, 122.56175);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 290, 10.69997, 122.56177);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 291, 10.70041, 122.56178);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 292, 10.70059, 122.56177);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 293, 10.7007, 122.56175);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 294, 10.70067, 122.56157);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 295, 10.70064, 122.56142);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 296, 10.70064, 122.5614);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 297, 10.70062, 122.56132);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 298, 10.70055, 122.56099);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 299, 10.70052, 122.56081);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 300, 10.70051, 122.56075);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 301, 10.70049, 122.56063);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 302, 10.70047, 122.56055);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 303, 10.70046, 122.56045);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2049429081, 304, 10.70045, 122.56037);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 1, 10.70045, 122.56037);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 2, 10.70044, 122.56016);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 3, 10.70042, 122.55991);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 4, 10.70041, 122.55986);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 5, 10.7004, 122.55982);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 6, 10.70038, 122.55972);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 7, 10.70023, 122.55793);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 8, 10.70022, 122.55776);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 9, 10.7002, 122.55759);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 10, 10.70019, 122.5574);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 11, 10.70018, 122.55729);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 12, 10.70017, 122.55711);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 13, 10.70005, 122.55584);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 14, 10.70004, 122.55576);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 15, 10.70004, 122.55573);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 16, 10.70004, 122.55569);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 17, 10.70004, 122.55561);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 18, 10.7, 122.55531);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 19, 10.69993, 122.55476);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 20, 10.69992, 122.55463);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 21, 10.69989, 122.55444);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 22, 10.69992, 122.5544);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 23, 10.69993, 122.55438);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 24, 10.69994, 122.55436);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 25, 10.69995, 122.55434);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 26, 10.69997, 122.55432);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 27, 10.69999, 122.5543);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 28, 10.70001, 122.55428);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 29, 10.70003, 122.55426);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 30, 10.70014, 122.55417);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 31, 10.70092, 122.55397);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 32, 10.701, 122.55395);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 33, 10.70107, 122.55393);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 34, 10.70173, 122.55374);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 35, 10.70237, 122.55356);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 36, 10.70271, 122.55347);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 37, 10.70289, 122.55343);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 38, 10.70368, 122.55322);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 39, 10.70431, 122.55304);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 40, 10.70527, 122.55282);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 41, 10.70563, 122.55272);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 42, 10.70604, 122.55261);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 43, 10.70686, 122.55239);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 44, 10.70696, 122.55236);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 45, 10.70758, 122.55219);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 46, 10.70847, 122.55197);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 47, 10.70852, 122.55195);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 48, 10.70871, 122.55191);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 49, 10.70887, 122.55187);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 50, 10.70904, 122.55183);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 51, 10.7092, 122.5518);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 52, 10.7094, 122.55177);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 53, 10.70967, 122.55173);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 54, 10.70996, 122.55172);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 55, 10.7101, 122.55172);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 56, 10.71026, 122.55172);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 57, 10.7104, 122.55172);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 58, 10.71055, 122.55173);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 59, 10.71069, 122.55174);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 60, 10.71089, 122.55175);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 61, 10.71098, 122.55176);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 62, 10.71109, 122.55177);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 63, 10.71124, 122.55179);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 64, 10.71143, 122.55182);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 65, 10.7117, 122.55188);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 66, 10.7118, 122.55191);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 67, 10.71188, 122.55193);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 68, 10.71314, 122.55226);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 69, 10.71332, 122.5523);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 70, 10.71427, 122.55258);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 71, 10.71462, 122.55266);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 72, 10.71516, 122.55279);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 73, 10.71535, 122.55283);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 74, 10.71549, 122.55285);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 75, 10.71573, 122.5529);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 76, 10.71575, 122.5529);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 77, 10.716, 122.55292);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 78, 10.71623, 122.55293);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 79, 10.71647, 122.55293);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 80, 10.71672, 122.55293);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 81, 10.71697, 122.55292);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 82, 10.71715, 122.5529);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 83, 10.71734, 122.55288);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 84, 10.71753, 122.55286);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 85, 10.7177, 122.55283);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 86, 10.7179, 122.55279);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 87, 10.7181, 122.55275);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 88, 10.71836, 122.55268);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 89, 10.71858, 122.55262);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 90, 10.71881, 122.55254);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 91, 10.71901, 122.55247);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 92, 10.71917, 122.55241);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 93, 10.71935, 122.55234);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 94, 10.71954, 122.55225);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 95, 10.7195, 122.55212);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 96, 10.71935, 122.55219);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 97, 10.71919, 122.55225);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 98, 10.71909, 122.5523);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 99, 10.71883, 122.55243);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 100, 10.71881, 122.55243);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 101, 10.71833, 122.55258);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 102, 10.71783, 122.5527);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 103, 10.71738, 122.55278);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 104, 10.71679, 122.55282);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 105, 10.71614, 122.55281);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 106, 10.71599, 122.55279);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 107, 10.7158, 122.55277);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 108, 10.71577, 122.55277);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 109, 10.71555, 122.55273);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 110, 10.71504, 122.55261);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 111, 10.71489, 122.55255);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 112, 10.71431, 122.55243);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 113, 10.71337, 122.55217);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 114, 10.7129, 122.55205);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 115, 10.71245, 122.55194);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 116, 10.71194, 122.55181);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 117, 10.71169, 122.55176);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 118, 10.71146, 122.55171);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 119, 10.71127, 122.55167);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 120, 10.7111, 122.55164);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 121, 10.7107, 122.55158);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 122, 10.71049, 122.55157);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 123, 10.71032, 122.55156);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 124, 10.71025, 122.55156);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 125, 10.70983, 122.55158);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 126, 10.70964, 122.55159);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 127, 10.70938, 122.55101);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 128, 10.70918, 122.55055);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 129, 10.70903, 122.55024);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 130, 10.70896, 122.55008);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 131, 10.70894, 122.55005);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 132, 10.70892, 122.55001);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 133, 10.70873, 122.54968);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 134, 10.70862, 122.54951);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 135, 10.7085, 122.54935);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 136, 10.70831, 122.54913);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 137, 10.70833, 122.5491);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 138, 10.70834, 122.54907);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 139, 10.70835, 122.54905);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 140, 10.70835, 122.54903);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 141, 10.70836, 122.54901);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 142, 10.70836, 122.54899);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 143, 10.70836, 122.54896);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 144, 10.70835, 122.54894);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 145, 10.70835, 122.54892);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 146, 10.70834, 122.5489);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 147, 10.70833, 122.54888);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 148, 10.70832, 122.54886);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 149, 10.70829, 122.54883);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 150, 10.70827, 122.54881);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 151, 10.70826, 122.5488);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 152, 10.70824, 122.54879);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 153, 10.70822, 122.54878);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 154, 10.7082, 122.54877);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 155, 10.70818, 122.54877);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 156, 10.70815, 122.54876);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 157, 10.70813, 122.54876);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 158, 10.70811, 122.54876);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 159, 10.70809, 122.54877);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 160, 10.70807, 122.54877);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 161, 10.70804, 122.54878);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 162, 10.70802, 122.54879);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 163, 10.70801, 122.5488);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 164, 10.70798, 122.54881);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 165, 10.70795, 122.54886);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 166, 10.70794, 122.54888);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 167, 10.70793, 122.5489);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 168, 10.70792, 122.54892);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 169, 10.70791, 122.54894);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 170, 10.70791, 122.54897);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 171, 10.70791, 122.54899);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 172, 10.70791, 122.54901);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 173, 10.70791, 122.54903);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 174, 10.70792, 122.54908);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 175, 10.70766, 122.54914);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 176, 10.70759, 122.54919);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 177, 10.70757, 122.54922);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 178, 10.70732, 122.54934);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 179, 10.70649, 122.54981);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 180, 10.70628, 122.54927);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 181, 10.70597, 122.54846);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 182, 10.70588, 122.54823);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 183, 10.70583, 122.54804);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 184, 10.7058, 122.54794);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 185, 10.70579, 122.54783);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 186, 10.70578, 122.54752);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 187, 10.70578, 122.54713);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 188, 10.70578, 122.5468);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 189, 10.7058, 122.54664);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 190, 10.70584, 122.54654);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 191, 10.70591, 122.54646);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 192, 10.70559, 122.54606);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 193, 10.70556, 122.54601);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 194, 10.70533, 122.54573);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 195, 10.70506, 122.54534);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 196, 10.705, 122.54526);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 197, 10.70482, 122.54505);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 198, 10.70475, 122.54495);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 199, 10.70454, 122.5447);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 200, 10.70447, 122.54462);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 201, 10.70415, 122.54427);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 202, 10.70406, 122.54415);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 203, 10.70405, 122.54412);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 204, 10.70402, 122.54405);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 205, 10.70424, 122.54392);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 206, 10.70435, 122.54386);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 207, 10.70444, 122.5438);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 208, 10.70468, 122.54365);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 209, 10.70475, 122.54361);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 210, 10.70507, 122.54341);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 211, 10.70511, 122.54338);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 212, 10.70512, 122.54337);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 213, 10.70544, 122.54322);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 214, 10.70553, 122.54319);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 215, 10.70565, 122.54314);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 216, 10.70601, 122.543);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 217, 10.70605, 122.54299);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 218, 10.70615, 122.54296);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 219, 10.7062, 122.54294);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 220, 10.70737, 122.54263);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 221, 10.70753, 122.54273);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 222, 10.70768, 122.54283);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 223, 10.7081, 122.54306);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 224, 10.70856, 122.54324);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 225, 10.70941, 122.54349);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 226, 10.70948, 122.5435);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 227, 10.70957, 122.54352);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 228, 10.7098, 122.54355);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 229, 10.71017, 122.54365);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 230, 10.71027, 122.54368);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 231, 10.71063, 122.54383);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 232, 10.71098, 122.54397);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 233, 10.71108, 122.54401);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 234, 10.71164, 122.54429);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 235, 10.7132, 122.54503);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 236, 10.71337, 122.54513);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 237, 10.71388, 122.54541);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 238, 10.7141, 122.54553);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 239, 10.71467, 122.54579);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 240, 10.71489, 122.5459);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 241, 10.71514, 122.54597);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 242, 10.71566, 122.54607);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 243, 10.7161, 122.54621);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 244, 10.71666, 122.54648);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 245, 10.71676, 122.54654);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 246, 10.71693, 122.54666);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 247, 10.71735, 122.54698);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 248, 10.71745, 122.54706);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 249, 10.7175, 122.54699);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 250, 10.71748, 122.54698);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 251, 10.71702, 122.54661);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 252, 10.71698, 122.54658);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1566553975, 253, 10.71691, 122.54654);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 1, 10.69227, 122.57341);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 2, 10.6918, 122.57388);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 3, 10.69166, 122.57372);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 4, 10.69168, 122.57357);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 5, 10.69183, 122.57251);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 6, 10.69188, 122.5722);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 7, 10.69198, 122.57166);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 8, 10.69198, 122.57165);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 9, 10.69206, 122.57066);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 10, 10.69206, 122.57001);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 11, 10.69206, 122.56999);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 12, 10.69213, 122.56979);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 13, 10.69212, 122.56919);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 14, 10.69213, 122.56919);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 15, 10.69213, 122.56918);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 16, 10.69214, 122.56918);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 17, 10.69214, 122.56917);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 18, 10.69214, 122.56916);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 19, 10.69214, 122.56915);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 20, 10.69215, 122.56915);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 21, 10.69215, 122.56914);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 22, 10.69215, 122.56913);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 23, 10.69309, 122.5691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 24, 10.69367, 122.5691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 25, 10.69463, 122.56909);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 26, 10.69488, 122.56908);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 27, 10.69511, 122.56909);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 28, 10.6959, 122.5691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 29, 10.69619, 122.5691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 30, 10.6964, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 31, 10.6965, 122.56904);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 32, 10.69617, 122.56787);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 33, 10.69589, 122.56698);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 34, 10.69571, 122.56638);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 35, 10.69523, 122.56481);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 36, 10.69505, 122.56425);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 37, 10.69475, 122.56327);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 38, 10.69444, 122.56226);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 39, 10.69429, 122.56175);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 40, 10.69487, 122.56172);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 41, 10.69559, 122.56172);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 42, 10.6957, 122.56172);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 43, 10.69559, 122.56172);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 44, 10.69578, 122.56126);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 45, 10.69599, 122.5608);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 46, 10.69605, 122.56067);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 47, 10.6962, 122.56034);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 48, 10.69639, 122.55996);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 49, 10.69657, 122.55965);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 50, 10.69667, 122.55943);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 51, 10.69676, 122.55923);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 52, 10.69678, 122.55919);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 53, 10.69684, 122.55909);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 54, 10.69688, 122.55904);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 55, 10.69697, 122.55896);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 56, 10.69693, 122.55862);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 57, 10.69685, 122.5579);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 58, 10.69684, 122.55784);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 59, 10.69684, 122.55779);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 60, 10.69672, 122.5566);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 61, 10.69669, 122.55638);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 62, 10.69667, 122.55617);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 63, 10.69666, 122.55616);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 64, 10.69665, 122.55604);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 65, 10.69654, 122.55488);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 66, 10.69653, 122.55483);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 67, 10.69646, 122.55404);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 68, 10.69645, 122.55394);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 69, 10.69633, 122.55265);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 70, 10.69627, 122.55198);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 71, 10.69624, 122.55163);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 72, 10.69622, 122.55147);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 73, 10.69619, 122.5511);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 74, 10.69617, 122.55093);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 75, 10.69617, 122.5509);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 76, 10.69616, 122.55075);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 77, 10.69615, 122.55062);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 78, 10.69609, 122.5501);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 79, 10.69603, 122.54966);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 80, 10.69602, 122.54955);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 81, 10.69602, 122.54948);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 82, 10.69599, 122.54917);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 83, 10.69591, 122.54844);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 84, 10.6959, 122.54835);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 85, 10.6959, 122.54832);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 86, 10.69585, 122.54782);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 87, 10.69584, 122.54771);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 88, 10.69582, 122.5475);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 89, 10.69577, 122.54695);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 90, 10.69574, 122.54678);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 91, 10.69571, 122.54664);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 92, 10.69568, 122.54655);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 93, 10.69564, 122.54647);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 94, 10.69561, 122.54643);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 95, 10.69559, 122.54641);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 96, 10.69551, 122.54635);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 97, 10.69533, 122.54624);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 98, 10.6951, 122.54608);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 99, 10.69481, 122.54589);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 100, 10.69463, 122.54576);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 101, 10.69445, 122.54564);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 102, 10.69345, 122.54495);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 103, 10.69282, 122.54448);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 104, 10.69267, 122.54437);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 105, 10.69254, 122.54427);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 106, 10.69252, 122.54425);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 107, 10.69241, 122.54417);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 108, 10.69216, 122.54396);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 109, 10.69196, 122.54381);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 110, 10.69156, 122.54352);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 111, 10.69133, 122.54335);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 112, 10.69115, 122.5432);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 113, 10.69095, 122.54302);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 114, 10.6907, 122.54271);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 115, 10.6906, 122.54255);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 116, 10.69053, 122.54242);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 117, 10.69051, 122.54239);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 118, 10.69049, 122.54235);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 119, 10.69039, 122.54218);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 120, 10.69004, 122.54155);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 121, 10.68999, 122.54147);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 122, 10.68989, 122.54126);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 123, 10.68966, 122.54073);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 124, 10.68958, 122.54048);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 125, 10.68951, 122.54031);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 126, 10.68947, 122.54024);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 127, 10.68942, 122.54015);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 128, 10.68937, 122.54007);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 129, 10.68921, 122.53987);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 130, 10.68895, 122.53954);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 131, 10.6887, 122.53924);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 132, 10.68854, 122.53902);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 133, 10.68848, 122.53893);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 134, 10.68843, 122.53885);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 135, 10.68839, 122.53878);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 136, 10.68836, 122.53871);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 137, 10.68828, 122.53854);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 138, 10.68825, 122.53847);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 139, 10.68823, 122.53838);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 140, 10.68819, 122.53824);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 141, 10.68817, 122.53808);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 142, 10.68814, 122.53784);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 143, 10.68811, 122.53764);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 144, 10.6881, 122.53759);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 145, 10.68805, 122.53709);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 146, 10.68801, 122.53656);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 147, 10.68798, 122.5362);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 148, 10.68798, 122.53615);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 149, 10.68799, 122.5361);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 150, 10.688, 122.53603);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 151, 10.68802, 122.53598);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 152, 10.68803, 122.53593);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 153, 10.68806, 122.53587);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 154, 10.6881, 122.5358);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 155, 10.68816, 122.5357);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 156, 10.68822, 122.53563);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 157, 10.6883, 122.53555);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 158, 10.68851, 122.53537);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 159, 10.68881, 122.53508);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 160, 10.68899, 122.53496);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 161, 10.68909, 122.53491);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 162, 10.68915, 122.53487);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 163, 10.68917, 122.53487);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 164, 10.6892, 122.53485);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 165, 10.68927, 122.53482);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 166, 10.68956, 122.53469);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 167, 10.68982, 122.53457);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 168, 10.69004, 122.53448);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 169, 10.69025, 122.53438);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 170, 10.69062, 122.53422);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 171, 10.69087, 122.53412);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 172, 10.69142, 122.53389);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 173, 10.69164, 122.53432);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 174, 10.69187, 122.5347);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 175, 10.69203, 122.53496);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 176, 10.69209, 122.53506);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 177, 10.69213, 122.53511);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 178, 10.69234, 122.53541);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 179, 10.69249, 122.53562);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 180, 10.69277, 122.53603);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 181, 10.69304, 122.53644);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 182, 10.69327, 122.53678);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 183, 10.69353, 122.53715);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 184, 10.69371, 122.53741);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 185, 10.69457, 122.53872);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 186, 10.69489, 122.53916);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 187, 10.69518, 122.5396);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 188, 10.6952, 122.53965);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 189, 10.69538, 122.53996);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 190, 10.6954, 122.53999);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 191, 10.69556, 122.54032);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 192, 10.6958, 122.5407);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 193, 10.69589, 122.54086);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 194, 10.69637, 122.54161);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 195, 10.69648, 122.54179);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 196, 10.69662, 122.54202);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 197, 10.6967, 122.54214);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 198, 10.69682, 122.54236);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 199, 10.69683, 122.54237);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 200, 10.69702, 122.54277);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 201, 10.69734, 122.54341);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 202, 10.69728, 122.54345);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 203, 10.69677, 122.54382);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 204, 10.6964, 122.54408);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 205, 10.69638, 122.5441);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 206, 10.69633, 122.54414);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 207, 10.6962, 122.54425);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 208, 10.69617, 122.54427);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 209, 10.6961, 122.54434);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 210, 10.69607, 122.54437);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 211, 10.69599, 122.54445);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 212, 10.6953, 122.54488);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 213, 10.69477, 122.54534);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 214, 10.69477, 122.54535);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 215, 10.69463, 122.54546);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 216, 10.69455, 122.54554);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (270737713, 217, 10.69447, 122.54561);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 1, 10.69348, 122.49977);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 2, 10.6934, 122.50003);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 3, 10.6932, 122.50067);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 4, 10.69317, 122.50076);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 5, 10.69265, 122.50231);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 6, 10.69244, 122.50292);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 7, 10.6922, 122.50398);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 8, 10.6921, 122.50441);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 9, 10.69209, 122.50448);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 10, 10.69195, 122.50509);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 11, 10.69173, 122.5062);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 12, 10.69159, 122.50689);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 13, 10.69158, 122.50695);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 14, 10.69146, 122.50753);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 15, 10.69139, 122.5079);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 16, 10.69124, 122.50845);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 17, 10.69107, 122.50904);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 18, 10.69065, 122.51047);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 19, 10.69052, 122.51096);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 20, 10.69041, 122.51135);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 21, 10.69014, 122.51222);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 22, 10.69009, 122.51238);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 23, 10.69001, 122.51267);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 24, 10.68997, 122.51282);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 25, 10.68993, 122.51296);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 26, 10.68993, 122.51297);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 27, 10.68989, 122.5132);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 28, 10.68986, 122.51353);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 29, 10.68984, 122.51362);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 30, 10.68964, 122.5147);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 31, 10.68942, 122.51531);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 32, 10.6893, 122.51561);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 33, 10.68911, 122.51601);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 34, 10.68907, 122.5161);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 35, 10.68893, 122.51639);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 36, 10.68891, 122.51648);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 37, 10.68886, 122.51673);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 38, 10.6889, 122.51788);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 39, 10.68891, 122.51824);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 40, 10.68891, 122.51826);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 41, 10.68894, 122.51947);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 42, 10.68894, 122.51955);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 43, 10.68894, 122.51985);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 44, 10.68895, 122.52072);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 45, 10.68896, 122.52085);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 46, 10.68896, 122.52089);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 47, 10.68895, 122.5211);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 48, 10.68896, 122.5214);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 49, 10.68897, 122.52169);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 50, 10.68901, 122.52273);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 51, 10.68903, 122.52301);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 52, 10.68905, 122.52366);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 53, 10.68906, 122.52395);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 54, 10.68906, 122.52437);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 55, 10.68905, 122.52461);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 56, 10.68905, 122.5248);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 57, 10.68904, 122.52492);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 58, 10.68902, 122.52508);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 59, 10.68902, 122.52511);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 60, 10.68899, 122.52534);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 61, 10.68894, 122.52568);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 62, 10.68885, 122.52621);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 63, 10.68873, 122.52687);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 64, 10.68872, 122.52702);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 65, 10.68872, 122.52708);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 66, 10.68872, 122.5271);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 67, 10.68872, 122.52718);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 68, 10.68873, 122.52724);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 69, 10.68874, 122.52734);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 70, 10.68876, 122.52742);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 71, 10.68877, 122.52749);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 72, 10.68882, 122.52768);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 73, 10.68892, 122.52808);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 74, 10.68892, 122.5281);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 75, 10.68896, 122.52833);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 76, 10.68899, 122.52844);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 77, 10.68902, 122.52854);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 78, 10.68902, 122.52856);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 79, 10.68905, 122.52864);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 80, 10.68909, 122.52874);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 81, 10.68916, 122.52891);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 82, 10.68924, 122.52909);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 83, 10.6893, 122.52921);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 84, 10.68933, 122.52928);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 85, 10.68945, 122.52953);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 86, 10.68982, 122.53026);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 87, 10.6899, 122.53041);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 88, 10.69002, 122.53065);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 89, 10.69016, 122.53091);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 90, 10.69024, 122.5311);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 91, 10.69039, 122.53142);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 92, 10.69048, 122.53164);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 93, 10.69054, 122.53178);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 94, 10.69059, 122.5319);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 95, 10.69066, 122.53211);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 96, 10.69081, 122.53253);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 97, 10.69091, 122.5328);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 98, 10.69115, 122.53336);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 99, 10.69142, 122.53389);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 100, 10.69164, 122.53432);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 101, 10.69187, 122.5347);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 102, 10.69203, 122.53496);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 103, 10.69209, 122.53506);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 104, 10.69213, 122.53511);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 105, 10.69234, 122.53541);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 106, 10.69249, 122.53562);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 107, 10.69277, 122.53603);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 108, 10.69304, 122.53644);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 109, 10.69327, 122.53678);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 110, 10.69353, 122.53715);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 111, 10.69371, 122.53741);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 112, 10.69457, 122.53872);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 113, 10.69489, 122.53916);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 114, 10.69518, 122.5396);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 115, 10.6952, 122.53965);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 116, 10.69538, 122.53996);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 117, 10.6954, 122.53999);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 118, 10.69556, 122.54032);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 119, 10.6958, 122.5407);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 120, 10.69589, 122.54086);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 121, 10.69637, 122.54161);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 122, 10.69648, 122.54179);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 123, 10.69662, 122.54202);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 124, 10.6967, 122.54214);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 125, 10.69682, 122.54236);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 126, 10.69683, 122.54237);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 127, 10.69702, 122.54277);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 128, 10.69734, 122.54341);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 129, 10.69677, 122.54382);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 130, 10.6964, 122.54408);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 131, 10.69638, 122.5441);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 132, 10.69633, 122.54414);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 133, 10.6962, 122.54425);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 134, 10.69617, 122.54427);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 135, 10.6961, 122.54434);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 136, 10.69607, 122.54437);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 137, 10.69599, 122.54445);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 138, 10.69626, 122.54488);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 139, 10.69629, 122.54491);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 140, 10.69642, 122.54513);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 141, 10.69647, 122.54521);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 142, 10.69652, 122.5453);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 143, 10.69657, 122.54538);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 144, 10.6967, 122.5456);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 145, 10.69705, 122.54619);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 146, 10.69746, 122.54691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 147, 10.69766, 122.54724);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 148, 10.69779, 122.54749);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 149, 10.69782, 122.54755);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 150, 10.69782, 122.54756);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 151, 10.69809, 122.54797);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 152, 10.69849, 122.54866);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 153, 10.69877, 122.54917);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 154, 10.69888, 122.54939);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 155, 10.69896, 122.54952);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 156, 10.69909, 122.54977);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 157, 10.69916, 122.54992);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 158, 10.69919, 122.55001);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 159, 10.69922, 122.5502);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 160, 10.69933, 122.55103);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 161, 10.69935, 122.55117);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 162, 10.6994, 122.55156);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 163, 10.69941, 122.5517);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 164, 10.69942, 122.55182);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 165, 10.69948, 122.55231);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 166, 10.69953, 122.55257);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 167, 10.69959, 122.55267);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 168, 10.69964, 122.55317);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 169, 10.69967, 122.5534);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 170, 10.6997, 122.55367);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 171, 10.69973, 122.55391);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 172, 10.69975, 122.55406);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 173, 10.69975, 122.55409);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 174, 10.69977, 122.55427);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 175, 10.6998, 122.55445);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 176, 10.69988, 122.55504);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 177, 10.69996, 122.55564);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 178, 10.69993, 122.55578);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 179, 10.69994, 122.55587);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 180, 10.69995, 122.55599);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 181, 10.7, 122.55648);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 182, 10.70001, 122.55658);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 183, 10.70008, 122.55728);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 184, 10.70008, 122.55733);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 185, 10.70011, 122.55758);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 186, 10.70012, 122.55774);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 187, 10.70013, 122.55793);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 188, 10.70025, 122.55921);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 189, 10.7003, 122.55989);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 190, 10.70031, 122.55992);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 191, 10.70034, 122.56024);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 192, 10.70039, 122.56075);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 193, 10.70044, 122.56101);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 194, 10.70046, 122.56111);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 195, 10.70051, 122.5613);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 196, 10.70052, 122.56135);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 197, 10.70055, 122.56149);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 198, 10.70059, 122.56177);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 199, 10.70066, 122.56222);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 200, 10.70076, 122.56285);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 201, 10.70079, 122.563);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 202, 10.70085, 122.56344);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 203, 10.70091, 122.56387);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 204, 10.70103, 122.56464);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 205, 10.70106, 122.56486);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 206, 10.70108, 122.56502);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 207, 10.70112, 122.56532);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 208, 10.70115, 122.5655);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 209, 10.70115, 122.56553);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 210, 10.70118, 122.56574);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 211, 10.70128, 122.56646);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 212, 10.70135, 122.56696);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 213, 10.70137, 122.56709);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 214, 10.70142, 122.56748);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 215, 10.70146, 122.56771);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 216, 10.7015, 122.5679);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 217, 10.70155, 122.56813);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 218, 10.70158, 122.56823);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 219, 10.70163, 122.56833);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 220, 10.70171, 122.5684);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 221, 10.70168, 122.56846);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 222, 10.70157, 122.56885);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 223, 10.70155, 122.56895);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 224, 10.70154, 122.56898);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 225, 10.70153, 122.56902);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 226, 10.70152, 122.56902);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 227, 10.70152, 122.56903);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 228, 10.70151, 122.56903);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 229, 10.7015, 122.56903);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 230, 10.7015, 122.56904);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 231, 10.70149, 122.56904);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 232, 10.70148, 122.56905);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 233, 10.70129, 122.5691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 234, 10.70096, 122.56911);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 235, 10.70085, 122.56911);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 236, 10.70009, 122.56911);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 237, 10.69931, 122.56911);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 238, 10.69914, 122.56907);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 239, 10.69818, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 240, 10.69797, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 241, 10.69795, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 242, 10.69781, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 243, 10.69676, 122.56905);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 244, 10.69667, 122.56905);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 245, 10.69663, 122.56905);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 246, 10.69659, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 247, 10.69658, 122.56907);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 248, 10.69651, 122.5691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 249, 10.69643, 122.56915);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 250, 10.69557, 122.56986);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 251, 10.69475, 122.57049);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 252, 10.69474, 122.5705);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 253, 10.69392, 122.57101);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 254, 10.69376, 122.57129);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 255, 10.69363, 122.57154);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 256, 10.69358, 122.57162);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 257, 10.69352, 122.57172);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 258, 10.69331, 122.57203);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 259, 10.69292, 122.57257);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 260, 10.69287, 122.57273);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 261, 10.69273, 122.57293);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 262, 10.69232, 122.57336);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 263, 10.6918, 122.57388);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 264, 10.69166, 122.57372);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 265, 10.69168, 122.57357);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 266, 10.69174, 122.57316);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 267, 10.69183, 122.57251);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 268, 10.69198, 122.57166);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 269, 10.69198, 122.57165);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 270, 10.69206, 122.57066);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 271, 10.69206, 122.57001);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 272, 10.69206, 122.56999);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 273, 10.69213, 122.56979);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 274, 10.69212, 122.56919);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 275, 10.69213, 122.56919);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 276, 10.69213, 122.56918);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 277, 10.69214, 122.56918);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 278, 10.69214, 122.56917);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 279, 10.69214, 122.56916);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 280, 10.69214, 122.56915);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 281, 10.69215, 122.56915);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 282, 10.69215, 122.56914);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 283, 10.69215, 122.56913);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 284, 10.69215, 122.56912);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 285, 10.69214, 122.56912);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 286, 10.69214, 122.56911);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 287, 10.69214, 122.5691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 288, 10.69213, 122.5691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 289, 10.69213, 122.56909);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 290, 10.69212, 122.56908);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 291, 10.69211, 122.56908);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 292, 10.69211, 122.56907);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 293, 10.6921, 122.56907);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 294, 10.69209, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 295, 10.69208, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 296, 10.69207, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 297, 10.69206, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 298, 10.69205, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 299, 10.69205, 122.56907);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 300, 10.69204, 122.56907);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 301, 10.69203, 122.56907);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 302, 10.69203, 122.56908);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 303, 10.69202, 122.56908);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 304, 10.69191, 122.56795);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 305, 10.69193, 122.56795);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 306, 10.69251, 122.56794);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 307, 10.69294, 122.56793);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 308, 10.69356, 122.56791);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 309, 10.69402, 122.56789);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 310, 10.69441, 122.56789);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 311, 10.69483, 122.56789);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 312, 10.69608, 122.56787);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 313, 10.69617, 122.56787);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 314, 10.69656, 122.56786);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 315, 10.69785, 122.56781);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 316, 10.69785, 122.56777);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 317, 10.69785, 122.56771);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 318, 10.69785, 122.56672);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 319, 10.69788, 122.56642);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 320, 10.69781, 122.56586);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 321, 10.69775, 122.56537);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 322, 10.69768, 122.56479);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 323, 10.69748, 122.5648);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 324, 10.69523, 122.56481);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 325, 10.69513, 122.56481);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 326, 10.69462, 122.56479);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 327, 10.69442, 122.56479);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 328, 10.69378, 122.56477);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 329, 10.69333, 122.56476);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 330, 10.69331, 122.56476);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 331, 10.6932, 122.56325);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 332, 10.69365, 122.56325);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 333, 10.6944, 122.56327);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 334, 10.69466, 122.56328);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 335, 10.69469, 122.56328);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 336, 10.69475, 122.56327);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 337, 10.69444, 122.56226);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 338, 10.69429, 122.56175);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 339, 10.69417, 122.56139);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 340, 10.69412, 122.56123);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 341, 10.69384, 122.56034);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 342, 10.69367, 122.55981);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 343, 10.69336, 122.55889);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 344, 10.69335, 122.55881);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 345, 10.69334, 122.55872);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 346, 10.69335, 122.55863);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 347, 10.69336, 122.55855);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 348, 10.69339, 122.55835);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 349, 10.69344, 122.55809);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 350, 10.69346, 122.55799);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 351, 10.6936, 122.55739);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 352, 10.69377, 122.55665);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 353, 10.69388, 122.55607);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 354, 10.69409, 122.55567);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 355, 10.69445, 122.55519);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 356, 10.69449, 122.5551);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (508373133, 357, 10.69447, 122.55503);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1455207158, 1, 10.69447, 122.55503);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1455207158, 2, 10.69449, 122.5551);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1455207158, 3, 10.69461, 122.55506);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1455207158, 4, 10.69467, 122.55505);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1455207158, 5, 10.69521, 122.555);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1455207158, 6, 10.69542, 122.55499);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1455207158, 7, 10.6957, 122.55496);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1455207158, 8, 10.69628, 122.55491);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1455207158, 9, 10.69654, 122.55488);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1455207158, 10, 10.69747, 122.55476);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1455207158, 11, 10.69769, 122.55473);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1455207158, 12, 10.69861, 122.55462);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1455207158, 13, 10.69868, 122.55461);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1455207158, 14, 10.69873, 122.5546);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1455207158, 15, 10.69884, 122.55458);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1455207158, 16, 10.69909, 122.55448);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1455207158, 17, 10.69929, 122.5544);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1455207158, 18, 10.69947, 122.55435);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1455207158, 19, 10.6996, 122.55436);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1455207158, 20, 10.69963, 122.55437);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1455207158, 21, 10.69965, 122.55438);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1455207158, 22, 10.69967, 122.5544);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1455207158, 23, 10.69969, 122.55442);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1455207158, 24, 10.69971, 122.55444);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1455207158, 25, 10.69975, 122.55451);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1455207158, 26, 10.69978, 122.55479);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1455207158, 27, 10.6998, 122.55493);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1455207158, 28, 10.69984, 122.55528);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1455207158, 29, 10.69988, 122.55558);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1455207158, 30, 10.6999, 122.55567);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1455207158, 31, 10.69991, 122.55574);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1455207158, 32, 10.69992, 122.55575);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1455207158, 33, 10.69993, 122.55578);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1455207158, 34, 10.70004, 122.55576);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1455207158, 35, 10.69998, 122.55566);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1455207158, 36, 10.69996, 122.55564);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1455207158, 37, 10.69988, 122.55504);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1455207158, 38, 10.6998, 122.55445);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1455207158, 39, 10.69977, 122.55427);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1455207158, 40, 10.69975, 122.55409);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1455207158, 41, 10.69975, 122.55406);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1455207158, 42, 10.69973, 122.55391);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1455207158, 43, 10.6997, 122.55367);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1455207158, 44, 10.69968, 122.55349);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 1, 10.71741, 122.5801);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 2, 10.71724, 122.58026);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 3, 10.7172, 122.5803);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 4, 10.7171, 122.5804);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 5, 10.71669, 122.58076);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 6, 10.71659, 122.58083);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 7, 10.71652, 122.58086);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 8, 10.71649, 122.58087);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 9, 10.71645, 122.58088);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 10, 10.71641, 122.58088);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 11, 10.71637, 122.58089);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 12, 10.71595, 122.58089);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 13, 10.7159, 122.58089);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 14, 10.71588, 122.5809);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 15, 10.71585, 122.5809);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 16, 10.71583, 122.5809);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 17, 10.71581, 122.58091);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 18, 10.71579, 122.58091);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 19, 10.71577, 122.58092);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 20, 10.71575, 122.58093);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 21, 10.71571, 122.58097);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 22, 10.71516, 122.58145);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 23, 10.71501, 122.58152);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 24, 10.71496, 122.58153);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 25, 10.71492, 122.58154);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 26, 10.71487, 122.58154);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 27, 10.71459, 122.58151);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 28, 10.71404, 122.58145);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 29, 10.71399, 122.58144);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 30, 10.71391, 122.58144);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 31, 10.71389, 122.58117);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 32, 10.71387, 122.58098);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 33, 10.71383, 122.58049);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 34, 10.71375, 122.57981);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 35, 10.71373, 122.57963);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 36, 10.71372, 122.57928);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 37, 10.71373, 122.579);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 38, 10.71375, 122.57871);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 39, 10.71375, 122.57865);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 40, 10.7138, 122.57804);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 41, 10.71385, 122.57742);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 42, 10.71388, 122.577);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 43, 10.71392, 122.57658);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 44, 10.71394, 122.57626);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 45, 10.71395, 122.57617);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 46, 10.71396, 122.57608);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 47, 10.71398, 122.57603);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 48, 10.71398, 122.576);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 49, 10.71402, 122.57594);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 50, 10.71413, 122.57576);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 51, 10.7143, 122.57551);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 52, 10.71357, 122.57455);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 53, 10.7134, 122.57433);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 54, 10.71329, 122.5742);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 55, 10.71303, 122.57383);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 56, 10.71281, 122.57356);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 57, 10.71275, 122.57348);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 58, 10.7125, 122.57315);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 59, 10.71225, 122.57278);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 60, 10.71194, 122.57236);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 61, 10.71182, 122.5722);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 62, 10.71164, 122.57194);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 63, 10.71161, 122.57191);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 64, 10.71202, 122.5716);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 65, 10.71216, 122.57151);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 66, 10.71254, 122.57124);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 67, 10.71282, 122.57104);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 68, 10.71305, 122.57088);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 69, 10.71314, 122.57082);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 70, 10.71337, 122.57066);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 71, 10.71373, 122.57033);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 72, 10.71412, 122.57004);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 73, 10.71422, 122.56997);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 74, 10.71432, 122.56989);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 75, 10.71445, 122.5698);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 76, 10.71495, 122.56946);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 77, 10.715, 122.56943);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 78, 10.71599, 122.56884);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 79, 10.71608, 122.56877);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 80, 10.7162, 122.56868);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 81, 10.7163, 122.56862);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 82, 10.71648, 122.56848);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 83, 10.71683, 122.56824);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 84, 10.71684, 122.56824);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 85, 10.71686, 122.56823);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 86, 10.71765, 122.56778);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 87, 10.71784, 122.56768);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 88, 10.71796, 122.56761);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 89, 10.7181, 122.56752);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 90, 10.71832, 122.56739);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 91, 10.71841, 122.56733);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 92, 10.71859, 122.56722);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 93, 10.71905, 122.56693);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 94, 10.71922, 122.56682);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 95, 10.71953, 122.56664);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 96, 10.7197, 122.56655);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 97, 10.71975, 122.56652);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 98, 10.71983, 122.56647);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 99, 10.7201, 122.56627);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 100, 10.72043, 122.56597);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 101, 10.72064, 122.5657);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 102, 10.72023, 122.56535);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 103, 10.71968, 122.5649);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 104, 10.71967, 122.56489);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 105, 10.71933, 122.5646);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 106, 10.71897, 122.56431);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 107, 10.71857, 122.56397);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 108, 10.71851, 122.56393);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 109, 10.71805, 122.56441);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 110, 10.71757, 122.56488);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 111, 10.71749, 122.56495);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 112, 10.71747, 122.56498);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 113, 10.71743, 122.56502);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 114, 10.71738, 122.56508);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 115, 10.71724, 122.56519);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 116, 10.71714, 122.56527);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 117, 10.71702, 122.56536);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 118, 10.71669, 122.56563);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 119, 10.71659, 122.5657);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 120, 10.71619, 122.56602);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 121, 10.71589, 122.56627);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 122, 10.71577, 122.56639);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 123, 10.71544, 122.56666);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 124, 10.71533, 122.56675);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 125, 10.71505, 122.56696);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 126, 10.71497, 122.56702);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 127, 10.71494, 122.56705);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 128, 10.71472, 122.56722);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 129, 10.71452, 122.56737);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 130, 10.71415, 122.56769);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 131, 10.71355, 122.56814);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 132, 10.71289, 122.56866);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 133, 10.71283, 122.5687);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 134, 10.71256, 122.5689);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 135, 10.71233, 122.56911);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 136, 10.71188, 122.56943);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 137, 10.71178, 122.5695);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 138, 10.71045, 122.57037);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 139, 10.71033, 122.57023);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 140, 10.70983, 122.56963);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 141, 10.70977, 122.56956);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 142, 10.70932, 122.56899);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 143, 10.70925, 122.56891);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 144, 10.70918, 122.56883);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 145, 10.70891, 122.56849);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 146, 10.70865, 122.56818);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 147, 10.70849, 122.56799);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 148, 10.70838, 122.56786);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 149, 10.70851, 122.56772);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 150, 10.70885, 122.5673);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 151, 10.70901, 122.5671);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 152, 10.70915, 122.56691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1539890272, 153, 10.70918, 122.56685);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 1, 10.70898, 122.56676);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 2, 10.70807, 122.56702);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 3, 10.70778, 122.5671);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 4, 10.70767, 122.56713);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 5, 10.70749, 122.56716);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 6, 10.70733, 122.5672);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 7, 10.70698, 122.56728);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 8, 10.7068, 122.56734);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 9, 10.70663, 122.5674);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 10, 10.70658, 122.56741);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 11, 10.70637, 122.56749);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 12, 10.70627, 122.56752);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 13, 10.70575, 122.56769);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 14, 10.70521, 122.56786);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 15, 10.70507, 122.5679);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 16, 10.70498, 122.56791);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 17, 10.70469, 122.56793);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 18, 10.70465, 122.56793);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 19, 10.70452, 122.56793);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 20, 10.70408, 122.56796);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 21, 10.70398, 122.56796);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 22, 10.70383, 122.56797);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 23, 10.70356, 122.56799);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 24, 10.70323, 122.56804);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 25, 10.70303, 122.56806);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 26, 10.70298, 122.56807);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 27, 10.70265, 122.5681);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 28, 10.70261, 122.5681);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 29, 10.70224, 122.56814);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 30, 10.7021, 122.56816);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 31, 10.70183, 122.56828);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 32, 10.70182, 122.56827);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 33, 10.7017, 122.56813);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 34, 10.70165, 122.56806);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 35, 10.70162, 122.56802);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 36, 10.70161, 122.56798);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 37, 10.70159, 122.56792);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 38, 10.70158, 122.56785);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 39, 10.70155, 122.56772);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 40, 10.70154, 122.56763);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 41, 10.70153, 122.5676);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 42, 10.70146, 122.56705);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 43, 10.70145, 122.56695);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 44, 10.70138, 122.56646);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 45, 10.7013, 122.56588);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 46, 10.70125, 122.56552);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 47, 10.70125, 122.56549);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 48, 10.70123, 122.56539);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 49, 10.70121, 122.5652);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 50, 10.70116, 122.56484);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 51, 10.70101, 122.5639);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 52, 10.701, 122.56385);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 53, 10.70095, 122.56353);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 54, 10.70094, 122.56345);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 55, 10.70088, 122.56307);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 56, 10.70087, 122.563);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 57, 10.70085, 122.56277);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 58, 10.70085, 122.56265);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 59, 10.70076, 122.56209);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 60, 10.70073, 122.56191);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 61, 10.7007, 122.56175);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 62, 10.70059, 122.56177);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 63, 10.70041, 122.56178);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 64, 10.69997, 122.56177);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 65, 10.69947, 122.56175);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 66, 10.69894, 122.56174);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 67, 10.69804, 122.56175);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 68, 10.69788, 122.56175);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 69, 10.69747, 122.56174);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 70, 10.69726, 122.56173);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 71, 10.69681, 122.56172);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 72, 10.69667, 122.56172);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 73, 10.69559, 122.56172);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 74, 10.69487, 122.56172);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 75, 10.69455, 122.56174);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 76, 10.69429, 122.56175);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 77, 10.69419, 122.56175);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 78, 10.69428, 122.56206);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 79, 10.69466, 122.56328);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 80, 10.69496, 122.56427);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 81, 10.69513, 122.56481);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 82, 10.69527, 122.56528);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 83, 10.69561, 122.56639);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 84, 10.6958, 122.56699);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 85, 10.69608, 122.56787);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 86, 10.69632, 122.56875);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 87, 10.6964, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 88, 10.69619, 122.5691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 89, 10.6959, 122.5691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 90, 10.69511, 122.56909);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 91, 10.69488, 122.56908);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 92, 10.69463, 122.56909);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 93, 10.69367, 122.5691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 94, 10.69309, 122.5691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 95, 10.69215, 122.56913);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 96, 10.69215, 122.56912);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 97, 10.69214, 122.56912);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 98, 10.69214, 122.56911);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 99, 10.69214, 122.5691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 100, 10.69213, 122.5691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 101, 10.69213, 122.56909);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 102, 10.69212, 122.56908);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 103, 10.69211, 122.56908);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 104, 10.69211, 122.56907);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 105, 10.6921, 122.56907);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 106, 10.69209, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 107, 10.69208, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 108, 10.69207, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 109, 10.69206, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 110, 10.69205, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 111, 10.69205, 122.56907);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 112, 10.69204, 122.56907);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 113, 10.69203, 122.56907);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 114, 10.69203, 122.56908);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 115, 10.69202, 122.56908);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 116, 10.692, 122.56911);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 117, 10.692, 122.56913);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 118, 10.692, 122.56914);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 119, 10.692, 122.56915);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 120, 10.692, 122.56916);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 121, 10.692, 122.56917);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 122, 10.69201, 122.56918);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 123, 10.69201, 122.56919);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 124, 10.69202, 122.56919);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 125, 10.69202, 122.5692);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 126, 10.69203, 122.5692);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 127, 10.69202, 122.56975);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 128, 10.69203, 122.56979);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 129, 10.69206, 122.56999);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 130, 10.69206, 122.57001);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 131, 10.69206, 122.57066);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 132, 10.69198, 122.57165);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 133, 10.69198, 122.57166);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 134, 10.69183, 122.57251);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 135, 10.69168, 122.57357);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 136, 10.69166, 122.57372);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 137, 10.6918, 122.57388);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 138, 10.69143, 122.5743);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 139, 10.69106, 122.5748);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 140, 10.69094, 122.57498);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 141, 10.69046, 122.57566);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 142, 10.68993, 122.57642);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 143, 10.69052, 122.57691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 144, 10.69054, 122.57689);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 145, 10.69079, 122.57656);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 146, 10.69115, 122.57601);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 147, 10.69148, 122.57549);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 148, 10.69153, 122.57542);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 149, 10.69158, 122.57534);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 150, 10.69177, 122.57508);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 151, 10.69184, 122.57497);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 152, 10.69228, 122.57434);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 153, 10.6918, 122.57388);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 154, 10.69232, 122.57336);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 155, 10.69273, 122.57293);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 156, 10.69287, 122.57273);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 157, 10.69299, 122.57264);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 158, 10.69337, 122.57208);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 159, 10.69338, 122.57207);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 160, 10.69357, 122.57175);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 161, 10.69363, 122.57164);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 162, 10.69368, 122.57156);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 163, 10.69397, 122.57104);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 164, 10.69486, 122.57056);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 165, 10.69561, 122.56992);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 166, 10.69643, 122.56926);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 167, 10.69646, 122.56924);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 168, 10.69654, 122.56921);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 169, 10.69655, 122.5692);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 170, 10.69659, 122.56918);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 171, 10.69662, 122.56917);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 172, 10.69667, 122.56915);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 173, 10.69673, 122.56914);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 174, 10.69684, 122.56913);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 175, 10.69695, 122.56912);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 176, 10.69781, 122.56915);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 177, 10.69795, 122.56914);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 178, 10.69797, 122.56914);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 179, 10.69819, 122.56914);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 180, 10.69914, 122.56916);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 181, 10.69931, 122.56911);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 182, 10.70009, 122.56911);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 183, 10.70096, 122.56911);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 184, 10.70129, 122.5691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 185, 10.7014, 122.56915);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 186, 10.70146, 122.56917);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 187, 10.70148, 122.56918);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 188, 10.70148, 122.56919);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 189, 10.70149, 122.56919);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 190, 10.70149, 122.5692);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 191, 10.7015, 122.5692);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 192, 10.70151, 122.56921);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 193, 10.70152, 122.56921);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 194, 10.70153, 122.56921);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 195, 10.70154, 122.56922);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 196, 10.70155, 122.56922);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 197, 10.70156, 122.56922);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 198, 10.70157, 122.56922);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 199, 10.70157, 122.56921);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 200, 10.70158, 122.56921);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 201, 10.70159, 122.56921);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 202, 10.7016, 122.56921);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 203, 10.7016, 122.5692);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 204, 10.70161, 122.5692);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 205, 10.70162, 122.56919);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 206, 10.70163, 122.56918);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 207, 10.70163, 122.56917);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 208, 10.70164, 122.56917);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 209, 10.70164, 122.56916);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 210, 10.70164, 122.56915);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 211, 10.70165, 122.56915);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 212, 10.70165, 122.56914);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 213, 10.70165, 122.56913);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 214, 10.70177, 122.56882);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 215, 10.7018, 122.56871);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 216, 10.70185, 122.56855);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 217, 10.70195, 122.5684);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 218, 10.70203, 122.56834);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 219, 10.70215, 122.56826);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 220, 10.70224, 122.56814);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1619997782, 221, 10.7023, 122.56813);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 1, 10.69864, 122.54894);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 2, 10.69877, 122.54917);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 3, 10.69888, 122.54939);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 4, 10.69896, 122.54952);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 5, 10.699, 122.54953);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 6, 10.69903, 122.54953);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 7, 10.69904, 122.54953);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 8, 10.69907, 122.54952);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 9, 10.69911, 122.54951);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 10, 10.69914, 122.5495);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 11, 10.69916, 122.54948);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 12, 10.69919, 122.54947);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 13, 10.69924, 122.54942);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 14, 10.69923, 122.5493);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 15, 10.69916, 122.54887);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 16, 10.6991, 122.54851);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 17, 10.69893, 122.54764);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 18, 10.69889, 122.54733);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 19, 10.69888, 122.54731);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 20, 10.69887, 122.5472);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 21, 10.6988, 122.54689);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 22, 10.69876, 122.5466);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 23, 10.69876, 122.54659);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 24, 10.69874, 122.54652);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 25, 10.69868, 122.54626);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 26, 10.69863, 122.54609);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 27, 10.69856, 122.54582);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 28, 10.69852, 122.54566);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 29, 10.69844, 122.5455);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 30, 10.69836, 122.5453);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 31, 10.69817, 122.54493);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 32, 10.69796, 122.54454);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 33, 10.69774, 122.54409);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 34, 10.69773, 122.54408);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 35, 10.69734, 122.54341);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 36, 10.69688, 122.54373);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 37, 10.69677, 122.54382);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 38, 10.6964, 122.54408);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 39, 10.69638, 122.5441);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 40, 10.69633, 122.54414);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 41, 10.6962, 122.54425);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 42, 10.69617, 122.54427);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 43, 10.6961, 122.54434);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 44, 10.69607, 122.54437);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 45, 10.69599, 122.54445);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 46, 10.6953, 122.54488);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 47, 10.69477, 122.54534);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 48, 10.69477, 122.54535);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 49, 10.69463, 122.54546);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 50, 10.69455, 122.54554);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 51, 10.69445, 122.54564);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 52, 10.69393, 122.54617);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 53, 10.69361, 122.54649);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 54, 10.69338, 122.54672);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 55, 10.69335, 122.54676);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 56, 10.69332, 122.54679);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 57, 10.69318, 122.54694);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 58, 10.69311, 122.54701);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 59, 10.69287, 122.54728);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 60, 10.6927, 122.54747);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 61, 10.69266, 122.54752);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 62, 10.69247, 122.54776);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 63, 10.6922, 122.54822);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 64, 10.69214, 122.54835);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 65, 10.69207, 122.54853);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 66, 10.692, 122.54867);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 67, 10.69199, 122.54871);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 68, 10.69198, 122.54874);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 69, 10.69196, 122.54883);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 70, 10.69196, 122.54899);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 71, 10.692, 122.54917);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 72, 10.69203, 122.5493);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 73, 10.69204, 122.54936);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 74, 10.69212, 122.54966);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 75, 10.6922, 122.54997);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 76, 10.69225, 122.55016);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 77, 10.69229, 122.5504);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 78, 10.6923, 122.55049);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 79, 10.69229, 122.55058);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 80, 10.69229, 122.55111);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 81, 10.6923, 122.55144);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 82, 10.69231, 122.55173);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 83, 10.69231, 122.55177);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 84, 10.69231, 122.55186);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 85, 10.69232, 122.55208);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 86, 10.69233, 122.55213);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 87, 10.69241, 122.55324);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 88, 10.69243, 122.55365);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 89, 10.69244, 122.55386);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 90, 10.69245, 122.55404);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 91, 10.69247, 122.55432);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 92, 10.69249, 122.55444);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 93, 10.69253, 122.55462);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 94, 10.69257, 122.55474);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 95, 10.69258, 122.55479);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 96, 10.69269, 122.55513);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 97, 10.69275, 122.55526);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 98, 10.69278, 122.5553);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 99, 10.69282, 122.55536);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 100, 10.69289, 122.55547);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 101, 10.69294, 122.55556);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 102, 10.693, 122.55564);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 103, 10.69312, 122.55576);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 104, 10.69325, 122.55591);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 105, 10.69333, 122.556);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 106, 10.6936, 122.55635);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 107, 10.69366, 122.55644);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 108, 10.69368, 122.55649);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 109, 10.69369, 122.55658);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 110, 10.69369, 122.55663);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 111, 10.69368, 122.55673);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 112, 10.69364, 122.55694);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 113, 10.6936, 122.55707);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 114, 10.69352, 122.55737);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 115, 10.69346, 122.55762);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 116, 10.69344, 122.55774);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 117, 10.69342, 122.5578);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 118, 10.69329, 122.55854);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 119, 10.69328, 122.55872);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 120, 10.69328, 122.55882);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 121, 10.69329, 122.55885);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 122, 10.69331, 122.55892);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 123, 10.69366, 122.56007);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 124, 10.6937, 122.56018);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 125, 10.69419, 122.56175);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 126, 10.69428, 122.56206);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 127, 10.69466, 122.56328);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 128, 10.69496, 122.56427);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 129, 10.69513, 122.56481);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 130, 10.69527, 122.56528);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 131, 10.6953, 122.56538);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 132, 10.69561, 122.56639);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 133, 10.6958, 122.56699);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 134, 10.69608, 122.56787);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 135, 10.6964, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 136, 10.69619, 122.5691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 137, 10.6959, 122.5691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 138, 10.69511, 122.56909);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 139, 10.69488, 122.56908);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 140, 10.69463, 122.56909);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 141, 10.69367, 122.5691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 142, 10.69309, 122.5691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 143, 10.69267, 122.56911);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 144, 10.69215, 122.56913);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 145, 10.69215, 122.56912);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 146, 10.69214, 122.56912);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 147, 10.69214, 122.56911);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 148, 10.69214, 122.5691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 149, 10.69213, 122.5691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 150, 10.69213, 122.56909);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 151, 10.69212, 122.56908);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 152, 10.69211, 122.56908);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 153, 10.69211, 122.56907);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 154, 10.6921, 122.56907);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 155, 10.69209, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 156, 10.69208, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 157, 10.69207, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 158, 10.69206, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 159, 10.69205, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 160, 10.69205, 122.56907);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 161, 10.69204, 122.56907);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 162, 10.69203, 122.56907);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 163, 10.69203, 122.56908);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 164, 10.69202, 122.56908);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 165, 10.692, 122.56911);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 166, 10.692, 122.56913);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 167, 10.692, 122.56914);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 168, 10.692, 122.56915);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 169, 10.692, 122.56916);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 170, 10.692, 122.56917);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 171, 10.69201, 122.56918);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 172, 10.69201, 122.56919);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 173, 10.69202, 122.56919);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 174, 10.69202, 122.5692);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 175, 10.69203, 122.5692);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 176, 10.69202, 122.56975);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 177, 10.69203, 122.56979);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 178, 10.69206, 122.56999);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 179, 10.69206, 122.57001);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 180, 10.69206, 122.57066);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 181, 10.69198, 122.57165);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 182, 10.69198, 122.57166);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 183, 10.69205, 122.57169);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 184, 10.6921, 122.57173);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 185, 10.69216, 122.57178);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 186, 10.69292, 122.57257);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 187, 10.69287, 122.57273);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 188, 10.69273, 122.57293);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 189, 10.69236, 122.57332);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 190, 10.69232, 122.57336);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 191, 10.6918, 122.57388);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 192, 10.69166, 122.57372);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 193, 10.69168, 122.57357);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 194, 10.69183, 122.57251);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 195, 10.6919, 122.57211);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 196, 10.69198, 122.57166);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 197, 10.69198, 122.57165);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 198, 10.69206, 122.57066);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 199, 10.69206, 122.57001);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (616320184, 200, 10.69206, 122.56999);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 1, 10.69206, 122.56999);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 2, 10.69213, 122.56979);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 3, 10.69212, 122.56919);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 4, 10.69213, 122.56919);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 5, 10.69213, 122.56918);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 6, 10.69214, 122.56918);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 7, 10.69214, 122.56917);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 8, 10.69214, 122.56916);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 9, 10.69214, 122.56915);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 10, 10.69215, 122.56915);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 11, 10.69215, 122.56914);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 12, 10.69215, 122.56913);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 13, 10.69215, 122.56912);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 14, 10.69214, 122.56912);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 15, 10.69214, 122.56911);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 16, 10.69214, 122.5691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 17, 10.69213, 122.5691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 18, 10.69213, 122.56909);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 19, 10.69212, 122.56908);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 20, 10.69211, 122.56908);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 21, 10.69211, 122.56907);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 22, 10.6921, 122.56907);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 23, 10.69209, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 24, 10.69208, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 25, 10.69207, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 26, 10.69206, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 27, 10.69205, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 28, 10.69205, 122.56907);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 29, 10.69204, 122.56907);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 30, 10.69203, 122.56907);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 31, 10.69203, 122.56908);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 32, 10.69202, 122.56908);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 33, 10.692, 122.56911);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 34, 10.692, 122.56913);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 35, 10.6911, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 36, 10.69109, 122.56944);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 37, 10.6911, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 38, 10.692, 122.56913);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 39, 10.692, 122.56914);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 40, 10.692, 122.56915);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 41, 10.692, 122.56916);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 42, 10.692, 122.56917);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 43, 10.69201, 122.56918);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 44, 10.69201, 122.56919);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 45, 10.69202, 122.56919);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 46, 10.69202, 122.5692);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 47, 10.69203, 122.5692);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 48, 10.69204, 122.56921);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 49, 10.69205, 122.56921);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 50, 10.69206, 122.56921);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 51, 10.69207, 122.56921);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 52, 10.69208, 122.56921);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 53, 10.69209, 122.56921);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 54, 10.6921, 122.56921);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 55, 10.69211, 122.5692);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 56, 10.69212, 122.5692);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 57, 10.69212, 122.56919);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 58, 10.69213, 122.56919);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 59, 10.69213, 122.56918);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 60, 10.69214, 122.56918);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 61, 10.69214, 122.56917);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 62, 10.69214, 122.56916);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 63, 10.69214, 122.56915);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 64, 10.69215, 122.56915);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 65, 10.69215, 122.56914);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 66, 10.69215, 122.56913);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 67, 10.69309, 122.5691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 68, 10.69367, 122.5691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 69, 10.69463, 122.56909);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 70, 10.69488, 122.56908);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 71, 10.69511, 122.56909);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 72, 10.6959, 122.5691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 73, 10.69619, 122.5691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 74, 10.6964, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 75, 10.6965, 122.56904);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 76, 10.69634, 122.56848);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 77, 10.69617, 122.56787);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 78, 10.69589, 122.56698);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 79, 10.69571, 122.56638);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 80, 10.69523, 122.56481);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 81, 10.69505, 122.56425);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 82, 10.69475, 122.56327);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 83, 10.69444, 122.56226);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 84, 10.69429, 122.56175);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 85, 10.69417, 122.56139);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 86, 10.69412, 122.56123);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 87, 10.69384, 122.56034);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 88, 10.69367, 122.55981);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 89, 10.69336, 122.55889);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 90, 10.69335, 122.55881);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 91, 10.69334, 122.55872);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 92, 10.69335, 122.55863);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 93, 10.69336, 122.55855);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 94, 10.69339, 122.55835);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 95, 10.69344, 122.55809);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 96, 10.69346, 122.55799);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 97, 10.6936, 122.55739);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 98, 10.69377, 122.55665);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 99, 10.69388, 122.55607);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 100, 10.69409, 122.55567);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 101, 10.69445, 122.55519);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 102, 10.69449, 122.5551);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 103, 10.69447, 122.55503);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 104, 10.69401, 122.55514);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 105, 10.69396, 122.55515);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 106, 10.69383, 122.55517);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 107, 10.69297, 122.55526);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 108, 10.69294, 122.55527);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 109, 10.69278, 122.5553);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 110, 10.69275, 122.55526);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 111, 10.69269, 122.55513);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 112, 10.69258, 122.55479);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 113, 10.69257, 122.55474);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 114, 10.69253, 122.55462);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 115, 10.69249, 122.55444);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 116, 10.69247, 122.55432);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 117, 10.69245, 122.55404);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 118, 10.69244, 122.55386);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 119, 10.69243, 122.55365);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 120, 10.69241, 122.55324);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 121, 10.69235, 122.55249);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 122, 10.69233, 122.55213);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 123, 10.69232, 122.55208);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 124, 10.69231, 122.55186);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 125, 10.69231, 122.55177);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 126, 10.69231, 122.55173);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 127, 10.6923, 122.55144);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 128, 10.69229, 122.55111);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 129, 10.69229, 122.55058);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 130, 10.6923, 122.55049);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 131, 10.69229, 122.5504);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 132, 10.69225, 122.55016);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 133, 10.6922, 122.54997);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 134, 10.69212, 122.54966);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 135, 10.69204, 122.54936);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 136, 10.69203, 122.5493);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 137, 10.692, 122.54917);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 138, 10.69196, 122.54899);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 139, 10.69196, 122.54883);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 140, 10.69198, 122.54874);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 141, 10.69199, 122.54871);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 142, 10.692, 122.54867);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 143, 10.69207, 122.54853);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 144, 10.69214, 122.54835);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 145, 10.6922, 122.54822);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 146, 10.69247, 122.54776);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 147, 10.69266, 122.54752);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 148, 10.6927, 122.54747);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 149, 10.69287, 122.54728);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 150, 10.69311, 122.54701);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 151, 10.69318, 122.54694);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 152, 10.69332, 122.54679);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 153, 10.69335, 122.54676);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 154, 10.69338, 122.54672);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 155, 10.69361, 122.54649);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 156, 10.69393, 122.54617);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 157, 10.69445, 122.54564);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 158, 10.69455, 122.54554);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 159, 10.69463, 122.54546);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 160, 10.69477, 122.54535);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 161, 10.69477, 122.54534);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 162, 10.6953, 122.54488);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 163, 10.69599, 122.54445);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 164, 10.69626, 122.54488);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 165, 10.69629, 122.54491);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 166, 10.69637, 122.54481);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 167, 10.69663, 122.54467);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 168, 10.69743, 122.54425);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 169, 10.69774, 122.54409);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 170, 10.69773, 122.54408);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 171, 10.69734, 122.54341);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 172, 10.69688, 122.54373);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 173, 10.69677, 122.54382);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 174, 10.6964, 122.54408);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 175, 10.69638, 122.5441);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 176, 10.69633, 122.54414);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 177, 10.6962, 122.54425);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 178, 10.69617, 122.54427);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 179, 10.6961, 122.54434);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 180, 10.69607, 122.54437);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 181, 10.69599, 122.54445);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 182, 10.69626, 122.54488);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 183, 10.69629, 122.54491);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 184, 10.69642, 122.54513);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 185, 10.69647, 122.54521);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 186, 10.69652, 122.5453);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 187, 10.69657, 122.54538);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 188, 10.6967, 122.5456);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 189, 10.69705, 122.54619);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 190, 10.69746, 122.54691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 191, 10.69766, 122.54724);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 192, 10.69779, 122.54749);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 193, 10.69782, 122.54755);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 194, 10.69782, 122.54756);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 195, 10.69809, 122.54797);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 196, 10.69849, 122.54866);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (2043878050, 197, 10.69864, 122.54894);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 1, 10.69601, 122.54443);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 2, 10.69599, 122.54445);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 3, 10.69626, 122.54488);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 4, 10.69629, 122.54491);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 5, 10.69642, 122.54513);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 6, 10.69647, 122.54521);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 7, 10.69657, 122.54538);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 8, 10.6967, 122.5456);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 9, 10.69705, 122.54619);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 10, 10.69746, 122.54691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 11, 10.69766, 122.54724);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 12, 10.69779, 122.54749);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 13, 10.69782, 122.54755);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 14, 10.69782, 122.54756);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 15, 10.69809, 122.54797);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 16, 10.69849, 122.54866);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 17, 10.69877, 122.54917);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 18, 10.69888, 122.54939);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 19, 10.69896, 122.54952);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 20, 10.69909, 122.54977);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 21, 10.69916, 122.54992);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 22, 10.69919, 122.55001);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 23, 10.69922, 122.5502);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 24, 10.69933, 122.55103);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 25, 10.69935, 122.5512);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 26, 10.6994, 122.5516);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 27, 10.69941, 122.5517);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 28, 10.69943, 122.55188);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 29, 10.69948, 122.55231);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 30, 10.69953, 122.55257);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 31, 10.69959, 122.55267);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 32, 10.69964, 122.55317);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 33, 10.69967, 122.5534);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 34, 10.6997, 122.55367);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 35, 10.69973, 122.55391);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 36, 10.69975, 122.55406);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 37, 10.69975, 122.55409);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 38, 10.69977, 122.55427);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 39, 10.6998, 122.55445);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 40, 10.69988, 122.55504);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 41, 10.69996, 122.55564);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 42, 10.69993, 122.55578);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 43, 10.69994, 122.55587);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 44, 10.69995, 122.55599);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 45, 10.7, 122.55648);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 46, 10.70001, 122.55658);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 47, 10.70008, 122.55728);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 48, 10.70008, 122.55733);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 49, 10.70011, 122.55758);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 50, 10.70012, 122.55774);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 51, 10.70013, 122.55793);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 52, 10.70025, 122.55921);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 53, 10.7003, 122.55989);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 54, 10.70036, 122.55997);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 55, 10.70042, 122.56052);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 56, 10.70045, 122.56081);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 57, 10.70047, 122.56088);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 58, 10.7005, 122.56102);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 59, 10.7005, 122.56103);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 60, 10.70051, 122.56106);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 61, 10.70055, 122.56124);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 62, 10.70056, 122.56126);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 63, 10.70059, 122.56142);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 64, 10.70063, 122.5616);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 65, 10.70064, 122.56166);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 66, 10.70065, 122.56171);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 67, 10.70065, 122.56175);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 68, 10.70066, 122.56178);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 69, 10.70068, 122.56196);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 70, 10.70079, 122.56268);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 71, 10.70081, 122.56286);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 72, 10.70079, 122.563);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 73, 10.70085, 122.56344);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 74, 10.70091, 122.56387);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 75, 10.70103, 122.56464);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 76, 10.70106, 122.56486);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 77, 10.70108, 122.56502);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 78, 10.70112, 122.56532);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 79, 10.70115, 122.5655);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 80, 10.70115, 122.56553);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 81, 10.70118, 122.56574);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 82, 10.70128, 122.56646);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 83, 10.70135, 122.56696);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 84, 10.70137, 122.56709);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 85, 10.70142, 122.56748);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 86, 10.70146, 122.56771);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 87, 10.7015, 122.5679);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 88, 10.70155, 122.56812);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 89, 10.70155, 122.56813);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 90, 10.70158, 122.56823);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 91, 10.70163, 122.56833);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 92, 10.70171, 122.5684);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 93, 10.70168, 122.56846);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 94, 10.70157, 122.56885);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 95, 10.70155, 122.56895);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 96, 10.70154, 122.56898);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 97, 10.70153, 122.56902);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 98, 10.70152, 122.56902);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 99, 10.70152, 122.56903);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 100, 10.70151, 122.56903);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 101, 10.7015, 122.56903);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 102, 10.7015, 122.56904);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 103, 10.70149, 122.56904);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 104, 10.70148, 122.56905);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 105, 10.70129, 122.5691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 106, 10.70096, 122.56911);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 107, 10.70009, 122.56911);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 108, 10.69931, 122.56911);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 109, 10.69914, 122.56907);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 110, 10.69818, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 111, 10.69797, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 112, 10.69795, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 113, 10.69781, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 114, 10.69676, 122.56905);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 115, 10.69667, 122.56905);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 116, 10.69663, 122.56905);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 117, 10.69659, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 118, 10.69658, 122.56907);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 119, 10.69651, 122.5691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 120, 10.6965, 122.56904);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 121, 10.69634, 122.56848);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 122, 10.69617, 122.56787);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 123, 10.69656, 122.56786);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 124, 10.69785, 122.56781);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 125, 10.69784, 122.56793);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 126, 10.69784, 122.56804);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 127, 10.69781, 122.56896);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 128, 10.69781, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 129, 10.69676, 122.56905);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 130, 10.69667, 122.56905);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 131, 10.69663, 122.56905);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 132, 10.69659, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 133, 10.69658, 122.56907);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 134, 10.69651, 122.5691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 135, 10.69643, 122.56915);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 136, 10.69557, 122.56986);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 137, 10.69475, 122.57049);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 138, 10.69474, 122.5705);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 139, 10.69392, 122.57101);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 140, 10.69363, 122.57154);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 141, 10.69358, 122.57162);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 142, 10.69352, 122.57172);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 143, 10.69331, 122.57203);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 144, 10.69292, 122.57257);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 145, 10.69287, 122.57273);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 146, 10.69273, 122.57293);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 147, 10.69232, 122.57336);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 148, 10.6918, 122.57388);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 149, 10.69166, 122.57372);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 150, 10.69168, 122.57357);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 151, 10.69183, 122.57251);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 152, 10.69198, 122.57166);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 153, 10.69198, 122.57165);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 154, 10.69206, 122.57066);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 155, 10.69206, 122.57001);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 156, 10.69206, 122.56999);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 157, 10.69213, 122.56979);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 158, 10.69212, 122.56919);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 159, 10.69213, 122.56919);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 160, 10.69213, 122.56918);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 161, 10.69214, 122.56918);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 162, 10.69214, 122.56917);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 163, 10.69214, 122.56916);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 164, 10.69214, 122.56915);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 165, 10.69215, 122.56915);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 166, 10.69215, 122.56914);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 167, 10.69215, 122.56913);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 168, 10.69215, 122.56912);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 169, 10.69214, 122.56912);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 170, 10.69214, 122.56911);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 171, 10.69214, 122.5691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 172, 10.69213, 122.5691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 173, 10.69213, 122.56909);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 174, 10.69212, 122.56908);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 175, 10.69211, 122.56908);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 176, 10.69211, 122.56907);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 177, 10.6921, 122.56907);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 178, 10.69209, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 179, 10.69208, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 180, 10.69207, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 181, 10.69206, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 182, 10.69205, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 183, 10.69205, 122.56907);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 184, 10.69204, 122.56907);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 185, 10.69203, 122.56907);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 186, 10.69203, 122.56908);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 187, 10.69202, 122.56908);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 188, 10.692, 122.56911);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 189, 10.692, 122.56913);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 190, 10.692, 122.56914);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 191, 10.692, 122.56915);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 192, 10.692, 122.56916);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 193, 10.692, 122.56917);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 194, 10.69201, 122.56918);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 195, 10.69201, 122.56919);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 196, 10.69202, 122.56919);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 197, 10.69202, 122.5692);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 198, 10.69203, 122.5692);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 199, 10.69203, 122.5696);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 200, 10.69202, 122.56975);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 201, 10.69203, 122.56979);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 202, 10.69213, 122.56979);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 203, 10.69212, 122.56919);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 204, 10.69213, 122.56919);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 205, 10.69213, 122.56918);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 206, 10.69214, 122.56918);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 207, 10.69214, 122.56917);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 208, 10.69214, 122.56916);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 209, 10.69214, 122.56915);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 210, 10.69215, 122.56915);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 211, 10.69215, 122.56914);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 212, 10.69215, 122.56913);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 213, 10.69309, 122.5691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 214, 10.69367, 122.5691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 215, 10.69463, 122.56909);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 216, 10.69488, 122.56908);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 217, 10.69511, 122.56909);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 218, 10.6959, 122.5691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 219, 10.69619, 122.5691);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 220, 10.6964, 122.56906);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 221, 10.6965, 122.56904);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 222, 10.69634, 122.56848);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 223, 10.69617, 122.56787);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 224, 10.69589, 122.56698);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 225, 10.69571, 122.56638);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 226, 10.69523, 122.56481);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 227, 10.69505, 122.56425);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 228, 10.69475, 122.56327);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 229, 10.69444, 122.56226);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 230, 10.69429, 122.56175);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 231, 10.69417, 122.56139);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 232, 10.69412, 122.56123);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 233, 10.69384, 122.56034);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 234, 10.69367, 122.55981);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 235, 10.69336, 122.55889);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 236, 10.69331, 122.55892);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 237, 10.6934, 122.55923);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 238, 10.69366, 122.56007);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 239, 10.6937, 122.56018);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 240, 10.69419, 122.56175);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 241, 10.69324, 122.56171);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 242, 10.69294, 122.56168);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 243, 10.69255, 122.56162);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 244, 10.69255, 122.5616);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 245, 10.69261, 122.56134);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 246, 10.69276, 122.56073);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 247, 10.69285, 122.56038);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 248, 10.6929, 122.56016);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 249, 10.69291, 122.56013);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 250, 10.69314, 122.55912);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 251, 10.69318, 122.55904);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 252, 10.6932, 122.55902);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 253, 10.69321, 122.559);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 254, 10.69324, 122.55897);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 255, 10.69331, 122.55892);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 256, 10.69336, 122.55889);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 257, 10.69335, 122.55881);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 258, 10.69334, 122.55872);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 259, 10.69335, 122.55863);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 260, 10.69336, 122.55855);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 261, 10.69339, 122.55835);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 262, 10.69344, 122.55809);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 263, 10.69346, 122.55799);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 264, 10.6936, 122.55739);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 265, 10.69377, 122.55665);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 266, 10.69388, 122.55607);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 267, 10.69409, 122.55567);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 268, 10.69445, 122.55519);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 269, 10.69449, 122.5551);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 270, 10.69447, 122.55503);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 271, 10.69401, 122.55514);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 272, 10.69396, 122.55515);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 273, 10.69304, 122.55528);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 274, 10.69298, 122.55529);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 275, 10.69293, 122.55531);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 276, 10.6929, 122.55532);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 277, 10.69282, 122.55535);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 278, 10.69275, 122.55526);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 279, 10.69269, 122.55513);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 280, 10.69258, 122.55479);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 281, 10.69257, 122.55474);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 282, 10.69253, 122.55462);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 283, 10.69249, 122.55444);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 284, 10.69247, 122.55432);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 285, 10.69245, 122.55404);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 286, 10.69244, 122.55386);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 287, 10.69243, 122.55365);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 288, 10.69241, 122.55324);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 289, 10.69233, 122.55213);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 290, 10.69232, 122.55208);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 291, 10.69231, 122.55186);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 292, 10.69231, 122.55177);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 293, 10.69231, 122.55173);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 294, 10.6923, 122.55144);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 295, 10.69229, 122.55111);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 296, 10.69229, 122.55058);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 297, 10.6923, 122.55049);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 298, 10.69229, 122.5504);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 299, 10.69225, 122.55016);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 300, 10.6922, 122.54997);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 301, 10.69212, 122.54966);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 302, 10.69204, 122.54936);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 303, 10.69203, 122.5493);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 304, 10.692, 122.54917);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 305, 10.69196, 122.54899);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 306, 10.69196, 122.54883);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 307, 10.69198, 122.54874);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 308, 10.69199, 122.54871);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 309, 10.692, 122.54867);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 310, 10.69207, 122.54853);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 311, 10.69214, 122.54835);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 312, 10.69234, 122.54846);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 313, 10.69214, 122.54835);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 314, 10.6922, 122.54822);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 315, 10.69247, 122.54776);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 316, 10.69266, 122.54752);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 317, 10.6927, 122.54747);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 318, 10.69287, 122.54728);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 319, 10.69311, 122.54701);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 320, 10.69318, 122.54694);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 321, 10.69332, 122.54679);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 322, 10.69335, 122.54676);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 323, 10.69338, 122.54672);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 324, 10.69361, 122.54649);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 325, 10.69393, 122.54617);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 326, 10.69445, 122.54564);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 327, 10.69455, 122.54554);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 328, 10.69477, 122.54535);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 329, 10.69477, 122.54534);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 330, 10.6953, 122.54488);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 331, 10.69599, 122.54445);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 332, 10.69626, 122.54488);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 333, 10.69629, 122.54491);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 334, 10.69642, 122.54513);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 335, 10.69647, 122.54521);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 336, 10.69644, 122.54523);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 337, 10.69642, 122.54524);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 338, 10.69639, 122.54526);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 339, 10.69637, 122.54528);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 340, 10.69636, 122.54528);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 341, 10.69635, 122.54529);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 342, 10.69635, 122.5453);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 343, 10.69635, 122.54531);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 344, 10.69634, 122.54532);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 345, 10.69634, 122.54534);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 346, 10.69635, 122.54535);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 347, 10.69635, 122.54537);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 348, 10.69636, 122.5454);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 349, 10.69638, 122.54543);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 350, 10.6964, 122.54547);
+INSERT INTO prd_route_points (polyline_id, point_order, lat, lng) VALUES (1941429857, 351, 10.6964, 122.54548);
 
-CREATE INDEX idx_prd_routes_route_number ON prd_routes(route_number);
-CREATE INDEX idx_prd_route_stops_route_id ON prd_route_stops(route_id);
+CREATE INDEX IF NOT EXISTS idx_prd_routes_route_number ON prd_routes(route_number);
+CREATE INDEX IF NOT EXISTS idx_prd_route_stops_route_id ON prd_route_stops(route_id);
+CREATE INDEX IF NOT EXISTS idx_prd_route_polylines_route_id ON prd_route_polylines(route_id);
+CREATE MATERIALIZED VIEW IF NOT EXISTS prd_dataset_json AS
+SELECT
+    m.id,
+    jsonb_build_object(
+        'generated_at_utc', m.generated_at_utc,
+        'route_count', m.route_count,
+        'routes_with_stop_coordinates', m.routes_with_stop_coordinates,
+        'routes_with_fare', m.routes_with_fare,
+        'routes', COALESCE((
+            SELECT jsonb_agg(
+                jsonb_build_object(
+                    'route_id', r.route_id,
+                    'route_number', r.route_number,
+                    'route_code', r.route_code,
+                    'route_name', r.route_name,
+                    'route_title', concat_ws(' ', r.route_code, r.route_name),
+                    'fare_min_php', r.fare_min_php,
+                    'fare_max_php', r.fare_max_php,
+                    'fare_text', r.fare_text,
+                    'stop_count', r.stop_count,
+                    'stops', COALESCE((
+                        SELECT jsonb_agg(
+                            jsonb_build_object(
+                                'stop_id', s.stop_id,
+                                'stop_order', s.stop_order,
+                                'stop_name', s.stop_name,
+                                'lat', s.lat,
+                                'lng', s.lng,
+                                'source_type', CASE WHEN s.lat IS NULL OR s.lng IS NULL THEN 'text_stop' ELSE 'map_marker' END,
+                                'has_coordinates', s.lat IS NOT NULL AND s.lng IS NOT NULL
+                            )
+                            ORDER BY s.stop_order
+                        )
+                        FROM prd_route_stops s
+                        WHERE s.route_id = r.route_id
+                    ), '[]'::jsonb),
+                    'map_polyline_count', (SELECT count(*) FROM prd_route_polylines p WHERE p.route_id = r.route_id),
+                    'map_point_count', COALESCE((SELECT sum(p.point_count) FROM prd_route_polylines p WHERE p.route_id = r.route_id), 0),
+                    'map_polylines', COALESCE((
+                        SELECT jsonb_agg(
+                            jsonb_build_object(
+                                'name', p.segment_name,
+                                'point_count', p.point_count,
+                                'coordinates_lat_lng', COALESCE((
+                                    SELECT jsonb_agg(jsonb_build_array(pt.lat, pt.lng) ORDER BY pt.point_order)
+                                    FROM prd_route_points pt
+                                    WHERE pt.polyline_id = p.polyline_id
+                                ), '[]'::jsonb)
+                            )
+                            ORDER BY p.segment_index
+                        )
+                        FROM prd_route_polylines p
+                        WHERE p.route_id = r.route_id
+                    ), '[]'::jsonb)
+                )
+                ORDER BY r.route_number
+            )
+            FROM prd_routes r
+        ), '[]'::jsonb)
+    ) AS payload
+FROM prd_meta m
+WHERE m.id = 1;
+CREATE UNIQUE INDEX IF NOT EXISTS idx_prd_dataset_json_id ON prd_dataset_json(id);
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_roles WHERE rolname = 'anon') THEN
+        GRANT SELECT ON prd_dataset_json TO anon, authenticated;
+    END IF;
+END
+$$;
 
 COMMIT;
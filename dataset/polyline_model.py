@@ -0,0 +1,120 @@
+from array import array
+from collections.abc import Sequence
+
+
+# The canonical on-disk order is [lat, lng] (what the app and SQL dumps read);
+# [lng, lat] for KML/GeoJSON is derived on demand instead of being stored twice.
+CANONICAL_KEY = "coordinates_lat_lng"
+SWAPPED_KEY = "coordinates_lng_lat"
+
+
+class CoordinateView(Sequence):
+    __slots__ = ("_coords", "_swap")
+
+    def __init__(self, coords: array, swap: bool):
+        self._coords = coords
+        self._swap = swap
+
+    def __len__(self):
+        return len(self._coords) // 2
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("coordinate index out of range")
+        a = self._coords[2 * index]
+        b = self._coords[2 * index + 1]
+        return (b, a) if self._swap else (a, b)
+
+    def __iter__(self):
+        coords = self._coords
+        it = iter(coords)
+        if self._swap:
+            for a, b in zip(it, it):
+                yield (b, a)
+        else:
+            for a, b in zip(it, it):
+                yield (a, b)
+
+    def to_list(self):
+        return [list(pair) for pair in self]
+
+
+class CompactPolyline:
+    __slots__ = ("name", "_coords")
+
+    def __init__(self, name=None, coords=None):
+        # coords: flat array('d') of interleaved lat, lng.
+        self.name = name
+        self._coords = coords if coords is not None else array("d")
+
+    @classmethod
+    def from_lat_lng(cls, name, pairs):
+        coords = array("d")
+        for pair in pairs:
+            if len(pair) >= 2:
+                coords.append(float(pair[0]))
+                coords.append(float(pair[1]))
+        return cls(name, coords)
+
+    @classmethod
+    def from_lng_lat(cls, name, pairs):
+        coords = array("d")
+        for pair in pairs:
+            if len(pair) >= 2:
+                coords.append(float(pair[1]))
+                coords.append(float(pair[0]))
+        return cls(name, coords)
+
+    @classmethod
+    def from_dict(cls, polyline: dict):
+        # Older outputs carry both orders; either one is enough.
+        if polyline.get(CANONICAL_KEY):
+            return cls.from_lat_lng(polyline.get("name"), polyline[CANONICAL_KEY])
+        return cls.from_lng_lat(polyline.get("name"), polyline.get(SWAPPED_KEY) or [])
+
+    def __len__(self):
+        return len(self._coords) // 2
+
+    @property
+    def point_count(self):
+        return len(self)
+
+    @property
+    def lat_lng(self):
+        return CoordinateView(self._coords, swap=False)
+
+    @property
+    def lng_lat(self):
+        return CoordinateView(self._coords, swap=True)
+
+    def lats(self):
+        return self._coords[0::2]
+
+    def lngs(self):
+        return self._coords[1::2]
+
+    def nbytes(self):
+        return self._coords.buffer_info()[1] * self._coords.itemsize
+
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "point_count": len(self),
+            CANONICAL_KEY: self.lat_lng.to_list(),
+        }
+
+
+def compact_polyline_dict(polyline: dict):
+    # Rewrites a legacy two-order polyline dict into the single canonical order,
+    # keeping any extra keys the producer attached.
+    out = {k: v for k, v in polyline.items() if k not in (CANONICAL_KEY, SWAPPED_KEY)}
+    out.update(CompactPolyline.from_dict(polyline).to_dict())
+    return out
+
+
+def geojson_coordinates(polyline: dict):
+    return CompactPolyline.from_dict(polyline).lng_lat.to_list()
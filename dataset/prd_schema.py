@@ -0,0 +1,212 @@
+PRD_SCHEMA = [
+    (
+        "prd_meta",
+        """
+    id INTEGER PRIMARY KEY,
+    generated_at_utc TEXT,
+    route_count INTEGER,
+    routes_with_stop_coordinates INTEGER,
+    routes_with_fare INTEGER
+""",
+    ),
+    (
+        "prd_routes",
+        """
+    route_id INTEGER PRIMARY KEY,
+    route_number INTEGER NOT NULL UNIQUE,
+    route_code TEXT NOT NULL,
+    route_name TEXT NOT NULL,
+    fare_min_php REAL,
+    fare_max_php REAL,
+    fare_text TEXT,
+    stop_count INTEGER
+""",
+    ),
+    (
+        "prd_route_stops",
+        """
+    stop_id INTEGER PRIMARY KEY,
+    route_id INTEGER NOT NULL,
+    stop_order INTEGER NOT NULL,
+    stop_name TEXT,
+    lat REAL,
+    lng REAL,
+    FOREIGN KEY (route_id) REFERENCES prd_routes(route_id)
+""",
+    ),
+]
+
+# Route geometry backs the map_polylines of the prd_dataset_json view. The loader,
+# the dump and the delta scripts fill these tables; the upsert only creates them.
+PRD_GEOMETRY_SCHEMA = [
+    (
+        "prd_route_polylines",
+        """
+    polyline_id INTEGER PRIMARY KEY,
+    route_id INTEGER NOT NULL,
+    segment_index INTEGER NOT NULL,
+    segment_name TEXT,
+    point_count INTEGER,
+    FOREIGN KEY (route_id) REFERENCES prd_routes(route_id)
+""",
+    ),
+    (
+        "prd_route_points",
+        """
+    polyline_id INTEGER NOT NULL,
+    point_order INTEGER NOT NULL,
+    lat DOUBLE PRECISION,
+    lng DOUBLE PRECISION,
+    PRIMARY KEY (polyline_id, point_order),
+    FOREIGN KEY (polyline_id) REFERENCES prd_route_polylines(polyline_id)
+""",
+    ),
+]
+
+PRD_META_COLUMNS = [
+    "id",
+    "generated_at_utc",
+    "route_count",
+    "routes_with_stop_coordinates",
+    "routes_with_fare",
+]
+PRD_ROUTE_COLUMNS = [
+    "route_id",
+    "route_number",
+    "route_code",
+    "route_name",
+    "fare_min_php",
+    "fare_max_php",
+    "fare_text",
+    "stop_count",
+]
+PRD_STOP_COLUMNS = [
+    "stop_id",
+    "route_id",
+    "stop_order",
+    "stop_name",
+    "lat",
+    "lng",
+]
+
+
+def create_table_sql(table: str, body: str, if_not_exists=False):
+    guard = "IF NOT EXISTS " if if_not_exists else ""
+    return f"CREATE TABLE {guard}{table} ({body.rstrip()}\n);"
+
+
+def prd_meta_values(payload: dict):
+    return [
+        1,
+        payload.get("generated_at_utc"),
+        payload.get("route_count"),
+        payload.get("routes_with_stop_coordinates"),
+        payload.get("routes_with_fare"),
+    ]
+
+
+def prd_route_values(route: dict, route_id):
+    return [
+        route_id,
+        route.get("route_number"),
+        route.get("route_code"),
+        route.get("route_name"),
+        route.get("fare_min_php"),
+        route.get("fare_max_php"),
+        route.get("fare_text"),
+        route.get("stop_count"),
+    ]
+
+
+def prd_stop_values(stop: dict, stop_id, route_id):
+    return [
+        stop_id,
+        route_id,
+        stop.get("stop_order"),
+        stop.get("stop_name"),
+        stop.get("lat"),
+        stop.get("lng"),
+    ]
+
+
+PRD_POLYLINE_COLUMNS = ["polyline_id", "route_id", "segment_index", "segment_name", "point_count"]
+PRD_POINT_COLUMNS = ["polyline_id", "point_order", "lat", "lng"]
+
+# One row holding the whole dataset in the shape of prd_routes_dataset.json, so a
+# client needs a single select instead of one per table.
+PRD_DATASET_VIEW = "prd_dataset_json"
+PRD_DATASET_VIEW_SQL = """
+CREATE MATERIALIZED VIEW IF NOT EXISTS prd_dataset_json AS
+SELECT
+    m.id,
+    jsonb_build_object(
+        'generated_at_utc', m.generated_at_utc,
+        'route_count', m.route_count,
+        'routes_with_stop_coordinates', m.routes_with_stop_coordinates,
+        'routes_with_fare', m.routes_with_fare,
+        'routes', COALESCE((
+            SELECT jsonb_agg(
+                jsonb_build_object(
+                    'route_id', r.route_id,
+                    'route_number', r.route_number,
+                    'route_code', r.route_code,
+                    'route_name', r.route_name,
+                    'route_title', concat_ws(' ', r.route_code, r.route_name),
+                    'fare_min_php', r.fare_min_php,
+                    'fare_max_php', r.fare_max_php,
+                    'fare_text', r.fare_text,
+                    'stop_count', r.stop_count,
+                    'stops', COALESCE((
+                        SELECT jsonb_agg(
+                            jsonb_build_object(
+                                'stop_id', s.stop_id,
+                                'stop_order', s.stop_order,
+                                'stop_name', s.stop_name,
+                                'lat', s.lat,
+                                'lng', s.lng,
+                                'source_type', CASE WHEN s.lat IS NULL OR s.lng IS NULL THEN 'text_stop' ELSE 'map_marker' END,
+                                'has_coordinates', s.lat IS NOT NULL AND s.lng IS NOT NULL
+                            )
+                            ORDER BY s.stop_order
+                        )
+                        FROM prd_route_stops s
+                        WHERE s.route_id = r.route_id
+                    ), '[]'::jsonb),
+                    'map_polyline_count', (SELECT count(*) FROM prd_route_polylines p WHERE p.route_id = r.route_id),
+                    'map_point_count', COALESCE((SELECT sum(p.point_count) FROM prd_route_polylines p WHERE p.route_id = r.route_id), 0),
+                    'map_polylines', COALESCE((
+                        SELECT jsonb_agg(
+                            jsonb_build_object(
+                                'name', p.segment_name,
+                                'point_count', p.point_count,
+                                'coordinates_lat_lng', COALESCE((
+                                    SELECT jsonb_agg(jsonb_build_array(pt.lat, pt.lng) ORDER BY pt.point_order)
+                                    FROM prd_route_points pt
+                                    WHERE pt.polyline_id = p.polyline_id
+                                ), '[]'::jsonb)
+                            )
+                            ORDER BY p.segment_index
+                        )
+                        FROM prd_route_polylines p
+                        WHERE p.route_id = r.route_id
+                    ), '[]'::jsonb)
+                )
+                ORDER BY r.route_number
+            )
+            FROM prd_routes r
+        ), '[]'::jsonb)
+    ) AS payload
+FROM prd_meta m
+WHERE m.id = 1;
+""".strip()
+
+# For SQL scripts that may run against a database the loader never touched (no view yet).
+PRD_DATASET_VIEW_REFRESH_SQL = f"""
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_matviews WHERE matviewname = '{PRD_DATASET_VIEW}') THEN
+        REFRESH MATERIALIZED VIEW {PRD_DATASET_VIEW};
+    END IF;
+END
+$$;
+""".strip()
@@ -0,0 +1,254 @@
+import argparse
+import json
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from polyline_model import CompactPolyline
+from route_geometry import EARTH_RADIUS_M
+
+
+ROOT = Path(__file__).resolve().parent
+OUTPUT_DIR = ROOT / "output"
+
+PRD_JSON = OUTPUT_DIR / "prd_routes_dataset.json"
+
+DEFAULT_RADIUS_M = 400.0
+CHUNK_SIZE = 256
+# Below this many points the pool start-up costs more than it saves.
+PARALLEL_MIN_POINTS = 20000
+
+_INDEX = None
+
+
+def build_lookup_index(payload: dict):
+    # Every route becomes a run of segments in local metres: its polyline segments,
+    # plus each coordinate stop as a zero-length segment so routes without geometry
+    # still match. Runs are contiguous, so per-route minima are one reduceat.
+    coords = []
+    for route in payload.get("routes", []):
+        for polyline in route.get("map_polylines", []):
+            coords.extend(CompactPolyline.from_dict(polyline).lat_lng)
+        coords.extend((s["lat"], s["lng"]) for s in route.get("stops", []) if s.get("lat") is not None and s.get("lng") is not None)
+    lat0 = float(np.mean([c[0] for c in coords])) if coords else 0.0
+    lng0 = float(np.mean([c[1] for c in coords])) if coords else 0.0
+    k_lat = math.pi / 180.0 * EARTH_RADIUS_M
+    k_lng = math.cos(math.radians(lat0)) * k_lat
+
+    route_numbers = []
+    route_starts = []
+    segments = []
+    stops = []
+    stop_rows = []
+
+    for route in payload.get("routes", []):
+        route_segments = []
+        for polyline in route.get("map_polylines", []):
+            points = CompactPolyline.from_dict(polyline).lat_lng
+            route_segments.extend((a[0], a[1], b[0], b[1]) for a, b in zip(points, points[1:]))
+        for stop in route.get("stops", []):
+            if stop.get("lat") is None or stop.get("lng") is None:
+                continue
+            route_segments.append((stop["lat"], stop["lng"], stop["lat"], stop["lng"]))
+            stops.append((stop["lat"], stop["lng"]))
+            stop_rows.append((route.get("route_number"), stop.get("stop_order"), stop.get("stop_name")))
+        if not route_segments:
+            continue
+        route_numbers.append(route.get("route_number"))
+        route_starts.append(len(segments))
+        segments.extend(route_segments)
+
+    seg = np.array(segments, dtype=np.float64).reshape(-1, 4)
+    stop_array = np.array(stops, dtype=np.float64).reshape(-1, 2)
+    return {
+        "lat0": lat0,
+        "lng0": lng0,
+        "k_lat": k_lat,
+        "k_lng": k_lng,
+        "route_numbers": np.array(route_numbers, dtype=object),
+        "route_starts": np.array(route_starts, dtype=np.int64),
+        "ax": (seg[:, 1] - lng0) * k_lng,
+        "ay": (seg[:, 0] - lat0) * k_lat,
+        "bx": (seg[:, 3] - lng0) * k_lng,
+        "by": (seg[:, 2] - lat0) * k_lat,
+        "stop_x": (stop_array[:, 1] - lng0) * k_lng,
+        "stop_y": (stop_array[:, 0] - lat0) * k_lat,
+        "stop_rows": stop_rows,
+    }
+
+
+def _segment_distances(index, px, py):
+    ax, ay, bx, by = index["ax"], index["ay"], index["bx"], index["by"]
+    dx = bx - ax
+    dy = by - ay
+    seg_sq = dx * dx + dy * dy
+    rel_x = px[:, None] - ax[None, :]
+    rel_y = py[:, None] - ay[None, :]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        t = np.where(seg_sq > 0, (rel_x * dx + rel_y * dy) / seg_sq, 0.0)
+    np.clip(t, 0.0, 1.0, out=t)
+    return np.hypot(rel_x - t * dx, rel_y - t * dy)
+
+
+def lookup_chunk(index: dict, lats, lngs, radius_m=DEFAULT_RADIUS_M):
+    lats = np.asarray(lats, dtype=np.float64)
+    lngs = np.asarray(lngs, dtype=np.float64)
+    px = (lngs - index["lng0"]) * index["k_lng"]
+    py = (lats - index["lat0"]) * index["k_lat"]
+
+    results = []
+    if len(index["route_starts"]):
+        route_dist = np.minimum.reduceat(_segment_distances(index, px, py), index["route_starts"], axis=1)
+    else:
+        route_dist = np.empty((len(px), 0))
+    if len(index["stop_x"]):
+        stop_dist = np.hypot(px[:, None] - index["stop_x"][None, :], py[:, None] - index["stop_y"][None, :])
+        nearest_stop = stop_dist.argmin(axis=1)
+    else:
+        stop_dist = None
+
+    for i in range(len(px)):
+        near = np.flatnonzero(route_dist[i] <= radius_m)
+        near = near[np.argsort(route_dist[i][near], kind="stable")]
+        result = {
+            "routes": [
+                {"route_number": index["route_numbers"][r], "distance_m": round(float(route_dist[i][r]), 1)} for r in near
+            ],
+            "nearest_stop": None,
+        }
+        if stop_dist is not None:
+            s = nearest_stop[i]
+            route_number, stop_order, stop_name = index["stop_rows"][s]
+            result["nearest_stop"] = {
+                "route_number": route_number,
+                "stop_order": stop_order,
+                "stop_name": stop_name,
+                "distance_m": round(float(stop_dist[i][s]), 1),
+            }
+        results.append(result)
+    return results
+
+
+def _init_worker(index):
+    global _INDEX
+    _INDEX = index
+
+
+def _lookup_worker_chunk(args):
+    lats, lngs, radius_m = args
+    return lookup_chunk(_INDEX, lats, lngs, radius_m)
+
+
+def reverse_lookup(index: dict, lats, lngs, radius_m=DEFAULT_RADIUS_M, workers=None, chunk_size=CHUNK_SIZE):
+    lats = np.asarray(lats, dtype=np.float64)
+    lngs = np.asarray(lngs, dtype=np.float64)
+    chunks = [(lats[i : i + chunk_size], lngs[i : i + chunk_size], radius_m) for i in range(0, len(lats), chunk_size)]
+
+    if workers is None:
+        workers = os.cpu_count() if len(lats) >= PARALLEL_MIN_POINTS else 1
+    if workers == 1:
+        parts = [lookup_chunk(index, *chunk) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(index,)) as executor:
+            parts = list(executor.map(_lookup_worker_chunk, chunks))
+    return [result for part in parts for result in part]
+
+
+def build_partitioned_index(payload: dict):
+    # One index per source/city. A point is only looked up in the partitions whose
+    # bounding box, grown by the search radius, contains it.
+    groups = {}
+    for route in payload.get("routes", []):
+        groups.setdefault(route.get("source_id"), []).append(route)
+
+    partitions = []
+    for source_id, routes in groups.items():
+        index = build_lookup_index({"routes": routes})
+        if not len(index["route_starts"]):
+            continue
+        xs = np.concatenate([index["ax"], index["bx"]])
+        ys = np.concatenate([index["ay"], index["by"]])
+        index["source_id"] = source_id
+        index["bbox_m"] = (float(xs.min()), float(ys.min()), float(xs.max()), float(ys.max()))
+        partitions.append(index)
+    return partitions
+
+
+def _partition_mask(index, lats, lngs, radius_m):
+    min_x, min_y, max_x, max_y = index["bbox_m"]
+    px = (lngs - index["lng0"]) * index["k_lng"]
+    py = (lats - index["lat0"]) * index["k_lat"]
+    return (px >= min_x - radius_m) & (px <= max_x + radius_m) & (py >= min_y - radius_m) & (py <= max_y + radius_m)
+
+
+def partitioned_reverse_lookup(partitions, lats, lngs, radius_m=DEFAULT_RADIUS_M, workers=None, chunk_size=CHUNK_SIZE):
+    lats = np.asarray(lats, dtype=np.float64)
+    lngs = np.asarray(lngs, dtype=np.float64)
+    results = [{"routes": [], "nearest_stop": None} for _ in range(len(lats))]
+
+    for index in partitions:
+        rows = np.flatnonzero(_partition_mask(index, lats, lngs, radius_m))
+        if not rows.size:
+            continue
+        found = reverse_lookup(index, lats[rows], lngs[rows], radius_m, workers=workers, chunk_size=chunk_size)
+        for row, result in zip(rows, found):
+            merged = results[row]
+            merged["routes"].extend(result["routes"])
+            stop = result["nearest_stop"]
+            if stop is not None and (merged["nearest_stop"] is None or stop["distance_m"] < merged["nearest_stop"]["distance_m"]):
+                merged["nearest_stop"] = stop
+
+    if len(partitions) > 1:
+        for result in results:
+            result["routes"].sort(key=lambda r: r["distance_m"])
+    return results
+
+
+def load_points_csv(path: Path):
+    frame = pd.read_csv(path)
+    columns = {c.lower(): c for c in frame.columns}
+    lat_column = columns.get("lat") or columns.get("latitude")
+    lng_column = columns.get("lng") or columns.get("lon") or columns.get("longitude")
+    if lat_column is None or lng_column is None:
+        raise ValueError(f"{path} needs lat and lng columns (got {', '.join(frame.columns)})")
+    return frame, frame[lat_column].to_numpy(dtype=np.float64), frame[lng_column].to_numpy(dtype=np.float64)
+
+
+def results_frame(frame: pd.DataFrame, results):
+    out = frame.copy()
+    out["route_count"] = [len(r["routes"]) for r in results]
+    out["route_numbers"] = [";".join(str(x["route_number"]) for x in r["routes"]) for r in results]
+    out["route_distances_m"] = [";".join(str(x["distance_m"]) for x in r["routes"]) for r in results]
+    for key in ("route_number", "stop_order", "stop_name", "distance_m"):
+        out[f"nearest_stop_{key}"] = [(r["nearest_stop"] or {}).get(key) for r in results]
+    return out
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Find the routes and nearest stop around many points at once.")
+    parser.add_argument("points", type=Path, help="CSV with lat/lng (or latitude/longitude) columns")
+    parser.add_argument("--dataset", type=Path, default=PRD_JSON)
+    parser.add_argument("--radius", type=float, default=DEFAULT_RADIUS_M, help="metres")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--output", type=Path, default=None)
+    args = parser.parse_args()
+
+    payload = json.loads(args.dataset.read_text(encoding="utf-8"))
+    partitions = build_partitioned_index(payload)
+    frame, lats, lngs = load_points_csv(args.points)
+    results = partitioned_reverse_lookup(partitions, lats, lngs, radius_m=args.radius, workers=args.workers)
+
+    output = args.output or OUTPUT_DIR / f"{args.points.stem}_route_lookup.csv"
+    results_frame(frame, results).to_csv(output, index=False, encoding="utf-8")
+
+    matched = sum(1 for r in results if r["routes"])
+    print(f"Saved: {output}")
+    print(f"Points: {len(results)}, with a route within {args.radius:g} m: {matched}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+import math
+from array import array
+from bisect import bisect_right
+
+from polyline_model import CompactPolyline
+
+
+EARTH_RADIUS_M = 6371000.0
+
+# A stop can sit at any nearest approach within this much of its closest one, so a
+# stop on a road the route passes twice may take either pass.
+CANDIDATE_SLACK_M = 60.0
+# Cost, in metres of offset, of leaving a stop unplaced when no in-order spot fits.
+SKIP_COST_M = 500.0
+
+
+def haversine_m(lat1, lng1, lat2, lng2):
+    r_lat1 = math.radians(lat1)
+    r_lat2 = math.radians(lat2)
+    d_lat = r_lat2 - r_lat1
+    d_lng = math.radians(lng2 - lng1)
+    a = math.sin(d_lat / 2) ** 2 + math.cos(r_lat1) * math.cos(r_lat2) * math.sin(d_lng / 2) ** 2
+    return EARTH_RADIUS_M * 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+
+
+def _reversed(piece):
+    lats, lngs = piece
+    return array("d", reversed(lats)), array("d", reversed(lngs))
+
+
+def chain_polylines(polylines):
+    # KML segments come in no particular order or direction. Starting from the
+    # first one, repeatedly attach the remaining segment whose nearer end is
+    # closest to either end of the chain, flipping it when needed, so any gap
+    # left between pieces is the shortest one rather than a jump across the map.
+    pieces = []
+    for polyline in polylines:
+        compact = CompactPolyline.from_dict(polyline)
+        if len(compact):
+            pieces.append((compact.lats(), compact.lngs()))
+    if not pieces:
+        return []
+
+    chain = [pieces[0]]
+    remaining = pieces[1:]
+    while remaining:
+        head_lat, head_lng = chain[0][0][0], chain[0][1][0]
+        tail_lat, tail_lng = chain[-1][0][-1], chain[-1][1][-1]
+        best = None
+        for index, (lats, lngs) in enumerate(remaining):
+            options = (
+                (haversine_m(tail_lat, tail_lng, lats[0], lngs[0]), False, False),
+                (haversine_m(tail_lat, tail_lng, lats[-1], lngs[-1]), False, True),
+                (haversine_m(head_lat, head_lng, lats[-1], lngs[-1]), True, False),
+                (haversine_m(head_lat, head_lng, lats[0], lngs[0]), True, True),
+            )
+            for gap_m, prepend, flip in options:
+                if best is None or gap_m < best[0]:
+                    best = (gap_m, index, prepend, flip)
+        _, index, prepend, flip = best
+        piece = remaining.pop(index)
+        if flip:
+            piece = _reversed(piece)
+        if prepend:
+            chain.insert(0, piece)
+        else:
+            chain.append(piece)
+    return chain
+
+
+def route_path(route: dict):
+    lats = array("d")
+    lngs = array("d")
+    for piece_lats, piece_lngs in chain_polylines(route.get("map_polylines", [])):
+        lats.extend(piece_lats)
+        lngs.extend(piece_lngs)
+    return lats, lngs
+
+
+def cumulative_distances(lats, lngs):
+    cumulative = array("d", [0.0] * len(lats))
+    total = 0.0
+    for i in range(1, len(lats)):
+        total += haversine_m(lats[i - 1], lngs[i - 1], lats[i], lngs[i])
+        cumulative[i] = total
+    return cumulative
+
+
+def _segment_projections(lat, lng, lats, lngs, cumulative):
+    # (chainage, offset) of the point's projection onto each segment of the path.
+    # Local equirectangular projection is accurate to well under a metre at city scale.
+    k_lng = math.cos(math.radians(lat)) * math.pi / 180.0 * EARTH_RADIUS_M
+    k_lat = math.pi / 180.0 * EARTH_RADIUS_M
+
+    out = []
+    for i in range(1, len(lats)):
+        ax = (lngs[i - 1] - lng) * k_lng
+        ay = (lats[i - 1] - lat) * k_lat
+        bx = (lngs[i] - lng) * k_lng
+        by = (lats[i] - lat) * k_lat
+        dx = bx - ax
+        dy = by - ay
+        seg_sq = dx * dx + dy * dy
+        t = 0.0 if seg_sq == 0 else max(0.0, min(1.0, -(ax * dx + ay * dy) / seg_sq))
+        px = ax + t * dx
+        py = ay + t * dy
+        out.append((cumulative[i - 1] + t * (cumulative[i] - cumulative[i - 1]), math.sqrt(px * px + py * py)))
+    return out
+
+
+def project_onto_path(lat, lng, lats, lngs, cumulative):
+    if not lats:
+        return None, None
+    if len(lats) == 1:
+        return 0.0, haversine_m(lat, lng, lats[0], lngs[0])
+    return min(_segment_projections(lat, lng, lats, lngs, cumulative), key=lambda p: p[1])
+
+
+def path_candidates(lat, lng, lats, lngs, cumulative, slack_m=CANDIDATE_SLACK_M):
+    # Every local nearest approach of the point to the path (one per pass of the
+    # path by the point), within slack_m of the closest.
+    if len(lats) < 2:
+        return [] if not lats else [(0.0, haversine_m(lat, lng, lats[0], lngs[0]))]
+    projections = _segment_projections(lat, lng, lats, lngs, cumulative)
+    limit = min(offset for _, offset in projections) + slack_m
+    out = []
+    for i, (chainage, offset) in enumerate(projections):
+        if offset > limit:
+            continue
+        # Two segments meeting at the nearest vertex give the same approach twice.
+        if i > 0 and (projections[i - 1][1] < offset or projections[i - 1] == (chainage, offset)):
+            continue
+        if i + 1 < len(projections) and projections[i + 1][1] < offset:
+            continue
+        out.append((chainage, offset))
+    return out
+
+
+def _place_in_order(options):
+    # options: per stop, sorted (chainage, offset) candidates or None. Keeps a frontier
+    # of (last chainage, cost, placements) where no state is beaten on both chainage
+    # and cost, so the cheapest non-decreasing placement survives.
+    frontier = [(-math.inf, 0.0, ())]
+    for candidates in options:
+        if candidates is None:
+            frontier = [(c, cost, placed + (None,)) for c, cost, placed in frontier]
+            continue
+        states = [(c, cost + SKIP_COST_M, placed + (None,)) for c, cost, placed in frontier]
+        for chainage, offset in candidates:
+            reachable = [state for state in frontier if state[0] <= chainage]
+            if reachable:
+                _, cost, placed = min(reachable, key=lambda state: state[1])
+                states.append((chainage, cost + offset, placed + (chainage,)))
+        states.sort(key=lambda state: (state[0], state[1]))
+        frontier = []
+        for state in states:
+            if not frontier or state[1] < frontier[-1][1]:
+                frontier.append(state)
+    _, cost, placed = min(frontier, key=lambda state: state[1])
+    return cost, list(placed)
+
+
+def place_stops(points, lats, lngs, cumulative, cyclic=False):
+    # Chainage of each stop (None without coordinates or a fitting spot), taken in
+    # stop order: a stop nearest to two passes of the path takes the one that keeps
+    # the order. The path may run against the stop order. A cyclic route may start
+    # anywhere on its path, so its stops are placed on one lap starting at the first
+    # placed stop, and chainage counts from there.
+    length = cumulative[-1]
+    candidates = [None if p is None else path_candidates(p[0], p[1], lats, lngs, cumulative) for p in points]
+    first = next((i for i, c in enumerate(candidates) if c), None)
+    if first is None:
+        return [None] * len(points)
+
+    best = None
+    for reverse in (False, True):
+        directed = [
+            None if c is None else sorted((length - chainage if reverse else chainage, offset) for chainage, offset in c)
+            for c in candidates
+        ]
+        if not cyclic:
+            cost, placed = _place_in_order(directed)
+            if best is None or cost < best[0]:
+                best = (cost, placed)
+            continue
+
+        laps = [None if c is None else c + [(chainage + length, offset) for chainage, offset in c] for c in directed]
+        for start, start_offset in directed[first]:
+            options = [
+                None if c is None else [(chainage - start, offset) for chainage, offset in c if start <= chainage <= start + length]
+                for c in laps
+            ]
+            options[first] = [(0.0, start_offset)]
+            cost, placed = _place_in_order(options)
+            if best is None or cost < best[0]:
+                best = (cost, placed)
+    return best[1]
+
+
+def point_at_chainage(chainage, lats, lngs, cumulative):
+    if not lats:
+        return None
+    if chainage <= 0:
+        return lats[0], lngs[0]
+    if chainage >= cumulative[-1]:
+        return lats[-1], lngs[-1]
+
+    i = bisect_right(cumulative, chainage)
+    span = cumulative[i] - cumulative[i - 1]
+    t = 0.0 if span == 0 else (chainage - cumulative[i - 1]) / span
+    return (
+        lats[i - 1] + t * (lats[i] - lats[i - 1]),
+        lngs[i - 1] + t * (lngs[i] - lngs[i - 1]),
+    )
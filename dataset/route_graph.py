@@ -0,0 +1,465 @@
+import gzip
+import heapq
+import json
+import math
+import random
+import time
+from array import array
+from pathlib import Path
+
+from fare_engine import build_route_profile, trip_distance_m
+from journey_table import TRANSFER_RADIUS_M, stop_key
+from json_output import dumps
+from route_geometry import EARTH_RADIUS_M, haversine_m
+from route_topology import CYCLIC_TOPOLOGIES
+
+
+ROOT = Path(__file__).resolve().parent
+OUTPUT_DIR = ROOT / "output"
+
+PRD_JSON = OUTPUT_DIR / "prd_routes_dataset.json"
+ROUTE_GRAPH = OUTPUT_DIR / "prd_route_graph.json.gz"
+
+RIDE_SPEED_MPS = 15.0 / 3.6
+WALK_SPEED_MPS = 4.5 / 3.6
+TRANSFER_PENALTY_S = 300.0
+WITNESS_SETTLE_LIMIT = 500
+
+RIDE = 0
+WALK = 1
+SHORTCUT = 2
+
+
+def build_csr(node_count, edges):
+    # edges: (source, target, weight, kind); parallel edges keep the cheapest one.
+    best = {}
+    for u, v, w, kind in edges:
+        if u == v:
+            continue
+        previous = best.get((u, v))
+        if previous is None or w < previous[0]:
+            best[(u, v)] = (w, kind)
+
+    indptr = array("l", [0] * (node_count + 1))
+    for u, _ in best:
+        indptr[u + 1] += 1
+    for i in range(node_count):
+        indptr[i + 1] += indptr[i]
+
+    targets = array("l", [0] * len(best))
+    weights = array("d", [0.0] * len(best))
+    kinds = array("b", [0] * len(best))
+    cursor = array("l", indptr[:-1])
+    for (u, v), (w, kind) in sorted(best.items()):
+        pos = cursor[u]
+        targets[pos] = v
+        weights[pos] = w
+        kinds[pos] = kind
+        cursor[u] = pos + 1
+    return indptr, targets, weights, kinds
+
+
+def walk_links(lats, lngs, keys, node_route, radius_m=TRANSFER_RADIUS_M):
+    # Grid buckets one radius wide: only the 3x3 neighbourhood of a stop is compared.
+    cell_lat = radius_m / (math.pi / 180.0 * EARTH_RADIUS_M)
+    buckets = {}
+    for node, (lat, lng) in enumerate(zip(lats, lngs)):
+        if not math.isnan(lat):
+            cell_lng = cell_lat / max(math.cos(math.radians(lat)), 1e-6)
+            buckets.setdefault((int(lat // cell_lat), int(lng // cell_lng)), []).append(node)
+
+    links = {}
+    for (cy, cx), nodes in buckets.items():
+        nearby = [n for dy in (-1, 0, 1) for dx in (-1, 0, 1) for n in buckets.get((cy + dy, cx + dx), ())]
+        for a in nodes:
+            for b in nearby:
+                if node_route[a] == node_route[b]:
+                    continue
+                walk_m = haversine_m(lats[a], lngs[a], lats[b], lngs[b])
+                if walk_m <= radius_m:
+                    links[(a, b)] = walk_m
+
+    # Stops sharing a name are treated as the same place, coordinates or not.
+    by_key = {}
+    for node, key in enumerate(keys):
+        if key:
+            by_key.setdefault(key, []).append(node)
+    for nodes in by_key.values():
+        for a in nodes:
+            for b in nodes:
+                if node_route[a] != node_route[b]:
+                    links[(a, b)] = 0.0
+    return links
+
+
+def build_route_graph(payload: dict, radius_m=TRANSFER_RADIUS_M):
+    node_route = []
+    node_stop = []
+    names = []
+    lats = array("d")
+    lngs = array("d")
+    edges = []
+
+    for route in payload.get("routes", []):
+        stops = route.get("stops", [])
+        if not stops:
+            continue
+        profile = build_route_profile(route)
+        first = len(node_route)
+        for i, stop in enumerate(stops):
+            node_route.append(route.get("route_number"))
+            node_stop.append(i)
+            names.append(stop.get("stop_name"))
+            has_coordinates = stop.get("lat") is not None and stop.get("lng") is not None
+            lats.append(stop["lat"] if has_coordinates else math.nan)
+            lngs.append(stop["lng"] if has_coordinates else math.nan)
+
+        # Ride edges follow the stop order; distances come from the polyline chainage.
+        # Cyclic routes wrap back past the terminal; the rest also run in reverse.
+        hops = [(i, i + 1) for i in range(len(stops) - 1)]
+        if route.get("topology") in CYCLIC_TOPOLOGIES and len(stops) > 1:
+            hops.append((len(stops) - 1, len(stops) - route["cycle_length"]))
+        else:
+            hops.extend((i + 1, i) for i in range(len(stops) - 1))
+        for a, b in hops:
+            distance_m = trip_distance_m(profile, a, b)
+            if distance_m is not None:
+                edges.append((first + a, first + b, distance_m / RIDE_SPEED_MPS, RIDE))
+
+    keys = [stop_key(name) for name in names]
+    for (a, b), walk_m in walk_links(lats, lngs, keys, node_route, radius_m).items():
+        edges.append((a, b, walk_m / WALK_SPEED_MPS + TRANSFER_PENALTY_S, WALK))
+
+    # A* lower bound: the cheapest seconds per straight-line metre over any edge. Riding
+    # speed alone is not enough, since same-name walk links join distant stops for a
+    # flat transfer penalty.
+    s_per_m = 1.0 / RIDE_SPEED_MPS
+    for a, b, w, _ in edges:
+        if not math.isnan(lats[a]) and not math.isnan(lats[b]):
+            span_m = haversine_m(lats[a], lngs[a], lats[b], lngs[b])
+            if span_m > 0:
+                s_per_m = min(s_per_m, w / span_m)
+
+    indptr, targets, weights, kinds = build_csr(len(node_route), edges)
+    return {
+        "node_route": node_route,
+        "node_stop": node_stop,
+        "node_name": names,
+        "lat": lats,
+        "lng": lngs,
+        "indptr": indptr,
+        "targets": targets,
+        "weights": weights,
+        "kinds": kinds,
+        "heuristic_s_per_m": s_per_m,
+    }
+
+
+def _unwind(parents, source, target):
+    path = [target]
+    while path[-1] != source:
+        path.append(parents[path[-1]])
+    path.reverse()
+    return path
+
+
+def dijkstra(graph: dict, source: int, target: int):
+    indptr, targets, weights = graph["indptr"], graph["targets"], graph["weights"]
+    dist = {source: 0.0}
+    parents = {}
+    heap = [(0.0, source)]
+    while heap:
+        d, u = heapq.heappop(heap)
+        if u == target:
+            return d, _unwind(parents, source, target)
+        if d > dist[u]:
+            continue
+        for pos in range(indptr[u], indptr[u + 1]):
+            v = targets[pos]
+            nd = d + weights[pos]
+            if nd < dist.get(v, math.inf):
+                dist[v] = nd
+                parents[v] = u
+                heapq.heappush(heap, (nd, v))
+    return None, []
+
+
+def astar(graph: dict, source: int, target: int):
+    # Straight-line distance times the cheapest edge cost per metre never overestimates
+    # the remaining time, and no edge drops h by more than its own cost (consistent).
+    # Stops without coordinates get h = 0, so nodes may be reopened; the result stays optimal.
+    indptr, targets, weights = graph["indptr"], graph["targets"], graph["weights"]
+    lats, lngs = graph["lat"], graph["lng"]
+    t_lat, t_lng = lats[target], lngs[target]
+    target_known = not math.isnan(t_lat)
+    s_per_m = graph.get("heuristic_s_per_m", 1.0 / RIDE_SPEED_MPS)
+
+    def h(node):
+        if not target_known or math.isnan(lats[node]):
+            return 0.0
+        return haversine_m(lats[node], lngs[node], t_lat, t_lng) * s_per_m
+
+    dist = {source: 0.0}
+    parents = {}
+    heap = [(h(source), 0.0, source)]
+    while heap:
+        _, d, u = heapq.heappop(heap)
+        if u == target:
+            return d, _unwind(parents, source, target)
+        if d > dist[u]:
+            continue
+        for pos in range(indptr[u], indptr[u + 1]):
+            v = targets[pos]
+            nd = d + weights[pos]
+            if nd < dist.get(v, math.inf):
+                dist[v] = nd
+                parents[v] = u
+                heapq.heappush(heap, (nd + h(v), nd, v))
+    return None, []
+
+
+def _witnesses(out_edges, source, skip, limits):
+    # Bounded Dijkstra from source that avoids `skip`: the targets it reaches within
+    # their limit already have a path as short as the would-be shortcut.
+    dist = {source: 0.0}
+    heap = [(0.0, source)]
+    found = set()
+    settled = 0
+    max_limit = max(limits.values())
+    while heap and settled < WITNESS_SETTLE_LIMIT:
+        d, u = heapq.heappop(heap)
+        if d > max_limit:
+            break
+        if d > dist[u]:
+            continue
+        settled += 1
+        if u in limits and d <= limits[u]:
+            found.add(u)
+            if len(found) == len(limits):
+                break
+        for v, w in out_edges[u].items():
+            if v == skip:
+                continue
+            nd = d + w
+            if nd < dist.get(v, math.inf):
+                dist[v] = nd
+                heapq.heappush(heap, (nd, v))
+    return found
+
+
+def _shortcuts(node, out_edges, in_edges):
+    shortcuts = []
+    for u, cost_in in in_edges[node].items():
+        limits = {w: cost_in + c for w, c in out_edges[node].items() if w != u}
+        if not limits:
+            continue
+        witnessed = _witnesses(out_edges, u, node, limits)
+        shortcuts.extend((u, w, cost) for w, cost in limits.items() if w not in witnessed)
+    return shortcuts
+
+
+def contract_graph(graph: dict):
+    # Contraction hierarchies: nodes are removed cheapest-first (edge difference plus
+    # contracted neighbours), adding shortcut edges where no witness path exists.
+    # out_edges/in_edges only ever hold the not-yet-contracted part of the graph.
+    node_count = len(graph["node_route"])
+    indptr, targets, weights, kinds = graph["indptr"], graph["targets"], graph["weights"], graph["kinds"]
+    out_edges = [dict() for _ in range(node_count)]
+    in_edges = [dict() for _ in range(node_count)]
+    edge_kinds = {}
+    for u in range(node_count):
+        for pos in range(indptr[u], indptr[u + 1]):
+            v = targets[pos]
+            out_edges[u][v] = weights[pos]
+            in_edges[v][u] = weights[pos]
+            edge_kinds[(u, v)] = kinds[pos]
+
+    deleted_neighbours = [0] * node_count
+    middles = {}
+    up_edges = []
+    down_edges = []
+
+    def priority(node):
+        shortcuts = _shortcuts(node, out_edges, in_edges)
+        return len(shortcuts) - len(out_edges[node]) - len(in_edges[node]) + deleted_neighbours[node]
+
+    heap = [(priority(node), node) for node in range(node_count)]
+    heapq.heapify(heap)
+    rank = [None] * node_count
+    order = 0
+    while heap:
+        _, node = heapq.heappop(heap)
+        if rank[node] is not None:
+            continue
+        # Lazy update: re-evaluate and push back if the node is no longer the cheapest.
+        current = priority(node)
+        if heap and current > heap[0][0]:
+            heapq.heappush(heap, (current, node))
+            continue
+
+        for u, w, cost in _shortcuts(node, out_edges, in_edges):
+            if cost < out_edges[u].get(w, math.inf):
+                out_edges[u][w] = cost
+                in_edges[w][u] = cost
+                middles[(u, w)] = node
+
+        # Every remaining neighbour ranks higher: outgoing edges join the upward graph,
+        # incoming ones the downward graph (stored reversed so both searches climb).
+        for w, cost in out_edges[node].items():
+            up_edges.append((node, w, cost, SHORTCUT if (node, w) in middles else edge_kinds[(node, w)]))
+            del in_edges[w][node]
+        for u, cost in in_edges[node].items():
+            down_edges.append((node, u, cost, SHORTCUT if (u, node) in middles else edge_kinds[(u, node)]))
+            del out_edges[u][node]
+        for neighbour in out_edges[node].keys() | in_edges[node].keys():
+            deleted_neighbours[neighbour] += 1
+        out_edges[node] = {}
+        in_edges[node] = {}
+        rank[node] = order
+        order += 1
+
+    return {
+        "rank": rank,
+        "up": build_csr(node_count, up_edges),
+        "down": build_csr(node_count, down_edges),
+        "middles": middles,
+        "shortcut_count": len(middles),
+    }
+
+
+def _unpack(middles, u, v, out):
+    middle = middles.get((u, v))
+    if middle is None:
+        out.append(v)
+        return
+    _unpack(middles, u, middle, out)
+    _unpack(middles, middle, v, out)
+
+
+def ch_query(ch: dict, source: int, target: int):
+    # Bidirectional Dijkstra where both sides only climb in rank; a side stops once
+    # its frontier is past the best meeting cost found so far.
+    csrs = (ch["up"], ch["down"])
+    dist = ({source: 0.0}, {target: 0.0})
+    parents = ({}, {})
+    heaps = ([(0.0, source)], [(0.0, target)])
+    best = math.inf
+    meeting = None
+
+    while (heaps[0] and heaps[0][0][0] < best) or (heaps[1] and heaps[1][0][0] < best):
+        for side in (0, 1):
+            heap = heaps[side]
+            if not heap or heap[0][0] >= best:
+                continue
+            d, u = heapq.heappop(heap)
+            if d > dist[side][u]:
+                continue
+            other = dist[1 - side].get(u)
+            if other is not None and d + other < best:
+                best = d + other
+                meeting = u
+            indptr, targets, weights, _ = csrs[side]
+            for pos in range(indptr[u], indptr[u + 1]):
+                v = targets[pos]
+                nd = d + weights[pos]
+                if nd < dist[side].get(v, math.inf):
+                    dist[side][v] = nd
+                    parents[side][v] = u
+                    heapq.heappush(heap, (nd, v))
+
+    if meeting is None:
+        return None, []
+
+    up_path = _unwind(parents[0], source, meeting)
+    down_path = _unwind(parents[1], target, meeting)
+    down_path.reverse()
+
+    path = [source]
+    for u, v in zip(up_path, up_path[1:]):
+        _unpack(ch["middles"], u, v, path)
+    for u, v in zip(down_path, down_path[1:]):
+        _unpack(ch["middles"], u, v, path)
+    return best, path
+
+
+def describe_path(graph: dict, path):
+    legs = []
+    for u in path:
+        route_number = graph["node_route"][u]
+        if legs and legs[-1]["route_number"] == route_number:
+            legs[-1]["alight_index"] = graph["node_stop"][u]
+            legs[-1]["alight_stop"] = graph["node_name"][u]
+            continue
+        legs.append(
+            {
+                "route_number": route_number,
+                "board_index": graph["node_stop"][u],
+                "board_stop": graph["node_name"][u],
+                "alight_index": graph["node_stop"][u],
+                "alight_stop": graph["node_name"][u],
+            }
+        )
+    return [leg for leg in legs if leg["board_index"] != leg["alight_index"]]
+
+
+def write_route_graph(graph: dict, ch: dict, path: Path = ROUTE_GRAPH):
+    def csr_lists(csr):
+        return [list(part) for part in csr]
+
+    data = {
+        "node_route": graph["node_route"],
+        "node_stop": graph["node_stop"],
+        "node_name": graph["node_name"],
+        "lat": [None if math.isnan(v) else v for v in graph["lat"]],
+        "lng": [None if math.isnan(v) else v for v in graph["lng"]],
+        "csr_fields": ["indptr", "targets", "weights", "kinds"],
+        "graph": csr_lists((graph["indptr"], graph["targets"], graph["weights"], graph["kinds"])),
+        "rank": ch["rank"],
+        "up": csr_lists(ch["up"]),
+        "down": csr_lists(ch["down"]),
+        "shortcut_middles": [[u, v, m] for (u, v), m in sorted(ch["middles"].items())],
+        "heuristic_s_per_m": graph["heuristic_s_per_m"],
+    }
+    raw = dumps(data)
+    with open(path, "wb") as fh:
+        with gzip.GzipFile(fileobj=fh, mode="wb", compresslevel=9, mtime=0) as gz:
+            gz.write(raw)
+    return len(raw)
+
+
+def main():
+    if not PRD_JSON.exists():
+        raise FileNotFoundError(f"Missing {PRD_JSON}")
+
+    payload = json.loads(PRD_JSON.read_text(encoding="utf-8"))
+
+    started = time.perf_counter()
+    graph = build_route_graph(payload)
+    built = time.perf_counter()
+    ch = contract_graph(graph)
+    contracted = time.perf_counter()
+    raw_size = write_route_graph(graph, ch)
+
+    kinds = graph["kinds"]
+    print(f"Saved: {ROUTE_GRAPH} ({raw_size} bytes raw)")
+    print(f"Nodes: {len(graph['node_route'])}")
+    print(f"Ride edges: {sum(1 for k in kinds if k == RIDE)}, walk edges: {sum(1 for k in kinds if k == WALK)}")
+    print(f"Shortcuts: {ch['shortcut_count']}")
+    print(f"Build time: {built - started:.2f}s, contraction: {contracted - built:.2f}s")
+
+    # Most text-only stops have no ride edges; show the first reachable random pair.
+    nodes = len(graph["node_route"])
+    rng = random.Random(25)
+    for _ in range(200 if nodes > 1 else 0):
+        source, target = rng.randrange(nodes), rng.randrange(nodes)
+        cost, path = ch_query(ch, source, target)
+        legs = describe_path(graph, path) if cost is not None else []
+        if legs:
+            print(f"Sample query {source} -> {target}: {cost / 60:.1f} min")
+            for leg in legs:
+                print(f"  ROUTE {leg['route_number']}: {leg['board_stop']} -> {leg['alight_stop']}")
+            break
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+import re
+from urllib.parse import urljoin
+
+import lxml.html
+
+from guide_extraction import element_text
+
+
+ROUTE_HEADER_PATTERN = re.compile(r"^ROUTE\s*#?\s*(\d+)\b", flags=re.IGNORECASE)
+ROUTE_NUMBER_PATTERN = re.compile(r"\bROUTE\s*#?\s*(\d+)\b", flags=re.IGNORECASE)
+
+CONTENT_XPATHS = (
+    "//article//*[contains(concat(' ', normalize-space(@class), ' '), ' entry-content ')]",
+    "//*[contains(concat(' ', normalize-space(@class), ' '), ' entry-content ')]",
+)
+
+
+def parse_route_number(text: str):
+    match = ROUTE_NUMBER_PATTERN.search(text or "")
+    return int(match.group(1)) if match else None
+
+
+def find_content_root(root):
+    for xpath in CONTENT_XPATHS:
+        found = root.xpath(xpath)
+        if found:
+            return found[0]
+    return root
+
+
+def _first_links(node):
+    # One descendant scan yields both the first anchor and the first iframe.
+    anchor_href = None
+    iframe_src = None
+    for child in node.iterdescendants():
+        tag = child.tag
+        if anchor_href is None and tag == "a" and child.get("href") is not None:
+            anchor_href = child.get("href")
+        elif iframe_src is None and tag == "iframe" and child.get("src") is not None:
+            iframe_src = child.get("src")
+        if anchor_href is not None and iframe_src is not None:
+            break
+    return anchor_href, iframe_src
+
+
+def new_route_section(heading, route_title: str, base_url: str):
+    return {
+        "route_number": parse_route_number(route_title),
+        "route_title": route_title,
+        "section_id": heading.get("id"),
+        "source_url": base_url,
+        "stop_description": None,
+        "stops": [],
+        "full_guide_url": None,
+        "map_embed_url": None,
+        "map_mid": None,
+        "map_kml_url": None,
+        "map_polylines": [],
+        "map_polyline_count": 0,
+        "map_point_count": 0,
+        "map_scrape_error": None,
+        "faq_url": None,
+    }
+
+
+def _absorb(section: dict, node, text: str, base_url: str):
+    tag = node.tag
+    lowered = text.lower()
+    anchor_href, iframe_src = _first_links(node)
+
+    if not section["full_guide_url"] and tag in {"p", "h3", "h4"} and "full guide" in lowered:
+        if anchor_href is not None:
+            section["full_guide_url"] = urljoin(base_url, anchor_href)
+
+    if tag == "p" and text and not section["stop_description"]:
+        if not lowered.startswith("full guide") and not lowered.startswith("read also"):
+            section["stop_description"] = text
+
+    if iframe_src is not None and not section["map_embed_url"]:
+        section["map_embed_url"] = urljoin(base_url, iframe_src)
+
+    if tag in {"h4", "p"} and "faq" in lowered and not section["faq_url"]:
+        if anchor_href is not None:
+            section["faq_url"] = urljoin(base_url, anchor_href)
+
+
+def _is_route_block_heading(node) -> bool:
+    return node.tag == "h2" and "wp-block-heading" in (node.get("class") or "").split()
+
+
+def split_route_sections(html: str, base_url: str):
+    root = lxml.html.document_fromstring(html)
+    content = find_content_root(root)
+
+    # Route headings may sit under different parents; each parent's children are
+    # walked exactly once, switching sections at every ROUTE h2.
+    parents = []
+    for heading in content.iter("h2"):
+        if _is_route_block_heading(heading):
+            parent = heading.getparent()
+            if parent is not None and all(p is not parent for p in parents):
+                parents.append(parent)
+
+    sections = []
+    for parent in parents:
+        current = None
+        for node in parent.iterchildren():
+            if not isinstance(node.tag, str):
+                continue
+
+            text = element_text(node)
+            if node.tag == "h2" and ROUTE_HEADER_PATTERN.match(text):
+                current = None
+                if _is_route_block_heading(node):
+                    current = new_route_section(node, text, base_url)
+                    sections.append(current)
+                continue
+
+            if current is not None:
+                _absorb(current, node, text, base_url)
+
+    return sections
@@ -0,0 +1,212 @@
+import json
+import types
+import typing
+from dataclasses import dataclass, field, fields, is_dataclass
+from pathlib import Path
+
+from polyline_model import CompactPolyline
+
+try:
+    import orjson
+except ImportError:  # optional; stdlib json is the fallback
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # optional; the plain decoder below builds the same models
+    msgspec = None
+
+
+ROOT = Path(__file__).resolve().parent
+OUTPUT_DIR = ROOT / "output"
+
+PRD_JSON = OUTPUT_DIR / "prd_routes_dataset.json"
+INDEX_JSON = OUTPUT_DIR / "iloilo_routes_index.json"
+FULL_GUIDES_JSON = OUTPUT_DIR / "iloilo_full_guides.json"
+
+
+# Field order follows the JSON writers, so model_to_dict() reproduces their key order.
+# Polylines decode into CompactPolyline: one array('d') per polyline instead of a
+# list of two-float lists.
+@dataclass(slots=True)
+class Stop:
+    stop_id: int | None = None
+    stop_order: int | None = None
+    stop_name: str | None = None
+    lat: float | None = None
+    lng: float | None = None
+    source_type: str | None = None
+    has_coordinates: bool = False
+    distance_along_route_m: float | None = None
+    place_id: int | None = None
+
+
+@dataclass(slots=True)
+class PrdRoute:
+    route_id: int | None = None
+    route_number: int | None = None
+    route_code: str | None = None
+    route_name: str | None = None
+    route_title: str | None = None
+    fare_min_php: float | None = None
+    fare_max_php: float | None = None
+    fare_text: str | None = None
+    fare_candidates: list = field(default_factory=list)
+    fare_source_url: str | None = None
+    map_embed_url: str | None = None
+    map_mid: str | None = None
+    map_kml_url: str | None = None
+    map_polyline_count: int = 0
+    map_point_count: int = 0
+    map_marker_count: int = 0
+    map_marker_error: str | None = None
+    stop_count: int = 0
+    stops: list[Stop] = field(default_factory=list)
+    map_polylines: list[CompactPolyline] = field(default_factory=list)
+    source_id: str | None = None
+    source_route_number: int | None = None
+    topology: str | None = None
+    topology_source: str | None = None
+    cycle_length: int | None = None
+    route_length_km: float | None = None
+    estimated_fare_min_php: float | None = None
+    estimated_fare_max_php: float | None = None
+
+
+@dataclass(slots=True)
+class RouteIndexEntry:
+    route_number: int | None = None
+    route_title: str | None = None
+    section_id: str | None = None
+    source_url: str | None = None
+    stop_description: str | None = None
+    stops: list[str] = field(default_factory=list)
+    full_guide_url: str | None = None
+    map_embed_url: str | None = None
+    map_mid: str | None = None
+    map_kml_url: str | None = None
+    map_polylines: list[CompactPolyline] = field(default_factory=list)
+    map_polyline_count: int = 0
+    map_point_count: int = 0
+    map_scrape_error: str | None = None
+    faq_url: str | None = None
+
+
+@dataclass(slots=True)
+class GuideMap:
+    map_embed_url: str | None = None
+    map_mid: str | None = None
+    map_kml_url: str | None = None
+    map_polylines: list[CompactPolyline] = field(default_factory=list)
+    map_polyline_count: int = 0
+    map_point_count: int = 0
+    map_scrape_error: str | None = None
+
+
+@dataclass(slots=True)
+class FullGuide:
+    route_number: int | None = None
+    route_title: str | None = None
+    full_guide_url: str | None = None
+    canonical_url: str | None = None
+    article_title: str | None = None
+    date_published: str | None = None
+    date_modified: str | None = None
+    first_paragraph: str | None = None
+    paragraphs: list[str] = field(default_factory=list)
+    headings: list[str] = field(default_factory=list)
+    map_embed_urls: list[str] = field(default_factory=list)
+    map_geometry: list[GuideMap] = field(default_factory=list)
+    guide_polyline_count: int = 0
+    guide_point_count: int = 0
+    scraped_at_utc: str | None = None
+
+
+_PLANS = {}
+
+
+def _scalar_check(cls_name, name, options):
+    # Exact type match (bool is an int subclass); ints are valid JSON floats.
+    allowed = set(options)
+    if float in allowed:
+        allowed.add(int)
+
+    def check(value):
+        if type(value) not in allowed:
+            expected = " | ".join(t.__name__ for t in options)
+            raise ValueError(f"{cls_name}.{name}: expected {expected}, got {type(value).__name__}")
+        return value
+
+    return check
+
+
+def _converter(cls_name, name, hint):
+    origin = typing.get_origin(hint)
+    if origin is list or hint is list:
+        (item,) = typing.get_args(hint) or (None,)
+        if item is CompactPolyline:
+            return lambda value: [CompactPolyline.from_dict(p) for p in value]
+        if is_dataclass(item):
+            return lambda value: [decode_model(item, x) for x in value]
+        return _scalar_check(cls_name, name, (list,))
+    options = typing.get_args(hint) if origin in (typing.Union, types.UnionType) else (hint,)
+    return _scalar_check(cls_name, name, options)
+
+
+def _plan(cls):
+    plan = _PLANS.get(cls)
+    if plan is None:
+        hints = typing.get_type_hints(cls)
+        plan = [(f.name, _converter(cls.__name__, f.name, hints[f.name])) for f in fields(cls)]
+        _PLANS[cls] = plan
+    return plan
+
+
+def decode_model(cls, data: dict):
+    # Unknown keys are dropped and missing keys take the field default; present
+    # values are type-checked.
+    kwargs = {}
+    for name, convert in _plan(cls):
+        if name in data:
+            value = data[name]
+            kwargs[name] = None if value is None else convert(value)
+    return cls(**kwargs)
+
+
+def _msgspec_hook(type_, obj):
+    if type_ is CompactPolyline:
+        return CompactPolyline.from_dict(obj)
+    raise NotImplementedError(type_)
+
+
+def decode_items(raw: bytes, cls, key: str):
+    # Returns (meta, models): the top-level fields other than `key`, and the
+    # entries under `key` decoded into `cls`.
+    if msgspec is not None:
+        meta = msgspec.json.decode(raw)
+        items = msgspec.convert(meta.pop(key, []), list[cls], dec_hook=_msgspec_hook)
+        return meta, items
+    meta = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    return meta, [decode_model(cls, item) for item in meta.pop(key, [])]
+
+
+def load_prd_routes(path: Path = PRD_JSON):
+    return decode_items(Path(path).read_bytes(), PrdRoute, "routes")
+
+
+def load_index_routes(path: Path = INDEX_JSON):
+    return decode_items(Path(path).read_bytes(), RouteIndexEntry, "routes")
+
+
+def load_full_guides(path: Path = FULL_GUIDES_JSON):
+    return decode_items(Path(path).read_bytes(), FullGuide, "guides")
+
+
+def model_to_dict(model):
+    out = {}
+    for f in fields(model):
+        value = getattr(model, f.name)
+        if isinstance(value, list):
+            value = [x.to_dict() if isinstance(x, CompactPolyline) else model_to_dict(x) if is_dataclass(x) else x for x in value]
+        out[f.name] = value
+    return out
@@ -0,0 +1,241 @@
+import json
+import math
+from pathlib import Path
+
+import numpy as np
+
+from polyline_model import CompactPolyline
+from route_geometry import EARTH_RADIUS_M
+
+
+ROOT = Path(__file__).resolve().parent
+OUTPUT_DIR = ROOT / "output"
+
+PRD_JSON = OUTPUT_DIR / "prd_routes_dataset.json"
+
+GRID_CELL_M = 50.0
+# Two routes share a corridor where one's segment midpoint lies this close to a
+# roughly parallel segment of the other; runs shorter than MIN_CORRIDOR_M are noise.
+CORRIDOR_M = 25.0
+PARALLEL_COS = math.cos(math.radians(30))
+MIN_CORRIDOR_M = 100.0
+# Crossings this close together (or to a shared corridor) are one transfer point.
+CROSSING_MERGE_M = 50.0
+
+
+def route_segments(routes):
+    # Flat segment table in local metres; a segment never spans two polylines.
+    route_index = []
+    points = []
+    for r, route in enumerate(routes):
+        for polyline in route.get("map_polylines", []):
+            pairs = CompactPolyline.from_dict(polyline).lat_lng
+            for a, b in zip(pairs, pairs[1:]):
+                route_index.append(r)
+                points.append((a[1], a[0], b[1], b[0]))
+
+    seg = np.array(points, dtype=np.float64).reshape(-1, 4)
+    lat0 = float(seg[:, 1].mean()) if len(seg) else 0.0
+    lng0 = float(seg[:, 0].mean()) if len(seg) else 0.0
+    k_lat = math.pi / 180.0 * EARTH_RADIUS_M
+    k_lng = math.cos(math.radians(lat0)) * k_lat
+    return {
+        "lat0": lat0,
+        "lng0": lng0,
+        "k_lat": k_lat,
+        "k_lng": k_lng,
+        "route": np.array(route_index, dtype=np.int64),
+        "ax": (seg[:, 0] - lng0) * k_lng,
+        "ay": (seg[:, 1] - lat0) * k_lat,
+        "bx": (seg[:, 2] - lng0) * k_lng,
+        "by": (seg[:, 3] - lat0) * k_lat,
+    }
+
+
+def candidate_pairs(segments, cell_m=GRID_CELL_M, pad_m=CORRIDOR_M):
+    # Grid-bucketed broad phase: every segment (its bbox grown by pad_m) is filed
+    # under the cells it touches; only segments of different routes sharing a
+    # cell are compared. Returns unique (i, j) with i < j.
+    ax, ay, bx, by = segments["ax"], segments["ay"], segments["bx"], segments["by"]
+    x0 = np.floor((np.minimum(ax, bx) - pad_m) / cell_m).astype(np.int64)
+    x1 = np.floor((np.maximum(ax, bx) + pad_m) / cell_m).astype(np.int64)
+    y0 = np.floor((np.minimum(ay, by) - pad_m) / cell_m).astype(np.int64)
+    y1 = np.floor((np.maximum(ay, by) + pad_m) / cell_m).astype(np.int64)
+
+    spans = (x1 - x0 + 1) * (y1 - y0 + 1)
+    seg_ids = np.repeat(np.arange(len(ax)), spans)
+    offsets = np.arange(spans.sum()) - np.repeat(np.cumsum(spans) - spans, spans)
+    widths = np.repeat(x1 - x0 + 1, spans)
+    cx = np.repeat(x0, spans) + offsets % widths
+    cy = np.repeat(y0, spans) + offsets // widths
+
+    order = np.lexsort((seg_ids, cy, cx))
+    seg_ids, cx, cy = seg_ids[order], cx[order], cy[order]
+    boundaries = np.flatnonzero((np.diff(cx) != 0) | (np.diff(cy) != 0)) + 1
+    starts = np.concatenate([[0], boundaries])
+    ends = np.concatenate([boundaries, [len(seg_ids)]])
+
+    route = segments["route"]
+    found_i = []
+    found_j = []
+    for start, end in zip(starts, ends):
+        if end - start < 2:
+            continue
+        cell = seg_ids[start:end]
+        i, j = np.triu_indices(len(cell), 1)
+        i, j = cell[i], cell[j]
+        keep = route[i] != route[j]
+        found_i.append(i[keep])
+        found_j.append(j[keep])
+
+    if not found_i:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    i = np.concatenate(found_i)
+    j = np.concatenate(found_j)
+    lo, hi = np.minimum(i, j), np.maximum(i, j)
+    keys = np.unique(lo * len(ax) + hi)
+    return keys // len(ax), keys % len(ax)
+
+
+def _orient(ax, ay, bx, by, cx, cy):
+    return np.sign((bx - ax) * (cy - ay) - (by - ay) * (cx - ax))
+
+
+def crossings(segments, i, j):
+    # Proper crossings only; touching or collinear segments belong to corridors.
+    ax, ay, bx, by = segments["ax"], segments["ay"], segments["bx"], segments["by"]
+    o1 = _orient(ax[i], ay[i], bx[i], by[i], ax[j], ay[j])
+    o2 = _orient(ax[i], ay[i], bx[i], by[i], bx[j], by[j])
+    o3 = _orient(ax[j], ay[j], bx[j], by[j], ax[i], ay[i])
+    o4 = _orient(ax[j], ay[j], bx[j], by[j], bx[i], by[i])
+    hit = (o1 * o2 < 0) & (o3 * o4 < 0)
+    i, j = i[hit], j[hit]
+
+    dx1, dy1 = bx[i] - ax[i], by[i] - ay[i]
+    dx2, dy2 = bx[j] - ax[j], by[j] - ay[j]
+    t = ((ax[j] - ax[i]) * dy2 - (ay[j] - ay[i]) * dx2) / (dx1 * dy2 - dy1 * dx2)
+    return i, j, ax[i] + t * dx1, ay[i] + t * dy1
+
+
+def _near_parallel(segments, s, t):
+    # Segment s runs alongside segment t: its midpoint is within CORRIDOR_M of t
+    # and the two directions differ by less than 30 degrees (either way round).
+    ax, ay, bx, by = segments["ax"], segments["ay"], segments["bx"], segments["by"]
+    mx, my = (ax[s] + bx[s]) / 2, (ay[s] + by[s]) / 2
+    dx, dy = bx[t] - ax[t], by[t] - ay[t]
+    seg_sq = dx * dx + dy * dy
+    with np.errstate(invalid="ignore", divide="ignore"):
+        u = np.where(seg_sq > 0, ((mx - ax[t]) * dx + (my - ay[t]) * dy) / seg_sq, 0.0)
+    u = np.clip(u, 0.0, 1.0)
+    near = np.hypot(mx - (ax[t] + u * dx), my - (ay[t] + u * dy)) <= CORRIDOR_M
+
+    sx, sy = bx[s] - ax[s], by[s] - ay[s]
+    lengths = np.hypot(sx, sy) * np.sqrt(seg_sq)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        cos = np.abs(sx * dx + sy * dy) / lengths
+    return near & (cos >= PARALLEL_COS)
+
+
+def corridor_segments(segments, i, j):
+    # (segment, other route) pairs where the segment runs along the other route.
+    route = segments["route"]
+    s = np.concatenate([i, j])
+    t = np.concatenate([j, i])
+    keep = _near_parallel(segments, s, t)
+    routes = int(route.max()) + 1 if len(route) else 1
+    keys = np.unique(s[keep] * routes + route[t[keep]])
+    return keys // routes, keys % routes
+
+
+def _to_lat_lng(segments, x, y):
+    return [round(float(y) / segments["k_lat"] + segments["lat0"], 6), round(float(x) / segments["k_lng"] + segments["lng0"], 6)]
+
+
+def find_route_overlaps(routes, cell_m=GRID_CELL_M):
+    segments = route_segments(routes)
+    if len(segments["route"]) == 0:
+        return []
+    ax, ay, bx, by = segments["ax"], segments["ay"], segments["bx"], segments["by"]
+    length = np.hypot(bx - ax, by - ay)
+    route = segments["route"].tolist()
+
+    i, j = candidate_pairs(segments, cell_m)
+    corridor_seg, corridor_other = corridor_segments(segments, i, j)
+
+    # Corridor runs: consecutive segments of one route alongside the same other route.
+    pairs = {}
+    runs_by_key = {}
+    for s, other in zip(corridor_seg.tolist(), corridor_other.tolist()):
+        runs = runs_by_key.setdefault((route[s], other), [])
+        if runs and runs[-1][1] == s - 1:
+            runs[-1][1] = s
+        else:
+            runs.append([s, s])
+    for (a, b), runs in runs_by_key.items():
+        key = (min(a, b), max(a, b))
+        entry = pairs.setdefault(key, {"shared": {a: 0.0, b: 0.0}, "corridors": [], "crossings": []})
+        for first, last in runs:
+            run_m = float(length[first : last + 1].sum())
+            if run_m < MIN_CORRIDOR_M:
+                continue
+            entry["shared"][a] += run_m
+            if a == key[0]:
+                entry["corridors"].append(
+                    {
+                        "start": _to_lat_lng(segments, ax[first], ay[first]),
+                        "end": _to_lat_lng(segments, bx[last], by[last]),
+                        "length_m": round(run_m, 1),
+                    }
+                )
+
+    ci, cj, px, py = crossings(segments, i, j)
+    alongside = set(zip(corridor_seg.tolist(), corridor_other.tolist()))
+    corridor_points = {}
+    for (a, b), entry in pairs.items():
+        corridor_points[(a, b)] = [point for c in entry["corridors"] for point in (c["start"], c["end"])]
+    for s, t, x, y in zip(ci.tolist(), cj.tolist(), px.tolist(), py.tolist()):
+        if (s, route[t]) in alongside or (t, route[s]) in alongside:
+            continue
+        key = (min(route[s], route[t]), max(route[s], route[t]))
+        entry = pairs.setdefault(key, {"shared": {key[0]: 0.0, key[1]: 0.0}, "corridors": [], "crossings": []})
+        # Corridor ends and earlier crossings already cover anything this close.
+        taken = entry["crossings"] + [
+            ((p[1] - segments["lng0"]) * segments["k_lng"], (p[0] - segments["lat0"]) * segments["k_lat"]) for p in corridor_points.get(key, [])
+        ]
+        if any(math.hypot(x - qx, y - qy) <= CROSSING_MERGE_M for qx, qy in taken):
+            continue
+        entry["crossings"].append((x, y))
+
+    out = []
+    for (a, b), entry in sorted(pairs.items()):
+        if not entry["corridors"] and not entry["crossings"]:
+            continue
+        out.append(
+            {
+                "route_numbers": [routes[a].get("route_number"), routes[b].get("route_number")],
+                # Conservative: the shorter of the two routes' lengths alongside each other.
+                "shared_length_m": round(min(entry["shared"].values()), 1),
+                "corridors": entry["corridors"],
+                "crossings": [_to_lat_lng(segments, x, y) for x, y in entry["crossings"]],
+            }
+        )
+    return out
+
+
+def main():
+    if not PRD_JSON.exists():
+        raise FileNotFoundError(f"Missing {PRD_JSON}")
+
+    payload = json.loads(PRD_JSON.read_text(encoding="utf-8"))
+    overlaps = find_route_overlaps(payload.get("routes", []))
+    print(f"Route pairs that meet: {len(overlaps)}")
+    for overlap in sorted(overlaps, key=lambda o: -o["shared_length_m"])[:15]:
+        a, b = overlap["route_numbers"]
+        print(
+            f"  ROUTE {a} / ROUTE {b}: {overlap['shared_length_m']:.0f} m shared "
+            f"in {len(overlap['corridors'])} corridors, {len(overlap['crossings'])} crossings"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+import json
+from pathlib import Path
+
+from guide_extraction import stop_key
+from route_geometry import cumulative_distances, haversine_m, project_onto_path, route_path
+
+
+ROOT = Path(__file__).resolve().parent
+OUTPUT_DIR = ROOT / "output"
+
+PRD_JSON = OUTPUT_DIR / "prd_routes_dataset.json"
+
+LOOP = "loop"
+OUT_AND_BACK = "out_and_back"
+LINEAR = "linear"
+CYCLIC_TOPOLOGIES = (LOOP, OUT_AND_BACK)
+
+# Endpoints this close make a closed path; a closed path whose second half mostly
+# runs on top of the first half is an out-and-back rather than a loop.
+LOOP_CLOSE_M = 300.0
+RETRACE_M = 40.0
+RETRACE_SHARE = 0.6
+
+
+def retrace_share(lats, lngs):
+    half = len(lats) // 2
+    if half < 2:
+        return 0.0
+    out_lats, out_lngs = lats[: half + 1], lngs[: half + 1]
+    cumulative = cumulative_distances(out_lats, out_lngs)
+    back = range(half + 1, len(lats))
+    near = 0
+    for i in back:
+        _, offset = project_onto_path(lats[i], lngs[i], out_lats, out_lngs, cumulative)
+        if offset <= RETRACE_M:
+            near += 1
+    return near / len(back)
+
+
+def _same_name(a: dict, b: dict):
+    key = stop_key(a.get("stop_name"))
+    return bool(key) and key == stop_key(b.get("stop_name"))
+
+
+def _stop_coordinates(stops):
+    return [(s["lat"], s["lng"]) for s in stops if s.get("lat") is not None and s.get("lng") is not None]
+
+
+def titled_loop(route: dict):
+    return "LOOP" in (route.get("route_title") or "").upper().split()
+
+
+def shape_topology(route: dict):
+    lats, lngs = route_path(route)
+    if len(lats) >= 2:
+        if haversine_m(lats[0], lngs[0], lats[-1], lngs[-1]) > LOOP_CLOSE_M:
+            return LINEAR, "polyline"
+        return (OUT_AND_BACK if retrace_share(lats, lngs) >= RETRACE_SHARE else LOOP), "polyline"
+
+    coords = _stop_coordinates(route.get("stops", []))
+    if len(coords) >= 2:
+        closed = haversine_m(*coords[0], *coords[-1]) <= LOOP_CLOSE_M
+        return (LOOP if closed else LINEAR), "stops"
+    return None, None
+
+
+def classify_route(route: dict):
+    # Any sign of a round trip wins: a closed shape, a LOOP title or a last stop that
+    # repeats the first. Titles name both terminals ("X TO CITY PROPER") on round
+    # trips too, so they are no evidence of a one-way route.
+    shape, source = shape_topology(route)
+    if shape in CYCLIC_TOPOLOGIES:
+        return shape, source
+    if titled_loop(route):
+        return LOOP, "title"
+    stops = route.get("stops", [])
+    if len(stops) >= 2 and _same_name(stops[0], stops[-1]):
+        return LOOP, "stops"
+    return LINEAR, source
+
+
+def cycle_length(route: dict, topology: str):
+    # On a cyclic route the last stop often repeats the terminal; it then shares
+    # position 0 in the travel order instead of adding a step.
+    stops = route.get("stops", [])
+    n = len(stops)
+    if topology not in CYCLIC_TOPOLOGIES or n < 2:
+        return n
+    first, last = stops[0], stops[-1]
+    same_name = _same_name(first, last)
+    coords = _stop_coordinates([first, last])
+    same_place = len(coords) == 2 and haversine_m(*coords[0], *coords[1]) <= RETRACE_M
+    return n - 1 if same_name or same_place else n
+
+
+def annotate_route_topology(routes: list):
+    for route in routes:
+        topology, source = classify_route(route)
+        route["topology"] = topology
+        route["topology_source"] = source
+        route["cycle_length"] = cycle_length(route, topology)
+    return routes
+
+
+def travel_span(topology, cycle_len, origin_index: int, destination_index: int):
+    # Stops ridden from origin to destination, inclusive. Cyclic routes only run
+    # forward and wrap through the terminal; linear routes run both ways.
+    if topology in CYCLIC_TOPOLOGIES and cycle_len:
+        return (destination_index - origin_index) % cycle_len + 1
+    return abs(destination_index - origin_index) + 1
+
+
+def route_travel_span(route: dict, origin_index: int, destination_index: int):
+    return travel_span(route.get("topology"), route.get("cycle_length"), origin_index, destination_index)
+
+
+def main():
+    if not PRD_JSON.exists():
+        raise FileNotFoundError(f"Missing {PRD_JSON}")
+
+    payload = json.loads(PRD_JSON.read_text(encoding="utf-8"))
+    routes = annotate_route_topology(payload.get("routes", []))
+    for route in routes:
+        print(
+            f"ROUTE {route.get('route_number')}: {route['topology']} "
+            f"(from {route['topology_source'] or 'default'}, cycle of {route['cycle_length']} stops)"
+        )
+
+
+if __name__ == "__main__":
+    main()
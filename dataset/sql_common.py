@@ -0,0 +1,48 @@
+import math
+
+
+def sql_value(value):
+    if value is None:
+        return "NULL"
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float):
+        if math.isnan(value) or math.isinf(value):
+            return "NULL"
+        return repr(value)
+    text = str(value).replace("'", "''")
+    return f"'{text}'"
+
+
+def insert_line(table, columns, values):
+    cols = ", ".join(columns)
+    vals = ", ".join(sql_value(v) for v in values)
+    return f"INSERT INTO {table} ({cols}) VALUES ({vals});"
+
+
+def upsert_line(table, columns, values, conflict_columns):
+    updates = ", ".join(f"{c} = EXCLUDED.{c}" for c in columns if c not in conflict_columns)
+    return f"{insert_line(table, columns, values)[:-1]} ON CONFLICT ({', '.join(conflict_columns)}) DO UPDATE SET {updates};"
+
+
+def upsert_select_line(table, columns, values, conflict_columns, id_column=None, match=None, computed=None):
+    # With id_column, a row already matching `match` keeps its surrogate id; otherwise the
+    # supplied id is used (or MAX(id)+1 when none is given). Without it, every
+    # non-conflict column, ids included, is overwritten from the new values.
+    computed = computed or {}
+    exprs = []
+    for column, value in zip(columns, values):
+        if column == id_column:
+            fallback = sql_value(value) if value is not None else f"(SELECT COALESCE(MAX({id_column}), 0) + 1 FROM {table})"
+            exprs.append(f"COALESCE((SELECT {id_column} FROM {table} WHERE {match}), {fallback})")
+        elif column in computed:
+            exprs.append(computed[column])
+        else:
+            exprs.append(sql_value(value))
+    updates = ", ".join(f"{c} = EXCLUDED.{c}" for c in columns if c not in conflict_columns and c != id_column)
+    return (
+        f"INSERT INTO {table} ({', '.join(columns)}) SELECT {', '.join(exprs)} WHERE TRUE "
+        f"ON CONFLICT ({', '.join(conflict_columns)}) DO UPDATE SET {updates};"
+    )
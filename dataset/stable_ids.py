@@ -0,0 +1,75 @@
+import hashlib
+import json
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parent
+OUTPUT_DIR = ROOT / "output"
+
+ID_MAP_JSON = OUTPUT_DIR / "stable_id_map.json"
+ID_MAP_FORMAT = "route25-stable-ids/1"
+
+# Ids stay inside a signed 32-bit INTEGER column (PostgreSQL/Supabase).
+MAX_ID = 2**31 - 1
+COORD_DECIMALS = 6
+
+
+def id_key(*parts) -> str:
+    out = []
+    for part in parts:
+        if part is None:
+            out.append("")
+        elif isinstance(part, float):
+            out.append(f"{part:.{COORD_DECIMALS}f}")
+        else:
+            out.append(" ".join(str(part).split()).casefold())
+    return "|".join(out)
+
+
+def hashed_id(namespace: str, key: str) -> int:
+    digest = hashlib.blake2b(f"{namespace}:{key}".encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") % MAX_ID + 1
+
+
+def load_id_map(path: Path = ID_MAP_JSON):
+    path = Path(path)
+    namespaces = {}
+    if path.exists():
+        namespaces = json.loads(path.read_text(encoding="utf-8")).get("namespaces", {})
+    return {"path": path, "namespaces": namespaces, "_taken": {}, "_dirty": False}
+
+
+def assign_id(id_map: dict, namespace: str, *parts) -> int:
+    key = id_key(*parts)
+    ids = id_map["namespaces"].setdefault(namespace, {})
+    existing = ids.get(key)
+    if existing is not None:
+        return existing
+
+    taken = id_map["_taken"].get(namespace)
+    if taken is None:
+        taken = id_map["_taken"][namespace] = set(ids.values())
+
+    # A hash collision is settled once by probing; the map then pins the winner
+    # for every later run, so the order keys arrive in only matters the first time.
+    candidate = hashed_id(namespace, key)
+    while candidate in taken:
+        candidate = candidate % MAX_ID + 1
+    ids[key] = candidate
+    taken.add(candidate)
+    id_map["_dirty"] = True
+    return candidate
+
+
+def save_id_map(id_map: dict, path: Path = None):
+    path = Path(path or id_map["path"])
+    if not id_map["_dirty"] and path.exists():
+        return path
+    payload = {
+        "format": ID_MAP_FORMAT,
+        "namespaces": {ns: dict(sorted(ids.items())) for ns, ids in sorted(id_map["namespaces"].items())},
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, indent=1, ensure_ascii=False), encoding="utf-8")
+    id_map["_dirty"] = False
+    return path
@@ -0,0 +1,161 @@
+import json
+import math
+from collections import Counter
+from difflib import SequenceMatcher
+from pathlib import Path
+
+from journey_table import stop_key
+from route_geometry import EARTH_RADIUS_M, haversine_m
+from stable_ids import assign_id, load_id_map
+
+
+ROOT = Path(__file__).resolve().parent
+OUTPUT_DIR = ROOT / "output"
+
+PRD_JSON = OUTPUT_DIR / "prd_routes_dataset.json"
+
+# Stops merge into one place when they are this close and both are named with
+# similar names; stops without coordinates merge on their normalized name.
+MERGE_RADIUS_M = 40.0
+NAME_SIMILARITY = 0.8
+
+
+def similar_names(key_a: str, key_b: str):
+    if not key_a or not key_b:
+        return False
+    return key_a == key_b or SequenceMatcher(None, key_a, key_b).ratio() >= NAME_SIMILARITY
+
+
+def _find(parent, i):
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+def _union(parent, a, b):
+    a, b = _find(parent, a), _find(parent, b)
+    if a != b:
+        parent[max(a, b)] = min(a, b)
+
+
+def cluster_stops(members, radius_m=MERGE_RADIUS_M):
+    # members: (source_id, key, lat, lng). Returns a cluster root per member; the
+    # root is the first member of the cluster, so clusters come out in stop order.
+    parent = list(range(len(members)))
+
+    # A shared name alone only places stops without coordinates: they join the first
+    # located stop of that name (or the first of that name when none is located).
+    # Located stops merge by distance below, so one name at two ends of town stays
+    # two places.
+    anchors = {}
+    for i, (source_id, key, lat, _) in enumerate(members):
+        if key:
+            anchor = anchors.get((source_id, key))
+            if anchor is None or (members[anchor][2] is None and lat is not None):
+                anchors[(source_id, key)] = i
+    for i, (source_id, key, lat, _) in enumerate(members):
+        if key and lat is None:
+            _union(parent, anchors[(source_id, key)], i)
+
+    # Grid buckets one radius wide: only the 3x3 neighbourhood of a stop is compared.
+    cell_lat = radius_m / (math.pi / 180.0 * EARTH_RADIUS_M)
+    buckets = {}
+    for i, (_, _, lat, lng) in enumerate(members):
+        if lat is not None and lng is not None:
+            cell_lng = cell_lat / max(math.cos(math.radians(lat)), 1e-6)
+            buckets.setdefault((int(lat // cell_lat), int(lng // cell_lng)), []).append(i)
+    for (cy, cx), nodes in buckets.items():
+        nearby = [n for dy in (-1, 0, 1) for dx in (-1, 0, 1) for n in buckets.get((cy + dy, cx + dx), ())]
+        for a in nodes:
+            source_a, key_a, lat_a, lng_a = members[a]
+            for b in nearby:
+                if b <= a or members[b][0] != source_a:
+                    continue
+                _, key_b, lat_b, lng_b = members[b]
+                if haversine_m(lat_a, lng_a, lat_b, lng_b) <= radius_m and similar_names(key_a, key_b):
+                    _union(parent, a, b)
+
+    return [_find(parent, i) for i in range(len(members))]
+
+
+def build_stop_registry(routes, id_map: dict, radius_m=MERGE_RADIUS_M):
+    # Tags every route stop with the place_id of its cluster and returns the shared
+    # place table. Place ids are stable ids keyed on the source and the smallest
+    # stop_id in the cluster, which does not depend on route or stop order. Payloads
+    # built before stable stop ids fall back to the cluster root's name or position.
+    #
+    # Route stops still repeat name and coordinates next to place_id because the app,
+    # the SQL dumps and the deltas read them. Once those resolve stops through the
+    # registry, the next payload format drops the repeated fields and keeps only
+    # stop_order and place_id per route stop.
+    refs = []
+    members = []
+    for route in routes:
+        for stop in route.get("stops", []):
+            refs.append((route, stop))
+            has_coords = stop.get("lat") is not None and stop.get("lng") is not None
+            members.append(
+                (
+                    route.get("source_id"),
+                    stop_key(stop.get("stop_name")),
+                    stop["lat"] if has_coords else None,
+                    stop["lng"] if has_coords else None,
+                )
+            )
+
+    clusters = {}
+    for i, root in enumerate(cluster_stops(members, radius_m)):
+        clusters.setdefault(root, []).append(i)
+
+    places = []
+    for root in sorted(clusters):
+        indexes = clusters[root]
+        names = Counter(refs[i][1].get("stop_name") for i in indexes if refs[i][1].get("stop_name"))
+        stop_name = max(names, key=lambda n: names[n]) if names else None
+        coords = [(members[i][2], members[i][3]) for i in indexes if members[i][2] is not None]
+        lat = round(sum(c[0] for c in coords) / len(coords), 6) if coords else None
+        lng = round(sum(c[1] for c in coords) / len(coords), 6) if coords else None
+        source_id = members[root][0]
+
+        stop_ids = [refs[i][1]["stop_id"] for i in indexes if refs[i][1].get("stop_id") is not None]
+        if stop_ids:
+            key_parts = ("stop", min(stop_ids))
+        else:
+            _, root_key, root_lat, root_lng = members[root]
+            key_parts = (root_key,) if root_key else (root_lat, root_lng)
+        place_id = assign_id(id_map, "prd_places", source_id, *key_parts)
+        for i in indexes:
+            refs[i][1]["place_id"] = place_id
+
+        route_numbers = sorted({refs[i][0].get("route_number") for i in indexes}, key=lambda n: (n is None, n or 0))
+        places.append(
+            {
+                "place_id": place_id,
+                "stop_name": stop_name,
+                "lat": lat,
+                "lng": lng,
+                "source_id": source_id,
+                "stop_count": len(indexes),
+                "route_numbers": route_numbers,
+            }
+        )
+    return places
+
+
+def main():
+    if not PRD_JSON.exists():
+        raise FileNotFoundError(f"Missing {PRD_JSON}")
+
+    payload = json.loads(PRD_JSON.read_text(encoding="utf-8"))
+    routes = payload.get("routes", [])
+    places = build_stop_registry(routes, load_id_map())
+    stops = sum(len(r.get("stops", [])) for r in routes)
+    shared = [p for p in places if len(p["route_numbers"]) > 1]
+    print(f"Stops: {stops}, places: {len(places)}, served by more than one route: {len(shared)}")
+    for place in sorted(shared, key=lambda p: -len(p["route_numbers"]))[:10]:
+        print(f"  {place['stop_name']}: routes {', '.join(str(n) for n in place['route_numbers'])}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+import argparse
+import json
+import os
+from itertools import islice
+from pathlib import Path
+
+from build_metrics import count, new_build_metrics, timed_stage, write_build_report
+from dataset_snapshot import snapshot_statements
+from dataset_sources import id_namespaces, load_sources, route_key
+from polyline_model import CompactPolyline
+from prd_schema import (
+    PRD_DATASET_VIEW,
+    PRD_DATASET_VIEW_SQL,
+    PRD_GEOMETRY_SCHEMA,
+    PRD_SCHEMA,
+    create_table_sql,
+    prd_meta_values,
+    prd_route_values,
+    prd_stop_values,
+)
+from stable_ids import assign_id, load_id_map, save_id_map
+from table_writer import table_writers_from_ddl
+
+
+ROOT = Path(__file__).resolve().parent
+OUTPUT_DIR = ROOT / "output"
+
+PRD_JSON = OUTPUT_DIR / "prd_routes_dataset.json"
+LOAD_REPORT = OUTPUT_DIR / "prd_load_report.json"
+
+DATABASE_URL_ENV = "ROUTE25_DATABASE_URL"
+DEFAULT_BATCH_SIZE = 2000
+DEFAULT_POOL_SIZE = 4
+
+# Child tables first so DELETE and DROP never trip over foreign keys.
+PRD_TABLES = ["prd_route_points", "prd_route_polylines", "prd_route_stops", "prd_routes", "prd_meta"]
+
+
+def open_pool(dsn: str, max_size=DEFAULT_POOL_SIZE):
+    # psycopg is only needed by this loader, so it is not in requirements.txt.
+    from psycopg_pool import ConnectionPool
+
+    return ConnectionPool(dsn, min_size=1, max_size=max_size, open=True)
+
+
+def batched(rows, size):
+    it = iter(rows)
+    while True:
+        batch = list(islice(it, size))
+        if not batch:
+            return
+        yield batch
+
+
+def table_statements():
+    return [create_table_sql(table, body, if_not_exists=True) for table, body in PRD_SCHEMA + PRD_GEOMETRY_SCHEMA]
+
+
+def index_statements():
+    return [
+        "CREATE INDEX IF NOT EXISTS idx_prd_routes_route_number ON prd_routes(route_number)",
+        "CREATE INDEX IF NOT EXISTS idx_prd_route_stops_route_id ON prd_route_stops(route_id)",
+        "CREATE INDEX IF NOT EXISTS idx_prd_route_polylines_route_id ON prd_route_polylines(route_id)",
+    ]
+
+
+def view_statements():
+    return [
+        PRD_DATASET_VIEW_SQL,
+        f"CREATE UNIQUE INDEX IF NOT EXISTS idx_{PRD_DATASET_VIEW}_id ON {PRD_DATASET_VIEW}(id)",
+        # Supabase exposes the view to the app roles; plain Postgres has no such roles.
+        f"""
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_roles WHERE rolname = 'anon') THEN
+        GRANT SELECT ON {PRD_DATASET_VIEW} TO anon, authenticated;
+    END IF;
+END
+$$
+""".strip(),
+    ]
+
+
+def schema_statements():
+    return table_statements() + index_statements() + view_statements()
+
+
+def payload_rows(payload: dict, id_map: dict, sources=None):
+    # Ids come from the payload when it was built with stable ids; older payloads get
+    # the same ids from the persisted map, keyed like build_prd_dataset.
+    namespaces = id_namespaces(sources if sources is not None else load_sources())
+    routes, stops, polylines, points = [], [], [], []
+
+    for route in payload.get("routes", []):
+        key = route_key(route, namespaces.get(route.get("source_id")))
+        route_id = route.get("route_id") or assign_id(id_map, "prd_routes", *key)
+        routes.append(prd_route_values(route, route_id))
+
+        for stop in route.get("stops", []):
+            stop_id = stop.get("stop_id") or assign_id(
+                id_map, "prd_route_stops", *key, stop.get("stop_order"), stop.get("lat"), stop.get("lng")
+            )
+            stops.append(prd_stop_values(stop, stop_id, route_id))
+
+        for segment_index, polyline in enumerate(route.get("map_polylines", []), start=1):
+            polyline_id = assign_id(id_map, "prd_route_polylines", *key, segment_index)
+            compact = CompactPolyline.from_dict(polyline)
+            polylines.append([polyline_id, route_id, segment_index, compact.name, len(compact)])
+            points.extend([polyline_id, order, lat, lng] for order, (lat, lng) in enumerate(compact.lat_lng, start=1))
+
+    return routes, stops, polylines, points
+
+
+def insert_rows(cur, writer, rows, batch_size):
+    for batch in batched(rows, batch_size):
+        writer.executemany(cur, batch, placeholder="%s")
+
+
+def copy_rows(cur, writer, rows, batch_size):
+    # One COPY stream per table, fed batch by batch in COPY text format.
+    with cur.copy(f"COPY {writer.table} ({', '.join(writer.columns)}) FROM STDIN") as copy:
+        for batch in batched(rows, batch_size):
+            copy.write("\n".join(writer.copy_rows(batch)) + "\n")
+
+
+def load_payload(pool, payload: dict, id_map: dict, batch_size=DEFAULT_BATCH_SIZE, metrics=None):
+    metrics = metrics or new_build_metrics("supabase_loader")
+    routes, stops, polylines, points = payload_rows(payload, id_map)
+    writers = table_writers_from_ddl(table_statements())
+
+    # Everything happens in one transaction: readers see either the previous dataset
+    # or the new one, never a half-loaded mix.
+    with pool.connection() as conn:
+        with conn.transaction(), conn.cursor() as cur:
+            with timed_stage(metrics, "schema"):
+                for statement in schema_statements():
+                    cur.execute(statement)
+                # DELETE rather than TRUNCATE: TRUNCATE's ACCESS EXCLUSIVE lock would
+                # block readers until the whole load commits.
+                for table in PRD_TABLES:
+                    cur.execute(f"DELETE FROM {table}")
+
+            with timed_stage(metrics, "meta_and_routes"):
+                insert_rows(cur, writers["prd_meta"], [prd_meta_values(payload)], batch_size)
+                insert_rows(cur, writers["prd_routes"], routes, batch_size)
+                insert_rows(cur, writers["prd_route_polylines"], polylines, batch_size)
+
+            with timed_stage(metrics, "copy_stops"):
+                copy_rows(cur, writers["prd_route_stops"], stops, batch_size)
+
+            with timed_stage(metrics, "copy_points"):
+                copy_rows(cur, writers["prd_route_points"], points, batch_size)
+
+            with timed_stage(metrics, "refresh_view"):
+                # CONCURRENTLY (backed by the unique id index) keeps the view readable
+                # while it is rebuilt.
+                cur.execute(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {PRD_DATASET_VIEW}")
+
+            with timed_stage(metrics, "snapshot"):
+                for statement in snapshot_statements(payload):
+                    cur.execute(statement)
+
+    count(metrics, "routes", len(routes))
+    count(metrics, "stops", len(stops))
+    count(metrics, "polylines", len(polylines))
+    count(metrics, "points", len(points))
+    return metrics
+
+
+def fetch_dataset(pool):
+    with pool.connection() as conn:
+        row = conn.execute(f"SELECT payload FROM {PRD_DATASET_VIEW} LIMIT 1").fetchone()
+    return row[0] if row else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk-load the PRD dataset into Postgres/Supabase.")
+    parser.add_argument("payload", type=Path, nargs="?", default=PRD_JSON)
+    parser.add_argument("--dsn", default=os.environ.get(DATABASE_URL_ENV), help=f"defaults to ${DATABASE_URL_ENV}")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--pool-size", type=int, default=DEFAULT_POOL_SIZE)
+    args = parser.parse_args()
+
+    if not args.dsn:
+        raise SystemExit(f"Set {DATABASE_URL_ENV} or pass --dsn")
+
+    payload = json.loads(args.payload.read_text(encoding="utf-8"))
+    id_map = load_id_map()
+
+    pool = open_pool(args.dsn, max_size=args.pool_size)
+    try:
+        metrics = load_payload(pool, payload, id_map, batch_size=args.batch_size)
+        with timed_stage(metrics, "verify"):
+            served = fetch_dataset(pool)
+    finally:
+        pool.close()
+
+    save_id_map(id_map)
+    report = write_build_report(metrics, LOAD_REPORT)
+
+    print(f"Loaded: {metrics['counters']}")
+    print(f"View {PRD_DATASET_VIEW}: {len((served or {}).get('routes', []))} routes")
+    print(f"Saved: {LOAD_REPORT} ({report['total_s']:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+import math
+import re
+
+from sql_common import sql_value
+
+
+CREATE_TABLE_PATTERN = re.compile(r"CREATE TABLE (?:IF NOT EXISTS )?(\w+) \((.*?)\n\);", flags=re.DOTALL)
+CONSTRAINT_PREFIXES = ("FOREIGN KEY", "PRIMARY KEY", "UNIQUE", "CHECK", "CONSTRAINT")
+
+
+# Each escaper takes the fast path for the column's declared type and defers to
+# sql_value for anything else, so output is byte-identical to insert_line.
+def _sql_integer(value):
+    if type(value) is int:
+        return str(value)
+    return sql_value(value)
+
+
+def _sql_real(value):
+    if type(value) is float and math.isfinite(value):
+        return repr(value)
+    return sql_value(value)
+
+
+def _sql_text(value):
+    if type(value) is str:
+        return "'" + value.replace("'", "''") + "'"
+    return sql_value(value)
+
+
+SQL_ESCAPERS = {
+    "INTEGER": _sql_integer,
+    "BIGINT": _sql_integer,
+    "REAL": _sql_real,
+    "DOUBLE": _sql_real,
+    "TEXT": _sql_text,
+}
+
+
+# Batch variants escape a whole column in one comprehension; `v - v == 0` is the
+# inline finiteness test (False for inf and nan).
+def _sql_integer_column(values):
+    return [str(v) if type(v) is int else sql_value(v) for v in values]
+
+
+def _sql_real_column(values):
+    return [repr(v) if type(v) is float and v - v == 0 else sql_value(v) for v in values]
+
+
+def _sql_text_column(values):
+    return ["'" + v.replace("'", "''") + "'" if type(v) is str else sql_value(v) for v in values]
+
+
+def _sql_any_column(values):
+    return [sql_value(v) for v in values]
+
+
+SQL_COLUMN_ESCAPERS = {
+    "INTEGER": _sql_integer_column,
+    "BIGINT": _sql_integer_column,
+    "REAL": _sql_real_column,
+    "DOUBLE": _sql_real_column,
+    "TEXT": _sql_text_column,
+}
+
+COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def copy_value(value):
+    # PostgreSQL COPY text format.
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, float) and not math.isfinite(value):
+        return "\\N"
+    return str(value).translate(COPY_ESCAPES)
+
+
+def _copy_numeric_column(values):
+    return [str(v) if type(v) is int or (type(v) is float and v - v == 0) else copy_value(v) for v in values]
+
+
+def _copy_text(value):
+    # Chained replace is several times faster than str.translate for long text.
+    return value.replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+
+
+def _copy_text_column(values):
+    return [_copy_text(v) if type(v) is str else copy_value(v) for v in values]
+
+
+def _copy_any_column(values):
+    return [copy_value(v) for v in values]
+
+
+COPY_COLUMN_ESCAPERS = {
+    "INTEGER": _copy_numeric_column,
+    "BIGINT": _copy_numeric_column,
+    "REAL": _copy_numeric_column,
+    "DOUBLE": _copy_numeric_column,
+    "TEXT": _copy_text_column,
+}
+
+
+def param_value(value):
+    # Driver parameters: booleans as 0/1 and non-finite floats as NULL, like sql_value.
+    if isinstance(value, bool):
+        return 1 if value else 0
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+class TableWriter:
+    __slots__ = ("table", "columns", "types", "_escapers", "_column_escapers", "_copy_escapers", "_insert_prefix")
+
+    def __init__(self, table, columns, types=None):
+        self.table = table
+        self.columns = list(columns)
+        self.types = list(types or ["TEXT"] * len(self.columns))
+        self._escapers = [SQL_ESCAPERS.get(t, sql_value) for t in self.types]
+        self._column_escapers = [SQL_COLUMN_ESCAPERS.get(t, _sql_any_column) for t in self.types]
+        self._copy_escapers = [COPY_COLUMN_ESCAPERS.get(t, _copy_any_column) for t in self.types]
+        self._insert_prefix = f"INSERT INTO {table} ({', '.join(self.columns)}) VALUES ("
+
+    def insert(self, values):
+        return self._insert_prefix + ", ".join([f(v) for f, v in zip(self._escapers, values)]) + ");"
+
+    def _escape_columns(self, escapers, rows):
+        # Column-at-a-time: one comprehension per typed column instead of a
+        # function call and type dispatch per value.
+        return zip(*[f(column) for f, column in zip(escapers, zip(*rows))])
+
+    def insert_many(self, rows):
+        if not rows:
+            return []
+        prefix = self._insert_prefix
+        return [prefix + ", ".join(row) + ");" for row in self._escape_columns(self._column_escapers, rows)]
+
+    def copy_rows(self, rows):
+        # PostgreSQL COPY text-format lines (no COPY header or terminator), for streaming.
+        if not rows:
+            return []
+        return ["\t".join(row) for row in self._escape_columns(self._copy_escapers, rows)]
+
+    def executemany(self, cursor, rows, placeholder="?"):
+        # placeholder: "?" for sqlite3, "%s" for psycopg.
+        marks = ", ".join([placeholder] * len(self.columns))
+        sql = f"INSERT INTO {self.table} ({', '.join(self.columns)}) VALUES ({marks})"
+        cursor.executemany(sql, [[param_value(v) for v in row] for row in rows])
+
+
+def parse_table_columns(body: str):
+    columns = []
+    types = []
+    for raw in body.splitlines():
+        line = raw.strip().rstrip(",")
+        if not line or line.upper().startswith(CONSTRAINT_PREFIXES):
+            continue
+        parts = line.split()
+        columns.append(parts[0])
+        types.append(parts[1].upper() if len(parts) > 1 else "TEXT")
+    return columns, types
+
+
+def table_writers_from_ddl(ddl):
+    if not isinstance(ddl, str):
+        ddl = "\n".join(ddl)
+    writers = {}
+    for match in CREATE_TABLE_PATTERN.finditer(ddl):
+        columns, types = parse_table_columns(match.group(2))
+        writers[match.group(1)] = TableWriter(match.group(1), columns, types)
+    return writers
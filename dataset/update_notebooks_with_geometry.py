@@ -35,7 +35,12 @@ set_code_cell(
 
     import pandas as pd
     import requests
-    from bs4 import BeautifulSoup, Tag
+    from bs4 import BeautifulSoup
+
+    from guide_extraction import normalize_text
+    from json_output import write_json
+    from polyline_model import CompactPolyline, geojson_coordinates
+    from route_index_sections import split_route_sections
 
     BASE_URL = "https://shemaegomez.com/iloilo-city-jeepney-routes/"
     KML_URL_TEMPLATE = "https://www.google.com/maps/d/kml?mid={mid}&forcekml=1"
@@ -55,11 +60,6 @@ set_code_cell(
     r"""
     ROUTE_HEADER_PATTERN = re.compile(r"^ROUTE\s*#?\s*(\d+)\b", flags=re.IGNORECASE)
 
-    def normalize_text(text: str) -> str:
-        if not text:
-            return ""
-        return " ".join(text.replace("\xa0", " ").split())
-
     def parse_route_number(text: str):
         match = re.search(r"\bROUTE\s*#?\s*(\d+)\b", text or "", flags=re.IGNORECASE)
         return int(match.group(1)) if match else None
@@ -94,7 +94,6 @@ set_code_cell(
 
             coordinate_tokens = normalize_text(coordinates_tag.get_text(" ", strip=True)).split()
             coordinates_lng_lat = []
-            coordinates_lat_lng = []
 
             for token in coordinate_tokens:
                 parts = token.split(",")
@@ -107,8 +106,7 @@ set_code_cell(
                 except ValueError:
                     continue
 
-                coordinates_lng_lat.append([lng, lat])
-                coordinates_lat_lng.append([lat, lng])
+                coordinates_lng_lat.append((lng, lat))
 
             if len(coordinates_lng_lat) < 2:
                 continue
@@ -116,14 +114,7 @@ set_code_cell(
             name_tag = placemark.find("name")
             polyline_name = normalize_text(name_tag.get_text(" ", strip=True)) if name_tag else f"segment_{idx}"
 
-            polylines.append(
-                {
-                    "name": polyline_name,
-                    "point_count": len(coordinates_lng_lat),
-                    "coordinates_lng_lat": coordinates_lng_lat,
-                    "coordinates_lat_lng": coordinates_lat_lng,
-                }
-            )
+            polylines.append(CompactPolyline.from_lng_lat(polyline_name, coordinates_lng_lat).to_dict())
 
         return polylines
 
@@ -187,64 +178,7 @@ set_code_cell(
     session = requests.Session()
     map_cache = {}
 
-    for h2 in article.find_all("h2", class_="wp-block-heading"):
-        route_title = normalize_text(h2.get_text(" ", strip=True))
-        if not ROUTE_HEADER_PATTERN.match(route_title):
-            continue
-
-        route_data = {
-            "route_number": parse_route_number(route_title),
-            "route_title": route_title,
-            "section_id": h2.get("id"),
-            "source_url": BASE_URL,
-            "stop_description": None,
-            "stops": [],
-            "full_guide_url": None,
-            "map_embed_url": None,
-            "map_mid": None,
-            "map_kml_url": None,
-            "map_polylines": [],
-            "map_polyline_count": 0,
-            "map_point_count": 0,
-            "map_scrape_error": None,
-            "faq_url": None,
-        }
-
-        node = h2.next_sibling
-        while node:
-            if isinstance(node, Tag):
-                if node.name == "h2":
-                    next_title = normalize_text(node.get_text(" ", strip=True))
-                    if ROUTE_HEADER_PATTERN.match(next_title):
-                        break
-
-                if not route_data["full_guide_url"] and node.name in {"p", "h3", "h4"}:
-                    node_text = normalize_text(node.get_text(" ", strip=True)).lower()
-                    if "full guide" in node_text:
-                        anchor = node.find("a", href=True)
-                        if anchor:
-                            route_data["full_guide_url"] = urljoin(BASE_URL, anchor["href"])
-
-                if node.name == "p":
-                    paragraph_text = normalize_text(node.get_text(" ", strip=True))
-                    lowered = paragraph_text.lower()
-
-                    if paragraph_text and not lowered.startswith("full guide") and not lowered.startswith("read also") and not route_data["stop_description"]:
-                        route_data["stop_description"] = paragraph_text
-
-                iframe = node.find("iframe", src=True)
-                if iframe and not route_data["map_embed_url"]:
-                    route_data["map_embed_url"] = urljoin(BASE_URL, iframe["src"])
-
-                if node.name in {"h4", "p"}:
-                    node_text = normalize_text(node.get_text(" ", strip=True)).lower()
-                    if "faq" in node_text and not route_data["faq_url"]:
-                        faq_anchor = node.find("a", href=True)
-                        if faq_anchor:
-                            route_data["faq_url"] = urljoin(BASE_URL, faq_anchor["href"])
-
-            node = node.next_sibling
-
+    for route_data in split_route_sections(html, BASE_URL):
         if not route_data["full_guide_url"] and route_data["route_number"] in table_guide_lookup:
             route_data["full_guide_url"] = table_guide_lookup[route_data["route_number"]]
 
@@ -279,7 +213,7 @@ set_code_cell(
     }
 
     json_path = OUTPUT_DIR / "iloilo_routes_index.json"
-    json_path.write_text(json.dumps(output_payload, indent=2, ensure_ascii=False), encoding="utf-8")
+    write_json(json_path, output_payload)
 
     csv_rows = []
     for route in routes:
@@ -307,7 +241,8 @@ set_code_cell(
     features = []
     for route in routes:
         for segment_index, polyline in enumerate(route.get("map_polylines", []), start=1):
-            if len(polyline.get("coordinates_lng_lat", [])) < 2:
+            coordinates = geojson_coordinates(polyline)
+            if len(coordinates) < 2:
                 continue
             features.append(
                 {
@@ -322,14 +257,14 @@ set_code_cell(
                     },
                     "geometry": {
                         "type": "LineString",
-                        "coordinates": polyline.get("coordinates_lng_lat", []),
+                        "coordinates": coordinates,
                     },
                 }
             )
 
     geojson_payload = {"type": "FeatureCollection", "features": features}
     geojson_path = OUTPUT_DIR / "iloilo_route_polylines.geojson"
-    geojson_path.write_text(json.dumps(geojson_payload, indent=2, ensure_ascii=False), encoding="utf-8")
+    write_json(geojson_path, geojson_payload)
 
     print(f"Saved: {json_path}")
     print("Saved: output/iloilo_routes_index.csv")
@@ -380,6 +315,10 @@ set_code_cell(
     import requests
     from bs4 import BeautifulSoup
 
+    from guide_extraction import extract_guide_page, normalize_text
+    from json_output import write_json
+    from polyline_model import CompactPolyline, geojson_coordinates
+
     OUTPUT_DIR = Path("output")
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -400,61 +339,6 @@ set_code_cell(
     nb2,
     2,
     """
-    def normalize_text(text: str) -> str:
-        if not text:
-            return ""
-        return " ".join(text.replace("\\xa0", " ").split())
-
-    def unique_in_order(items):
-        seen = set()
-        out = []
-        for item in items:
-            if item and item not in seen:
-                seen.add(item)
-                out.append(item)
-        return out
-
-    def extract_article_dates(soup: BeautifulSoup):
-        date_published = None
-        date_modified = None
-
-        for script in soup.find_all("script", attrs={"type": "application/ld+json"}):
-            raw = script.string or script.get_text(strip=True)
-            if not raw:
-                continue
-
-            try:
-                payload = json.loads(raw)
-            except Exception:
-                continue
-
-            candidates = []
-            if isinstance(payload, dict):
-                if isinstance(payload.get("@graph"), list):
-                    candidates.extend(payload["@graph"])
-                candidates.append(payload)
-            elif isinstance(payload, list):
-                candidates.extend(payload)
-
-            for candidate in candidates:
-                if not isinstance(candidate, dict):
-                    continue
-
-                candidate_type = candidate.get("@type")
-                if isinstance(candidate_type, list):
-                    type_match = any(t in {"Article", "BlogPosting", "NewsArticle"} for t in candidate_type)
-                else:
-                    type_match = candidate_type in {"Article", "BlogPosting", "NewsArticle"}
-
-                if type_match:
-                    date_published = date_published or candidate.get("datePublished")
-                    date_modified = date_modified or candidate.get("dateModified")
-
-            if date_published and date_modified:
-                break
-
-        return date_published, date_modified
-
     def extract_mid_from_url(url: str):
         if not url:
             return None
@@ -478,7 +362,6 @@ set_code_cell(
 
             coordinate_tokens = normalize_text(coordinates_tag.get_text(" ", strip=True)).split()
             coordinates_lng_lat = []
-            coordinates_lat_lng = []
 
             for token in coordinate_tokens:
                 parts = token.split(",")
@@ -491,8 +374,7 @@ set_code_cell(
                 except ValueError:
                     continue
 
-                coordinates_lng_lat.append([lng, lat])
-                coordinates_lat_lng.append([lat, lng])
+                coordinates_lng_lat.append((lng, lat))
 
             if len(coordinates_lng_lat) < 2:
                 continue
@@ -500,14 +382,7 @@ set_code_cell(
             name_tag = placemark.find("name")
             polyline_name = normalize_text(name_tag.get_text(" ", strip=True)) if name_tag else f"segment_{idx}"
 
-            polylines.append(
-                {
-                    "name": polyline_name,
-                    "point_count": len(coordinates_lng_lat),
-                    "coordinates_lng_lat": coordinates_lng_lat,
-                    "coordinates_lat_lng": coordinates_lat_lng,
-                }
-            )
+            polylines.append(CompactPolyline.from_lng_lat(polyline_name, coordinates_lng_lat).to_dict())
 
         return polylines
 
@@ -566,51 +441,27 @@ set_code_cell(
         if not response.encoding or response.encoding.lower() == "iso-8859-1":
             response.encoding = response.apparent_encoding or "utf-8"
 
-        soup = BeautifulSoup(response.text, "lxml")
-        article = soup.select_one("article .entry-content") or soup.select_one(".entry-content") or soup
+        page = extract_guide_page(response.text, url)
+        paragraphs = page["paragraphs"]
 
-        title_tag = soup.find("h1", class_=re.compile("entry-title")) or soup.find("h1")
-        article_title = normalize_text(title_tag.get_text(" ", strip=True)) if title_tag else ""
-
-        canonical_tag = soup.find("link", rel="canonical")
-        canonical_url = canonical_tag.get("href") if canonical_tag and canonical_tag.get("href") else url
-
-        paragraphs = []
-        for p in article.select("p"):
-            text = normalize_text(p.get_text(" ", strip=True))
-            if not text:
-                continue
-            if text.lower().startswith("read also"):
-                continue
-            paragraphs.append(text)
-
-        headings = [
-            normalize_text(h.get_text(" ", strip=True))
-            for h in article.select("h2, h3, h4")
-            if normalize_text(h.get_text(" ", strip=True))
-        ]
-
-        map_embed_urls = unique_in_order([urljoin(url, iframe.get("src")) for iframe in article.select("iframe[src]")])
         map_geometry = []
-        for embed_url in map_embed_urls:
+        for embed_url in page["map_embed_urls"]:
             map_mid = extract_mid_from_url(embed_url)
             geometry = fetch_map_geometry(map_mid, session=session, cache=map_cache)
             map_geometry.append({"map_embed_url": embed_url, **geometry})
 
-        date_published, date_modified = extract_article_dates(soup)
-
         return {
             "route_number": route_row.get("route_number"),
             "route_title": route_row.get("route_title"),
             "full_guide_url": url,
-            "canonical_url": canonical_url,
-            "article_title": article_title,
-            "date_published": date_published,
-            "date_modified": date_modified,
+            "canonical_url": page["canonical_url"],
+            "article_title": page["article_title"],
+            "date_published": page["date_published"],
+            "date_modified": page["date_modified"],
             "first_paragraph": paragraphs[0] if paragraphs else None,
             "paragraphs": paragraphs,
-            "headings": headings,
-            "map_embed_urls": map_embed_urls,
+            "headings": page["headings"],
+            "map_embed_urls": page["map_embed_urls"],
             "map_geometry": map_geometry,
             "guide_polyline_count": sum(item["map_polyline_count"] for item in map_geometry),
             "guide_point_count": sum(item["map_point_count"] for item in map_geometry),
@@ -670,7 +521,7 @@ set_code_cell(
         "errors": errors,
     }
 
-    full_guides_path.write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
+    write_json(full_guides_path, payload)
 
     summary_rows = []
     for guide in full_guides:
@@ -700,7 +551,8 @@ set_code_cell(
     for guide in full_guides:
         for map_item in guide.get("map_geometry", []):
             for segment_index, polyline in enumerate(map_item.get("map_polylines", []), start=1):
-                if len(polyline.get("coordinates_lng_lat", [])) < 2:
+                coordinates = geojson_coordinates(polyline)
+                if len(coordinates) < 2:
                     continue
                 features.append(
                     {
@@ -716,14 +568,14 @@ set_code_cell(
                         },
                         "geometry": {
                             "type": "LineString",
-                            "coordinates": polyline.get("coordinates_lng_lat", []),
+                            "coordinates": coordinates,
                         },
                     }
                 )
 
     geojson_path = OUTPUT_DIR / "iloilo_full_guides_polylines.geojson"
     geojson_payload = {"type": "FeatureCollection", "features": features}
-    geojson_path.write_text(json.dumps(geojson_payload, indent=2, ensure_ascii=False), encoding="utf-8")
+    write_json(geojson_path, geojson_payload)
 
     print(f"Saved: {full_guides_path}")
     print("Saved: output/iloilo_full_guides_summary.csv")
@@ -0,0 +1,354 @@
+import argparse
+import json
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+from dataset_sources import ILOILO_BOUNDS, load_sources, route_bounds
+from json_output import write_json
+from polyline_model import CompactPolyline
+from route_geometry import EARTH_RADIUS_M
+
+
+ROOT = Path(__file__).resolve().parent
+OUTPUT_DIR = ROOT / "output"
+
+PRD_JSON = OUTPUT_DIR / "prd_routes_dataset.json"
+VALIDATION_REPORT = OUTPUT_DIR / "prd_validation_report.json"
+
+THRESHOLDS_ENV = "ROUTE25_VALIDATION_THRESHOLDS"
+
+STOP_OFFSET_LIMIT_M = 150.0
+DUPLICATE_STOP_RADIUS_M = 5.0
+BACKTRACK_TOLERANCE_M = 50.0
+MAX_ISSUE_SAMPLES = 5
+
+# Maximum number of routes allowed to carry each issue before the build fails;
+# None only reports. Override with a JSON file named by $ROUTE25_VALIDATION_THRESHOLDS.
+DEFAULT_THRESHOLDS = {
+    "map_marker_error": 0,
+    "polyline_too_short": 0,
+    "out_of_bounds": 0,
+    "stop_order": 0,
+    "ride_distance_order": 0,
+    "stop_far_from_route": 0,
+    "duplicate_stop": None,
+    "stop_backtrack": None,
+    "self_intersection": None,
+}
+
+
+def load_thresholds(path=None):
+    thresholds = dict(DEFAULT_THRESHOLDS)
+    path = path or os.environ.get(THRESHOLDS_ENV)
+    if path:
+        overrides = json.loads(Path(path).read_text(encoding="utf-8"))
+        unknown = sorted(set(overrides) - set(DEFAULT_THRESHOLDS))
+        if unknown:
+            raise ValueError(f"Unknown validation checks in {path}: {', '.join(unknown)}")
+        thresholds.update(overrides)
+    return thresholds
+
+
+def _issue(code, message, **details):
+    return {"code": code, "message": message, **details}
+
+
+def _to_metres(lats, lngs, lat0, lng0):
+    # Local equirectangular projection, same approximation as route_geometry.
+    k_lat = math.pi / 180.0 * EARTH_RADIUS_M
+    k_lng = math.cos(math.radians(lat0)) * k_lat
+    return (lngs - lng0) * k_lng, (lats - lat0) * k_lat
+
+
+def route_polylines(route: dict):
+    return [CompactPolyline.from_dict(p) for p in route.get("map_polylines", [])]
+
+
+def route_stop_coordinates(route: dict):
+    stops = [s for s in route.get("stops", []) if s.get("lat") is not None and s.get("lng") is not None]
+    orders = np.array([s.get("stop_order") or 0 for s in stops], dtype=np.int64)
+    lats = np.array([s["lat"] for s in stops], dtype=np.float64)
+    lngs = np.array([s["lng"] for s in stops], dtype=np.float64)
+    return orders, lats, lngs
+
+
+def check_bounds(label, lats, lngs, bounds):
+    outside = (
+        (lats < bounds["min_lat"]) | (lats > bounds["max_lat"]) | (lngs < bounds["min_lng"]) | (lngs > bounds["max_lng"])
+    )
+    if not outside.any():
+        return []
+    first = int(np.argmax(outside))
+    return [
+        _issue(
+            "out_of_bounds",
+            f"{int(outside.sum())} {label} coordinates outside the source bounds",
+            where=label,
+            count=int(outside.sum()),
+            sample=[float(lats[first]), float(lngs[first])],
+        )
+    ]
+
+
+def check_stop_order(route: dict):
+    orders = [s.get("stop_order") for s in route.get("stops", [])]
+    if orders == list(range(1, len(orders) + 1)):
+        return []
+    return [_issue("stop_order", "stop_order is not the sequence 1..n", stop_orders=orders[:20])]
+
+
+def check_ride_distances(route: dict):
+    # Ride edges and fare estimates take the difference of distance_along_route_m
+    # between stops, so it must never decrease in stop order.
+    placed = [
+        (s.get("stop_order"), s["distance_along_route_m"])
+        for s in route.get("stops", [])
+        if s.get("distance_along_route_m") is not None
+    ]
+    drops = [order for (_, before), (order, after) in zip(placed, placed[1:]) if after < before]
+    if not drops:
+        return []
+    return [
+        _issue(
+            "ride_distance_order",
+            f"distance along the route decreases {len(drops)} times in stop order",
+            stop_orders=drops[:MAX_ISSUE_SAMPLES],
+        )
+    ]
+
+
+def check_duplicate_stops(route: dict, orders, x, y):
+    issues = []
+    names = [" ".join((s.get("stop_name") or "").split()).casefold() for s in route.get("stops", [])]
+    repeated = [i + 2 for i in range(len(names) - 1) if names[i] and names[i] == names[i + 1]]
+    if repeated:
+        issues.append(_issue("duplicate_stop", "consecutive stops share a name", stop_orders=repeated[:MAX_ISSUE_SAMPLES]))
+
+    if len(x) > 1:
+        gaps = np.hypot(np.diff(x), np.diff(y))
+        close = np.flatnonzero(gaps < DUPLICATE_STOP_RADIUS_M)
+        if close.size:
+            issues.append(
+                _issue(
+                    "duplicate_stop",
+                    f"{close.size} consecutive stops within {DUPLICATE_STOP_RADIUS_M:g} m of each other",
+                    stop_orders=orders[close + 1][:MAX_ISSUE_SAMPLES].tolist(),
+                )
+            )
+    return issues
+
+
+def project_points(px, py, ax, ay, bx, by):
+    # Distance from every point to every segment at once: (points, segments) arrays.
+    dx = bx - ax
+    dy = by - ay
+    seg_sq = dx * dx + dy * dy
+    rel_x = px[:, None] - ax[None, :]
+    rel_y = py[:, None] - ay[None, :]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        t = np.where(seg_sq > 0, (rel_x * dx + rel_y * dy) / seg_sq, 0.0)
+    t = np.clip(t, 0.0, 1.0)
+    off_x = rel_x - t * dx
+    off_y = rel_y - t * dy
+    dist = np.hypot(off_x, off_y)
+    nearest = dist.argmin(axis=1)
+    rows = np.arange(len(px))
+    return dist[rows, nearest], nearest, t[rows, nearest]
+
+
+def check_stop_offsets(orders, sx, sy, segments, seg_start_m, seg_length_m):
+    issues = []
+    ax, ay, bx, by = segments
+    offsets, nearest, t = project_points(sx, sy, ax, ay, bx, by)
+
+    far = np.flatnonzero(offsets > STOP_OFFSET_LIMIT_M)
+    if far.size:
+        issues.append(
+            _issue(
+                "stop_far_from_route",
+                f"{far.size} stops more than {STOP_OFFSET_LIMIT_M:g} m from the route geometry",
+                stop_orders=orders[far][:MAX_ISSUE_SAMPLES].tolist(),
+                max_offset_m=round(float(offsets[far].max()), 1),
+            )
+        )
+
+    # Stops should advance along the path; one drop is the wrap of a loop route.
+    chainage = seg_start_m[nearest] + t * seg_length_m[nearest]
+    drops = np.flatnonzero(np.diff(chainage) < -BACKTRACK_TOLERANCE_M)
+    if drops.size > 1:
+        issues.append(
+            _issue(
+                "stop_backtrack",
+                f"stop sequence moves backwards along the geometry {drops.size} times",
+                stop_orders=orders[drops + 1][:MAX_ISSUE_SAMPLES].tolist(),
+            )
+        )
+    return issues
+
+
+def self_intersections(x, y):
+    # Proper crossings between non-adjacent segments of one polyline (touching and
+    # collinear overlaps are ignored: out-and-back routes legitimately retrace roads).
+    ax, ay, bx, by = x[:-1], y[:-1], x[1:], y[1:]
+    n = len(ax)
+    if n < 3:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+    def orient(px, py, qx, qy, rx, ry):
+        return np.sign((qx - px) * (ry - py) - (qy - py) * (rx - px))
+
+    i, j = np.triu_indices(n, k=2)
+    # Cheap bounding-box rejection before the orientation tests.
+    overlap = (
+        (np.minimum(ax[i], bx[i]) <= np.maximum(ax[j], bx[j]))
+        & (np.minimum(ax[j], bx[j]) <= np.maximum(ax[i], bx[i]))
+        & (np.minimum(ay[i], by[i]) <= np.maximum(ay[j], by[j]))
+        & (np.minimum(ay[j], by[j]) <= np.maximum(ay[i], by[i]))
+    )
+    i, j = i[overlap], j[overlap]
+    o1 = orient(ax[i], ay[i], bx[i], by[i], ax[j], ay[j])
+    o2 = orient(ax[i], ay[i], bx[i], by[i], bx[j], by[j])
+    o3 = orient(ax[j], ay[j], bx[j], by[j], ax[i], ay[i])
+    o4 = orient(ax[j], ay[j], bx[j], by[j], bx[i], by[i])
+    crossing = (o1 * o2 < 0) & (o3 * o4 < 0)
+    return i[crossing], j[crossing]
+
+
+def validate_route(route: dict, bounds=ILOILO_BOUNDS):
+    issues = []
+    if route.get("map_marker_error"):
+        issues.append(_issue("map_marker_error", "KML markers could not be fetched", error=route["map_marker_error"]))
+    issues.extend(check_stop_order(route))
+    issues.extend(check_ride_distances(route))
+
+    polylines = route_polylines(route)
+    orders, stop_lats, stop_lngs = route_stop_coordinates(route)
+
+    short = [i for i, p in enumerate(polylines, start=1) if len(p) < 2]
+    if short:
+        issues.append(_issue("polyline_too_short", "polylines with fewer than 2 points", polyline_indexes=short))
+
+    line_lats = np.concatenate([np.asarray(p.lats()) for p in polylines]) if polylines else np.empty(0)
+    line_lngs = np.concatenate([np.asarray(p.lngs()) for p in polylines]) if polylines else np.empty(0)
+    bounds_issues = check_bounds("polyline", line_lats, line_lngs, bounds) + check_bounds("stop", stop_lats, stop_lngs, bounds)
+    issues.extend(bounds_issues)
+
+    # Short-circuit: distances and crossings are meaningless on broken geometry.
+    if short or bounds_issues or (len(line_lats) == 0 and len(stop_lats) == 0):
+        return issues
+
+    all_lats = np.concatenate([line_lats, stop_lats])
+    all_lngs = np.concatenate([line_lngs, stop_lngs])
+    lat0, lng0 = float(all_lats.mean()), float(all_lngs.mean())
+    sx, sy = _to_metres(stop_lats, stop_lngs, lat0, lng0)
+    issues.extend(check_duplicate_stops(route, orders, sx, sy))
+
+    if not polylines:
+        return issues
+
+    segment_parts = []
+    crossings = []
+    for index, polyline in enumerate(polylines, start=1):
+        x, y = _to_metres(np.asarray(polyline.lats()), np.asarray(polyline.lngs()), lat0, lng0)
+        segment_parts.append((x[:-1], y[:-1], x[1:], y[1:]))
+        i, j = self_intersections(x, y)
+        if i.size:
+            crossings.append({"polyline_index": index, "count": int(i.size), "segments": [[int(a), int(b)] for a, b in zip(i[:3], j[:3])]})
+    if crossings:
+        issues.append(_issue("self_intersection", "polyline crosses itself", polylines=crossings))
+
+    if len(sx):
+        segments = tuple(np.concatenate([part[k] for part in segment_parts]) for k in range(4))
+        seg_length_m = np.hypot(segments[2] - segments[0], segments[3] - segments[1])
+        seg_start_m = np.concatenate([[0.0], np.cumsum(seg_length_m)[:-1]])
+        issues.extend(check_stop_offsets(orders, sx, sy, segments, seg_start_m, seg_length_m))
+
+    return issues
+
+
+def _validate_one(args):
+    return validate_route(*args)
+
+
+def validate_payload(payload: dict, workers=None, sources=None):
+    routes = payload.get("routes", [])
+    sources = sources if sources is not None else load_sources()
+    jobs = [(route, route_bounds(route, sources)) for route in routes]
+    if workers == 1:
+        results = list(map(_validate_one, jobs))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_validate_one, jobs, chunksize=4))
+
+    return [
+        {"route_number": route.get("route_number"), "route_title": route.get("route_title"), "issues": issues}
+        for route, issues in zip(routes, results)
+    ]
+
+
+def build_validation_report(payload: dict, route_results, thresholds=None):
+    thresholds = thresholds if thresholds is not None else load_thresholds()
+    routes_with = {code: 0 for code in DEFAULT_THRESHOLDS}
+    issue_counts = {code: 0 for code in DEFAULT_THRESHOLDS}
+    for result in route_results:
+        codes = {issue["code"] for issue in result["issues"]}
+        for code in codes:
+            routes_with[code] += 1
+        for issue in result["issues"]:
+            issue_counts[issue["code"]] += 1
+
+    failures = [
+        {"code": code, "routes": routes_with[code], "limit": limit}
+        for code, limit in thresholds.items()
+        if limit is not None and routes_with[code] > limit
+    ]
+    return {
+        "validated_at_utc": datetime.now(timezone.utc).isoformat(),
+        "dataset_generated_at_utc": payload.get("generated_at_utc"),
+        "route_count": len(route_results),
+        "bounds": {s["source_id"]: s.get("bounds") or ILOILO_BOUNDS for s in load_sources()},
+        "thresholds": thresholds,
+        "routes_with_issue": routes_with,
+        "issue_counts": issue_counts,
+        "failures": failures,
+        "passed": not failures,
+        "routes": [r for r in route_results if r["issues"]],
+    }
+
+
+def validate_dataset(payload: dict, path: Path = VALIDATION_REPORT, thresholds=None, workers=None):
+    report = build_validation_report(payload, validate_payload(payload, workers=workers), thresholds)
+    write_json(path, report)
+    return report
+
+
+def failure_message(report: dict):
+    breached = ", ".join(f"{f['code']} on {f['routes']} routes (limit {f['limit']})" for f in report["failures"])
+    return f"Dataset validation failed: {breached}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate the PRD dataset geometry and stops.")
+    parser.add_argument("payload", type=Path, nargs="?", default=PRD_JSON)
+    parser.add_argument("--thresholds", type=Path, help=f"JSON overrides; defaults to ${THRESHOLDS_ENV}")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    payload = json.loads(args.payload.read_text(encoding="utf-8"))
+    report = validate_dataset(payload, thresholds=load_thresholds(args.thresholds), workers=args.workers)
+
+    print(f"Saved: {VALIDATION_REPORT}")
+    for code, routes in report["routes_with_issue"].items():
+        limit = report["thresholds"][code]
+        print(f"  {code:<20} {routes:>3} routes (limit {'-' if limit is None else limit})")
+    if not report["passed"]:
+        raise SystemExit(failure_message(report))
+
+
+if __name__ == "__main__":
+    main()
@@ -40,6 +40,8 @@ class JeepRoute {
     required this.stopCount,
     required this.stops,
     required this.mapPolylines,
+    this.topology = 'linear',
+    this.cycleLength,
   });
 
   final int routeNumber;
@@ -57,6 +59,8 @@ class JeepRoute {
   final int stopCount;
   final List<RouteStop> stops;
   final List<RoutePolylineSegment> mapPolylines;
+  final String topology;
+  final int? cycleLength;
 
   factory JeepRoute.fromJson(Map<String, dynamic> json) {
     final stopJson = (json['stops'] as List<dynamic>? ?? const <dynamic>[]);
@@ -85,9 +89,23 @@ class JeepRoute {
           .whereType<Map<String, dynamic>>()
           .map(RoutePolylineSegment.fromJson)
           .toList(growable: false),
+      topology: json['topology'] as String? ?? 'linear',
+      cycleLength: json['cycle_length'] as int?,
     );
   }
 
+  bool get isCyclic => topology == 'loop' || topology == 'out_and_back';
+
+  // Cyclic routes only run forward and wrap through the terminal; linear
+  // routes run both ways.
+  int travelSpan(int originIndex, int destinationIndex) {
+    final cycle = cycleLength ?? stops.length;
+    if (isCyclic && cycle > 0) {
+      return (destinationIndex - originIndex) % cycle + 1;
+    }
+    return (destinationIndex - originIndex).abs() + 1;
+  }
+
   bool get hasMapGeometry => mapPolylineCount > 0 && mapPolylines.isNotEmpty;
 
   bool get hasFare => fareMinPhp != null || fareMaxPhp != null;
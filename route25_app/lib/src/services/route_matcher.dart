@@ -38,7 +38,7 @@ class RouteMatchResult {
     if (originStopIndex == null) {
       return destinationStopIndex + 1;
     }
-    return (destinationStopIndex - originStopIndex!).abs() + 1;
+    return route.travelSpan(originStopIndex!, destinationStopIndex);
   }
 
   bool get isDirect => originStopIndex != null;
@@ -151,6 +151,16 @@ class RouteMatcher {
     OriginLocation location, {
     required int destinationIndex,
   }) {
+    // A cyclic route reaches the destination from any stop by wrapping around.
+    if (route.isCyclic) {
+      return _nearestStopIndexInRange(
+        route,
+        location,
+        minIndex: 0,
+        maxIndex: route.stops.length - 1,
+      );
+    }
+
     int? bestIndex = _nearestStopIndexInRange(
       route,
       location,
@@ -86,6 +86,15 @@ class RouteRepository {
       // Fall through to direct table reads for compatibility with different schemas.
     }
 
+    try {
+      final fromJsonView = await _loadDatasetFromSupabaseJsonView(client);
+      if (fromJsonView.routes.isNotEmpty) {
+        return fromJsonView;
+      }
+    } catch (_) {
+      // Fall through to per-table reads when the materialized view is missing.
+    }
+
     try {
       final fromPrdTables = await _loadDatasetFromSupabasePrdTables(client);
       if (fromPrdTables.routes.isNotEmpty) {
@@ -346,6 +355,17 @@ class RouteRepository {
     );
   }
 
+  Future<PrdDataset> _loadDatasetFromSupabaseJsonView(SupabaseClient client) async {
+    final row = await client.from('prd_dataset_json').select('payload').limit(1).single();
+
+    final map = _toJsonMap(row['payload']);
+    if (map == null) {
+      throw const FormatException('prd_dataset_json returned invalid JSON payload.');
+    }
+
+    return PrdDataset.fromJson(map);
+  }
+
   Future<PrdDataset> _loadDatasetFromSupabaseRpc(SupabaseClient client) async {
     final response = await client.rpc('get_route25_dataset');
 